@@ -1,13 +1,34 @@
-"""Top-level package for fmu-dataio"""
+"""Top-level package for fmu-dataio
 
-from fmu.dataio.dataio import ExportData, read_metadata
-from fmu.dataio.exceptions import (
-    ConfigurationError,
-    DeprecationError,
-    InvalidMetadataError,
-    ValidationError,
-)
-from fmu.dataio.preprocessed import ExportPreprocessedData
+The public names are imported on first access, such that importing a submodule, e.g.
+the ERT plugins when ERT starts, does not import the full export stack.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from fmu.dataio._content_store import deduplicated_writes
+    from fmu.dataio._definitions import ValidationLevel
+    from fmu.dataio._memory import memory_profile
+    from fmu.dataio._readers.loader import (
+        LoadedData,
+        cached_loads,
+        clear_load_cache,
+        load,
+    )
+    from fmu.dataio._staging import staged_writes
+    from fmu.dataio._validation import metadata_validation
+    from fmu.dataio.dataio import ExportData, read_metadata
+    from fmu.dataio.exceptions import (
+        ConfigurationError,
+        DeprecationError,
+        InvalidMetadataError,
+        ValidationError,
+    )
+    from fmu.dataio.preprocessed import ExportPreprocessedData
 
 try:
     from .version import version
@@ -16,12 +37,53 @@ try:
 except ImportError:
     __version__ = "0.0.0"
 
+_LAZY_IMPORTS: Final[dict[str, str]] = {
+    "ConfigurationError": "fmu.dataio.exceptions",
+    "DeprecationError": "fmu.dataio.exceptions",
+    "ExportData": "fmu.dataio.dataio",
+    "ExportPreprocessedData": "fmu.dataio.preprocessed",
+    "InvalidMetadataError": "fmu.dataio.exceptions",
+    "LoadedData": "fmu.dataio._readers.loader",
+    "ValidationError": "fmu.dataio.exceptions",
+    "ValidationLevel": "fmu.dataio._definitions",
+    "cached_loads": "fmu.dataio._readers.loader",
+    "clear_load_cache": "fmu.dataio._readers.loader",
+    "deduplicated_writes": "fmu.dataio._content_store",
+    "load": "fmu.dataio._readers.loader",
+    "memory_profile": "fmu.dataio._memory",
+    "metadata_validation": "fmu.dataio._validation",
+    "read_metadata": "fmu.dataio.dataio",
+    "staged_writes": "fmu.dataio._staging",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
 __all__ = [
     "ConfigurationError",
     "DeprecationError",
     "ExportData",
     "ExportPreprocessedData",
     "InvalidMetadataError",
+    "LoadedData",
     "ValidationError",
+    "ValidationLevel",
+    "cached_loads",
+    "clear_load_cache",
+    "deduplicated_writes",
+    "load",
+    "memory_profile",
+    "metadata_validation",
     "read_metadata",
+    "staged_writes",
 ]
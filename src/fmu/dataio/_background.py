@@ -0,0 +1,217 @@
+"""Exports running on a background worker.
+
+Writing large objects, e.g. grids, blocks the calling script while the metadata is
+built and the object is serialized, hashed and written. In RMS interactive mode this
+freezes the user interface. The functions in this module return a future right away,
+and run these steps on a single background worker thread instead. Exports run one at
+a time in the order they were submitted.
+
+Exports run with the settings of the context they were submitted from, e.g. the
+metadata validation level and whether writes are staged or deduplicated, also when
+the settings have been changed before the export runs.
+
+The data to export must not be modified before its export has completed. Data given
+to ``ExportData.export_async()`` is copied by default, while the RMS export functions
+fetch new objects from the project that are owned by the export.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import functools
+import pickle
+import threading
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Final, ParamSpec, TypeVar
+
+from fmu.dataio._logging import null_logger
+from fmu.dataio._worker import get_export_worker
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+logger: Final = null_logger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_executor: ThreadPoolExecutor | None = None
+_pending: list[Future[Any]] = []
+_deferred: ContextVar[list[Future[Any]] | None] = ContextVar(
+    "deferred_exports", default=None
+)
+_lock: Final = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the background worker, started on first use."""
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="dataio-background"
+            )
+        return _executor
+
+
+def _submit(func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> Future[R]:
+    """Run a function in the export worker process if exports are run out of process,
+    otherwise on the background worker with the context of the calling thread, e.g.
+    its metadata validation level."""
+    worker = get_export_worker()
+    if worker is not None:
+        try:
+            return worker.submit(func, *args, **kwargs)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            logger.info("Unable to export out of process, exporting in thread: %s", err)
+    context = contextvars.copy_context()
+    # exports run on the background worker are not deferred again
+    context.run(_deferred.set, None)
+    run = functools.partial(context.run, func, *args, **kwargs)
+    return _get_executor().submit(run)
+
+
+def _track(future: Future[R]) -> Future[R]:
+    """Track a future until ``wait_all()``."""
+    with _lock:
+        _pending.append(future)
+    return future
+
+
+def submit(func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> Future[R]:
+    """Run a function on the background worker, and track it until ``wait_all()``."""
+    return _track(_submit(func, *args, **kwargs))
+
+
+def get_deferred_exports() -> list[Future[Any]] | None:
+    """Return the exports deferred to the background worker by ``export_async()``,
+    or None if exports are not deferred."""
+    return _deferred.get()
+
+
+def defer(func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> Future[R]:
+    """Run a deferred export on the background worker.
+
+    Errors are reported by the future returned from ``export_async()``, hence
+    deferred exports are not tracked on their own.
+    """
+    deferred = _deferred.get()
+    assert deferred is not None
+    future = _submit(func, *args, **kwargs)
+    with _lock:
+        deferred.append(future)
+    return future
+
+
+@contextmanager
+def _deferred_exports() -> Iterator[list[Future[Any]]]:
+    if _deferred.get() is not None:
+        raise RuntimeError("export_async() can not be called within export_async()")
+
+    deferred: list[Future[Any]] = []
+    token = _deferred.set(deferred)
+    try:
+        yield deferred
+    finally:
+        _deferred.reset(token)
+
+
+def _result_when_done(result: R, futures: list[Future[Any]]) -> R:
+    """Return the result, or raise the first error of the given exports."""
+    for future in futures:
+        future.result()
+    return result
+
+
+def export_async(func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> Future[R]:
+    """Run an export function, with the exports running on a background worker.
+
+    The function itself runs in the calling thread, such that data is fetched from
+    RMS in the thread the RMS API must be used from. Each object is handed over to
+    the background worker as soon as it is fetched, and the paths it will be written
+    to are determined up front. The returned future holds the result of the function
+    when all its exports have completed, or the first error raised by them.
+
+    Note that the fetched objects are held in memory until they are exported. If the
+    function raises, the error is raised right away, while the exports deferred before
+    the error still run and are waited for by ``wait_all()``.
+
+    Examples:
+        Export surfaces without blocking the RMS user interface::
+
+            from fmu.dataio.export import export_async, wait_all
+            from fmu.dataio.export.rms import export_structure_depth_surfaces
+
+            future = export_async(
+                export_structure_depth_surfaces, project, "DS_extracted"
+            )
+            ...
+            wait_all()
+
+    Args:
+        func: The export function to run, e.g. ``export_structure_depth_surfaces``.
+        *args: Positional arguments to the export function.
+        **kwargs: Keyword arguments to the export function.
+
+    Returns:
+        A future holding the result of the export function.
+    """
+    with _deferred_exports() as deferred:
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            with _lock:
+                _pending.extend(deferred)
+            raise
+    return _track(_get_executor().submit(_result_when_done, result, deferred))
+
+
+def wait_all(timeout: float | None = None) -> list[Any]:
+    """Wait for all background exports to complete.
+
+    Args:
+        timeout: The maximum number of seconds to wait, or None to wait until all
+            exports have completed.
+
+    Returns:
+        The results of the completed exports, in the order they were submitted.
+
+    Raises:
+        TimeoutError: If the exports did not complete within the timeout. The exports
+            not completed are still waited for by the next call.
+        ExceptionGroup: With the errors of all failed exports.
+    """
+    with _lock:
+        futures = _pending.copy()
+        _pending.clear()
+
+    _, not_done = wait(futures, timeout=timeout)
+    if not_done:
+        with _lock:
+            _pending[:0] = [f for f in futures if f in not_done]
+        raise TimeoutError(
+            f"{len(not_done)} of {len(futures)} background exports did not complete "
+            f"within {timeout} seconds."
+        )
+
+    errors = [err for f in futures if isinstance(err := f.exception(), Exception)]
+    if errors:
+        raise ExceptionGroup(
+            f"{len(errors)} of {len(futures)} background exports failed", errors
+        )
+    return [f.result() for f in futures]
+
+
+@atexit.register
+def _report_at_exit() -> None:
+    """Report the errors of background exports not waited for when Python exits."""
+    try:
+        wait_all()
+    except ExceptionGroup as group:
+        messages = "\n".join(f"  {type(e).__name__}: {e}" for e in group.exceptions)
+        warnings.warn(f"{group.message}:\n{messages}", UserWarning, stacklevel=1)
@@ -0,0 +1,193 @@
+"""A content-addressed store of exported files shared by the realizations of a case.
+
+Many realizations export byte-identical files, e.g. an unchanged grid geometry or
+copied observations. Within a ``deduplicated_writes`` block, exported files are stored
+once in the content store of the case, keyed on their MD5 checksum and size, and the
+exported files are hard links to the stored file. The metadata files are not affected.
+
+The checksum and size of an object are known from its metadata before the object is
+written, hence an object already in the store is not written again at all. A newly
+written file is only added to the store if its content matches the checksum and size,
+as an object serialized again may differ in bytes from the serialization its checksum
+was computed from, e.g. with timestamps in the file.
+
+A file in the store is shared by all its links, and must never be modified in place.
+Exported files are therefore always replaced by renaming a new file into place, and an
+exported file that is a link is removed before it is written to directly.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Final
+
+from fmu.dataio._logging import null_logger
+from fmu.dataio._utils import md5sum
+
+logger: Final = null_logger(__name__)
+
+# The location of the content store relative to the casepath
+CONTENT_STORE_PATH: Final = Path("share/.content_store")
+
+# Errors meaning the file system, or the pair of paths, does not support hard links
+_NO_LINK_ERRNOS: Final = frozenset(
+    {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP}
+)
+
+_enabled: ContextVar[bool] = ContextVar("deduplicated_writes", default=False)
+
+
+@contextmanager
+def deduplicated_writes() -> Iterator[None]:
+    """Store the files exported within the block in the content store of the case,
+    and export them as hard links to the stored files.
+
+    Identical files exported by several realizations, or several times, are then only
+    stored once. Files are only deduplicated when exported with metadata inside FMU,
+    and when hard links are supported between the export directory and the case.
+
+    The manifest records the size of each exported file and whether it was already
+    stored, from which the number of bytes saved can be found.
+
+    Deduplication applies to the current thread or asyncio task, and to the background
+    exports submitted from it.
+
+    Examples:
+        Export the static grid model of each realization only once::
+
+            from fmu.dataio import ExportData, deduplicated_writes
+
+            with deduplicated_writes():
+                ExportData(config=CFG, content="depth").export(grid)
+
+    """
+    token = _enabled.set(True)
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
+
+
+def deduplicated_writes_enabled() -> bool:
+    """Return whether exported files are deduplicated."""
+    return _enabled.get()
+
+
+def get_content_store(casepath: Path | None) -> ContentStore | None:
+    """Return the content store of a case if deduplicated writes are enabled."""
+    if not _enabled.get():
+        return None
+    if casepath is None:
+        logger.info("No casepath, exported files are not deduplicated.")
+        return None
+    return ContentStore(casepath)
+
+
+def _temporary_path(path: Path) -> Path:
+    """Return a hidden temporary path in the same directory as the given path."""
+    return path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+
+
+def _matches(path: Path, checksum_md5: str, size_bytes: int) -> bool:
+    """Whether a written file has the given checksum and size."""
+    if path.stat().st_size == size_bytes and md5sum(path) == checksum_md5:
+        return True
+    logger.info(
+        "The written file %s does not match its checksum, not added to the store.", path
+    )
+    return False
+
+
+def unlink_if_linked(path: Path) -> None:
+    """Remove a file that is linked to other files, such that writing to the path
+    does not modify the other files."""
+    try:
+        if path.stat().st_nlink > 1:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class ContentStore:
+    """The content store of a case, holding files keyed on their checksum and size."""
+
+    def __init__(self, casepath: Path) -> None:
+        self.path = casepath / CONTENT_STORE_PATH
+
+    def blob_path(self, checksum_md5: str, size_bytes: int) -> Path:
+        """Return the path a file with the given checksum and size is stored at."""
+        return self.path / checksum_md5[:2] / f"{checksum_md5}-{size_bytes}"
+
+    def write(
+        self,
+        path: Path,
+        checksum_md5: str,
+        size_bytes: int,
+        write: Callable[[Path], None],
+    ) -> bool:
+        """Export a file as a link to the stored file with the given checksum and size.
+
+        The file is written with the given function and added to the store if not
+        already stored, and if the written file matches the checksum and size. The
+        file is written as a regular file if hard links are not supported.
+
+        Args:
+            path: The path to export the file to.
+            checksum_md5: The MD5 checksum of the file.
+            size_bytes: The size of the file.
+            write: A function writing the file to a given path.
+
+        Returns:
+            Whether the file was already stored, i.e. not written again.
+        """
+        blob = self.blob_path(checksum_md5, size_bytes)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmpfile = _temporary_path(path)
+        try:
+            stored = self._link_stored(blob, tmpfile)
+            if not stored:
+                write(tmpfile)
+                if _matches(tmpfile, checksum_md5, size_bytes):
+                    self._store(tmpfile, blob)
+            tmpfile.replace(path)
+        finally:
+            tmpfile.unlink(missing_ok=True)
+
+        logger.debug("Exported %s, already stored: %s", path, stored)
+        return stored
+
+    @staticmethod
+    def _link_stored(blob: Path, path: Path) -> bool:
+        """Link a stored file to the path, returns False if not stored or if it can
+        not be linked."""
+        try:
+            os.link(blob, path)
+        except FileNotFoundError:
+            return False
+        except OSError as err:
+            if err.errno not in _NO_LINK_ERRNOS:
+                raise
+            logger.info("Unable to link %s, writing the file instead: %s", blob, err)
+            return False
+        return True
+
+    @staticmethod
+    def _store(path: Path, blob: Path) -> None:
+        """Add a written file to the store, if hard links are supported."""
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmpblob = _temporary_path(blob)
+        try:
+            os.link(path, tmpblob)
+            # concurrent exports of the same file store identical content
+            tmpblob.replace(blob)
+        except OSError as err:
+            tmpblob.unlink(missing_ok=True)
+            if err.errno not in _NO_LINK_ERRNOS:
+                raise
+            logger.info("Unable to store %s in %s: %s", path, blob, err)
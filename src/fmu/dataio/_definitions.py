@@ -108,3 +108,18 @@ class RMSExecutionMode(StrEnum):
 
     interactive = "interactive"
     batch = "batch"
+
+
+class ValidationLevel(StrEnum):
+    """How thoroughly the metadata for exported objects is validated.
+
+    full: The metadata is built from validated models for every object.
+    trusted: Parts produced internally are assembled without validation, and the
+        complete metadata is checked against the schema once per context.
+    deferred: As trusted, but the complete metadata of all objects is validated in
+        one batch at the end of the session instead of once per context.
+    """
+
+    full = "full"
+    trusted = "trusted"
+    deferred = "deferred"
@@ -1,8 +1,16 @@
 from ._export_config import ExportConfig, ExportConfigBuilder
-from ._export_config_resolver import build_from_export_data
+from ._export_config_resolver import (
+    CONTEXT_FIELDS,
+    ExportContext,
+    build_from_export_data,
+    resolve_per_object_field,
+)
 from ._export_models import AllowedContentSeismic, ObjectMetadataExport, UnsetData
+from ._plan import ExportPlan, PlannedExport, plan_export
 from .core import (
     export_metadata_file,
+    export_objdata_with_metadata,
+    export_to_buffer,
     export_with_metadata,
     export_without_metadata,
 )
@@ -12,11 +20,19 @@ __all__ = [
     "compute_md5_and_size",
     "export_metadata_file",
     "export_object",
+    "export_objdata_with_metadata",
+    "export_to_buffer",
     "export_with_metadata",
     "export_without_metadata",
     "ExportConfig",
     "ExportConfigBuilder",
+    "ExportPlan",
+    "PlannedExport",
+    "plan_export",
     "build_from_export_data",
+    "CONTEXT_FIELDS",
+    "ExportContext",
+    "resolve_per_object_field",
     "ObjectMetadataExport",
     "UnsetData",
     "AllowedContentSeismic",
@@ -30,7 +30,7 @@ from fmu.datamodels.fmu_results.enums import (
     FMUContext,
     VerticalDomain,
 )
-from fmu.datamodels.fmu_results.fields import Display, Workflow
+from fmu.datamodels.fmu_results.fields import Aggregation, Display, Workflow
 from fmu.datamodels.fmu_results.global_configuration import GlobalConfiguration
 from fmu.datamodels.fmu_results.standard_result import AnyStandardResult
 from fmu.datamodels.standard_results.enums import StandardResultName
@@ -49,6 +49,8 @@ logger: Final = null_logger(__name__)
 if TYPE_CHECKING:
     from fmu.dataio import ExportData
 
+    from ._export_config_resolver import ExportContext
+
 AnyContentMetadata: TypeAlias = (
     AllowedContentSeismic | FieldOutline | FieldRegion | FluidContact | Property
 )
@@ -94,6 +96,7 @@ class ExportConfig:
     table_fformat: str
     polygons_fformat: str
     points_fformat: str
+    partition_by: list[str] | None
 
     # Time configuration
     timedata: list[str] | list[list[str]] | None
@@ -120,6 +123,9 @@ class ExportConfig:
     # Data provenance
     tracklog_source: TracklogSource | None = None
 
+    # Aggregation over an ensemble
+    aggregation: Aggregation | None = None
+
     @property
     def content_enum(self) -> Content | None:
         """Filter possible 'unset' content."""
@@ -167,17 +173,20 @@ class ExportConfig:
         return ExportConfigBuilder()
 
     @classmethod
-    def from_export_data(cls, dataio: ExportData) -> ExportConfig:
+    def from_export_data(
+        cls, dataio: ExportData, context: ExportContext | None = None
+    ) -> ExportConfig:
         """Create an ExportConfig from an ExportData instance.
 
         Args:
             dataio: The ExportData instance to create config from.
+            context: A previously resolved export context to reuse, if still current.
 
         Returns:
             An immutable ExportConfig with all resolved values.
         """
 
-        return build_from_export_data(dataio)
+        return build_from_export_data(dataio, context)
 
 
 class ExportConfigBuilder:
@@ -239,6 +248,7 @@ class ExportConfigBuilder:
         self._table_fformat: str = "parquet"
         self._polygons_fformat: str = "parquet"
         self._points_fformat: str = "parquet"
+        self._partition_by: list[str] | None = None
 
         # Time
         self._timedata: list[str] | list[list[str]] | None = None
@@ -267,6 +277,9 @@ class ExportConfigBuilder:
         # Data provenance
         self._tracklog_source: TracklogSource | None = None
 
+        # Aggregation
+        self._aggregation: Aggregation | None = None
+
     def content(
         self,
         content: Content,
@@ -338,12 +351,14 @@ class ExportConfigBuilder:
         table_fformat: str = "parquet",
         polygons_fformat: str = "parquet",
         points_fformat: str = "parquet",
+        partition_by: list[str] | None = None,
     ) -> ExportConfigBuilder:
         """Set table-related configuration."""
         self._table_index = table_index
         self._table_fformat = table_fformat
         self._polygons_fformat = polygons_fformat
         self._points_fformat = points_fformat
+        self._partition_by = partition_by
         return self
 
     def timedata(
@@ -448,6 +463,11 @@ class ExportConfigBuilder:
         self._tracklog_source = TracklogSource(name=name, version=version)
         return self
 
+    def aggregation(self, aggregation: Aggregation | None) -> ExportConfigBuilder:
+        """Set the aggregation the exported object is the result of."""
+        self._aggregation = aggregation
+        return self
+
     def build(self) -> ExportConfig:
         """Build the immutable ExportConfig.
 
@@ -489,6 +509,7 @@ class ExportConfigBuilder:
             table_fformat=self._table_fformat,
             polygons_fformat=self._polygons_fformat,
             points_fformat=self._points_fformat,
+            partition_by=self._partition_by,
             timedata=self._timedata,
             preprocessed=self._preprocessed,
             is_prediction=self._is_prediction,
@@ -500,4 +521,5 @@ class ExportConfigBuilder:
             runcontext=runcontext,
             standard_result=self._standard_result,
             tracklog_source=self._tracklog_source,
+            aggregation=self._aggregation,
         )
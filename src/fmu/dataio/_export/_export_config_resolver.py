@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import warnings
+from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, Final, TypeAlias
@@ -47,14 +48,132 @@ AnyContentMetadata: TypeAlias = (
     AllowedContentSeismic | FieldOutline | FieldRegion | FluidContact | Property
 )
 
+# ExportData arguments the export context is resolved from
+CONTEXT_FIELDS: Final = frozenset({"config", "casepath", "fmu_context", "preprocessed"})
+
+# ExportData arguments copied as they are to the ExportConfig field of the same name
+_PER_OBJECT_FIELDS: Final = frozenset(
+    {
+        "name",
+        "tagname",
+        "forcefolder",
+        "subfolder",
+        "parent",
+        "filename_timedata_reverse",
+        "geometry",
+        "is_prediction",
+        "is_observation",
+        "undef_is_zero",
+        "table_index",
+        "table_fformat",
+        "polygons_fformat",
+        "points_fformat",
+        "partition_by",
+        "timedata",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ExportContext:
+    """The parts of an export configuration bound to the context the export runs in.
+
+    Resolving these reads the global configuration and the case metadata from disk,
+    hence they are resolved once and shared by the objects exported with the same
+    ExportData instance. The context is stale when the Ert environment or the working
+    directory it was resolved in has changed.
+    """
+
+    config: GlobalConfiguration | None
+    fmu_dir: ProjectFMUDirectory | None
+    runcontext: RunContext
+    preprocessed: bool
+    environment: FMUEnvironment
+    cwd: Path
+
+    @classmethod
+    def from_export_config(cls, export_config: ExportConfig) -> ExportContext:
+        """Return the context an ExportConfig was resolved in."""
+        return cls(
+            config=export_config.config,
+            fmu_dir=export_config.fmu_dir,
+            runcontext=export_config.runcontext,
+            preprocessed=export_config.preprocessed,
+            environment=FMUEnvironment.from_env(),
+            cwd=Path.cwd(),
+        )
+
+    def is_current(self) -> bool:
+        """Whether the context was resolved in the current environment."""
+        return self.environment == FMUEnvironment.from_env() and self.cwd == Path.cwd()
+
+
+def resolve_export_context(export_data: ExportData) -> ExportContext:
+    """Resolve the context bound parts of an ExportConfig from an ExportData instance.
+
+    Args:
+        export_data: The ExportData instance to resolve the context from.
+
+    Returns:
+        The resolved export context.
+    """
+    config = _resolve_global_config(export_data.config)
+    casepath_input = Path(export_data.casepath) if export_data.casepath else None
+
+    fmu_context, preprocessed = _resolve_fmu_context(
+        export_data.fmu_context, export_data.preprocessed
+    )
+
+    runcontext = RunContext(
+        casepath_proposed=casepath_input,
+        fmu_context=fmu_context,
+    )
 
-def build_from_export_data(export_data: ExportData) -> ExportConfig:
+    return ExportContext(
+        config=config,
+        fmu_dir=_resolve_fmu_dir(),
+        runcontext=runcontext,
+        preprocessed=preprocessed,
+        environment=FMUEnvironment.from_env(),
+        cwd=Path.cwd(),
+    )
+
+
+def resolve_per_object_field(name: str, value: Any) -> dict[str, Any] | None:
+    """Resolve an ExportData argument that only describes the exported object.
+
+    Such arguments do not depend on the export context or on other arguments, and a
+    changed value can be applied to an existing ExportConfig with
+    ``dataclasses.replace``.
+
+    Args:
+        name: The name of the ExportData argument.
+        value: The new value of the argument.
+
+    Returns:
+        The changed ExportConfig fields, or None if the argument must be resolved
+        together with the other arguments.
+    """
+    if name in _PER_OBJECT_FIELDS:
+        return {name: value}
+    if name == "unit":
+        return {"unit": value or ""}
+    if name == "display_name":
+        return {"display": Display(name=value)}
+    return None
+
+
+def build_from_export_data(
+    export_data: ExportData, context: ExportContext | None = None
+) -> ExportConfig:
     """Create an ExportConfig from an ExportData instance.
 
     This is effectively an adapter to user input.
 
     Args:
         dataio: The ExportData instance to create config from.
+        context: A previously resolved export context to reuse. It is resolved again
+            if not given, or if it is no longer current.
 
     Returns:
         An immutable ExportConfig with all resolved values.
@@ -66,17 +185,10 @@ def build_from_export_data(export_data: ExportData) -> ExportConfig:
     vertical_domain, domain_reference = _resolve_vertical_domain(
         export_data.vertical_domain, export_data.domain_reference
     )
-    config = _resolve_global_config(export_data.config)
-    casepath_input = Path(export_data.casepath) if export_data.casepath else None
 
-    fmu_context, preprocessed = _resolve_fmu_context(
-        export_data.fmu_context, export_data.preprocessed
-    )
-
-    runcontext = RunContext(
-        casepath_proposed=casepath_input,
-        fmu_context=fmu_context,
-    )
+    if context is None or not context.is_current():
+        context = resolve_export_context(export_data)
+    config = context.config
 
     return ExportConfig(
         # Content
@@ -96,7 +208,7 @@ def build_from_export_data(export_data: ExportData) -> ExportConfig:
         vertical_domain=vertical_domain,
         domain_reference=domain_reference,
         # FMU context
-        preprocessed=preprocessed,
+        preprocessed=context.preprocessed,
         display=Display(name=export_data.display_name),
         workflow=_resolve_workflow(export_data.workflow),
         # Classification/access
@@ -113,6 +225,7 @@ def build_from_export_data(export_data: ExportData) -> ExportConfig:
         table_fformat=export_data.table_fformat,
         polygons_fformat=export_data.polygons_fformat,
         points_fformat=export_data.points_fformat,
+        partition_by=export_data.partition_by,
         # Time
         timedata=export_data.timedata,
         # Other
@@ -121,8 +234,8 @@ def build_from_export_data(export_data: ExportData) -> ExportConfig:
         description=_resolve_description(export_data.description),
         # Config
         config=config,
-        fmu_dir=_resolve_fmu_dir(),
-        runcontext=runcontext,
+        fmu_dir=context.fmu_dir,
+        runcontext=context.runcontext,
         # Standard result
         standard_result=None,
     )
@@ -8,10 +8,13 @@ period is ongoing.
 from __future__ import annotations
 
 import warnings
+from pathlib import Path
 from typing import Final, Literal
 
 from pydantic import (
+    BaseModel,
     Field,
+    SerializeAsAny,
     model_validator,
 )
 
@@ -19,6 +22,7 @@ from fmu.dataio._logging import null_logger
 from fmu.datamodels import Masterdata, SsdlAccess
 from fmu.datamodels.fmu_results import data, enums, fields
 from fmu.datamodels.fmu_results.fmu_results import ObjectMetadata
+from fmu.datamodels.types import MD5HashStr
 
 logger: Final = null_logger(__name__)
 
@@ -55,6 +59,27 @@ class UnsetData(data.Data):
         return self
 
 
+class FilePartExport(BaseModel):
+    """A file in a dataset exported as a directory of files."""
+
+    relative_path: Path
+    """The path of the file relative to the dataset directory."""
+
+    checksum_md5: MD5HashStr
+    """A valid MD5 checksum of the file."""
+
+    size_bytes: int
+    """Size of the file in bytes."""
+
+
+class FileExport(fields.File):
+    """Wraps the schema File, adding the parts of a dataset exported as a directory.
+
+    The checksum and size of the directory are then derived from the parts."""
+
+    parts: list[FilePartExport] | None = Field(default=None)
+
+
 class ObjectMetadataExport(ObjectMetadata, populate_by_name=True):
     """Wraps the schema ObjectMetadata, adjusting some values to optional for pragmatic
     purposes when exporting metadata."""
@@ -65,4 +90,6 @@ class ObjectMetadataExport(ObjectMetadata, populate_by_name=True):
     masterdata: Masterdata | None  # type: ignore
     # !! Keep UnsetData first in this union
     data: UnsetData | data.AnyData  # type: ignore
+    # Serialize the parts of a FileExport
+    file: SerializeAsAny[fields.File]
     preprocessed: bool | None = Field(alias="_preprocessed", default=None)
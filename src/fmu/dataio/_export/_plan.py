@@ -0,0 +1,155 @@
+"""Planning of exports before any object is serialized.
+
+Objects exported to the same path overwrite each other, which is otherwise only
+found after the objects have been serialized and written. A plan resolves the paths,
+the entity uuids and the estimated sizes of a batch of objects up front, without
+serializing or hashing them, such that collisions are found before anything is
+written and the exports can be ordered, e.g. largest first.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import pyarrow as pa
+
+from fmu.dataio._logging import null_logger
+from fmu.dataio._metadata._file import SharePathConstructor
+from fmu.dataio._metadata._fmu import build_entity
+from fmu.dataio._metadata._object import create_object_data
+from fmu.datamodels.fmu_results.enums import FMUContext
+
+from .core import export_objdata_with_metadata, export_without_metadata
+from .serialize import estimate_serialized_size
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from fmu.dataio._metadata import ObjectData
+    from fmu.dataio.types import ExportableData
+
+    from ._export_config import ExportConfig
+
+logger: Final = null_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PlannedExport:
+    """The planned export of an object.
+
+    Attributes:
+        obj: The object to export.
+        absolute_path: The path the object will be exported to.
+        share_path: The path relative to the export root, e.g.
+            ``share/results/maps/surface.gri``.
+        entity_uuid: The uuid of the entity the object is an instance of, when
+            exported in a realization.
+        estimated_size_bytes: The estimated size of the exported file, or None if it
+            can not be estimated without serializing the object.
+    """
+
+    obj: ExportableData = field(repr=False, compare=False)
+    absolute_path: Path
+    share_path: Path
+    entity_uuid: UUID | None
+    estimated_size_bytes: int | None
+    _export_config: ExportConfig = field(repr=False, compare=False)
+    _objdata: ObjectData = field(repr=False, compare=False)
+
+    def export(self) -> str:
+        """Export the object as planned, with full metadata.
+
+        Returns:
+            The full path to the exported item.
+        """
+        if self._export_config.config is None:
+            return str(export_without_metadata(self._export_config, self.obj))
+        return str(export_objdata_with_metadata(self._export_config, self._objdata))
+
+
+@dataclass(frozen=True)
+class ExportPlan:
+    """The planned exports of a batch of objects, in the order they were given.
+
+    Plans of several ExportData instances are combined with ``+``, e.g. to find
+    collisions between them.
+    """
+
+    exports: tuple[PlannedExport, ...] = ()
+
+    def __iter__(self) -> Iterator[PlannedExport]:
+        return iter(self.exports)
+
+    def __len__(self) -> int:
+        return len(self.exports)
+
+    def __add__(self, other: ExportPlan) -> ExportPlan:
+        return ExportPlan(self.exports + other.exports)
+
+    @property
+    def collisions(self) -> dict[Path, list[PlannedExport]]:
+        """The paths that more than one object will be exported to, with the planned
+        exports of these objects."""
+        by_path: dict[Path, list[PlannedExport]] = defaultdict(list)
+        for planned in self.exports:
+            by_path[planned.absolute_path].append(planned)
+        return {path: exports for path, exports in by_path.items() if len(exports) > 1}
+
+    @property
+    def estimated_size_bytes(self) -> int:
+        """The estimated total size of the exported files, of the objects whose size
+        can be estimated."""
+        return sum(planned.estimated_size_bytes or 0 for planned in self.exports)
+
+    def largest_first(self) -> list[PlannedExport]:
+        """Return the planned exports ordered by decreasing estimated size, with the
+        exports of unknown size last. Starting the largest exports first balances the
+        load when exporting in parallel."""
+        return sorted(
+            self.exports,
+            key=lambda planned: (
+                -1
+                if planned.estimated_size_bytes is None
+                else planned.estimated_size_bytes
+            ),
+            reverse=True,
+        )
+
+
+def _entity_uuid(export_config: ExportConfig, share_path: Path) -> UUID | None:
+    """Return the entity uuid of an object exported in a realization, as in its
+    metadata."""
+    ctx = export_config.runcontext
+    if ctx.fmu_context != FMUContext.realization or ctx.case_metadata is None:
+        return None
+    return build_entity(ctx.case_metadata.fmu.case.uuid, share_path).uuid
+
+
+def plan_export(export_config: ExportConfig, obj: ExportableData) -> PlannedExport:
+    """Plan the export of an object, without serializing it.
+
+    Raises:
+        ValueError: If the object is a table to partition, or a stream of record
+            batches, whose paths are only known when written.
+    """
+    if export_config.partition_by or isinstance(obj, pa.RecordBatchReader | Iterator):
+        raise ValueError(
+            "The export of a partitioned table or a stream of record batches can not "
+            "be planned."
+        )
+
+    objdata = create_object_data(obj, export_config)
+    share_path = SharePathConstructor(export_config, objdata).get_share_path()
+    return PlannedExport(
+        obj=obj,
+        absolute_path=(export_config.runcontext.exportroot / share_path).resolve(),
+        share_path=share_path,
+        entity_uuid=_entity_uuid(export_config, share_path),
+        estimated_size_bytes=estimate_serialized_size(objdata),
+        _export_config=export_config,
+        _objdata=objdata,
+    )
@@ -2,22 +2,44 @@
 
 from __future__ import annotations
 
+import shutil
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Final
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 import yaml
 
+from fmu.dataio._background import defer, get_deferred_exports
+from fmu.dataio._content_store import (
+    ContentStore,
+    get_content_store,
+    unlink_if_linked,
+)
 from fmu.dataio._logging import null_logger
-from fmu.dataio._metadata import (
-    SharePathConstructor,
-    _generate_metadata,
+from fmu.dataio._memory import memory_stage
+from fmu.dataio._metadata._file import SharePathConstructor
+from fmu.dataio._metadata._object import (
+    PartitionedParquetData,
+    StreamedTableData,
     create_object_data,
 )
+from fmu.dataio._metadata.core import _generate_metadata
+from fmu.dataio._staging import staged_files
 from fmu.dataio.exceptions import ValidationError
 from fmu.dataio.manifest._manifest import update_export_manifest
 from fmu.dataio.types import ExportableData
 
-from .serialize import export_object
+from .serialize import (
+    export_object,
+    serialize_to_buffer,
+    to_record_batch_reader,
+    write_record_batches,
+)
 
 if TYPE_CHECKING:
     from fmu.dataio._metadata import ObjectData
@@ -26,52 +48,314 @@ if TYPE_CHECKING:
 
 logger: Final = null_logger(__name__)
 
+# File names of the parts in a partitioned dataset, {i} is a counter
+PARTITION_BASENAME_TEMPLATE: Final = "part-{i}.parquet"
+
+# The maximum number of partitions of a dataset, e.g. a table of many realizations
+# partitioned on the realization has more partitions than the default of pyarrow
+MAX_PARTITIONS: Final = 1_000_000
+
+# The maximum number of parts open while writing a dataset, well below the common
+# limit of 1024 open files. A partition is written to several parts if its part is
+# closed to open the parts of other partitions.
+MAX_OPEN_PARTS: Final = 512
+
 
 def export_without_metadata(export_config: ExportConfig, obj: ExportableData) -> Path:
     """Export object without generating metadata."""
+    if written := _write_table_stream(export_config, obj):
+        return written.obj
+
     objdata = create_object_data(obj, export_config)
     share_path = SharePathConstructor(export_config, objdata).get_share_path()
     absolute_path = export_config.runcontext.exportroot / share_path
 
-    _write_object(absolute_path, objdata)
+    with staged_files(absolute_path) as (staged_path,):
+        _write_object(staged_path, objdata)
 
     return absolute_path
 
 
+@memory_stage("export")
 def export_with_metadata(export_config: ExportConfig, obj: ExportableData) -> Path:
     """Export object with full metadata."""
-    if export_config.standard_result is not None and export_config.config is None:
-        raise ValidationError(
-            "When exporting standard_results it is required to have a valid config."
+    _validate_config_for_standard_result(export_config)
+    objdata: ObjectData | None = _write_table_stream(export_config, obj)
+    if objdata is None:
+        with memory_stage("object_data"):
+            objdata = create_object_data(obj, export_config)
+    return export_objdata_with_metadata(export_config, objdata)
+
+
+def export_to_buffer(
+    export_config: ExportConfig, obj: ExportableData
+) -> tuple[memoryview, dict]:
+    """Serialize an object to memory, returning the serialized bytes together with
+    the metadata describing them.
+
+    The object is serialized once, and the checksum and size in the metadata are
+    computed from the returned bytes. The paths in the metadata are the paths the
+    object would have been exported to.
+    """
+    _validate_config_for_standard_result(export_config)
+    if export_config.partition_by:
+        raise ValueError("A table exported with 'partition_by' can not be in memory.")
+    if isinstance(obj, pa.RecordBatchReader | Iterator):
+        raise TypeError(
+            "A stream of record batches can only be exported to a file, not to memory."
         )
 
     objdata = create_object_data(obj, export_config)
-    metadata = _generate_metadata(export_config, objdata)
+    payload = serialize_to_buffer(objdata)
+    return payload, _generate_metadata(export_config, objdata)
+
+
+def export_objdata_with_metadata(
+    export_config: ExportConfig, objdata: ObjectData
+) -> Path:
+    """Export an already created object data instance with full metadata.
+
+    Useful when the object data must be created with information that has already
+    been derived from the object, e.g. its value statistics.
+
+    Within ``export_async()`` the export is deferred to the background worker, and
+    the path the object will be exported to is returned right away.
+    """
+    _validate_config_for_standard_result(export_config)
+
+    if get_deferred_exports() is not None:
+        defer(_export_objdata_with_metadata, export_config, objdata)
+        share_path = SharePathConstructor(export_config, objdata).get_share_path()
+        return (export_config.runcontext.exportroot / share_path).resolve()
+
+    return _export_objdata_with_metadata(export_config, objdata)
+
+
+def _export_objdata_with_metadata(
+    export_config: ExportConfig, objdata: ObjectData
+) -> Path:
+    """Generate the metadata for an object, and write the object and metadata."""
+    with memory_stage("metadata"):
+        metadata = _generate_metadata(export_config, objdata)
 
     outfile = Path(metadata["file"]["absolute_path"])
     metafile = outfile.parent / f".{outfile.name}.yml"
+    deduplicated = None
 
-    _write_object(outfile, objdata)
+    if _is_written_to(objdata, outfile):
+        # tables written as a stream or partitioned are already in place
+        with staged_files(metafile) as (staged_metafile,):
+            export_metadata_file(staged_metafile, metadata)
+    else:
+        store = _get_content_store(export_config)
+        with staged_files(outfile, metafile) as (staged_outfile, staged_metafile):
+            if store is None:
+                _write_object(staged_outfile, objdata)
+            else:
+                deduplicated = _write_object_to_store(
+                    store, staged_outfile, objdata, metadata
+                )
+            export_metadata_file(staged_metafile, metadata)
     logger.info("Actual file is %s", outfile)
-
-    export_metadata_file(metafile, metadata)
     logger.info("Metadata file is: %s", metafile)
 
-    _update_manifest_if_needed(export_config, outfile)
+    _update_manifest_if_needed(
+        export_config,
+        outfile,
+        size_bytes=None if deduplicated is None else metadata["file"]["size_bytes"],
+        deduplicated=deduplicated,
+    )
 
     return outfile
 
 
-def _update_manifest_if_needed(export_config: ExportConfig, outfile: Path) -> None:
+def _validate_config_for_standard_result(export_config: ExportConfig) -> None:
+    """Raise if exporting a standard result without a valid config."""
+    if export_config.standard_result is not None and export_config.config is None:
+        raise ValidationError(
+            "When exporting standard_results it is required to have a valid config."
+        )
+
+
+def _record_batch_reader(obj: ExportableData) -> pa.RecordBatchReader:
+    """Return a reader of the batches of a table."""
+    if (reader := to_record_batch_reader(obj)) is not None:
+        return reader
+    if isinstance(obj, pa.Table):
+        return obj.to_reader()
+    if isinstance(obj, pd.DataFrame):
+        return pa.Table.from_pandas(obj, preserve_index=False).to_reader()
+    raise TypeError(
+        "Only tables can be exported partitioned, i.e. a pyarrow Table, a pandas "
+        "DataFrame, a pyarrow RecordBatchReader or an iterator of pyarrow "
+        f"RecordBatches, not {type(obj).__name__}."
+    )
+
+
+def _validate_partition_by(export_config: ExportConfig, schema: pa.Schema) -> None:
+    """Raise if the partition columns are not table index columns in the table."""
+    partition_by = export_config.partition_by or []
+    table_index = export_config.table_index or []
+
+    if not_in_index := [col for col in partition_by if col not in table_index]:
+        raise ValueError(
+            f"The partition columns {not_in_index} must be part of the 'table_index'."
+        )
+    if not_in_table := [col for col in partition_by if col not in schema.names]:
+        raise KeyError(
+            f"The partition columns {not_in_table} are not present in the table"
+        )
+    if len(partition_by) == len(schema.names):
+        raise ValueError("At least one column must not be a partition column.")
+
+
+@contextmanager
+def _temporary_path(export_root: Path) -> Iterator[Path]:
+    """Yield a temporary path in the export root to write to, removed on exit unless
+    it has been moved into place."""
+    export_root.mkdir(parents=True, exist_ok=True)
+    path = export_root / f".{uuid.uuid4().hex}.tmp"
+    try:
+        yield path
+    finally:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+
+
+def _move_into_place(
+    path: Path, export_config: ExportConfig, objdata: ObjectData
+) -> Path:
+    """Move a written file or directory to its share path, replacing existing data."""
+    outpath = (
+        export_config.runcontext.exportroot
+        / SharePathConstructor(export_config, objdata).get_share_path()
+    )
+    outpath.parent.mkdir(parents=True, exist_ok=True)
+    if outpath.is_dir():
+        shutil.rmtree(outpath)
+    path.replace(outpath)
+    return outpath
+
+
+def _export_partitioned(
+    export_config: ExportConfig, obj: ExportableData
+) -> PartitionedParquetData:
+    """Write a table as a directory of parquet files partitioned in the Hive layout,
+    one batch at a time.
+
+    The dataset is written to a temporary directory in the export root, and moved
+    into place when complete, replacing an existing dataset. An empty table can not
+    be partitioned, as it has no parts.
+    """
+    reader = _record_batch_reader(obj)
+    _validate_partition_by(export_config, reader.schema)
+
+    with _temporary_path(export_config.runcontext.exportroot) as tmpdir:
+        ds.write_dataset(
+            reader,
+            tmpdir,
+            format="parquet",
+            partitioning=export_config.partition_by,
+            partitioning_flavor="hive",
+            basename_template=PARTITION_BASENAME_TEMPLATE,
+            existing_data_behavior="error",
+            max_partitions=MAX_PARTITIONS,
+            max_open_files=MAX_OPEN_PARTS,
+        )
+        if not tmpdir.exists():
+            raise ValueError(
+                "A table exported with 'partition_by' must have at least one row."
+            )
+        outdir = _move_into_place(
+            tmpdir, export_config, PartitionedParquetData(tmpdir, export_config)
+        )
+
+    logger.info("Partitioned dataset is %s", outdir)
+    return PartitionedParquetData(outdir, export_config)
+
+
+def _export_streamed(
+    export_config: ExportConfig, reader: pa.RecordBatchReader
+) -> StreamedTableData:
+    """Write a stream of record batches to a parquet file one batch at a time.
+
+    The file is written to a temporary file in the export root, and moved into place
+    when complete.
+    """
+    with _temporary_path(export_config.runcontext.exportroot) as tmpfile:
+        summary = write_record_batches(reader, tmpfile)
+        outfile = _move_into_place(
+            tmpfile, export_config, StreamedTableData(tmpfile, export_config, summary)
+        )
+
+    logger.info("Streamed table is %s", outfile)
+    return StreamedTableData(outfile, export_config, summary)
+
+
+def _write_table_stream(
+    export_config: ExportConfig, obj: ExportableData
+) -> PartitionedParquetData | StreamedTableData | None:
+    """Write tables that are partitioned or given as a stream of record batches, which
+    must be written before the metadata can be generated. Returns None for other
+    objects."""
+    if export_config.partition_by:
+        return _export_partitioned(export_config, obj)
+    if (reader := to_record_batch_reader(obj)) is not None:
+        return _export_streamed(export_config, reader)
+    return None
+
+
+def _update_manifest_if_needed(
+    export_config: ExportConfig,
+    outfile: Path,
+    size_bytes: int | None = None,
+    deduplicated: bool | None = None,
+) -> None:
     """Update the export manifest with a new path if inside FMU."""
     if not export_config.runcontext.inside_fmu:
         return
-    update_export_manifest(outfile, casepath=export_config.runcontext.casepath)
+    update_export_manifest(
+        outfile,
+        casepath=export_config.runcontext.casepath,
+        size_bytes=size_bytes,
+        deduplicated=deduplicated,
+    )
+
+
+def _get_content_store(export_config: ExportConfig) -> ContentStore | None:
+    """Return the content store to export to, if deduplicated writes are enabled."""
+    if not export_config.runcontext.inside_fmu:
+        return None
+    return get_content_store(export_config.runcontext.casepath)
+
+
+def _write_object_to_store(
+    store: ContentStore, file: Path, objdata: ObjectData, metadata: dict
+) -> bool:
+    """Write an object as a link to the content store, returns whether the object
+    was already stored."""
+    return store.write(
+        file,
+        checksum_md5=metadata["file"]["checksum_md5"],
+        size_bytes=metadata["file"]["size_bytes"],
+        write=lambda path: _write_object(path, objdata),
+    )
+
+
+def _is_written_to(objdata: ObjectData, file: Path) -> bool:
+    """Whether the object is a file or directory already written to the given path."""
+    obj = objdata.obj
+    return isinstance(obj, Path) and file.exists() and file.samefile(obj)
 
 
+@memory_stage("write")
 def _write_object(file: Path, objdata: ObjectData) -> None:
     """Write an object to a file, creating parent directories as needed."""
     file.parent.mkdir(parents=True, exist_ok=True)
+    # a file linked to the content store is shared and must not be written to
+    unlink_if_linked(file)
     export_object(objdata, file)
 
 
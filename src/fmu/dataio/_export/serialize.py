@@ -6,12 +6,18 @@ serialization logic based on the underlying object type while checksumming.
 
 from __future__ import annotations
 
+import hashlib
+import io
+import itertools
 import json
 import logging
+import shutil
+from collections.abc import Iterator
+from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
 
 import pandas as pd
 import pyarrow as pa
@@ -19,11 +25,15 @@ import pyarrow.parquet as pq
 import xtgeo
 
 from fmu.dataio._logging import null_logger
+from fmu.dataio._memory import memory_stage
+from fmu.dataio._metadata._object._tables import StreamedTableData
 from fmu.dataio._metadata._object._xtgeo import PointsData, PolygonsData
 from fmu.dataio._readers.faultroom import FaultRoomSurface
 from fmu.dataio._utils import md5sum
 from fmu.datamodels.fmu_results.enums import FileFormat
 
+from ._export_models import FilePartExport
+
 if TYPE_CHECKING:
     from fmu.dataio._metadata import ObjectData
 
@@ -34,11 +44,14 @@ def export_object(objdata: ObjectData, file: Path | BytesIO) -> None:
     """Serialize an ObjectData's underlying object to file or buffer.
 
     Dispatches based on the ObjectData subclass to select the correct serialization
-    format.
+    format. An object already serialized to memory is written as is.
     """
     obj = objdata.obj
 
-    if isinstance(obj, xtgeo.RegularSurface):
+    if objdata.serialized is not None:
+        _export_serialized(objdata.serialized, file)
+
+    elif isinstance(obj, xtgeo.RegularSurface):
         obj.to_file(file, fformat="irap_binary")
 
     elif isinstance(obj, xtgeo.TriangulatedSurface):
@@ -69,12 +82,58 @@ def export_object(objdata: ObjectData, file: Path | BytesIO) -> None:
     elif isinstance(obj, dict):
         _export_json(json.dumps(obj), file)
 
+    elif isinstance(obj, Path):
+        _export_file(obj, file)
+
     else:
         raise NotImplementedError(
             f"No export support for object type: {type(obj).__name__}"
         )
 
 
+def estimate_serialized_size(objdata: ObjectData) -> int | None:
+    """Estimate the size of an ObjectData's underlying object when serialized, without
+    serializing it.
+
+    The estimates are derived from the dimensions of the object and the layout of its
+    file format, and are meant for planning. Returns None if the size can not be
+    estimated cheaply.
+    """
+    obj = objdata.obj
+
+    if isinstance(obj, xtgeo.RegularSurface):
+        # 32-bit values, with a header and a record marker pair per row
+        return 100 + obj.ncol * obj.nrow * 4 + obj.nrow * 8
+
+    if isinstance(obj, xtgeo.Cube):
+        # a 240 bytes header and 32-bit samples per trace, after the file headers
+        return 3600 + obj.ncol * obj.nrow * (240 + 4 * obj.nlay)
+
+    if isinstance(obj, xtgeo.Grid):
+        # 32-bit pillar coordinates and corner depths, and a byte per actnum
+        npillars = (obj.ncol + 1) * (obj.nrow + 1)
+        return 24 * npillars + 16 * npillars * (obj.nlay + 1) + obj.ntotal
+
+    if isinstance(obj, xtgeo.GridProperty):
+        return 4 * obj.ntotal
+
+    if isinstance(objdata, (PolygonsData, PointsData)):
+        return int(objdata.obj_dataframe.memory_usage(index=False).sum())
+
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=False).sum())
+
+    if isinstance(obj, pa.Table):
+        return obj.nbytes
+
+    if isinstance(obj, Path):
+        if obj.is_dir():
+            return sum(p.stat().st_size for p in obj.rglob("*") if p.is_file())
+        return obj.stat().st_size
+
+    return None
+
+
 def _export_tabular_xtgeo(objdata: ObjectData, file: Path | BytesIO) -> None:
     """Export xtgeo Polygons or Points, respecting the configured format."""
     assert isinstance(objdata, (PolygonsData, PointsData))  # for mypy
@@ -99,12 +158,45 @@ def _export_json(serialized: str, file: Path | BytesIO) -> None:
         file.write(serialized.encode("utf-8"))
 
 
+def _export_serialized(serialized: memoryview, file: Path | BytesIO) -> None:
+    """Write serialized bytes to a file path or BytesIO buffer."""
+    if isinstance(file, Path):
+        with open(file, "wb") as stream:
+            stream.write(serialized)
+    else:
+        file.write(serialized)
+
+
+def _export_file(source: Path, file: Path | BytesIO) -> None:
+    """Copy an already written file to a file path or BytesIO buffer."""
+    if isinstance(file, Path):
+        if file.exists() and file.samefile(source):
+            return
+        shutil.copyfile(source, file)
+    else:
+        with open(source, "rb") as stream:
+            shutil.copyfileobj(stream, file)
+
+
+@memory_stage("checksum")
 def compute_md5_and_size(objdata: ObjectData) -> tuple[str, int]:
     """Compute MD5 checksum and size by serializing the object.
 
     Tries in-memory serialization first, falls back to a temporary file if the in-memory
-    approach fails (e.g., for very large objects).
+    approach fails (e.g., for very large objects). Objects already written to a file
+    are checksummed directly from the file.
     """
+    if isinstance(objdata, StreamedTableData):
+        return objdata.summary.checksum_md5, objdata.summary.size_bytes
+
+    if objdata.serialized is not None:
+        return hashlib.md5(objdata.serialized).hexdigest(), objdata.serialized.nbytes
+
+    if isinstance(objdata.obj, Path):
+        if objdata.obj.is_dir():
+            return compute_dataset_md5_and_size(compute_dataset_parts(objdata.obj))
+        return md5sum(objdata.obj), objdata.obj.stat().st_size
+
     try:
         return _compute_md5_from_buffer(objdata)
     except Exception as e:
@@ -115,6 +207,148 @@ def compute_md5_and_size(objdata: ObjectData) -> tuple[str, int]:
         return _compute_md5_from_tempfile(objdata)
 
 
+@dataclass(frozen=True)
+class TableStreamSummary:
+    """Summary of a table collected while it was written batch by batch."""
+
+    schema: pa.Schema
+    num_rows: int
+    null_counts: dict[str, int]
+    checksum_md5: str
+    size_bytes: int
+
+
+class _ChecksumWriter(io.RawIOBase):
+    """A write-only stream computing the MD5 checksum and size of the bytes written
+    through it."""
+
+    def __init__(self, stream: io.BufferedWriter) -> None:
+        super().__init__()
+        self._stream = stream
+        self._md5 = hashlib.md5()
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        view = memoryview(data)
+        self._md5.update(view)
+        self.size += view.nbytes
+        return self._stream.write(view)
+
+    def tell(self) -> int:
+        return self.size
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def hexdigest(self) -> str:
+        return self._md5.hexdigest()
+
+
+def to_record_batch_reader(obj: Any) -> pa.RecordBatchReader | None:
+    """Return a reader for a stream of record batches, i.e. a pyarrow RecordBatchReader
+    or an iterator of pyarrow RecordBatches, else None.
+
+    Raises:
+        ValueError: If the iterator is empty, as the schema is then unknown.
+    """
+    if isinstance(obj, pa.RecordBatchReader):
+        return obj
+    if not isinstance(obj, Iterator):
+        return None
+
+    first = next(obj, None)
+    if first is None:
+        raise ValueError("Can not export an empty iterator of record batches.")
+    if not isinstance(first, pa.RecordBatch):
+        raise TypeError(
+            "Only iterators of pyarrow RecordBatches can be exported, not of "
+            f"{type(first).__name__}."
+        )
+    return pa.RecordBatchReader.from_batches(
+        first.schema, itertools.chain([first], obj)
+    )
+
+
+def write_record_batches(
+    reader: pa.RecordBatchReader, file: Path
+) -> TableStreamSummary:
+    """Write the batches of a reader to a parquet file one at a time, collecting the
+    checksum, size, number of rows and null counts on the fly."""
+    schema = reader.schema
+    num_rows = 0
+    null_counts = dict.fromkeys(schema.names, 0)
+
+    with (
+        open(file, "wb") as stream,
+        _ChecksumWriter(stream) as checksum_writer,
+        pq.ParquetWriter(pa.PythonFile(checksum_writer, mode="w"), schema) as writer,
+    ):
+        for batch in reader:
+            writer.write_batch(batch)
+            num_rows += batch.num_rows
+            for name, column in zip(schema.names, batch.columns, strict=True):
+                null_counts[name] += column.null_count
+
+    logger.debug("Wrote %s rows to %s", num_rows, file)
+    return TableStreamSummary(
+        schema=schema,
+        num_rows=num_rows,
+        null_counts=null_counts,
+        checksum_md5=checksum_writer.hexdigest(),
+        size_bytes=checksum_writer.size,
+    )
+
+
+def compute_dataset_parts(directory: Path) -> list[FilePartExport]:
+    """Compute the MD5 checksum and size of each file in a dataset directory.
+
+    Hidden files and files starting with an underscore are not part of the dataset,
+    following the convention of pyarrow datasets.
+    """
+    parts = []
+    for path in sorted(directory.rglob("*")):
+        relative_path = path.relative_to(directory)
+        if not path.is_file() or any(
+            part.startswith((".", "_")) for part in relative_path.parts
+        ):
+            continue
+        parts.append(
+            FilePartExport(
+                relative_path=relative_path,
+                checksum_md5=md5sum(path),
+                size_bytes=path.stat().st_size,
+            )
+        )
+    return parts
+
+
+def compute_dataset_md5_and_size(parts: list[FilePartExport]) -> tuple[str, int]:
+    """Compute the MD5 checksum and size of a dataset directory from its parts.
+
+    The checksum is the MD5 checksum of the listing of the relative paths and checksums
+    of the parts, hence it changes if any part is changed, added, removed or renamed.
+    """
+    listing = "".join(
+        f"{part.relative_path.as_posix()} {part.checksum_md5}\n" for part in parts
+    )
+    return (
+        hashlib.md5(listing.encode("utf-8")).hexdigest(),
+        sum(part.size_bytes for part in parts),
+    )
+
+
+def serialize_to_buffer(objdata: ObjectData) -> memoryview:
+    """Serialize an ObjectData's underlying object to memory, and keep the result on
+    the ObjectData such that its checksum is computed without serializing again."""
+    buffer = BytesIO()
+    export_object(objdata, buffer)
+    objdata.serialized = buffer.getbuffer()
+    return objdata.serialized
+
+
 def _compute_md5_from_buffer(objdata: ObjectData) -> tuple[str, int]:
     """Compute MD5 sum and buffer size using in-memory buffer."""
     buffer = BytesIO()
@@ -59,11 +59,23 @@ class SumoUploaderInterface:
 
         self._queue.append(file)
 
-    def queue_table(self, table: pa.Table, metadata: dict[str, Any]) -> None:
-        """Stage a table for upload."""
+    def queue_table(
+        self,
+        table: pa.Table,
+        metadata: dict[str, Any],
+        *,
+        payload: bytes | memoryview | None = None,
+    ) -> None:
+        """Stage a table for upload.
+
+        The table is serialized unless already serialized to the payload, e.g. with
+        the same bytes the checksum in the metadata was computed from.
+        """
         from fmu.sumo.uploader._fileonjob import FileOnJob
 
-        table_bytes = pa_table_to_bytes(table)
+        table_bytes = (
+            bytes(payload) if payload is not None else pa_table_to_bytes(table)
+        )
         file = FileOnJob(table_bytes, metadata)
         self._queue_file(file, metadata)
 
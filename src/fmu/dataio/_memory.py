@@ -0,0 +1,213 @@
+"""Accounting of the peak memory used by each stage of an export.
+
+Large exports may run out of memory in one of several stages, e.g. when the value
+statistics are computed from a masked copy of the values, when the object is
+serialized to memory to compute its checksum, or when the object is written. Within a
+``memory_profile`` block the peak memory of each stage is recorded in a report.
+
+Two measures are recorded for each stage, both relative to the memory in use when the
+stage started:
+
+* The peak memory allocated through Python, including NumPy arrays, traced with
+  ``tracemalloc``.
+* The peak resident set size (RSS) of the process, sampled at a fixed interval. This
+  includes memory allocated by libraries outside Python, e.g. the xtgeo writers, but
+  short-lived peaks between two samples may be missed.
+
+Memory allocated by other threads while a stage runs is included in its peak, hence
+exports should be profiled one at a time. Tracing slows down all allocations, and
+profiling should only be enabled when investigating memory use.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+from fmu.dataio._logging import null_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger: Final = null_logger(__name__)
+
+_PAGE_SIZE: Final = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_bytes() -> int | None:
+    """Return the resident set size of the process, or None if not available."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _format_bytes(size: int | None) -> str:
+    return "n/a" if size is None else f"{size / 2**20:.1f} MiB"
+
+
+@dataclass(frozen=True)
+class StageMemory:
+    """The peak memory of an export stage over all the times it was run.
+
+    Attributes:
+        calls: The number of times the stage was run.
+        peak_traced_bytes: The peak memory allocated through Python, above the memory
+            allocated when the stage started.
+        peak_rss_bytes: The peak resident set size, above the resident set size when
+            the stage started. None if not available on this platform.
+    """
+
+    calls: int
+    peak_traced_bytes: int
+    peak_rss_bytes: int | None
+
+
+class MemoryReport:
+    """The peak memory of the export stages run within a ``memory_profile`` block,
+    by stage name."""
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageMemory] = {}
+
+    def __getitem__(self, stage: str) -> StageMemory:
+        return self.stages[stage]
+
+    def __contains__(self, stage: object) -> bool:
+        return stage in self.stages
+
+    def __str__(self) -> str:
+        lines = [f"{'stage':<20}{'calls':>8}{'peak traced':>16}{'peak RSS':>16}"]
+        lines.extend(
+            f"{name:<20}{stage.calls:>8}"
+            f"{_format_bytes(stage.peak_traced_bytes):>16}"
+            f"{_format_bytes(stage.peak_rss_bytes):>16}"
+            for name, stage in self.stages.items()
+        )
+        return "\n".join(lines)
+
+    def _record(self, name: str, traced: int, rss: int | None) -> None:
+        if previous := self.stages.get(name):
+            traced = max(traced, previous.peak_traced_bytes)
+            if rss is not None and previous.peak_rss_bytes is not None:
+                rss = max(rss, previous.peak_rss_bytes)
+        calls = previous.calls + 1 if previous else 1
+        self.stages[name] = StageMemory(calls, traced, rss)
+
+
+@dataclass
+class _OpenStage:
+    """The memory at the start of a running stage, and the peaks seen since."""
+
+    name: str
+    start_traced: int
+    start_rss: int | None
+    peak_traced: int
+    peak_rss: int | None
+
+
+_report: MemoryReport | None = None
+_open_stages: list[_OpenStage] = []
+_lock: Final = threading.Lock()
+
+
+def _update_peaks() -> None:
+    """Fold the peaks since the last update into the running stages. Must be called
+    with the lock held."""
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    rss = _rss_bytes()
+    for stage in _open_stages:
+        stage.peak_traced = max(stage.peak_traced, peak_traced)
+        if rss is not None and stage.peak_rss is not None:
+            stage.peak_rss = max(stage.peak_rss, rss)
+
+
+def _sample_rss(stop: threading.Event, interval: float) -> None:
+    while not stop.wait(interval):
+        with _lock:
+            _update_peaks()
+
+
+@contextmanager
+def memory_profile(rss_interval: float = 0.01) -> Iterator[MemoryReport]:
+    """Record the peak memory of each stage of the exports within the block.
+
+    The stages recorded are ``export`` for a full export with metadata, and within it
+    ``object_data``, ``value_statistics``, ``metadata``, ``checksum`` and ``write``.
+    The report is logged when the block is exited. Nested blocks add to the report of
+    the outermost block.
+
+    Args:
+        rss_interval: The number of seconds between each sample of the resident set
+            size of the process.
+
+    Examples:
+        Find the stage using the most memory when exporting a cube::
+
+            from fmu.dataio import ExportData, memory_profile
+
+            with memory_profile() as report:
+                ExportData(config=CFG, content="seismic").export(cube)
+            print(report)
+
+    """
+    global _report
+
+    if _report is not None:
+        yield _report
+        return
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    report = _report = MemoryReport()
+    stop = threading.Event()
+    sampler = threading.Thread(
+        target=_sample_rss, args=(stop, rss_interval), name="dataio-memory"
+    )
+    sampler.start()
+    try:
+        yield report
+    finally:
+        stop.set()
+        sampler.join()
+        _report = None
+        if started_tracing:
+            tracemalloc.stop()
+        logger.info("Peak memory of the export stages:\n%s", report)
+
+
+@contextmanager
+def memory_stage(name: str) -> Iterator[None]:
+    """Record the peak memory of an export stage, if within a ``memory_profile``
+    block. Can also be used as a decorator."""
+    report = _report
+    if report is None:
+        yield
+        return
+
+    with _lock:
+        _update_peaks()
+        traced, _ = tracemalloc.get_traced_memory()
+        rss = _rss_bytes()
+        running = _OpenStage(name, traced, rss, traced, rss)
+        _open_stages.append(running)
+    try:
+        yield
+    finally:
+        with _lock:
+            _update_peaks()
+            _open_stages.remove(running)
+            report._record(
+                name,
+                running.peak_traced - running.start_traced,
+                None
+                if running.peak_rss is None or running.start_rss is None
+                else running.peak_rss - running.start_rss,
+            )
@@ -1,8 +1,18 @@
 """Subpackage for creating metadata."""
 
+# The export package, which this package depends on, imports from the modules of this
+# package. Importing it first resolves the circular import in either order.
+import fmu.dataio._export  # noqa: F401
+
 from ._file import FileMetadata, ShareFolder, SharePathConstructor
 from ._fmu import ERT_RELATIVE_CASE_METADATA_FILE, FmuMetadata
-from ._object import ObjectData, create_object_data
+from ._object import (
+    ObjectData,
+    ParquetFileData,
+    PartitionedParquetData,
+    StreamedTableData,
+    create_object_data,
+)
 from .core import _generate_metadata, generate_export_metadata, generate_metadata
 
 __all__ = [
@@ -15,5 +25,8 @@ __all__ = [
     "ShareFolder",
     "FmuMetadata",
     "ObjectData",
+    "ParquetFileData",
+    "PartitionedParquetData",
+    "StreamedTableData",
     "create_object_data",
 ]
@@ -13,9 +13,14 @@ from typing import TYPE_CHECKING, Final
 
 from fmu.dataio._definitions import ShareFolder
 from fmu.dataio._export import ExportConfig
-from fmu.dataio._export.serialize import compute_md5_and_size
+from fmu.dataio._export._export_models import FileExport
+from fmu.dataio._export.serialize import (
+    compute_dataset_md5_and_size,
+    compute_dataset_parts,
+    compute_md5_and_size,
+)
 from fmu.dataio._logging import null_logger
-from fmu.datamodels.fmu_results import fields
+from fmu.dataio._validation import build_model
 from fmu.datamodels.fmu_results.enums import FMUContext
 
 logger: Final = null_logger(__name__)
@@ -145,7 +150,7 @@ class FileMetadata:
         self.runcontext = runcontext
         self.share_path = share_path
 
-    def get_metadata(self) -> fields.File:
+    def get_metadata(self) -> FileExport:
         casepath = self.runcontext.casepath
         exportroot = self.runcontext.exportroot
         share_path = self.share_path
@@ -153,10 +158,18 @@ class FileMetadata:
         absolute_path = exportroot / share_path
         relative_path = absolute_path.relative_to(casepath or exportroot)
 
-        checksum, size = compute_md5_and_size(self.objdata)
+        # datasets exported as a directory are checksummed part by part
+        obj = self.objdata.obj
+        if isinstance(obj, Path) and obj.is_dir():
+            parts = compute_dataset_parts(obj)
+            checksum, size = compute_dataset_md5_and_size(parts)
+        else:
+            parts = None
+            checksum, size = compute_md5_and_size(self.objdata)
 
         logger.info("Returning metadata pydantic model fields.File")
-        return fields.File(
+        return build_model(
+            FileExport,
             absolute_path=absolute_path.resolve(),
             relative_path=relative_path,
             runpath_relative_path=(
@@ -166,4 +179,5 @@ class FileMetadata:
             ),
             checksum_md5=checksum,
             size_bytes=size,
+            parts=parts,
         )
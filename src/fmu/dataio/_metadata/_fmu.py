@@ -41,6 +41,7 @@ from fmu.dataio import _utils
 from fmu.dataio._definitions import ERT_RELATIVE_CASE_METADATA_FILE
 from fmu.dataio._logging import null_logger
 from fmu.dataio._runcontext import FMUEnvironment
+from fmu.dataio._validation import build_model
 from fmu.dataio.exceptions import InvalidMetadataError
 from fmu.datamodels.fmu_results import fields
 from fmu.datamodels.fmu_results.enums import ErtSimulationMode, FMUContext
@@ -58,6 +59,12 @@ DEFAULT_ENSEMBLE_NAME: Final = "iter-0"
 logger: Final = null_logger(__name__)
 
 
+def build_entity(case_uuid: UUID | str, share_path: Path | None) -> fields.Entity:
+    """Construct the entity for an object from the case uuid and its share path."""
+    entity_uuid = _utils.uuid_from_string(f"{case_uuid}{share_path}")
+    return build_model(fields.Entity, uuid=entity_uuid)
+
+
 class FmuMetadata:
     """Class for providing metadata regarding the ERT run.
 
@@ -66,6 +73,7 @@ class FmuMetadata:
         runcontext: The context this is ran in, with paths and case metadata
         workflow: Descriptive work flow info
         share_path: The share path location for the object
+        aggregation: The aggregation over the ensemble the object is the result of
     """
 
     def __init__(
@@ -74,11 +82,13 @@ class FmuMetadata:
         model: fields.Model | None = None,
         workflow: Workflow | None = None,
         share_path: Path | None = None,
+        aggregation: fields.Aggregation | None = None,
     ) -> None:
         logger.info("Initialize %s...", self.__class__)
         self._model = model
         self._workflow = workflow
         self._share_path = share_path
+        self._aggregation = aggregation
         self._runcontext = runcontext
         self._env = FMUEnvironment.from_env()
 
@@ -106,6 +116,7 @@ class FmuMetadata:
         kwargs["ensemble"] = self._build_ensemble(ensemble_uuid)
 
         if context == FMUContext.ensemble:
+            kwargs["aggregation"] = self._aggregation
             return fields.FMU.model_validate(kwargs)
 
         kwargs["realization"] = self._build_realization(real_uuid)
@@ -148,8 +159,7 @@ class FmuMetadata:
         )
 
     def _build_entity(self, case_uuid: UUID) -> fields.Entity:
-        entity_uuid = _utils.uuid_from_string(f"{case_uuid}{self._share_path}")
-        return fields.Entity(uuid=entity_uuid)
+        return build_entity(case_uuid, self._share_path)
 
     def _derive_uuids(self, case_uuid: UUID) -> tuple[UUID, UUID]:
         ensemble_uuid = _utils.uuid_from_string(f"{case_uuid}{self._ensemble_name}")
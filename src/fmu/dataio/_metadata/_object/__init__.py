@@ -1,7 +1,11 @@
 from ._base import ObjectData
+from ._tables import ParquetFileData, PartitionedParquetData, StreamedTableData
 from .core import create_object_data
 
 __all__ = [
     "ObjectData",
+    "ParquetFileData",
+    "PartitionedParquetData",
+    "StreamedTableData",
     "create_object_data",
 ]
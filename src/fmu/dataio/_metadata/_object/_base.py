@@ -2,16 +2,21 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING, Final
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final, get_args
 
+from fmu.dataio._definitions import ValidationLevel
 from fmu.dataio._export import ExportConfig, UnsetData
 from fmu.dataio._logging import null_logger
+from fmu.dataio._validation import get_validation_level
 from fmu.datamodels.fmu_results.data import AnyData, SmdaEntity, Time, Timestamp
 from fmu.datamodels.fmu_results.global_configuration import (
     StratigraphyElement,
 )
 
 if TYPE_CHECKING:
+    from pydantic import BaseModel
+
     from fmu.dataio.types import ExportableData
     from fmu.datamodels.fmu_results.data import (
         BoundingBox2D,
@@ -28,6 +33,15 @@ if TYPE_CHECKING:
 logger: Final = null_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _data_models() -> dict[str, type[BaseModel]]:
+    """Return the data model of each content in the AnyData union."""
+    models = get_args(AnyData.model_fields["root"].annotation)
+    return {
+        get_args(model.model_fields["content"].annotation)[0]: model for model in models
+    }
+
+
 class ObjectData:
     """Base class for providing metadata for data objects in fmu-dataio, e.g. a surface.
 
@@ -43,6 +57,11 @@ class ObjectData:
         self.obj = obj
         self.export_config = export_config
 
+        # The object serialized to memory, if already done e.g. when exporting to a
+        # buffer. The checksum is then computed from it, and it is written as is,
+        # instead of serializing again.
+        self.serialized: memoryview | None = None
+
         self._validate_config()
         self._strat_element = self._resolve_stratigraphy()
         self._time = self._resolve_timedata()
@@ -155,8 +174,16 @@ class ObjectData:
         if cfg.content_metadata:
             data[cfg.content] = cfg.content_metadata
 
-        model = UnsetData if cfg.content == "unset" else AnyData
-        return model.model_validate(data)
+        if get_validation_level() == ValidationLevel.full:
+            model = UnsetData if cfg.content == "unset" else AnyData
+            return model.model_validate(data)
+
+        # the values are resolved from validated models and configuration, hence
+        # they are not validated again when the validation level is lowered
+        if cfg.content == "unset":
+            return UnsetData.model_construct(None, **data)
+        content_model = _data_models()[cfg.content]
+        return AnyData.model_construct(root=content_model.model_construct(None, **data))
 
     @property
     def name(self) -> str:
@@ -3,6 +3,9 @@ from __future__ import annotations
 import warnings
 from typing import TYPE_CHECKING, Final
 
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
 from fmu.dataio._definitions import (
     STANDARD_TABLE_INDEX_COLUMNS,
     ExportFolder,
@@ -22,9 +25,14 @@ from ._base import ObjectData
 from ._utils import is_empty_column
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     import pandas as pd
     import pyarrow as pa
 
+    from fmu.dataio._export import ExportConfig
+    from fmu.dataio._export.serialize import TableStreamSummary
+
 logger: Final = null_logger(__name__)
 
 
@@ -146,6 +154,13 @@ def _drop_empty_table_index_columns(
 ) -> list[str]:
     """Drop table index columns if they have only empty values."""
     empty_columns = [col for col in table_index if is_empty_column(table, col)]
+    return _drop_table_index_columns(table_index, empty_columns)
+
+
+def _drop_table_index_columns(
+    table_index: list[str], empty_columns: list[str]
+) -> list[str]:
+    """Drop the empty columns from the table index, with a warning."""
     if empty_columns:
         warnings.warn(
             "The following table index columns are dropped due to having "
@@ -264,3 +279,239 @@ class ArrowTableData(ObjectData):
             num_rows=self.obj.num_rows,
             size=self.obj.num_columns * self.obj.num_rows,
         )
+
+
+def _column_null_count(metadata: pq.FileMetaData, index: int) -> int | None:
+    """Return the null count of a column in a parquet file from the row group
+    statistics, or None if some row groups have no statistics."""
+    null_count = 0
+    for row_group in range(metadata.num_row_groups):
+        statistics = metadata.row_group(row_group).column(index).statistics
+        if statistics is None or statistics.null_count is None:
+            return None
+        null_count += statistics.null_count
+    return null_count
+
+
+def _is_empty_parquet_column(parquet_file: pq.ParquetFile, column: str) -> bool:
+    """Check if a column in a parquet file only has null values, using the row group
+    statistics. Columns without statistics are not considered empty."""
+    metadata = parquet_file.metadata
+    index = parquet_file.schema_arrow.get_field_index(column)
+    return _column_null_count(metadata, index) == metadata.num_rows
+
+
+class ParquetFileData(ObjectData):
+    """Object data for a table that has already been written to a parquet file.
+
+    Only the schema and the file metadata are read, hence this can be used for
+    tables that are too large to be held in memory.
+    """
+
+    obj: Path
+
+    def __init__(self, obj: Path, export_config: ExportConfig) -> None:
+        self._parquet_file = pq.ParquetFile(obj)
+        super().__init__(obj, export_config)
+
+    @property
+    def classname(self) -> ObjectMetadataClass:
+        return ObjectMetadataClass.table
+
+    @property
+    def efolder(self) -> str:
+        return self.export_config.forcefolder or ExportFolder.tables.value
+
+    @property
+    def extension(self) -> str:
+        return FileExtension.parquet.value
+
+    @property
+    def fmt(self) -> FileFormat:
+        return FileFormat.parquet
+
+    @property
+    def layout(self) -> Layout:
+        return Layout.table
+
+    @property
+    def table_index(self) -> list[str]:
+        """Return the table index."""
+        table_index = _derive_index(
+            table_index=self.export_config.table_index,
+            table_columns=self._parquet_file.schema_arrow.names,
+            content=self.export_config.content_enum,
+        )
+        # tables aggregated over realizations are indexed by the realization
+        if (
+            "REAL" in self._parquet_file.schema_arrow.names
+            and "REAL" not in table_index
+        ):
+            table_index = [*table_index, "REAL"]
+        return [
+            col
+            for col in table_index
+            if not _is_empty_parquet_column(self._parquet_file, col)
+        ]
+
+    def get_geometry(self) -> None:
+        """Derive data.geometry for a parquet file."""
+
+    def get_bbox(self) -> None:
+        """Derive data.bbox for a parquet file."""
+
+    def get_spec(self) -> TableSpecification:
+        """Derive data.spec for a parquet file."""
+        logger.info("Get spec for parquet file (tables)")
+        metadata = self._parquet_file.metadata
+        return TableSpecification(
+            columns=self._parquet_file.schema_arrow.names,
+            num_columns=metadata.num_columns,
+            num_rows=metadata.num_rows,
+            size=metadata.num_columns * metadata.num_rows,
+        )
+
+
+class StreamedTableData(ObjectData):
+    """Object data for a table that has been streamed batch by batch to a parquet file.
+
+    The checksum, specification and table index are derived from the summary
+    collected while writing, hence the table is never read back.
+    """
+
+    obj: Path
+
+    def __init__(
+        self, obj: Path, export_config: ExportConfig, summary: TableStreamSummary
+    ) -> None:
+        self.summary = summary
+        super().__init__(obj, export_config)
+
+    @property
+    def classname(self) -> ObjectMetadataClass:
+        return ObjectMetadataClass.table
+
+    @property
+    def efolder(self) -> str:
+        return self.export_config.forcefolder or ExportFolder.tables.value
+
+    @property
+    def extension(self) -> str:
+        return FileExtension.parquet.value
+
+    @property
+    def fmt(self) -> FileFormat:
+        return FileFormat.parquet
+
+    @property
+    def layout(self) -> Layout:
+        return Layout.table
+
+    @property
+    def table_index(self) -> list[str]:
+        """Return the table index."""
+        table_index = _derive_index(
+            table_index=self.export_config.table_index,
+            table_columns=self.summary.schema.names,
+            content=self.export_config.content_enum,
+        )
+        empty_columns = [
+            col
+            for col in table_index
+            if self.summary.null_counts[col] == self.summary.num_rows
+        ]
+        return _drop_table_index_columns(table_index, empty_columns)
+
+    def get_geometry(self) -> None:
+        """Derive data.geometry for a streamed table."""
+
+    def get_bbox(self) -> None:
+        """Derive data.bbox for a streamed table."""
+
+    def get_spec(self) -> TableSpecification:
+        """Derive data.spec for a streamed table."""
+        logger.info("Get spec for streamed table (tables)")
+        num_columns = len(self.summary.schema.names)
+        return TableSpecification(
+            columns=self.summary.schema.names,
+            num_columns=num_columns,
+            num_rows=self.summary.num_rows,
+            size=num_columns * self.summary.num_rows,
+        )
+
+
+class PartitionedParquetData(ObjectData):
+    """Object data for a table that has been written as a directory of parquet files,
+    partitioned on some of the table index columns in the Hive layout.
+
+    Only the schema and the file metadata of the parts are read, hence this can be used
+    for tables that are too large to be held in memory.
+    """
+
+    obj: Path
+
+    def __init__(self, obj: Path, export_config: ExportConfig) -> None:
+        self._dataset = ds.dataset(obj, format="parquet", partitioning="hive")
+        self._parts = [fragment.metadata for fragment in self._dataset.get_fragments()]
+        super().__init__(obj, export_config)
+
+    @property
+    def classname(self) -> ObjectMetadataClass:
+        return ObjectMetadataClass.table
+
+    @property
+    def efolder(self) -> str:
+        return self.export_config.forcefolder or ExportFolder.tables.value
+
+    @property
+    def extension(self) -> str:
+        return FileExtension.parquet.value
+
+    @property
+    def fmt(self) -> FileFormat:
+        return FileFormat.parquet
+
+    @property
+    def layout(self) -> Layout:
+        return Layout.table
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows in all parts."""
+        return sum(part.num_rows for part in self._parts)
+
+    def _is_empty_column(self, column: str) -> bool:
+        """Check if a column only has null values in all parts. The partition columns
+        are not stored in the parts, and are never considered empty."""
+        for part in self._parts:
+            index = part.schema.to_arrow_schema().get_field_index(column)
+            if index < 0 or _column_null_count(part, index) != part.num_rows:
+                return False
+        return True
+
+    @property
+    def table_index(self) -> list[str]:
+        """Return the table index."""
+        table_index = _derive_index(
+            table_index=self.export_config.table_index,
+            table_columns=self._dataset.schema.names,
+            content=self.export_config.content_enum,
+        )
+        return [col for col in table_index if not self._is_empty_column(col)]
+
+    def get_geometry(self) -> None:
+        """Derive data.geometry for a partitioned parquet dataset."""
+
+    def get_bbox(self) -> None:
+        """Derive data.bbox for a partitioned parquet dataset."""
+
+    def get_spec(self) -> TableSpecification:
+        """Derive data.spec for a partitioned parquet dataset."""
+        logger.info("Get spec for partitioned parquet dataset (tables)")
+        num_columns = len(self._dataset.schema.names)
+        return TableSpecification(
+            columns=self._dataset.schema.names,
+            num_columns=num_columns,
+            num_rows=self.num_rows,
+            size=num_columns * self.num_rows,
+        )
@@ -7,6 +7,7 @@ import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
 
+from fmu.dataio._memory import memory_stage
 from fmu.datamodels.fmu_results.specification import Statistics
 
 if TYPE_CHECKING:
@@ -50,6 +51,7 @@ def is_empty_column(table: pd.DataFrame | pa.Table, column: str) -> bool:
     return is_empty_column_pandas(table, column)
 
 
+@memory_stage("value_statistics")
 def get_value_statistics(values: np.ndarray) -> Statistics | None:
     """Get statistics for valid values in a numpy array."""
     values = np.ma.masked_invalid(values)
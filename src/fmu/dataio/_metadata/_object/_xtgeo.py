@@ -35,6 +35,7 @@ if TYPE_CHECKING:
     import pandas as pd
 
     from fmu.dataio.types import ExportableData
+    from fmu.datamodels.fmu_results.specification import Statistics
 
 logger: Final = null_logger(__name__)
 
@@ -602,6 +603,17 @@ class CPGridData(ObjectData):
 class CPGridPropertyData(ObjectData):
     obj: xtgeo.GridProperty
 
+    def __init__(
+        self,
+        obj: xtgeo.GridProperty,
+        export_config: ExportConfig,
+        value_statistics: Statistics | None = None,
+    ) -> None:
+        # statistics already derived from the property values, e.g. during
+        # validation, are reused to avoid another pass over the values
+        self._value_statistics = value_statistics
+        super().__init__(obj, export_config)
+
     @property
     def classname(self) -> ObjectMetadataClass:
         return ObjectMetadataClass.cpgrid_property
@@ -638,7 +650,9 @@ class CPGridPropertyData(ObjectData):
             ncol=self.obj.ncol,
             nlay=self.obj.nlay,
             codenames=self.obj.codes if self.obj.isdiscrete else None,
-            value_statistics=get_value_statistics(self.obj.values),
+            value_statistics=(
+                self._value_statistics or get_value_statistics(self.obj.values)
+            ),
         )
 
     def get_geometry(self) -> Geometry | None:
@@ -0,0 +1,215 @@
+"""Metadata templates for objects exported in the same context.
+
+Apart from the ``class``, ``data``, ``file`` and ``display`` blocks, the entity in the
+``fmu`` block and the tracklog timestamp, the metadata is identical for all objects
+exported in the same context, e.g. within one realization. Building and validating
+the ``fmu``, ``masterdata``, ``access`` and ``tracklog`` blocks involves reading the
+environment, deriving uuids, possibly reading the case metadata of a restart case and
+collecting system information, which is unnecessary to repeat for every object.
+
+The fully validated metadata of the first object exported in a context is kept as a
+template, dumped in JSON mode, and only the object specific parts are replaced for the
+following objects. The rendered metadata is still validated as a whole, unless the
+validation level is lowered.
+
+Templates are kept for the lifetime of the process, for at most ``MAX_TEMPLATES``
+contexts, and are shared by all threads. A template is only used for exports with an
+identical key, which holds all the inputs the shared blocks are derived from, so a
+template is never used for an export whose shared blocks would differ. Templates are
+not modified once stored, and every rendered metadata is a copy.
+"""
+
+from __future__ import annotations
+
+import datetime
+import os
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from pydantic import TypeAdapter
+
+from fmu.dataio._logging import null_logger
+from fmu.dataio._runcontext import FMUEnvironment
+from fmu.dataio._validation import build_model
+from fmu.datamodels.fmu_results import fields
+from fmu.datamodels.fmu_results.global_configuration import GlobalConfiguration
+
+from ._file import FileMetadata
+from ._fmu import RESTART_PATH_ENVNAME, build_entity
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from fmu.dataio._export import ExportConfig
+    from fmu.datamodels import Asset, Masterdata, TracklogSource
+    from fmu.datamodels.common.enums import Classification
+    from fmu.datamodels.fmu_results.enums import FMUContext
+    from fmu.datamodels.fmu_results.fmu_results import CaseMetadata
+
+    from ._object import ObjectData
+
+logger: Final = null_logger(__name__)
+
+# Maximum number of contexts to keep templates for
+MAX_TEMPLATES: Final = 16
+
+_DATETIME_ADAPTER: Final = TypeAdapter(datetime.datetime)
+
+
+@dataclass(frozen=True)
+class _TemplateKey:
+    """The parts of an export that the shared metadata blocks are derived from."""
+
+    # Run context
+    inside_fmu: bool
+    fmu_context: FMUContext | None
+    casepath: Path | None
+    runpath: Path | None
+    ensemble_name: str | None
+    realization_name: str | None
+    case_metadata: CaseMetadata | None
+
+    # Environment read when building the metadata
+    environment: FMUEnvironment
+    restart_path: str | None
+    komodo_release: str | None
+
+    # Global configuration
+    model: fields.Model | None
+    masterdata: Masterdata | None
+    asset: Asset | None
+
+    # Export configuration
+    workflow: fields.Workflow | None
+    classification: Classification
+    rep_include: bool
+    preprocessed: bool
+    tracklog_source: TracklogSource | None
+    aggregation: fields.Aggregation | None
+
+    @classmethod
+    def from_export_config(cls, export_config: ExportConfig) -> _TemplateKey:
+        ctx = export_config.runcontext
+        config = export_config.config
+        global_config = config if isinstance(config, GlobalConfiguration) else None
+
+        return cls(
+            inside_fmu=ctx.inside_fmu,
+            fmu_context=ctx.fmu_context,
+            casepath=ctx.casepath,
+            runpath=ctx.runpath,
+            ensemble_name=ctx.paths.ensemble_name,
+            realization_name=ctx.paths.realization_name,
+            case_metadata=ctx.case_metadata,
+            environment=FMUEnvironment.from_env(),
+            restart_path=os.getenv(RESTART_PATH_ENVNAME),
+            komodo_release=os.getenv(
+                "KOMODO_RELEASE", os.getenv("KOMODO_RELEASE_BACKUP")
+            ),
+            model=config.model if config else None,
+            masterdata=global_config.masterdata if global_config else None,
+            asset=global_config.access.asset if global_config else None,
+            workflow=export_config.workflow,
+            classification=export_config.classification,
+            rep_include=export_config.rep_include,
+            preprocessed=export_config.preprocessed,
+            tracklog_source=export_config.tracklog_source,
+            aggregation=export_config.aggregation,
+        )
+
+
+def _dump(model: Any) -> Any:
+    return model.model_dump(mode="json", exclude_none=True, by_alias=True)
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy JSON-mode metadata, faster than a generic deep copy."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+class MetadataTemplate:
+    """Fully validated metadata from an object, used as template for other objects
+    exported in the same context.
+
+    Args:
+        metadata: The metadata of an object, dumped in JSON mode.
+    """
+
+    def __init__(self, metadata: dict[str, Any]) -> None:
+        self._metadata = _copy_json(metadata)
+
+    def render(
+        self, export_config: ExportConfig, objdata: ObjectData, share_path: Path
+    ) -> dict[str, Any]:
+        """Return the metadata for an object, with the object specific parts replaced.
+
+        Args:
+            export_config: Configuration being used to export the object.
+            objdata: Provides metadata about the object itself.
+            share_path: The share path the object will be exported to.
+        """
+        object_blocks = {
+            "class": objdata.classname.value,
+            "data": _dump(objdata.get_metadata()),
+            "file": _dump(
+                FileMetadata(
+                    export_config.runcontext, objdata, share_path
+                ).get_metadata()
+            ),
+            "display": _dump(
+                build_model(
+                    fields.Display, name=export_config.display.name or objdata.name
+                )
+            ),
+        }
+
+        metadata = {
+            key: object_blocks[key] if key in object_blocks else _copy_json(value)
+            for key, value in self._metadata.items()
+        }
+
+        if (fmu := metadata.get("fmu")) and "entity" in fmu:
+            fmu["entity"] = _dump(build_entity(fmu["case"]["uuid"], share_path))
+
+        metadata["tracklog"][0]["datetime"] = _DATETIME_ADAPTER.dump_python(
+            datetime.datetime.now(datetime.UTC), mode="json"
+        )
+        return metadata
+
+
+_templates: list[tuple[_TemplateKey, MetadataTemplate]] = []
+_lock: Final = threading.Lock()
+
+
+def get_metadata_template(export_config: ExportConfig) -> MetadataTemplate | None:
+    """Return the metadata template for the context of the export config, if any."""
+    key = _TemplateKey.from_export_config(export_config)
+    with _lock:
+        for template_key, template in _templates:
+            if template_key == key:
+                return template
+    return None
+
+
+def store_metadata_template(
+    export_config: ExportConfig, metadata: dict[str, Any]
+) -> None:
+    """Keep the metadata as template for objects exported in the same context."""
+    key = _TemplateKey.from_export_config(export_config)
+    with _lock:
+        if any(template_key == key for template_key, _ in _templates):
+            return
+        _templates.append((key, MetadataTemplate(metadata)))
+        del _templates[:-MAX_TEMPLATES]
+    logger.debug("Stored metadata template, %s templates in total", len(_templates))
+
+
+def clear_metadata_templates() -> None:
+    """Remove all stored metadata templates."""
+    with _lock:
+        _templates.clear()
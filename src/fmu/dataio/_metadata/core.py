@@ -10,10 +10,20 @@ dependencies on the internals.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any, Final
 
+import pyarrow as pa
+
+from fmu.dataio._definitions import ValidationLevel
 from fmu.dataio._export import ExportConfig, ObjectMetadataExport
 from fmu.dataio._logging import null_logger
+from fmu.dataio._validation import (
+    build_model,
+    defer_validation,
+    get_validation_level,
+    validate_metadata,
+)
 from fmu.dataio.exceptions import InvalidMetadataError
 from fmu.dataio.types import ExportableData
 from fmu.dataio.version import __version__
@@ -24,6 +34,7 @@ from fmu.datamodels.fmu_results.global_configuration import GlobalConfiguration
 from ._file import FileMetadata, SharePathConstructor
 from ._fmu import FmuMetadata
 from ._object import ObjectData, create_object_data
+from ._template import get_metadata_template, store_metadata_template
 
 logger: Final = null_logger(__name__)
 
@@ -55,7 +66,13 @@ def generate_export_metadata(
     config = export_config.config
     global_config = config if isinstance(config, GlobalConfiguration) else None
 
-    return ObjectMetadataExport(  # type: ignore[call-arg]
+    # the parts are validated already when not validating fully
+    model = (
+        ObjectMetadataExport
+        if get_validation_level() == ValidationLevel.full
+        else ObjectMetadataExport.model_construct
+    )
+    return model(  # type: ignore[call-arg]
         class_=objdata.classname,
         fmu=_build_fmu_metadata(export_config, share_path),
         masterdata=global_config.masterdata if global_config else None,
@@ -70,7 +87,9 @@ def generate_export_metadata(
         data=objdata.get_metadata(),
         file=FileMetadata(ctx, objdata, share_path).get_metadata(),
         tracklog=Tracklog.initialize(__version__, export_config.tracklog_source),
-        display=fields.Display(name=export_config.display.name or objdata.name),
+        display=build_model(
+            fields.Display, name=export_config.display.name or objdata.name
+        ),
         preprocessed=export_config.preprocessed,
     )
 
@@ -79,6 +98,16 @@ def generate_metadata(
     export_config: ExportConfig, obj: ExportableData
 ) -> dict[str, Any]:
     """Generate metadata without exporting."""
+    if export_config.partition_by:
+        # the checksums of the parts are only known when the parts are written
+        raise ValueError(
+            "Metadata for a table exported with 'partition_by' is generated on export."
+        )
+    if isinstance(obj, pa.RecordBatchReader | Iterator):
+        # a stream can only be consumed once
+        raise ValueError(
+            "Metadata for a stream of record batches is generated on export."
+        )
     objdata = create_object_data(obj, export_config)
     return _generate_metadata(export_config, objdata)
 
@@ -86,11 +115,36 @@ def generate_metadata(
 def _generate_metadata(
     export_config: ExportConfig, objdata: ObjectData
 ) -> dict[str, Any]:
-    """Generate metadata without exporting."""
-    return generate_export_metadata(
-        objdata=objdata,
-        export_config=export_config,
-    ).model_dump(mode="json", exclude_none=True, by_alias=True)
+    """Generate metadata without exporting.
+
+    The metadata blocks shared by all objects exported in the same context are only
+    built for the first object, and reused for the following objects. How thoroughly
+    the metadata is validated is given by the validation level, where the 'full'
+    level validates the complete metadata of every object.
+    """
+    level = get_validation_level()
+
+    if template := get_metadata_template(export_config):
+        share_path = SharePathConstructor(export_config, objdata).get_share_path()
+        metadata = template.render(export_config, objdata, share_path)
+
+        # the rendered metadata is validated as a whole, like when built from models
+        if level == ValidationLevel.full:
+            validate_metadata([metadata])
+    else:
+        metadata = generate_export_metadata(
+            objdata=objdata,
+            export_config=export_config,
+        ).model_dump(mode="json", exclude_none=True, by_alias=True)
+
+        # a single check of the complete metadata before it is used as template
+        if level != ValidationLevel.full:
+            validate_metadata([metadata])
+        store_metadata_template(export_config, metadata)
+
+    if level == ValidationLevel.deferred:
+        defer_validation(metadata)
+    return metadata
 
 
 def _build_fmu_metadata(
@@ -106,6 +160,7 @@ def _build_fmu_metadata(
         model=export_config.config.model if export_config.config else None,
         workflow=export_config.workflow,
         share_path=share_path,
+        aggregation=export_config.aggregation,
     )
     try:
         return provider.get_metadata()
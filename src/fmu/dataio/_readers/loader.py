@@ -0,0 +1,225 @@
+"""Module for loading exported data objects together with their metadata.
+
+The data are read as cheaply as the file format allows. Parquet files are memory
+mapped, partitioned parquet datasets are opened as lazy pyarrow datasets, and the
+values of irap binary surfaces are read in one pass through a memory map of the value
+block and copied once into the surface. Other formats are delegated to xtgeo and
+pandas.
+
+The object is only read when it is first accessed, hence loading many objects only to
+look at their metadata does not read the data. Roff grids and properties, segy cubes
+and the other formats read by xtgeo and pandas are not lazy beyond this; they are read
+in full into memory when the object is first accessed.
+
+Loaded objects are only cached within a ``cached_loads`` block, keyed on the path and
+modification time of the file. The cache holds at most ``LOAD_CACHE_SIZE`` objects and
+is released when the block is left, or emptied with ``clear_load_cache``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Final
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import xtgeo
+from xtgeo.common.constants import UNDEF_MAP_IRAPB
+
+from fmu.dataio._logging import null_logger
+from fmu.dataio._utils import read_metadata_from_file
+from fmu.datamodels.fmu_results.enums import FileFormat, ObjectMetadataClass
+
+from .values import irap_binary_layout
+
+logger: Final = null_logger(__name__)
+
+# Number of loaded objects kept in the cache of a cached_loads block
+LOAD_CACHE_SIZE: Final = 32
+
+_cache: ContextVar[OrderedDict[tuple[Path, int], LoadedData] | None] = ContextVar(
+    "load_cache", default=None
+)
+
+
+@dataclass(frozen=True)
+class LoadedData:
+    """An exported object together with its metadata.
+
+    The object is read from the file when first accessed.
+    """
+
+    path: Path
+    """The path to the exported file or directory."""
+
+    metadata: dict[str, Any]
+    """The metadata of the object."""
+
+    @cached_property
+    def obj(self) -> Any:
+        """The exported object."""
+        return _read_object(self.path, self.metadata)
+
+
+def load(filename: str | Path) -> LoadedData:
+    """Load an exported object together with its metadata.
+
+    The object is read lazily, and as cheaply as the file format allows:
+
+    - parquet files are memory mapped and returned as a pyarrow Table
+    - partitioned parquet datasets are returned as a lazy pyarrow Dataset
+    - irap binary surfaces are read through a memory map of the value block, and the
+      values are copied once into the returned surface
+    - other formats, e.g. roff and segy, are read in full with xtgeo when first
+      accessed, and are not memory mapped or read lazily
+
+    Within a ``cached_loads`` block, repeated loads of an unchanged file return the same
+    loaded object, which should then be copied before being modified. Outside such a
+    block every call loads the file anew.
+
+    Example::
+
+        loaded = dataio.load("share/results/maps/topvolantis--depth.gri")
+        surface, metadata = loaded.obj, loaded.metadata
+
+    Args:
+        filename: The full path filename to the data-object.
+
+    Returns:
+        The loaded object and its metadata.
+    """
+    path = Path(filename).resolve()
+    key = (path, path.stat().st_mtime_ns)
+
+    cache = _cache.get()
+    if cache is None:
+        return _load(path)
+
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    loaded = cache[key] = _load(path)
+    while len(cache) > LOAD_CACHE_SIZE:
+        cache.popitem(last=False)
+    return loaded
+
+
+def _load(path: Path) -> LoadedData:
+    """Load the metadata of an object."""
+    logger.debug("Loading %s", path)
+    return LoadedData(path, read_metadata_from_file(path))
+
+
+@contextmanager
+def cached_loads() -> Iterator[None]:
+    """Cache the objects loaded with ``load`` within the block.
+
+    Repeated loads of an unchanged file are served from a cache keyed on the path and
+    the modification time of the file, holding the ``LOAD_CACHE_SIZE`` most recently
+    loaded objects. The cached objects keep their data, memory maps and open files
+    alive, hence the cache is released when the block is left. A nested block shares
+    the cache of the enclosing block.
+
+    The cache applies to the current thread or asyncio task.
+
+    Examples:
+        Load the same surfaces in several steps of a workflow::
+
+            from fmu.dataio import cached_loads, load
+
+            with cached_loads():
+                for step in steps:
+                    step(load("share/results/maps/topvolantis--depth.gri").obj)
+
+    """
+    if _cache.get() is not None:
+        yield
+        return
+
+    token = _cache.set(OrderedDict())
+    try:
+        yield
+    finally:
+        _cache.reset(token)
+
+
+def clear_load_cache() -> None:
+    """Release the objects cached in the current ``cached_loads`` block."""
+    cache = _cache.get()
+    if cache is not None:
+        cache.clear()
+
+
+def _read_object(path: Path, metadata: dict[str, Any]) -> Any:
+    """Read the object in a file given the format and class in its metadata."""
+    fmt = metadata["data"]["format"]
+    classname = metadata["class"]
+    logger.debug("Reading %s of class %s and format %s", path, classname, fmt)
+
+    if fmt == FileFormat.irap_binary:
+        return _read_irap_binary(path)
+
+    if fmt == FileFormat.roff:
+        if classname == ObjectMetadataClass.cpgrid:
+            return xtgeo.grid_from_file(path, fformat="roff")
+        return xtgeo.gridproperty_from_file(path, fformat="roff")
+
+    if fmt == FileFormat.segy:
+        return xtgeo.cube_from_file(path, fformat="segy")
+
+    if fmt == FileFormat.tsurf:
+        return xtgeo.triangulated_surface_from_file(path, fformat="tsurf")
+
+    if fmt == FileFormat.irap_ascii:
+        if classname == ObjectMetadataClass.points:
+            return xtgeo.points_from_file(path, fformat="xyz")
+        return xtgeo.polygons_from_file(path, fformat="xyz")
+
+    if fmt == FileFormat.parquet:
+        return _read_parquet(path)
+
+    if fmt in (FileFormat.csv, FileFormat.csv_xtgeo):
+        return pd.read_csv(path)
+
+    if fmt == FileFormat.json:
+        with open(path, encoding="utf-8") as stream:
+            return json.load(stream)
+
+    raise NotImplementedError(f"No load support for the file format: {fmt}")
+
+
+def _read_irap_binary(path: Path) -> xtgeo.RegularSurface:
+    """Read an irap binary surface, with the values read through a memory map.
+
+    The values are copied when assigned to the surface, as xtgeo keeps its own masked
+    array of the values."""
+    ncol, nrow, layout = irap_binary_layout(path)
+    if layout is None:
+        return xtgeo.surface_from_file(path, fformat="irap_binary")
+
+    # the values are stored row by row with the column index running fastest
+    values = layout.array()
+    if values.shape != (nrow, ncol):
+        values = layout.read(0, ncol * nrow).reshape(nrow, ncol)
+
+    surf = xtgeo.surface_from_file(path, fformat="irap_binary", values=False)
+    surf.values = np.ma.masked_greater_equal(values.T, UNDEF_MAP_IRAPB)
+    return surf
+
+
+def _read_parquet(path: Path) -> pa.Table | ds.Dataset:
+    """Read a memory mapped parquet file, or open a partitioned parquet dataset."""
+    if path.is_dir():
+        return ds.dataset(path, format="parquet", partitioning="hive")
+    return pq.read_table(path, memory_map=True)
@@ -0,0 +1,84 @@
+"""Memory mapped access to the values stored in exported files."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Size of the three header records in an irap binary file
+IRAP_HEADER_SIZE: Final = 100
+
+
+@dataclass(frozen=True)
+class ValuesLayout:
+    """Where the values are stored in a file."""
+
+    path: Path
+    dtype: np.dtype
+    offset: int
+    shape: int
+    field: str | None = None
+
+    def array(self) -> np.ndarray:
+        """Memory map the values, with one row per record in record based files."""
+        array = np.memmap(
+            self.path, dtype=self.dtype, mode="r", offset=self.offset, shape=self.shape
+        )
+        return array[self.field] if self.field else array
+
+    def read(self, start: int, stop: int) -> np.ndarray:
+        """Return a copy of the values in the range, in file order.
+
+        Only the records holding the range are copied, as the records are not
+        contiguous in memory."""
+        array = self.array()
+        if array.ndim == 1:
+            return np.array(array[start:stop])
+
+        per_record = array.shape[1]
+        first, last = start // per_record, -(-stop // per_record)
+        values = array[first:last].reshape(-1)
+        return values[start - first * per_record : stop - first * per_record]
+
+
+def irap_binary_layout(path: Path) -> tuple[int, int, ValuesLayout | None]:
+    """Return the number of columns and rows of an irap binary surface file, and the
+    layout of its values if all data records have the same length."""
+    with open(path, "rb") as stream:
+        header = stream.read(IRAP_HEADER_SIZE + 4)
+    nrow = int(np.frombuffer(header, ">i4", count=1, offset=8)[0])
+    ncol = int(np.frombuffer(header, ">i4", count=1, offset=44)[0])
+    size = ncol * nrow
+
+    record_size = int(np.frombuffer(header, ">i4", count=1, offset=100)[0])
+    values_per_record = record_size // 4
+    if values_per_record == 0 or size % values_per_record:
+        return ncol, nrow, None
+
+    nrecords = size // values_per_record
+    dtype = np.dtype(
+        [
+            ("head", ">i4"),
+            ("values", ">f4", (values_per_record,)),
+            ("tail", ">i4"),
+        ]
+    )
+    if IRAP_HEADER_SIZE + nrecords * dtype.itemsize != path.stat().st_size:
+        return ncol, nrow, None
+
+    records = np.memmap(
+        path, dtype=dtype, mode="r", offset=IRAP_HEADER_SIZE, shape=nrecords
+    )
+    markers = records[[0, -1]]
+    del records
+    if not (
+        np.all(markers["head"] == record_size)
+        and np.all(markers["tail"] == record_size)
+    ):
+        return ncol, nrow, None
+    return ncol, nrow, ValuesLayout(path, dtype, IRAP_HEADER_SIZE, nrecords, "values")
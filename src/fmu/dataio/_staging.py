@@ -0,0 +1,180 @@
+"""Staged writes of exported files and their metadata.
+
+By default the exported file and its metadata are written directly to their final
+paths. Within a ``staged_writes`` block they are instead written to temporary files in
+the same directory, and renamed into place when both are complete. A crashed export
+hence never leaves a partly written file behind, and readers polling the export
+directories never see an incomplete file.
+
+The metadata file is renamed into place last, and acts as the marker of a complete
+export. Any previous metadata file is removed before the exported file is replaced,
+such that an existing metadata file always describes the file next to it.
+
+To make the writes durable the files are synced to disk before being renamed, while
+the directories they are renamed in are only synced once, when the block is exited.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final
+
+from fmu.dataio._logging import null_logger
+
+logger: Final = null_logger(__name__)
+
+
+@dataclass
+class _StagingSession:
+    """The state of a staged_writes block.
+
+    Exports running on other threads add their directories to the session of the
+    block they were submitted in. Directories added after the session is closed, i.e.
+    by exports completing after the block has been exited, are synced right away.
+    """
+
+    durable: bool
+    directories: set[Path] = field(default_factory=set)
+    closed: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add_directory(self, directory: Path) -> None:
+        with self.lock:
+            if not self.closed:
+                self.directories.add(directory)
+                return
+        if self.durable:
+            _fsync_directory(directory)
+
+    def close(self) -> None:
+        """Close the session, and sync the added directories if durable."""
+        with self.lock:
+            self.closed = True
+            directories = sorted(self.directories)
+            self.directories.clear()
+        if not self.durable:
+            return
+        for directory in directories:
+            _fsync_directory(directory)
+        logger.debug("Synced %s directories", len(directories))
+
+
+_session: ContextVar[_StagingSession | None] = ContextVar("staged_writes", default=None)
+
+
+def get_staged_writes_durability() -> bool | None:
+    """Return whether staged writes are durable, or None if writes are not staged."""
+    session = _session.get()
+    return None if session is None else session.durable
+
+
+@contextmanager
+def staged_writes(durable: bool = True) -> Iterator[None]:
+    """Stage the files exported within the block, and rename them into place when
+    complete.
+
+    The exported file and its metadata are written to temporary files in the target
+    directory, and renamed into place as a pair when both are written. The metadata
+    file is renamed last, hence a metadata file always describes a complete file.
+
+    Args:
+        durable: Sync the files to disk before they are renamed into place, and the
+            directories they are renamed in when the block is exited. Without this,
+            the renames are atomic for readers, but the files may be lost if the
+            machine crashes.
+
+    Staged writes apply to the current thread or asyncio task, and to the background
+    exports submitted from it.
+
+    Examples:
+        Export many surfaces, syncing each export directory once::
+
+            from fmu.dataio import ExportData, staged_writes
+
+            with staged_writes():
+                for surface in surfaces:
+                    ExportData(config=CFG, content="depth").export(surface)
+
+    """
+    if _session.get() is not None:
+        # nested blocks are synced when the outermost block is exited
+        yield
+        return
+
+    session = _StagingSession(durable=durable)
+    token = _session.set(session)
+    logger.debug("Staged writes started, durable=%s", durable)
+    try:
+        yield
+    finally:
+        _session.reset(token)
+        session.close()
+
+
+def _staging_path(path: Path) -> Path:
+    """Return a hidden temporary path in the same directory as the given path."""
+    return path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+
+
+@contextmanager
+def staged_files(*paths: Path) -> Iterator[tuple[Path, ...]]:
+    """Yield the paths to write the given files to.
+
+    Outside a staged_writes block the given paths are yielded as they are. Inside a
+    block, temporary paths in the same directories are yielded, and the files are
+    renamed to the given paths in order when the block exits without errors. The last
+    path is the marker of a complete write, and is removed before the other files are
+    replaced. The temporary files are removed if an error occurs.
+    """
+    session = _session.get()
+    if session is None:
+        yield paths
+        return
+
+    staged = tuple(_staging_path(path) for path in paths)
+    try:
+        yield staged
+        if session.durable:
+            for path in staged:
+                _fsync_file(path)
+    except BaseException:
+        for path in staged:
+            path.unlink(missing_ok=True)
+        raise
+
+    paths[-1].unlink(missing_ok=True)
+    for source, target in zip(staged, paths, strict=True):
+        source.replace(target)
+        session.add_directory(target.parent)
+    logger.debug("Renamed staged files into place: %s", paths)
+
+
+def _fsync_file(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Sync the entries of a directory to disk, if supported by the platform."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        logger.debug("Unable to open %s to sync it", directory)
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        # directories can not be synced on all platforms and file systems
+        logger.debug("Unable to sync %s", directory)
+    finally:
+        os.close(fd)
@@ -33,9 +33,10 @@ def casepath_has_metadata(casepath: Path) -> bool:
 
 
 def md5sum(file: Path | BytesIO) -> str:
+    """Calculate the MD5 checksum of a file or a buffer."""
     if isinstance(file, (str, Path)):
         with open(file, "rb") as stream:
-            return md5sum_stream(stream)
+            return hashlib.file_digest(stream, "md5").hexdigest()
     return md5sum_stream(file)
 
 
@@ -0,0 +1,190 @@
+"""Control of the validation level used when generating metadata.
+
+The metadata is built from models that have, for the most part, already been
+validated, e.g. the stratigraphy, specification and bounding box of an object. The
+validation of the assembled metadata can be lowered or postponed for a session with
+the ``metadata_validation`` context manager.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Final, TypeVar, get_args
+
+from pydantic import BaseModel, TypeAdapter, ValidationError as PydanticValidationError
+
+from fmu.dataio._definitions import ValidationLevel
+from fmu.dataio._logging import null_logger
+from fmu.dataio.exceptions import ValidationError
+
+logger: Final = null_logger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class _DeferredBatch:
+    """The metadata queued for validation in a 'deferred' block.
+
+    Exports running on other threads append to the batch of the block they were
+    submitted in. Metadata added after the batch is closed, i.e. from exports
+    completing after the block has been exited, is validated right away.
+    """
+
+    def __init__(self) -> None:
+        self._metadata: list[dict[str, Any]] = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._metadata)
+
+    def add(self, metadata: dict[str, Any]) -> None:
+        with self._lock:
+            if not self._closed:
+                self._metadata.append(metadata)
+                return
+        validate_metadata([metadata])
+
+    def close(self) -> list[dict[str, Any]]:
+        """Close the batch, and return the queued metadata."""
+        with self._lock:
+            self._closed = True
+            metadata, self._metadata = self._metadata, []
+        return metadata
+
+
+_level: ContextVar[ValidationLevel] = ContextVar(
+    "metadata_validation_level", default=ValidationLevel.full
+)
+_deferred: ContextVar[_DeferredBatch | None] = ContextVar(
+    "deferred_metadata_validation", default=None
+)
+
+
+def get_validation_level() -> ValidationLevel:
+    """Return the validation level currently in use."""
+    return _level.get()
+
+
+@contextmanager
+def metadata_validation(level: ValidationLevel | str) -> Iterator[None]:
+    """Set the validation level for metadata generated within the block.
+
+    With the 'deferred' level, the metadata of all objects exported within the block
+    is validated when the block is exited. The files are written before their metadata
+    is validated. Background exports submitted within the block use its validation
+    level, and their metadata is validated right away if they complete after the block
+    has been exited.
+
+    The validation level applies to the current thread or asyncio task, and to the
+    background exports submitted from it.
+
+    Args:
+        level: One of 'full', 'trusted' or 'deferred'.
+
+    Raises:
+        ValidationError: On exit from a 'deferred' block if the metadata of any of the
+            exported objects is invalid.
+
+    Examples:
+        Export many small objects with deferred validation::
+
+            from fmu.dataio import ExportData, metadata_validation
+
+            with metadata_validation("deferred"):
+                for surface in surfaces:
+                    ExportData(config=CFG, content="depth").export(surface)
+
+    """
+    level = ValidationLevel(level)
+    level_token = _level.set(level)
+    logger.debug("Metadata validation level set to %s", level)
+
+    # nested deferred blocks are validated when the outermost block is exited
+    batch = None
+    if level == ValidationLevel.deferred and _deferred.get() is None:
+        batch = _DeferredBatch()
+        batch_token = _deferred.set(batch)
+    try:
+        yield
+    except BaseException:
+        if batch is not None:
+            batch.close()
+        raise
+    finally:
+        if batch is not None:
+            _deferred.reset(batch_token)
+        _level.reset(level_token)
+
+    if batch is not None:
+        validate_metadata(batch.close())
+
+
+def build_model(model: type[M], /, **values: Any) -> M:
+    """Build a model from values produced by fmu-dataio itself, e.g. the file block of
+    an object. The values are only validated at the 'full' level, as the complete
+    metadata is still validated at the 'deferred' level."""
+    if get_validation_level() == ValidationLevel.full:
+        return model(**values)
+    return model.model_construct(**values)
+
+
+def defer_validation(metadata: dict[str, Any]) -> None:
+    """Queue the metadata of an object for validation when the outermost 'deferred'
+    block is exited."""
+    batch = _deferred.get()
+    if batch is None:
+        validate_metadata([metadata])
+    else:
+        batch.add(metadata)
+
+
+@lru_cache(maxsize=1)
+def _get_metadata_adapter() -> tuple[TypeAdapter[list[Any]], tuple[str, ...]]:
+    """Return an adapter validating a list of metadata, and the fields that are
+    required but may be None, hence excluded from dumped metadata."""
+    from fmu.dataio._export import ObjectMetadataExport  # Avoid circular import
+
+    required_nullable_fields = tuple(
+        field.alias or name
+        for name, field in ObjectMetadataExport.model_fields.items()
+        if field.is_required() and type(None) in get_args(field.annotation)
+    )
+    return TypeAdapter(list[ObjectMetadataExport]), required_nullable_fields
+
+
+def validate_metadata(metadata: list[dict[str, Any]]) -> None:
+    """Validate a list of dumped metadata against the schema in one batch.
+
+    Raises:
+        ValidationError: If the metadata of any of the objects is invalid.
+    """
+    if not metadata:
+        return
+
+    adapter, required_nullable_fields = _get_metadata_adapter()
+
+    logger.debug("Validating metadata for %s objects", len(metadata))
+    try:
+        adapter.validate_python(
+            [
+                {key: None for key in required_nullable_fields} | meta
+                for meta in metadata
+            ]
+        )
+    except PydanticValidationError as err:
+        invalid = sorted(
+            {
+                str(metadata[error["loc"][0]]["file"]["absolute_path"])  # type: ignore[index]
+                for error in err.errors()
+            }
+        )
+        raise ValidationError(
+            f"Invalid metadata was exported for the files {invalid}. "
+            f"Detailed information:\n{err}"
+        ) from err
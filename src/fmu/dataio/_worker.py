@@ -0,0 +1,426 @@
+"""Exports running in a separate worker process.
+
+Background exports on a thread still compete for the GIL with the calling script,
+which in RMS is the embedded Python of the user interface. Within an
+``out_of_process_exports`` block, background exports are instead handed over to a
+long-lived worker process, started on first use and shared by all later blocks.
+
+Exports are handed over with pickle protocol 5, where the large array buffers of an
+object, e.g. surface values or grid geometries, are not serialized but copied into
+shared memory blocks. The pickled exports that remain are small descriptors of the
+objects and export configurations. The worker process runs the exports one at a time
+in the order they were submitted, with the environment, working directory and export
+settings of the main process at the time each export was submitted.
+
+The export manifest is only written by the main process. The worker process sends the
+manifest updates of an export back together with its result.
+
+The worker process is started with ``sys.executable``, and reads the shared memory
+blocks from the main process. It is only suitable where both are available, e.g. not
+in an RMS version where ``sys.executable`` is the RMS binary.
+"""
+
+from __future__ import annotations
+
+import atexit
+import io
+import itertools
+import os
+import pickle
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from multiprocessing import Pipe, resource_tracker
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Final, ParamSpec, TypeVar
+
+import numpy as np
+import xtgeo
+
+from fmu.dataio._content_store import (
+    deduplicated_writes,
+    deduplicated_writes_enabled,
+)
+from fmu.dataio._definitions import ValidationLevel
+from fmu.dataio._logging import null_logger
+from fmu.dataio._staging import get_staged_writes_durability, staged_writes
+from fmu.dataio._validation import get_validation_level, metadata_validation
+from fmu.dataio.manifest._manifest import (
+    collected_manifest_updates,
+    write_manifest_updates,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+logger: Final = null_logger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Buffers smaller than this are pickled with the rest of the export
+SHARED_MEMORY_MIN_BYTES: Final = 64 * 1024
+
+_enabled: ContextVar[bool] = ContextVar("out_of_process_exports", default=False)
+_worker: ExportWorker | None = None
+_lock: Final = threading.Lock()
+
+
+@contextmanager
+def out_of_process_exports() -> Iterator[None]:
+    """Run the background exports submitted within the block in a worker process.
+
+    This applies to the exports of ``ExportData.export_async()`` and
+    ``export_async()``, which give the same files and metadata as when run on the
+    background thread. The main process only copies the data of the objects to shared
+    memory, while the metadata is built and the objects are written by the worker.
+    The worker process is started on first use, and is kept for the rest of the
+    session.
+
+    Objects are copied to shared memory when submitted, hence ``copy_data=False`` can
+    be given to ``ExportData.export_async()`` to avoid copying them twice. Exports
+    not supported by the worker process, e.g. of objects that can not be pickled, are
+    run on the background thread instead.
+
+    The validation level, staged writes and deduplication in use when an export is
+    submitted apply to the export in the worker process. Each export is run in its own
+    block, hence with 'deferred' validation the metadata of an export is validated
+    when it completes, and with durable staged writes its directories are synced when
+    it completes.
+
+    Examples:
+        Export grids from RMS in a separate process::
+
+            from fmu.dataio.export import out_of_process_exports, wait_all
+
+            with out_of_process_exports():
+                for grid in grids:
+                    ed.export_async(grid)
+            wait_all()
+
+    """
+    token = _enabled.set(True)
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
+
+
+def get_export_worker() -> ExportWorker | None:
+    """Return the export worker process if exports are run out of process, started
+    on first use."""
+    global _worker
+
+    if not _enabled.get():
+        return None
+    with _lock:
+        if _worker is None or _worker.closed:
+            _worker = ExportWorker()
+        return _worker
+
+
+@atexit.register
+def _shutdown_worker() -> None:
+    """Complete the exports in the worker process when Python exits."""
+    if _worker is not None:
+        _worker.shutdown()
+
+
+def _masked_array(
+    data: np.ndarray, mask: np.ndarray | np.bool_, fill_value: Any
+) -> np.ma.MaskedArray:
+    return np.ma.MaskedArray(data, mask=mask, fill_value=fill_value)
+
+
+def _grid(
+    coordsv: np.ndarray,
+    zcornsv: np.ndarray,
+    actnumsv: np.ndarray,
+    dualporo: bool,
+    dualperm: bool,
+    subgrids: dict | None,
+    units: xtgeo.Units | None,
+    name: str | None,
+) -> xtgeo.Grid:
+    return xtgeo.Grid(
+        coordsv,
+        zcornsv,
+        actnumsv,
+        dualporo=dualporo,
+        dualperm=dualperm,
+        subgrids=subgrids,
+        units=units,
+        name=name,
+    )
+
+
+class _Pickler(pickle.Pickler):
+    """Pickle objects with their array buffers kept out of band.
+
+    Masked arrays pickle their data and mask as bytes, and grids hold an object that
+    can not be pickled, hence these are pickled from their arrays instead. Objects
+    already serialized to memory hold the bytes in a memoryview, which is pickled
+    from its buffer.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if type(obj) is memoryview:
+            return memoryview, (pickle.PickleBuffer(obj),)
+        if type(obj) is np.ma.MaskedArray:
+            return _masked_array, (obj.data, obj.mask, obj.fill_value)
+        if isinstance(obj, xtgeo.Grid):
+            # the grid properties attached to a grid are not exported with it
+            return _grid, (
+                obj._coordsv,
+                obj._zcornsv,
+                obj._actnumsv,
+                obj._dualporo,
+                obj._dualperm,
+                obj.subgrids,
+                obj.units,
+                obj.name,
+            )
+        return NotImplemented
+
+
+@dataclass
+class _SharedBuffers:
+    """Shared memory blocks holding the buffers of a pickled export."""
+
+    blocks: list[SharedMemory] = field(default_factory=list)
+    sizes: list[int] = field(default_factory=list)
+
+    def add(self, buffer: pickle.PickleBuffer) -> bool:
+        """Copy a buffer into a new shared memory block, returns True to keep small
+        buffers in band."""
+        with buffer.raw() as raw:
+            if raw.nbytes < SHARED_MEMORY_MIN_BYTES:
+                return True
+            block = SharedMemory(create=True, size=raw.nbytes)
+            self.blocks.append(block)
+            self.sizes.append(raw.nbytes)
+            assert block.buf is not None
+            block.buf[: raw.nbytes] = raw
+        return False
+
+    def release(self) -> None:
+        """Remove the shared memory blocks."""
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks.clear()
+
+    @property
+    def descriptor(self) -> list[tuple[str, int]]:
+        return [
+            (block.name, size)
+            for block, size in zip(self.blocks, self.sizes, strict=True)
+        ]
+
+
+def _dumps(obj: Any) -> tuple[bytes, _SharedBuffers]:
+    """Pickle an object, with its large buffers copied into shared memory."""
+    buffers = _SharedBuffers()
+    file = io.BytesIO()
+    try:
+        _Pickler(file, protocol=5, buffer_callback=buffers.add).dump(obj)
+    except BaseException:
+        buffers.release()
+        raise
+    return file.getvalue(), buffers
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to a shared memory block owned by the main process."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    block = SharedMemory(name=name)
+    # the block is removed by the main process, not when this process exits
+    resource_tracker.unregister(block._name, "shared_memory")  # type: ignore[attr-defined]
+    return block
+
+
+def _loads(data: bytes, descriptor: list[tuple[str, int]]) -> Any:
+    """Unpickle an object, with its large buffers copied from shared memory."""
+    buffers = []
+    for name, size in descriptor:
+        block = _attach(name)
+        try:
+            assert block.buf is not None
+            with block.buf[:size] as view:
+                buffers.append(bytearray(view))
+        finally:
+            block.close()
+    return pickle.loads(data, buffers=buffers)
+
+
+@dataclass(frozen=True)
+class _Settings:
+    """The export settings of the main process, applied to an export in the worker
+    process."""
+
+    validation_level: ValidationLevel
+    staged_durable: bool | None
+    deduplicated: bool
+
+    @classmethod
+    def capture(cls) -> _Settings:
+        """Return the settings of the current context."""
+        return cls(
+            validation_level=get_validation_level(),
+            staged_durable=get_staged_writes_durability(),
+            deduplicated=deduplicated_writes_enabled(),
+        )
+
+    @contextmanager
+    def apply(self) -> Iterator[None]:
+        """Use the settings within the block."""
+        with ExitStack() as stack:
+            stack.enter_context(metadata_validation(self.validation_level))
+            if self.staged_durable is not None:
+                stack.enter_context(staged_writes(durable=self.staged_durable))
+            if self.deduplicated:
+                stack.enter_context(deduplicated_writes())
+            yield
+
+
+@dataclass
+class _Job:
+    future: Future[Any]
+    buffers: _SharedBuffers
+
+
+class ExportWorker:
+    """A worker process running exports one at a time.
+
+    Results are received on a thread in the main process, which completes the futures
+    of the exports and removes their shared memory blocks.
+    """
+
+    def __init__(self) -> None:
+        self._conn, child_conn = Pipe()
+        self._process = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                f"from {__name__} import serve; serve({child_conn.fileno()})",
+            ],
+            pass_fds=(child_conn.fileno(),),
+        )
+        child_conn.close()
+        logger.info("Started export worker process %s", self._process.pid)
+
+        self.closed = False
+        self._jobs: dict[int, _Job] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(
+            target=self._read_results, name="dataio-export-worker", daemon=True
+        )
+        self._reader.start()
+
+    def submit(
+        self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+    ) -> Future[R]:
+        """Run a function in the worker process, with the export settings of the
+        calling context.
+
+        Raises:
+            pickle.PicklingError, TypeError: If the function or its arguments can not
+                be pickled.
+        """
+        data, buffers = _dumps((func, args, kwargs))
+        future: Future[R] = Future()
+        with self._lock:
+            if self.closed:
+                buffers.release()
+                raise RuntimeError("The export worker process has been shut down")
+            job_id = next(self._ids)
+            self._jobs[job_id] = _Job(future, buffers)
+            self._conn.send(
+                (
+                    job_id,
+                    dict(os.environ),
+                    os.getcwd(),
+                    _Settings.capture(),
+                    data,
+                    buffers.descriptor,
+                )
+            )
+        return future
+
+    def _read_results(self) -> None:
+        while True:
+            try:
+                job_id, ok, result, manifest_updates = self._conn.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                job = self._jobs.pop(job_id)
+            job.buffers.release()
+            try:
+                write_manifest_updates(manifest_updates)
+            except Exception as err:
+                ok, result = False, err
+            if ok:
+                job.future.set_result(result)
+            else:
+                job.future.set_exception(result)
+
+        with self._lock:
+            self.closed = True
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+        for job in jobs:
+            job.buffers.release()
+            job.future.set_exception(
+                RuntimeError("The export worker process exited unexpectedly")
+            )
+
+    def shutdown(self) -> None:
+        """Stop the worker process when the exports submitted have completed."""
+        with self._lock:
+            if not self.closed:
+                self.closed = True
+                self._conn.send(None)
+        self._process.wait()
+        self._reader.join()
+        self._conn.close()
+
+
+def _run(
+    job: tuple[int, dict[str, str], str, _Settings, bytes, list[tuple[str, int]]],
+) -> tuple:
+    """Run an export in the worker process, returns its result or error together
+    with the manifest updates to be written by the main process."""
+    job_id, environ, cwd, settings, data, descriptor = job
+    with collected_manifest_updates() as manifest_updates:
+        try:
+            if environ != os.environ:
+                os.environ.clear()
+                os.environ.update(environ)
+            os.chdir(cwd)
+            func, args, kwargs = _loads(data, descriptor)
+            with settings.apply():
+                result = func(*args, **kwargs)
+            pickle.dumps(result)
+        except Exception as err:
+            try:
+                pickle.dumps(err)
+            except Exception:
+                err = RuntimeError(f"{type(err).__name__}: {err}")
+            return job_id, False, err, manifest_updates
+    return job_id, True, result, manifest_updates
+
+
+def serve(fd: int) -> None:
+    """Run the exports received from the main process until told to stop, the entry
+    point of the worker process."""
+    with Connection(fd) as conn:
+        while (job := conn.recv()) is not None:
+            conn.send(_run(job))
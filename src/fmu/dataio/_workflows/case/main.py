@@ -1,6 +1,8 @@
 """Create FMU case metadata and register case on Sumo (optional).
 
-This script is intended to be run through an Ert HOOK PRE_SIMULATION workflow.
+This script is intended to be run through an Ert HOOK PRE_SIMULATION workflow. The
+workflow is registered with Ert in the lightweight ``plugin`` module, which imports this
+module only when the workflow is run.
 """
 
 from __future__ import annotations
@@ -9,13 +11,10 @@ import argparse
 import logging
 import shutil
 from pathlib import Path
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
-import ert
-
-from fmu.dataio._export import ExportConfig
+from fmu.dataio._export import ExportConfig, export_to_buffer
 from fmu.dataio._interfaces import SumoUploaderInterface
-from fmu.dataio._metadata import generate_metadata
 from fmu.datamodels.common.enums import Classification
 from fmu.datamodels.fmu_results.enums import Content, FMUContext
 from fmu.datamodels.standard_results.enums import (
@@ -34,28 +33,12 @@ from ._observations import get_ert_observations_table
 from ._parameters import get_ert_parameters_table
 from .export_case_metadata import ExportCaseMetadata
 
+if TYPE_CHECKING:
+    import ert
+
 logger: Final = logging.getLogger(__name__)
 logger.setLevel(logging.CRITICAL)
 
-# This documentation is compiled into ert's internal docs
-DESCRIPTION = """
-WF_CREATE_CASE_METADATA will create case metadata with fmu-dataio for storing on disk
-and on Sumo. When Sumo upload is enabled, the workflow also uploads Ert parameters
-and observations, including summary, RFT, and breakthrough observations. The workflow
-uses Ert storage directly, so the relevant case metadata, parameters, and observations
-are collected automatically from the active Ert run.
-"""
-
-EXAMPLES = """
-Create an Ert workflow e.g. called ``ert/bin/workflows/create_case_metadata`` with::
-
-  WF_CREATE_CASE_METADATA <casepath> "--sumo"
-
-Arguments:
-    <casepath>: Absolute path to root of the case, typically <SCRATCH>/<USER>/<CASE_DIR>
-    --sumo: Register case on Sumo
-"""  # noqa: E501
-
 
 def _get_ensemble_name(
     ensemble: ert.Ensemble,
@@ -102,8 +85,8 @@ def _queue_ert_parameters(
         .standard_result(StandardResultName.parameters)
         .build()
     )
-    metadata = generate_metadata(export_config, table)
-    sumo_uploader.queue_table(table, metadata)
+    payload, metadata = export_to_buffer(export_config, table)
+    sumo_uploader.queue_table(table, metadata, payload=payload)
 
 
 def _queue_ert_observations_breakthrough(
@@ -134,8 +117,8 @@ def _queue_ert_observations_breakthrough(
         .standard_result(StandardResultName.observations_breakthrough)
         .build()
     )
-    metadata = generate_metadata(export_config, table)
-    sumo_uploader.queue_table(table, metadata)
+    payload, metadata = export_to_buffer(export_config, table)
+    sumo_uploader.queue_table(table, metadata, payload=payload)
 
 
 def _queue_ert_observations_rft(
@@ -165,8 +148,8 @@ def _queue_ert_observations_rft(
         .standard_result(StandardResultName.observations_rft)
         .build()
     )
-    metadata = generate_metadata(export_config, table)
-    sumo_uploader.queue_table(table, metadata)
+    payload, metadata = export_to_buffer(export_config, table)
+    sumo_uploader.queue_table(table, metadata, payload=payload)
 
 
 def _queue_ert_observations_summary(
@@ -197,8 +180,8 @@ def _queue_ert_observations_summary(
         .standard_result(StandardResultName.observations_summary)
         .build()
     )
-    metadata = generate_metadata(export_config, table)
-    sumo_uploader.queue_table(table, metadata)
+    payload, metadata = export_to_buffer(export_config, table)
+    sumo_uploader.queue_table(table, metadata, payload=payload)
 
 
 def _queue_stratigraphy_mappings(
@@ -228,8 +211,8 @@ def _queue_stratigraphy_mappings(
         .standard_result(StandardResultName.stratigraphy_mapping)
         .build()
     )
-    metadata = generate_metadata(export_config, table)
-    sumo_uploader.queue_table(table, metadata)
+    payload, metadata = export_to_buffer(export_config, table)
+    sumo_uploader.queue_table(table, metadata, payload=payload)
 
 
 def _upload_files_to_sumo(
@@ -292,94 +275,13 @@ def _copy_fmu_directory(casepath: Path) -> ProjectFMUDirectory | None:
     return get_fmu_directory(casepath)
 
 
-def get_parser() -> argparse.ArgumentParser:
-    """Construct parser object."""
-    parser = argparse.ArgumentParser()
-    parser.add_argument(
-        "casepath",
-        type=Path,
-        help="Absolute path to the case",
-    )
-    parser.add_argument(
-        "--sumo",
-        action="store_true",
-        help="If passed, register the case on Sumo.",
-    )
-
-    # Deprecated
-
-    parser.add_argument(
-        "ert_config_path",
-        type=Path,
-        help="Deprecated and can safely be removed",
-        nargs="?",  # Optional
-        default=None,
-    )
-    parser.add_argument(
-        "ert_casename",
-        type=str,
-        help="Deprecated and can safely be removed",
-        nargs="?",  # Optional
-        default=None,
-    )
-    parser.add_argument(
-        "ert_username",
-        type=str,
-        help="Deprecated and can safely be removed",
-        nargs="?",  # Optional
-        default=None,
-    )
-    parser.add_argument(
-        "--global_variables_path",
-        type=Path,
-        help="Path to global variables file relative to Ert config path.",
-        default=None,
-    )
-    parser.add_argument(
-        "--verbosity",
-        type=str,
-        help="Set log level",
-        default=None,
-    )
-    parser.add_argument(
-        "--sumo_env",
-        type=str,
-        help="Deprecated and can safely be removed",
-        default=None,
-    )
-    return parser
-
-
-class WfExportCaseMetadata(ert.ErtScript):
-    """A class with a run() function that can be registered as an ERT plugin.
-
-    This is used for the ERT workflow context. It is prefixed 'Wf' to avoid a
-    potential naming collisions in fmu-dataio."""
-
-    def run(
-        self,
-        workflow_args: list[str],
-        ensemble: ert.Ensemble,
-        run_paths: ert.Runpaths,
-    ) -> None:
-        """Parse arguments and run the workflow."""
-        parser = get_parser()
-        args = parser.parse_args(workflow_args)
-
-        maybe_fmu_dir = _copy_fmu_directory(args.casepath)
-
-        cfg = CaseWorkflowConfig.from_presim_workflow(run_paths, args, maybe_fmu_dir)
-        _run_workflow(ensemble, run_paths, cfg)
-
+def create_case_metadata_main(
+    args: argparse.Namespace,
+    ensemble: ert.Ensemble,
+    run_paths: ert.Runpaths,
+) -> None:
+    """Create the case metadata, and register the case on Sumo if requested."""
+    maybe_fmu_dir = _copy_fmu_directory(args.casepath)
 
-@ert.plugin(name="fmu_dataio")
-def ertscript_workflow(config: ert.CaseWorkflowConfigs) -> None:
-    """Hook the WfExportCaseMetadata class with documentation into ERT."""
-    config.add_workflow(
-        WfExportCaseMetadata,
-        "WF_CREATE_CASE_METADATA",
-        parser=get_parser,
-        description=DESCRIPTION,
-        examples=EXAMPLES,
-        category="export",
-    )
+    cfg = CaseWorkflowConfig.from_presim_workflow(run_paths, args, maybe_fmu_dir)
+    _run_workflow(ensemble, run_paths, cfg)
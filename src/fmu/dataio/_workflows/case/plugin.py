@@ -0,0 +1,123 @@
+"""Register the workflow creating FMU case metadata as an Ert plugin.
+
+Ert imports its plugins at startup, in every Ert command. This module holds only the
+name, parser and documentation of the workflow, and the workflow itself, with the
+export stack it depends on, is imported when the workflow is run.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import ert
+
+# This documentation is compiled into ert's internal docs
+DESCRIPTION = """
+WF_CREATE_CASE_METADATA will create case metadata with fmu-dataio for storing on disk
+and on Sumo. When Sumo upload is enabled, the workflow also uploads Ert parameters
+and observations, including summary, RFT, and breakthrough observations. The workflow
+uses Ert storage directly, so the relevant case metadata, parameters, and observations
+are collected automatically from the active Ert run.
+"""
+
+EXAMPLES = """
+Create an Ert workflow e.g. called ``ert/bin/workflows/create_case_metadata`` with::
+
+  WF_CREATE_CASE_METADATA <casepath> "--sumo"
+
+Arguments:
+    <casepath>: Absolute path to root of the case, typically <SCRATCH>/<USER>/<CASE_DIR>
+    --sumo: Register case on Sumo
+"""  # noqa: E501
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Construct parser object."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "casepath",
+        type=Path,
+        help="Absolute path to the case",
+    )
+    parser.add_argument(
+        "--sumo",
+        action="store_true",
+        help="If passed, register the case on Sumo.",
+    )
+
+    # Deprecated
+
+    parser.add_argument(
+        "ert_config_path",
+        type=Path,
+        help="Deprecated and can safely be removed",
+        nargs="?",  # Optional
+        default=None,
+    )
+    parser.add_argument(
+        "ert_casename",
+        type=str,
+        help="Deprecated and can safely be removed",
+        nargs="?",  # Optional
+        default=None,
+    )
+    parser.add_argument(
+        "ert_username",
+        type=str,
+        help="Deprecated and can safely be removed",
+        nargs="?",  # Optional
+        default=None,
+    )
+    parser.add_argument(
+        "--global_variables_path",
+        type=Path,
+        help="Path to global variables file relative to Ert config path.",
+        default=None,
+    )
+    parser.add_argument(
+        "--verbosity",
+        type=str,
+        help="Set log level",
+        default=None,
+    )
+    parser.add_argument(
+        "--sumo_env",
+        type=str,
+        help="Deprecated and can safely be removed",
+        default=None,
+    )
+    return parser
+
+
+class WfExportCaseMetadata(ert.ErtScript):
+    """A class with a run() function that can be registered as an ERT plugin.
+
+    This is used for the ERT workflow context. It is prefixed 'Wf' to avoid a
+    potential naming collisions in fmu-dataio."""
+
+    def run(
+        self,
+        workflow_args: list[str],
+        ensemble: ert.Ensemble,
+        run_paths: ert.Runpaths,
+    ) -> None:
+        """Parse arguments and run the workflow."""
+        from .main import create_case_metadata_main
+
+        parser = get_parser()
+        args = parser.parse_args(workflow_args)
+        create_case_metadata_main(args, ensemble, run_paths)
+
+
+@ert.plugin(name="fmu_dataio")
+def ertscript_workflow(config: ert.CaseWorkflowConfigs) -> None:
+    """Hook the WfExportCaseMetadata class with documentation into ERT."""
+    config.add_workflow(
+        WfExportCaseMetadata,
+        "WF_CREATE_CASE_METADATA",
+        parser=get_parser,
+        description=DESCRIPTION,
+        examples=EXAMPLES,
+        category="export",
+    )
@@ -2,7 +2,8 @@
 
 """Copy preprocessed data to an FMU case while updating the metadata.
 
-This script is intended to be run through an ERT HOOK PRESIM workflow.
+This script is intended to be run through an ERT HOOK PRESIM workflow. The export stack
+is imported when the workflow is run, not when ERT imports the plugin at startup.
 
 """
 
@@ -16,8 +17,6 @@ from typing import Final
 
 import ert
 
-from fmu.dataio import ExportPreprocessedData
-
 logger: Final = logging.getLogger(__name__)
 
 # This documentation is compiled into ert's internal docs
@@ -69,6 +68,7 @@ class WfCopyPreprocessedData(ert.ErtScript):
 
 def copy_preprocessed_data_main(args: argparse.Namespace) -> None:
     """Copy the preprocessed data to scratch and upload it to sumo."""
+    from fmu.dataio import ExportPreprocessedData
 
     check_arguments(args)
     logger.setLevel(args.verbosity)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+"""Update or rebuild the metadata catalog of an FMU case.
+
+This script is intended to be run through an ERT HOOK POST_SIMULATION workflow. The
+catalog is imported when the workflow is run, not when ERT imports the plugin at
+startup.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+from typing import Final
+
+import ert
+
+logger: Final = logging.getLogger(__name__)
+
+# This documentation is compiled into ert's internal docs
+DESCRIPTION = """
+WF_UPDATE_CATALOG_DATAIO will add the metadata of the data exported in a FMU case to
+the metadata catalog at <caseroot>/share/metadata/catalog.sqlite. Only the data
+exported since the last update are added, as found in the export manifests of the case
+and its realizations. With the '--rebuild' option the catalog is instead rebuilt from
+all metadata files in the case.
+
+The catalog can be queried with ``fmu.dataio.catalog.MetadataCatalog``. The catalog
+should be updated by this workflow, and not from the realizations. Concurrent updates
+from several hosts are not supported, as SQLite locking is not reliable on network file
+systems.
+"""
+
+EXAMPLES = """
+Create an ERT workflow e.g. named ``ert/bin/workflows/xhook_update_catalog`` with the
+contents::
+  WF_UPDATE_CATALOG_DATAIO <SCRATCH>/<USER>/<CASE_DIR>
+
+Add following lines to your ERT config to have the job automatically executed::
+  LOAD_WORKFLOW ../bin/workflows/xhook_update_catalog
+  HOOK_WORKFLOW xhook_update_catalog POST_SIMULATION
+"""
+
+
+def main() -> None:
+    """Entry point from command line
+
+    When script is called from an ERT workflow, it will be called through the 'run'
+    method on the WfUpdateCatalog class. The command line entry point is useful for
+    rebuilding the catalog of an existing case.
+    """
+    parser = get_parser()
+    commandline_args = parser.parse_args()
+    update_catalog_main(commandline_args)
+
+
+class WfUpdateCatalog(ert.ErtScript):
+    """A class with a run() function that can be registered as an ERT plugin.
+
+    This is used for the ERT workflow context. It is prefixed 'Wf' to avoid a
+    potential naming collisions in fmu-dataio."""
+
+    def run(self, *args: str) -> None:
+        """Parse arguments and call update_catalog_main()"""
+        parser = get_parser()
+        workflow_args = parser.parse_args(args)
+        update_catalog_main(workflow_args)
+
+
+def update_catalog_main(args: argparse.Namespace) -> None:
+    """Update or rebuild the metadata catalog of the case."""
+    from fmu.dataio.catalog import MetadataCatalog
+
+    logger.setLevel(args.verbosity)
+
+    casepath = Path(args.ert_caseroot)
+    if not casepath.is_absolute():
+        logger.debug("Argument 'ert_caseroot' was not absolute: %s", casepath)
+        raise ValueError("'ert_caseroot' must be an absolute path")
+
+    catalog = MetadataCatalog(casepath)
+    if args.rebuild:
+        count = catalog.rebuild()
+        logger.info("Rebuilt the catalog %s with %s objects", catalog.path, count)
+    else:
+        count = catalog.update()
+        logger.info("Added %s objects to the catalog %s", count, catalog.path)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Construct parser object."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("ert_caseroot", type=str, help="Absolute path to the case root")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the catalog from all metadata files in the case",
+    )
+    parser.add_argument(
+        "--verbosity", type=str, help="Set log level", default="WARNING"
+    )
+    return parser
+
+
+@ert.plugin(name="fmu_dataio")
+def ertscript_workflow(config: ert.WorkflowConfigs) -> None:
+    """Hook the WfUpdateCatalog class with documentation into ERT."""
+    config.add_workflow(
+        WfUpdateCatalog,
+        "WF_UPDATE_CATALOG_DATAIO",
+        parser=get_parser,
+        description=DESCRIPTION,
+        examples=EXAMPLES,
+        category="export",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+"""Verify that the exported files in an FMU case match their metadata.
+
+This script can be run through an ERT workflow, or from the command line e.g. after
+a case has been copied or restored. The catalog is imported when the workflow is run,
+not when ERT imports the plugin at startup.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import ert
+
+if TYPE_CHECKING:
+    from fmu.dataio.catalog import VerificationReport
+
+logger: Final = logging.getLogger(__name__)
+
+# This documentation is compiled into ert's internal docs
+DESCRIPTION = """
+WF_VERIFY_DATAIO will verify that the files exported in a FMU case match the size and
+checksum in their metadata, and report the files that are missing, have the wrong size
+or the wrong checksum. The files are found from the export manifests of the case and
+its realizations, or from the metadata catalog of the case.
+
+With '--mode cheap' only the size is compared, and the files are checked not to be
+modified after their metadata was written. With '--resume' the files verified by an
+interrupted verification are skipped.
+"""
+
+EXAMPLES = """
+Create an ERT workflow e.g. named ``ert/bin/workflows/xhook_verify_case`` with the
+contents::
+  WF_VERIFY_DATAIO <SCRATCH>/<USER>/<CASE_DIR> --mode cheap
+
+Add following lines to your ERT config to have the job automatically executed::
+  LOAD_WORKFLOW ../bin/workflows/xhook_verify_case
+  HOOK_WORKFLOW xhook_verify_case POST_SIMULATION
+"""
+
+
+def main() -> None:
+    """Entry point from command line
+
+    Exits with a non-zero status if any file does not match its metadata.
+    """
+    parser = get_parser()
+    commandline_args = parser.parse_args()
+    report = verify_case_main(commandline_args)
+    sys.exit(0 if report.ok else 1)
+
+
+class WfVerifyCase(ert.ErtScript):
+    """A class with a run() function that can be registered as an ERT plugin.
+
+    This is used for the ERT workflow context. It is prefixed 'Wf' to avoid a
+    potential naming collisions in fmu-dataio."""
+
+    def run(self, *args: str) -> None:
+        """Parse arguments and call verify_case_main()"""
+        parser = get_parser()
+        workflow_args = parser.parse_args(args)
+        verify_case_main(workflow_args)
+
+
+def verify_case_main(args: argparse.Namespace) -> VerificationReport:
+    """Verify the exported files in the case and log the files that do not match."""
+    from fmu.dataio.catalog import verify_case
+
+    logger.setLevel(args.verbosity)
+
+    casepath = Path(args.ert_caseroot)
+    if not casepath.is_absolute():
+        logger.debug("Argument 'ert_caseroot' was not absolute: %s", casepath)
+        raise ValueError("'ert_caseroot' must be an absolute path")
+
+    report = verify_case(
+        casepath,
+        mode=args.mode,
+        source=args.source,
+        max_workers=args.max_workers,
+        resume=args.resume,
+    )
+    for result in report.failed:
+        logger.warning("%s: %s %s", result.status, result.path, result.detail)
+    logger.info(
+        "Verified %s files, %s did not match their metadata",
+        len(report.results),
+        len(report.failed),
+    )
+    return report
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Construct parser object."""
+    from fmu.dataio.catalog import VerificationMode, VerificationSource
+    from fmu.dataio.catalog._verify import DEFAULT_MAX_WORKERS
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("ert_caseroot", type=str, help="Absolute path to the case root")
+    parser.add_argument(
+        "--mode",
+        type=str,
+        choices=[mode.value for mode in VerificationMode],
+        default=VerificationMode.full.value,
+        help="Compare size and checksum (full), or size and modification time (cheap)",
+    )
+    parser.add_argument(
+        "--source",
+        type=str,
+        choices=[source.value for source in VerificationSource],
+        default=VerificationSource.manifest.value,
+        help="Find the files from the export manifests or the metadata catalog",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="The maximum number of files verified at the same time",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip the files verified by an interrupted verification",
+    )
+    parser.add_argument(
+        "--verbosity", type=str, help="Set log level", default="WARNING"
+    )
+    return parser
+
+
+@ert.plugin(name="fmu_dataio")
+def ertscript_workflow(config: ert.WorkflowConfigs) -> None:
+    """Hook the WfVerifyCase class with documentation into ERT."""
+    config.add_workflow(
+        WfVerifyCase,
+        "WF_VERIFY_DATAIO",
+        parser=get_parser,
+        description=DESCRIPTION,
+        examples=EXAMPLES,
+        category="export",
+    )
+
+
+if __name__ == "__main__":
+    main()
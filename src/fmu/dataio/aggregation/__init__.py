@@ -0,0 +1,6 @@
+"""Aggregation of realization exports to the ensemble level."""
+
+from ._statistics import grid_property_statistics, surface_statistics
+from ._tables import aggregate_tables
+
+__all__ = ["aggregate_tables", "grid_property_statistics", "surface_statistics"]
@@ -0,0 +1,102 @@
+"""Export configuration for ensemble level objects derived from realization exports."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from fmu.dataio._export import ExportConfig
+from fmu.dataio._export._export_config_resolver import (
+    _resolve_content_metadata,
+    _resolve_global_config,
+)
+from fmu.datamodels.common.enums import Classification
+from fmu.datamodels.fmu_results.enums import (
+    Content,
+    DomainReference,
+    FMUContext,
+    VerticalDomain,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from fmu.datamodels.fmu_results.fields import Aggregation
+
+
+def _timedata_from_metadata(data: dict[str, Any]) -> list[list[str]] | None:
+    """Convert the time block in the metadata back to the 'timedata' input format."""
+    if not (time := data.get("time")):
+        return None
+
+    timedata = []
+    for key in ("t0", "t1"):
+        if timestamp := time.get(key):
+            value = datetime.fromisoformat(timestamp["value"]).strftime("%Y%m%d")
+            label = timestamp.get("label")
+            timedata.append([value, label] if label else [value])
+    return timedata
+
+
+def build_ensemble_export_config(
+    config: dict[str, Any],
+    casepath: Path,
+    ensemble_name: str,
+    metadata: dict[str, Any],
+    *,
+    name: str | None = None,
+    tagname: str | None = None,
+    aggregation: Aggregation | None = None,
+) -> ExportConfig:
+    """Build the export config for an ensemble level object, with the settings taken
+    from the metadata of one of the realization exports it is derived from.
+
+    Args:
+        config: The global configuration.
+        casepath: The path to the case.
+        ensemble_name: The name of the ensemble.
+        metadata: The metadata of a realization export.
+        name: Name to use instead of the name in the metadata, e.g. the name given
+            on export which is resolved to a stratigraphic name.
+        tagname: Tagname to use instead of the tagname in the metadata.
+        aggregation: The aggregation the object is the result of.
+    """
+    data = metadata["data"]
+    access = metadata["access"]
+    content = data["content"]
+
+    return (
+        ExportConfig.builder()
+        .content(
+            Content(content),
+            _resolve_content_metadata(data.get(content), content),
+        )
+        .access(
+            Classification(access["classification"]),
+            rep_include=access.get("ssdl", {}).get("rep_include", False),
+        )
+        .domain(
+            VerticalDomain(data.get("vertical_domain", VerticalDomain.depth)),
+            DomainReference(data.get("domain_reference", DomainReference.msl)),
+        )
+        .table_config(table_index=data.get("table_index"))
+        .file_config(
+            name=data["name"] if name is None else name,
+            tagname=(data.get("tagname") or "") if tagname is None else tagname,
+        )
+        .timedata(_timedata_from_metadata(data))
+        .unit(data.get("unit") or "")
+        .flags(
+            is_prediction=data.get("is_prediction", True),
+            is_observation=data.get("is_observation", False),
+            undef_is_zero=data.get("undef_is_zero", False),
+        )
+        .global_config(_resolve_global_config(config))
+        .run_context(
+            fmu_context=FMUContext.ensemble,
+            ensemble_name=ensemble_name,
+            casepath=casepath,
+        )
+        .aggregation(aggregation)
+        .build()
+    )
@@ -0,0 +1,157 @@
+"""Discovery of the exports from the realizations in an ensemble.
+
+The exported files of a realization are found through the export manifest at the
+runpath if present, else by scanning the share folders. Each file is identified from
+its metadata sidecar file, hence only the sidecar files are read, not the data.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import yaml
+
+from fmu.dataio._definitions import ShareFolder
+from fmu.dataio._logging import null_logger
+from fmu.dataio._metadata._fmu import DEFAULT_ENSEMBLE_NAME
+from fmu.dataio.manifest._manifest import MANIFEST_FILENAME
+from fmu.dataio.manifest._models import ExportManifest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger: Final = null_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RealizationExport:
+    """A file exported by a realization, with its metadata."""
+
+    realization: int
+    path: Path
+    metadata: dict[str, Any]
+
+
+def _metadata_path(path: Path) -> Path:
+    return path.parent / f".{path.name}.yml"
+
+
+def _realization_runpaths(casepath: Path, ensemble_name: str) -> Iterator[Path]:
+    """Yield the runpaths of the realizations in the ensemble."""
+    for realization_path in sorted(casepath.glob("realization-*")):
+        runpath = realization_path / ensemble_name
+        if runpath.is_dir():
+            yield runpath
+        elif ensemble_name == DEFAULT_ENSEMBLE_NAME and realization_path.is_dir():
+            # runs without an ensemble folder, casepath/realization-N
+            yield realization_path
+
+
+def _exported_files(runpath: Path, suffix: str) -> list[Path]:
+    """Return the files with the suffix exported from a runpath."""
+    manifest_path = runpath / MANIFEST_FILENAME
+    if manifest_path.exists():
+        logger.debug("Using export manifest %s", manifest_path)
+        paths = (
+            entry.absolute_path
+            for entry in ExportManifest.from_file(manifest_path).root
+        )
+        return [
+            path
+            for path in dict.fromkeys(paths)
+            if path.suffix == suffix and path.exists()
+        ]
+
+    logger.debug("No export manifest in %s, scanning the share folders", runpath)
+    return [
+        path
+        for folder in ShareFolder
+        for path in sorted((runpath / folder.value).rglob(f"*{suffix}"))
+    ]
+
+
+def _matches(
+    metadata: dict[str, Any],
+    classname: str,
+    fmt: str,
+    content: str,
+    name: str,
+    tagname: str,
+) -> bool:
+    data = metadata.get("data", {})
+    return (
+        metadata.get("class") == classname
+        and data.get("format") == fmt
+        and data.get("content") == content
+        and (data.get("name") == name or name in (data.get("alias") or []))
+        and (data.get("tagname") or "") == tagname
+    )
+
+
+def find_realization_exports(
+    casepath: Path,
+    ensemble_name: str,
+    *,
+    classname: str,
+    fmt: str,
+    suffix: str,
+    content: str,
+    name: str,
+    tagname: str = "",
+    realizations: Iterable[int] | None = None,
+) -> list[RealizationExport]:
+    """Find the exports matching the criteria from the realizations in an ensemble.
+
+    Args:
+        casepath: The path to the case.
+        ensemble_name: The name of the ensemble, e.g. 'iter-0'.
+        classname: The class of the exported objects, e.g. 'table'.
+        fmt: The file format of the exported objects, e.g. 'parquet'.
+        suffix: The file suffix of the exported files, e.g. '.parquet'.
+        content: The content of the exported objects.
+        name: The name of the exported objects, or one of their aliases if the name is
+            a stratigraphic name.
+        tagname: The tagname of the exported objects.
+        realizations: Only include these realizations. Default is all.
+
+    Returns:
+        The matching exports sorted by realization.
+
+    Raises:
+        ValueError: If a realization has more than one matching export.
+    """
+    include = set(realizations) if realizations is not None else None
+
+    exports: dict[int, RealizationExport] = {}
+    for runpath in _realization_runpaths(casepath, ensemble_name):
+        for path in _exported_files(runpath, suffix):
+            metadata_path = _metadata_path(path)
+            if not metadata_path.exists():
+                continue
+
+            with open(metadata_path, encoding="utf-8") as stream:
+                metadata = yaml.safe_load(stream)
+
+            if not _matches(metadata, classname, fmt, content, name, tagname):
+                continue
+
+            realization = metadata.get("fmu", {}).get("realization")
+            if realization is None:
+                continue
+
+            real_id = int(realization["id"])
+            if include is not None and real_id not in include:
+                continue
+
+            if real_id in exports and exports[real_id].path != path:
+                raise ValueError(
+                    f"Realization {real_id} has more than one export matching "
+                    f"{name=}, {tagname=} and {content=}: {exports[real_id].path} "
+                    f"and {path}"
+                )
+            exports[real_id] = RealizationExport(real_id, path, metadata)
+
+    logger.debug("Found exports from %s realizations", len(exports))
+    return [exports[real_id] for real_id in sorted(exports)]
@@ -0,0 +1,413 @@
+"""Ensemble statistics of surfaces and grid properties exported by the realizations.
+
+The values of the realizations are processed in tiles, i.e. ranges of the values in
+the order they are stored in the files. The tiles are read through memory maps and
+processed in parallel, such that only a tile from each realization is held in memory
+at a time. The mean and standard deviation are computed with streaming moments over
+the realizations, while the percentiles are computed exactly on the tile of all
+realizations.
+"""
+
+from __future__ import annotations
+
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+
+from fmu.dataio._export import export_objdata_with_metadata
+from fmu.dataio._logging import null_logger
+from fmu.dataio._metadata import create_object_data
+from fmu.dataio._utils import uuid_from_string
+from fmu.datamodels.fmu_results import fields
+
+from ._config import build_ensemble_export_config
+from ._discovery import find_realization_exports
+from ._values import IrapBinaryValues, RoffValues
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from ._discovery import RealizationExport
+    from ._values import ValuesReader
+
+logger: Final = null_logger(__name__)
+
+DEFAULT_STATISTICS: Final = ("mean", "std", "min", "max", "p10", "p50", "p90")
+
+# Approximate memory used when processing one tile, in bytes
+DEFAULT_TILE_MEMORY: Final = 64 * 1024**2
+
+_PERCENTILE_PATTERN: Final = re.compile(r"p(\d{1,2}|100)")
+_MOMENTS: Final = ("mean", "std", "min", "max")
+
+
+def _percentile(statistic: str) -> int | None:
+    """Return the percentile of a statistic given as e.g. 'p10', else None."""
+    if match := _PERCENTILE_PATTERN.fullmatch(statistic):
+        return int(match.group(1))
+    return None
+
+
+def _validate_statistics(statistics: Iterable[str]) -> list[str]:
+    statistics = list(dict.fromkeys(statistics))
+    if not statistics:
+        raise ValueError("At least one statistic must be given.")
+    for statistic in statistics:
+        if statistic not in _MOMENTS and _percentile(statistic) is None:
+            raise ValueError(
+                f"Invalid statistic '{statistic}'. Valid statistics are "
+                f"{', '.join(_MOMENTS)} and percentiles given as 'p0' to 'p100'."
+            )
+    return statistics
+
+
+def _tile_size(nreal: int, nstat: int, tile_memory: int) -> int:
+    """Return the number of values in a tile, given the memory of a tile."""
+    # the tile of every realization is kept for the percentiles, in addition to the
+    # accumulated moments and the values of one realization
+    return max(1, tile_memory // (8 * (nreal + nstat + 6)))
+
+
+def _compute_tile(
+    readers: Sequence[ValuesReader],
+    start: int,
+    stop: int,
+    results: dict[str, np.ndarray],
+) -> None:
+    """Compute the statistics for a tile and store them in the results."""
+    size = stop - start
+    count = np.zeros(size)
+    mean = np.zeros(size)
+    m2 = np.zeros(size)
+    vmin = np.full(size, np.nan)
+    vmax = np.full(size, np.nan)
+
+    percentiles = {
+        statistic: q
+        for statistic in results
+        if (q := _percentile(statistic)) is not None
+    }
+    stack = np.empty((len(readers), size)) if percentiles else None
+
+    for i, reader in enumerate(readers):
+        values = reader.read(start, stop)
+        valid = ~np.isnan(values)
+
+        # Welford's algorithm, ignoring undefined values
+        count += valid
+        delta = np.where(valid, values - mean, 0.0)
+        mean += np.divide(delta, count, out=np.zeros(size), where=valid)
+        m2 += np.where(valid, delta * (values - mean), 0.0)
+
+        vmin = np.fmin(vmin, values)
+        vmax = np.fmax(vmax, values)
+        if stack is not None:
+            stack[i] = values
+
+    defined = count > 0
+    moments = {
+        "mean": np.where(defined, mean, np.nan),
+        "std": np.sqrt(np.divide(m2, count, out=np.full(size, np.nan), where=defined)),
+        "min": vmin,
+        "max": vmax,
+    }
+    for statistic, values in moments.items():
+        if statistic in results:
+            results[statistic][start:stop] = values
+
+    if stack is not None:
+        quantiles = np.full((len(percentiles), size), np.nan)
+        # only defined cells, to avoid warnings for all-NaN slices
+        quantiles[:, defined] = np.nanpercentile(
+            stack[:, defined], list(percentiles.values()), axis=0
+        )
+        for statistic, values in zip(percentiles, quantiles, strict=True):
+            results[statistic][start:stop] = values
+
+
+def compute_statistics(
+    readers: Sequence[ValuesReader],
+    statistics: Iterable[str],
+    tile_memory: int = DEFAULT_TILE_MEMORY,
+    max_workers: int | None = None,
+) -> dict[str, np.ndarray]:
+    """Compute statistics over the values of the readers, tile by tile in parallel.
+
+    Undefined values are ignored, and values undefined in all readers are NaN.
+
+    Args:
+        readers: Readers for the values of each realization.
+        statistics: The statistics to compute, e.g. 'mean' and 'p10'.
+        tile_memory: Approximate memory used to process one tile, in bytes.
+        max_workers: Maximum number of tiles processed in parallel.
+
+    Returns:
+        The values of each statistic, in the order they are stored in the files.
+    """
+    statistics = _validate_statistics(statistics)
+    if not readers:
+        raise ValueError("No realizations to compute statistics for.")
+
+    shape = readers[0].shape
+    for reader in readers[1:]:
+        if reader.shape != shape:
+            raise ValueError(
+                f"The shape {reader.shape} of {reader.path} differs from the shape "
+                f"{shape} of {readers[0].path}."
+            )
+
+    size = readers[0].size
+    tile_size = _tile_size(len(readers), len(statistics), tile_memory)
+    results = {statistic: np.empty(size) for statistic in statistics}
+
+    logger.debug("Computing statistics in tiles of %s values", tile_size)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _compute_tile, readers, start, min(start + tile_size, size), results
+            )
+            for start in range(0, size, tile_size)
+        ]
+        for future in futures:
+            future.result()
+
+    return results
+
+
+def _export_statistics(
+    config: dict[str, Any],
+    casepath: Path,
+    ensemble_name: str,
+    exports: list[RealizationExport],
+    readers: list[ValuesReader],
+    statistics: Iterable[str],
+    name: str,
+    tagname: str,
+    tile_memory: int,
+    max_workers: int | None,
+) -> dict[str, Path]:
+    """Compute and export the statistics, with the aggregation in the metadata."""
+    results = compute_statistics(readers, statistics, tile_memory, max_workers)
+
+    metadata = exports[0].metadata
+    fmu = metadata.get("fmu", {})
+    realization_ids = [export.realization for export in exports]
+    entity = fmu.get("entity", {}).get("uuid")
+
+    outfiles = {}
+    for statistic, values in results.items():
+        aggregation = fields.Aggregation(
+            id=uuid_from_string(
+                f"{fmu.get('case', {}).get('uuid')}{ensemble_name}{entity}"
+                f"{statistic}{realization_ids}"
+            ),
+            operation=statistic,
+            realization_ids=realization_ids,
+        )
+        export_config = build_ensemble_export_config(
+            config,
+            casepath,
+            ensemble_name,
+            metadata,
+            name=name,
+            tagname="_".join(filter(None, [tagname, statistic])),
+            aggregation=aggregation,
+        )
+        if export_config.runcontext.ensemble_path is None:
+            raise RuntimeError(
+                "Could not establish the ensemble export path. Aggregation must be "
+                "run in an FMU context, for a case with case metadata."
+            )
+
+        obj = readers[0].to_object(values)
+        outfiles[statistic] = export_objdata_with_metadata(
+            export_config, create_object_data(obj, export_config)
+        )
+    return outfiles
+
+
+def _ensemble_statistics(
+    config: dict[str, Any],
+    casepath: str | Path,
+    ensemble_name: str,
+    content: str,
+    name: str,
+    tagname: str,
+    statistics: Iterable[str],
+    realizations: Iterable[int] | None,
+    tile_memory: int,
+    max_workers: int | None,
+    *,
+    classname: str,
+    fmt: str,
+    suffix: str,
+    reader_class: type[IrapBinaryValues | RoffValues],
+) -> dict[str, Path]:
+    casepath = Path(casepath)
+    statistics = _validate_statistics(statistics)
+    exports = find_realization_exports(
+        casepath,
+        ensemble_name,
+        classname=classname,
+        fmt=fmt,
+        suffix=suffix,
+        content=content,
+        name=name,
+        tagname=tagname,
+        realizations=realizations,
+    )
+    if not exports:
+        raise FileNotFoundError(
+            f"No realization {classname} objects with {name=}, {tagname=} and "
+            f"{content=} found in ensemble '{ensemble_name}' of {casepath}"
+        )
+
+    logger.info(
+        "Computing %s of %s from %s realizations", statistics, name, len(exports)
+    )
+    with tempfile.TemporaryDirectory(prefix="fmu-dataio-") as spill_dir:
+        readers: list[ValuesReader] = [
+            reader_class(export.path, Path(spill_dir)) for export in exports
+        ]
+        return _export_statistics(
+            config,
+            casepath,
+            ensemble_name,
+            exports,
+            readers,
+            statistics,
+            name,
+            tagname,
+            tile_memory,
+            max_workers,
+        )
+
+
+def surface_statistics(
+    config: dict[str, Any],
+    casepath: str | Path,
+    ensemble_name: str,
+    content: str,
+    name: str,
+    tagname: str = "",
+    statistics: Iterable[str] = DEFAULT_STATISTICS,
+    realizations: Iterable[int] | None = None,
+    tile_memory: int = DEFAULT_TILE_MEMORY,
+    max_workers: int | None = None,
+) -> dict[str, Path]:
+    """Compute ensemble statistics of a surface exported by the realizations.
+
+    The surfaces are found through the export manifests or the metadata files in the
+    realizations, and must be exported as irap binary on the same grid. They are read
+    tile by tile, with the tiles processed in parallel, such that the memory usage is
+    bounded by the tile memory and not the number of realizations. Undefined values
+    are ignored, and nodes undefined in all realizations are undefined in the result.
+
+    Each statistic is exported with full metadata to
+    casepath/share/ensemble/<ensemble_name>/share/results/, with the statistic appended
+    to the tagname and the included realizations in the fmu.aggregation block.
+
+    Args:
+        config: The global configuration.
+        casepath: The path to the case.
+        ensemble_name: The name of the ensemble, e.g. 'iter-0'.
+        content: The content of the realization surfaces.
+        name: The name of the realization surfaces.
+        tagname: The tagname of the realization surfaces.
+        statistics: The statistics to compute. Valid statistics are 'mean', 'std'
+            (population standard deviation), 'min', 'max' and percentiles given as
+            e.g. 'p10' for the 10th percentile.
+        realizations: Only include these realizations. Default is all.
+        tile_memory: Approximate memory used to process one tile, in bytes.
+        max_workers: Maximum number of tiles processed in parallel.
+
+    Returns:
+        The paths to the exported surfaces for each statistic.
+
+    Examples:
+        Compute the mean and P90 of a depth surface in an Ert workflow::
+
+            from fmu.dataio.aggregation import surface_statistics
+
+            surface_statistics(
+                config=CFG,
+                casepath="/scratch/fmu/user/mycase",
+                ensemble_name="iter-0",
+                content="depth",
+                name="TopVolantis",
+                statistics=["mean", "p90"],
+            )
+
+    """
+    return _ensemble_statistics(
+        config,
+        casepath,
+        ensemble_name,
+        content,
+        name,
+        tagname,
+        statistics,
+        realizations,
+        tile_memory,
+        max_workers,
+        classname="surface",
+        fmt="irap_binary",
+        suffix=".gri",
+        reader_class=IrapBinaryValues,
+    )
+
+
+def grid_property_statistics(
+    config: dict[str, Any],
+    casepath: str | Path,
+    ensemble_name: str,
+    content: str,
+    name: str,
+    tagname: str = "",
+    statistics: Iterable[str] = DEFAULT_STATISTICS,
+    realizations: Iterable[int] | None = None,
+    tile_memory: int = DEFAULT_TILE_MEMORY,
+    max_workers: int | None = None,
+) -> dict[str, Path]:
+    """Compute ensemble statistics of a grid property exported by the realizations.
+
+    The grid properties must be continuous, exported as roff on the same grid. See
+    :func:`surface_statistics` for how the statistics are computed and exported.
+
+    Args:
+        config: The global configuration.
+        casepath: The path to the case.
+        ensemble_name: The name of the ensemble, e.g. 'iter-0'.
+        content: The content of the realization grid properties.
+        name: The name of the realization grid properties.
+        tagname: The tagname of the realization grid properties.
+        statistics: The statistics to compute. Valid statistics are 'mean', 'std'
+            (population standard deviation), 'min', 'max' and percentiles given as
+            e.g. 'p10' for the 10th percentile.
+        realizations: Only include these realizations. Default is all.
+        tile_memory: Approximate memory used to process one tile, in bytes.
+        max_workers: Maximum number of tiles processed in parallel.
+
+    Returns:
+        The paths to the exported grid properties for each statistic.
+    """
+    return _ensemble_statistics(
+        config,
+        casepath,
+        ensemble_name,
+        content,
+        name,
+        tagname,
+        statistics,
+        realizations,
+        tile_memory,
+        max_workers,
+        classname="cpgrid_property",
+        fmt="roff",
+        suffix=".roff",
+        reader_class=RoffValues,
+    )
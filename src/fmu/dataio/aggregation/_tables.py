@@ -0,0 +1,195 @@
+"""Aggregation of tables exported by the realizations into ensemble tables.
+
+The realization tables are streamed batch by batch through an Arrow dataset into a
+parquet writer, such that the memory usage is bounded by the batch size and not the
+number of realizations.
+"""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from fmu.dataio._export import export_objdata_with_metadata
+from fmu.dataio._logging import null_logger
+from fmu.dataio._metadata import ParquetFileData, SharePathConstructor
+from fmu.dataio._utils import uuid_from_string
+from fmu.datamodels.fmu_results import fields
+
+from ._config import build_ensemble_export_config
+from ._discovery import find_realization_exports
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from ._discovery import RealizationExport
+
+logger: Final = null_logger(__name__)
+
+REALIZATION_COLUMN: Final = "REAL"
+
+# The aggregation operation of tables combining the realization tables
+AGGREGATION_OPERATION: Final = "collection"
+
+# Maximum number of rows read from a realization table at a time
+DEFAULT_BATCH_SIZE: Final = 65_536
+
+
+def _unified_schema(exports: list[RealizationExport]) -> pa.Schema:
+    """Unify the schemas of the realization tables, reading only the file footers."""
+    schema = pa.unify_schemas(
+        [pq.read_schema(export.path) for export in exports],
+        promote_options="permissive",
+    )
+    if REALIZATION_COLUMN in schema.names:
+        raise ValueError(
+            f"The realization tables already contain a '{REALIZATION_COLUMN}' column."
+        )
+    return schema.remove_metadata()
+
+
+def _realization_batches(
+    exports: list[RealizationExport],
+    schema: pa.Schema,
+    out_schema: pa.Schema,
+    batch_size: int,
+) -> Iterator[pa.RecordBatch]:
+    """Yield the batches of all realization tables with the realization column."""
+    realizations = {str(export.path): export.realization for export in exports}
+    dataset = ds.dataset(list(realizations), schema=schema, format="parquet")
+
+    for fragment in dataset.get_fragments():
+        real = np.int32(realizations[fragment.path])
+        for batch in fragment.to_batches(schema=schema, batch_size=batch_size):
+            column = pa.array(np.full(batch.num_rows, real), type=pa.int32())
+            yield pa.RecordBatch.from_arrays(
+                [column, *batch.columns], schema=out_schema
+            )
+
+
+def _write_ensemble_table(
+    exports: list[RealizationExport], file: Path, batch_size: int
+) -> None:
+    """Stream the realization tables into one parquet file."""
+    schema = _unified_schema(exports)
+    out_schema = schema.insert(0, pa.field(REALIZATION_COLUMN, pa.int32()))
+
+    with pq.ParquetWriter(file, out_schema) as writer:
+        for batch in _realization_batches(exports, schema, out_schema, batch_size):
+            writer.write_batch(batch)
+
+
+def aggregate_tables(
+    config: dict[str, Any],
+    casepath: str | Path,
+    ensemble_name: str,
+    content: str,
+    name: str,
+    tagname: str = "",
+    realizations: Iterable[int] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Path:
+    """Aggregate a table exported by the realizations into one ensemble table.
+
+    The realization tables are found through the export manifests or the metadata
+    files in the realizations, and are streamed into one parquet file with a 'REAL'
+    column added. The ensemble table is exported with full metadata to
+    casepath/share/ensemble/<ensemble_name>/share/results/. Only a batch of rows is
+    held in memory at a time, independent of the number of realizations.
+
+    Args:
+        config: The global configuration.
+        casepath: The path to the case.
+        ensemble_name: The name of the ensemble, e.g. 'iter-0'.
+        content: The content of the realization tables.
+        name: The name of the realization tables.
+        tagname: The tagname of the realization tables.
+        realizations: Only include these realizations. Default is all.
+        batch_size: Maximum number of rows read from a realization table at a time.
+
+    Returns:
+        The path to the exported ensemble table.
+
+    Examples:
+        Aggregate the inplace volumes from an ensemble in an Ert workflow::
+
+            from fmu.dataio.aggregation import aggregate_tables
+
+            aggregate_tables(
+                config=CFG,
+                casepath="/scratch/fmu/user/mycase",
+                ensemble_name="iter-0",
+                content="volumes",
+                name="geogrid",
+            )
+
+    """
+    casepath = Path(casepath)
+    exports = find_realization_exports(
+        casepath,
+        ensemble_name,
+        classname="table",
+        fmt="parquet",
+        suffix=".parquet",
+        content=content,
+        name=name,
+        tagname=tagname,
+        realizations=realizations,
+    )
+    if not exports:
+        raise FileNotFoundError(
+            f"No realization tables with {name=}, {tagname=} and {content=} found in "
+            f"ensemble '{ensemble_name}' of {casepath}"
+        )
+
+    metadata = exports[0].metadata
+    fmu = metadata.get("fmu", {})
+    realization_ids = [export.realization for export in exports]
+    aggregation = fields.Aggregation(
+        id=uuid_from_string(
+            f"{fmu.get('case', {}).get('uuid')}{ensemble_name}"
+            f"{fmu.get('entity', {}).get('uuid')}{AGGREGATION_OPERATION}"
+            f"{realization_ids}"
+        ),
+        operation=AGGREGATION_OPERATION,
+        realization_ids=realization_ids,
+    )
+    export_config = build_ensemble_export_config(
+        config,
+        casepath,
+        ensemble_name,
+        metadata,
+        name=name,
+        aggregation=aggregation,
+    )
+    export_root = export_config.runcontext.ensemble_path
+    if export_root is None:
+        raise RuntimeError(
+            "Could not establish the ensemble export path. Aggregation must be run "
+            "in an FMU context, for a case with case metadata."
+        )
+
+    logger.info("Aggregating tables from %s realizations", len(exports))
+    export_root.mkdir(parents=True, exist_ok=True)
+    tmpfile = export_root / f".{uuid.uuid4().hex}.parquet.tmp"
+    try:
+        _write_ensemble_table(exports, tmpfile, batch_size)
+
+        share_path = SharePathConstructor(
+            export_config, ParquetFileData(tmpfile, export_config)
+        ).get_share_path()
+        outfile = export_root / share_path
+        outfile.parent.mkdir(parents=True, exist_ok=True)
+        tmpfile.replace(outfile)
+    finally:
+        tmpfile.unlink(missing_ok=True)
+
+    return export_objdata_with_metadata(
+        export_config, ParquetFileData(outfile, export_config)
+    )
@@ -0,0 +1,169 @@
+"""Chunked access to the values of exported surfaces and grid properties.
+
+The values are read directly from the files through memory maps, in the order they
+are stored in the file, such that only the part of a file being processed is read
+into memory. Undefined values are returned as NaN. A memory map is only kept open
+while reading, as an ensemble may have more realizations than the number of files
+a process can keep open.
+
+Files with a layout that can not be memory mapped, e.g. irap binary files with
+irregular record lengths or ASCII roff files, are read once with xtgeo and spilled to
+a temporary ``.npy`` file in file order, which is then memory mapped.
+"""
+
+from __future__ import annotations
+
+import mmap
+import uuid
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+import xtgeo
+from xtgeo.common.constants import UNDEF_MAP_IRAPB
+
+from fmu.dataio._logging import null_logger
+from fmu.dataio._readers.values import ValuesLayout, irap_binary_layout
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger: Final = null_logger(__name__)
+
+# Undefined value as stored in roff files
+ROFF_UNDEF: Final = -999.0
+
+_ROFF_BYTESWAPTEST: Final = b"byteswaptest\x00"
+_ROFF_FLOAT_DATA: Final = b"array\x00float\x00data\x00"
+
+
+def _spill(values: np.ndarray, spill_dir: Path) -> ValuesLayout:
+    """Spill values in file order to a temporary file."""
+    path = spill_dir / f"{uuid.uuid4().hex}.npy"
+    np.save(path, np.ma.filled(values.astype(np.float64), np.nan))
+    array = np.load(path, mmap_mode="r")
+    return ValuesLayout(path, array.dtype, array.offset, array.size)
+
+
+class ValuesReader(ABC):
+    """Reads a range of values from a file, in the order they are stored."""
+
+    path: Path
+    shape: tuple[int, ...]
+    size: int
+    _layout: ValuesLayout
+
+    def read(self, start: int, stop: int) -> np.ndarray:
+        """Return the values in the range as float64, with NaN for undefined."""
+        values = self._layout.read(start, stop).astype(np.float64)
+        values[self._undefined(values)] = np.nan
+        return values
+
+    @staticmethod
+    @abstractmethod
+    def _undefined(values: np.ndarray) -> np.ndarray:
+        """Return a mask of the values that are undefined in the file."""
+
+    @abstractmethod
+    def to_object(
+        self, values: np.ndarray
+    ) -> xtgeo.RegularSurface | xtgeo.GridProperty:
+        """Return a copy of the object in the file with the values replaced, given in
+        the order they are stored in the file."""
+
+
+class IrapBinaryValues(ValuesReader):
+    """Values of an irap binary surface file.
+
+    The file stores the values row by row, with the column index running fastest, in
+    big-endian Fortran records. The values are memory mapped if all data records have
+    the same length.
+    """
+
+    def __init__(self, path: Path, spill_dir: Path) -> None:
+        self.path = path
+
+        self.ncol, self.nrow, layout = irap_binary_layout(path)
+        self.shape = (self.ncol, self.nrow)
+        self.size = self.ncol * self.nrow
+
+        if layout is None:
+            logger.debug("Irap binary file %s can not be memory mapped", path)
+            surf = xtgeo.surface_from_file(path, fformat="irap_binary")
+            layout = _spill(surf.values.ravel(order="F"), spill_dir)
+        self._layout = layout
+
+    @staticmethod
+    def _undefined(values: np.ndarray) -> np.ndarray:
+        return values >= UNDEF_MAP_IRAPB
+
+    def to_object(self, values: np.ndarray) -> xtgeo.RegularSurface:
+        surf = xtgeo.surface_from_file(self.path, fformat="irap_binary")
+        surf.values = np.ma.masked_invalid(values.reshape(self.nrow, self.ncol).T)
+        return surf
+
+
+class RoffValues(ValuesReader):
+    """Values of a roff grid property file with continuous values.
+
+    The values are stored with the layer index running fastest and the layers in
+    reverse order compared to xtgeo. The data array of the parameter is memory
+    mapped in binary roff files.
+    """
+
+    def __init__(self, path: Path, spill_dir: Path) -> None:
+        self.path = path
+
+        layout = self._find_layout()
+        if layout is None:
+            logger.debug("Roff file %s can not be memory mapped", path)
+            prop = xtgeo.gridproperty_from_file(path, fformat="roff")
+            if prop.isdiscrete:
+                raise ValueError(
+                    "Statistics can not be computed for the discrete property in "
+                    f"{path}"
+                )
+            layout = _spill(np.flip(prop.values, axis=2).ravel(), spill_dir)
+        self._layout = layout
+        self.shape = (layout.shape,)
+        self.size = layout.shape
+
+    def _find_layout(self) -> ValuesLayout | None:
+        """Return the layout of the float data array, if the file is binary roff with
+        a single float array."""
+        with (
+            open(self.path, "rb") as stream,
+            mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        ):
+            if buffer[:8] != b"roff-bin":
+                return None
+
+            test = buffer.find(_ROFF_BYTESWAPTEST)
+            data = buffer.find(_ROFF_FLOAT_DATA)
+            if test < 0 or data < 0 or buffer.rfind(_ROFF_FLOAT_DATA) != data:
+                return None
+
+            test_offset = test + len(_ROFF_BYTESWAPTEST)
+            is_little_endian = buffer[test_offset : test_offset + 4] == b"\x01\0\0\0"
+            byteorder = "<" if is_little_endian else ">"
+
+            count_offset = data + len(_ROFF_FLOAT_DATA)
+            count = int.from_bytes(
+                buffer[count_offset : count_offset + 4],
+                "little" if is_little_endian else "big",
+            )
+
+        return ValuesLayout(
+            self.path, np.dtype(f"{byteorder}f4"), count_offset + 4, count
+        )
+
+    @staticmethod
+    def _undefined(values: np.ndarray) -> np.ndarray:
+        return values == ROFF_UNDEF
+
+    def to_object(self, values: np.ndarray) -> xtgeo.GridProperty:
+        prop = xtgeo.gridproperty_from_file(self.path, fformat="roff")
+        prop.values = np.ma.masked_invalid(
+            np.flip(values.reshape(prop.ncol, prop.nrow, prop.nlay), axis=2)
+        )
+        return prop
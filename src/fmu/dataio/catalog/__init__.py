@@ -0,0 +1,21 @@
+from ._catalog import CatalogEntry, MetadataCatalog, get_catalog_path
+from ._verify import (
+    VerificationMode,
+    VerificationReport,
+    VerificationResult,
+    VerificationSource,
+    VerificationStatus,
+    verify_case,
+)
+
+__all__ = [
+    "CatalogEntry",
+    "MetadataCatalog",
+    "VerificationMode",
+    "VerificationReport",
+    "VerificationResult",
+    "VerificationSource",
+    "VerificationStatus",
+    "get_catalog_path",
+    "verify_case",
+]
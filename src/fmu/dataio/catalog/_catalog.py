@@ -0,0 +1,414 @@
+"""
+This module provides a catalog of the metadata of the objects exported in a case.
+
+The catalog is a SQLite database at ``<casepath>/share/metadata/``, with one row per
+exported object holding the fields that are commonly filtered on together with the
+complete metadata. It is fed incrementally from the export manifests, such that only
+the sidecar files of objects exported since the last update are read.
+
+Realizations append concurrently to their own export manifests, not to the catalog.
+The catalog is updated from the manifests by the WF_UPDATE_CATALOG_DATAIO workflow,
+run after the realizations have finished.
+
+Concurrent writers on the same host are supported. They are serialized by the
+database lock, taken up front for each batch of rows, and a writer waits up to
+CATALOG_TIMEOUT seconds for the lock before giving up. The rollback journal is used
+rather than write-ahead logging, which needs shared memory between the writers.
+
+Concurrent writers on different hosts are not supported. The catalog usually lies on a
+network file system, where SQLite locking is not reliable. Updating the catalog from
+realizations running on several hosts at the same time is therefore out of scope, and
+may corrupt the catalog.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import yaml
+
+from fmu.dataio._definitions import ShareFolder
+from fmu.dataio._logging import null_logger
+from fmu.dataio.manifest._manifest import MANIFEST_FILENAME
+from fmu.dataio.manifest._models import ExportManifest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger: Final = null_logger(__name__)
+
+CATALOG_FILENAME: Final = "catalog.sqlite"
+
+# Seconds to wait for other processes writing to the catalog
+CATALOG_TIMEOUT: Final = 300.0
+
+_SCHEMA: Final = (
+    """
+CREATE TABLE IF NOT EXISTS objects (
+    relative_path TEXT PRIMARY KEY,
+    class TEXT,
+    content TEXT,
+    name TEXT,
+    tagname TEXT,
+    format TEXT,
+    ensemble TEXT,
+    realization INTEGER,
+    time0 TEXT,
+    time1 TEXT,
+    mtime_ns INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+)
+""",
+    """
+CREATE INDEX IF NOT EXISTS objects_class_content_name
+    ON objects (class, content, name)
+""",
+    """
+CREATE INDEX IF NOT EXISTS objects_ensemble_realization
+    ON objects (ensemble, realization)
+""",
+    # the number of entries in each export manifest that have been added
+    """
+CREATE TABLE IF NOT EXISTS manifests (
+    path TEXT PRIMARY KEY,
+    entries INTEGER NOT NULL
+)
+""",
+)
+
+_INSERT: Final = """
+INSERT OR REPLACE INTO objects VALUES (
+    :relative_path, :class, :content, :name, :tagname, :format, :ensemble,
+    :realization, :time0, :time1, :mtime_ns, :metadata
+)
+"""
+
+
+def get_catalog_path(casepath: Path | str) -> Path:
+    """Return the path to the metadata catalog of a case."""
+    return Path(casepath) / "share/metadata" / CATALOG_FILENAME
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """An object in the catalog."""
+
+    path: Path
+    """The absolute path to the exported file."""
+
+    metadata: dict[str, Any]
+    """The metadata of the object."""
+
+
+def export_roots(casepath: Path) -> Iterator[Path]:
+    """Yield the case, the export roots of the ensembles and the runpaths of the
+    realizations in the case."""
+    yield casepath
+    yield from sorted(casepath.glob("share/ensemble/*"))
+    for realization_path in sorted(casepath.glob("realization-*")):
+        yield realization_path
+        yield from sorted(p for p in realization_path.iterdir() if p.is_dir())
+
+
+def find_manifest_paths(casepath: Path) -> list[Path]:
+    """Return the paths to the export manifests in the case and its realizations."""
+    return [
+        root / MANIFEST_FILENAME
+        for root in export_roots(casepath)
+        if (root / MANIFEST_FILENAME).exists()
+    ]
+
+
+def metadata_path(path: Path) -> Path:
+    """Return the path to the metadata file of an exported file."""
+    return path.parent / f".{path.name}.yml"
+
+
+def _data_path(sidecar: Path) -> Path:
+    return sidecar.parent / sidecar.name[1:].removesuffix(".yml")
+
+
+def _time(data: dict[str, Any], key: str) -> str | None:
+    """Return a time of the object in a normalized ISO format."""
+    value = ((data.get("time") or {}).get(key) or {}).get("value")
+    if value is None:
+        return None
+    return _normalize_time(value)
+
+
+def _normalize_time(value: str | datetime) -> str:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.isoformat()
+
+
+class MetadataCatalog:
+    """A catalog of the metadata of the objects exported in a case.
+
+    Example::
+
+        catalog = MetadataCatalog(casepath)
+        catalog.update()
+        surfaces = catalog.query(
+            classname="surface", content="depth", ensemble="iter-2", tagname="extract"
+        )
+
+    The catalog can be updated by several processes on the same host at the same
+    time, but not from several hosts, see the module documentation.
+
+    Args:
+        casepath: The path to the case.
+    """
+
+    def __init__(self, casepath: Path | str) -> None:
+        self.casepath = Path(casepath).resolve()
+        self.path = get_catalog_path(self.casepath)
+        self._has_schema = False
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection holding the write lock of the catalog until the
+        transaction is committed, or rolled back on errors."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(
+            sqlite3.connect(self.path, timeout=CATALOG_TIMEOUT, isolation_level=None)
+        ) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        self._has_schema = True
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection for reading the catalog."""
+        if not self._has_schema:
+            with self._transaction():
+                pass
+        with closing(sqlite3.connect(self.path, timeout=CATALOG_TIMEOUT)) as connection:
+            yield connection
+
+    def _relative_path(self, path: Path) -> str:
+        """Return the path relative to the case, if inside the case."""
+        if path.is_relative_to(self.casepath):
+            return str(path.relative_to(self.casepath))
+        return str(path)
+
+    def _row(self, path: Path) -> dict[str, Any] | None:
+        """Read the sidecar file of an exported file into a catalog row."""
+        sidecar = metadata_path(path)
+        try:
+            mtime_ns = sidecar.stat().st_mtime_ns
+            with open(sidecar, encoding="utf-8") as stream:
+                metadata = yaml.safe_load(stream)
+        except FileNotFoundError:
+            logger.debug("No metadata for %s, not added to the catalog", path)
+            return None
+
+        fmu = metadata.get("fmu") or {}
+        data = metadata.get("data") or {}
+        return {
+            "relative_path": self._relative_path(path),
+            "class": metadata.get("class"),
+            "content": data.get("content"),
+            "name": data.get("name"),
+            "tagname": data.get("tagname"),
+            "format": data.get("format"),
+            "ensemble": (fmu.get("ensemble") or {}).get("name"),
+            "realization": (fmu.get("realization") or {}).get("id"),
+            "time0": _time(data, "t0"),
+            "time1": _time(data, "t1"),
+            "mtime_ns": mtime_ns,
+            "metadata": json.dumps(metadata, default=str),
+        }
+
+    def _changed_rows(self, paths: Iterable[Path]) -> list[dict[str, Any]]:
+        """Read the sidecar files that have changed since they were added."""
+        rows = []
+        with self._connection() as connection:
+            for path in dict.fromkeys(paths):
+                indexed = connection.execute(
+                    "SELECT mtime_ns FROM objects WHERE relative_path = ?",
+                    (self._relative_path(path),),
+                ).fetchone()
+                sidecar = metadata_path(path)
+                if (
+                    indexed
+                    and sidecar.exists()
+                    and sidecar.stat().st_mtime_ns == indexed[0]
+                ):
+                    continue
+                if row := self._row(path):
+                    rows.append(row)
+        return rows
+
+    def _write(
+        self,
+        rows: list[dict[str, Any]],
+        manifests: dict[str, int],
+        *,
+        replace_all: bool = False,
+    ) -> int:
+        """Write rows and the number of added manifest entries in one transaction."""
+        with self._transaction() as connection:
+            if replace_all:
+                connection.execute("DELETE FROM objects")
+                connection.execute("DELETE FROM manifests")
+            connection.executemany(_INSERT, rows)
+            connection.executemany(
+                "INSERT OR REPLACE INTO manifests VALUES (?, ?)", manifests.items()
+            )
+        logger.debug("Wrote %s objects to the catalog %s", len(rows), self.path)
+        return len(rows)
+
+    def add(self, paths: Iterable[Path | str]) -> int:
+        """Add exported files to the catalog, replacing them if already added.
+
+        Files with unchanged metadata since they were added are skipped.
+
+        Args:
+            paths: The paths to the exported files.
+
+        Returns:
+            The number of objects added or updated.
+        """
+        return self._write(
+            self._changed_rows(Path(path).resolve() for path in paths), {}
+        )
+
+    def update(self, manifest_paths: Iterable[Path | str] | None = None) -> int:
+        """Add the objects exported since the last update, as listed in the export
+        manifests.
+
+        Only the manifest entries added since the last update are read, as the export
+        manifests are only appended to.
+
+        Args:
+            manifest_paths: The paths to the export manifests to update from. Default
+                is all export manifests in the case and its realizations.
+
+        Returns:
+            The number of objects added or updated.
+        """
+        manifests = (
+            [Path(path).resolve() for path in manifest_paths]
+            if manifest_paths is not None
+            else find_manifest_paths(self.casepath)
+        )
+
+        paths: list[Path] = []
+        progress: dict[str, int] = {}
+        with self._connection() as connection:
+            for manifest_path in manifests:
+                if not manifest_path.exists():
+                    logger.debug("No export manifest at %s", manifest_path)
+                    continue
+
+                entries = ExportManifest.from_file(manifest_path).root
+                indexed = connection.execute(
+                    "SELECT entries FROM manifests WHERE path = ?",
+                    (str(manifest_path),),
+                ).fetchone()
+                start = indexed[0] if indexed else 0
+                if start > len(entries):
+                    # the manifest has been recreated
+                    start = 0
+                paths.extend(entry.absolute_path for entry in entries[start:])
+                progress[str(manifest_path)] = len(entries)
+
+        return self._write(self._changed_rows(paths), progress)
+
+    def rebuild(self) -> int:
+        """Rebuild the catalog from the metadata files in the share folders of the
+        case and its realizations.
+
+        Returns:
+            The number of objects in the catalog.
+        """
+        rows = [
+            row
+            for root in export_roots(self.casepath)
+            for folder in ShareFolder
+            for sidecar in sorted((root / folder.value).rglob(".*.yml"))
+            if (row := self._row(_data_path(sidecar)))
+        ]
+        progress = {
+            str(path): len(ExportManifest.from_file(path))
+            for path in find_manifest_paths(self.casepath)
+        }
+        logger.info("Rebuilding the catalog %s", self.path)
+        return self._write(rows, progress, replace_all=True)
+
+    def query(
+        self,
+        *,
+        classname: str | None = None,
+        content: str | None = None,
+        name: str | None = None,
+        tagname: str | None = None,
+        fmt: str | None = None,
+        ensemble: str | None = None,
+        realization: int | Iterable[int] | None = None,
+        time0: str | datetime | None = None,
+        time1: str | datetime | None = None,
+    ) -> list[CatalogEntry]:
+        """Return the objects in the catalog matching all the given criteria.
+
+        Args:
+            classname: The class of the objects, e.g. 'surface'.
+            content: The content of the objects, e.g. 'depth'.
+            name: The name of the objects.
+            tagname: The tagname of the objects.
+            fmt: The file format of the objects, e.g. 'irap_binary'.
+            ensemble: The name of the ensemble, e.g. 'iter-0'.
+            realization: The realization number, or several realization numbers.
+            time0: The first time of the objects.
+            time1: The second time of the objects.
+
+        Returns:
+            The matching objects sorted by path.
+        """
+        criteria: dict[str, Any] = {
+            "class": classname,
+            "content": content,
+            "name": name,
+            "tagname": tagname,
+            "format": fmt,
+            "ensemble": ensemble,
+            "time0": _normalize_time(time0) if time0 is not None else None,
+            "time1": _normalize_time(time1) if time1 is not None else None,
+        }
+        clauses = [f"{column} = ?" for column, v in criteria.items() if v is not None]
+        params: list[Any] = [v for v in criteria.values() if v is not None]
+
+        if realization is not None:
+            realizations = (
+                [realization] if isinstance(realization, int) else list(realization)
+            )
+            clauses.append(f"realization IN ({', '.join('?' * len(realizations))})")
+            params.extend(realizations)
+
+        # only the column names are formatted into the statement, never the values
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connection() as connection:
+            rows = connection.execute(
+                f"SELECT relative_path, metadata FROM objects {where} "
+                "ORDER BY relative_path",
+                params,
+            ).fetchall()
+
+        return [
+            CatalogEntry(self.casepath / relative_path, json.loads(metadata))
+            for relative_path, metadata in rows
+        ]
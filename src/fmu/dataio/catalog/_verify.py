@@ -0,0 +1,325 @@
+"""
+This module verifies that the exported files in a case match their metadata.
+
+The files to verify are found from the export manifests or from the metadata catalog
+of the case. The files are verified in parallel by a bounded number of threads, as
+hashing is mostly waiting for I/O and releases the GIL.
+
+The result of each file is appended to a state file in ``<casepath>/share/metadata/``
+as soon as it is verified, such that an interrupted verification can be resumed. A
+file that can not be verified, e.g. as it is removed while verified or its metadata
+can not be parsed, is recorded with the error, and verified again when resumed.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import yaml
+
+from fmu.dataio._export.serialize import (
+    compute_dataset_md5_and_size,
+    compute_dataset_parts,
+)
+from fmu.dataio._logging import null_logger
+from fmu.dataio._utils import md5sum
+from fmu.dataio.manifest._models import ExportManifest
+
+from ._catalog import (
+    MetadataCatalog,
+    find_manifest_paths,
+    get_catalog_path,
+    metadata_path,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger: Final = null_logger(__name__)
+
+# Number of files verified at the same time
+DEFAULT_MAX_WORKERS: Final = 8
+
+
+class VerificationMode(StrEnum):
+    """How thoroughly the files are verified."""
+
+    cheap = "cheap"
+    """Compare the size of the files, and check that they have not been modified
+    after their metadata was written."""
+
+    full = "full"
+    """Compare the size and the MD5 checksum of the files."""
+
+
+class VerificationSource(StrEnum):
+    """Where the files to verify are found."""
+
+    manifest = "manifest"
+    """The export manifests of the case and its realizations."""
+
+    catalog = "catalog"
+    """The metadata catalog of the case."""
+
+
+class VerificationStatus(StrEnum):
+    """The result of verifying a file."""
+
+    ok = "ok"
+    missing = "missing"
+    missing_metadata = "missing_metadata"
+    size_mismatch = "size_mismatch"
+    checksum_mismatch = "checksum_mismatch"
+    modified = "modified"
+    error = "error"
+
+
+@dataclass(frozen=True)
+class VerificationResult:
+    """The result of verifying an exported file."""
+
+    path: Path
+    status: VerificationStatus
+    detail: str = ""
+
+
+@dataclass(frozen=True)
+class VerificationReport:
+    """The results of verifying the exported files in a case."""
+
+    results: list[VerificationResult] = field(default_factory=list)
+
+    @property
+    def failed(self) -> list[VerificationResult]:
+        """The results of the files that do not match their metadata."""
+        return [r for r in self.results if r.status != VerificationStatus.ok]
+
+    @property
+    def ok(self) -> bool:
+        """Whether all files match their metadata."""
+        return not self.failed
+
+
+def get_verification_state_path(casepath: Path | str, mode: VerificationMode) -> Path:
+    """Return the path to the state file of a verification of a case."""
+    return get_catalog_path(casepath).parent / f"verification-{mode}.jsonl"
+
+
+def _verify_dataset(
+    path: Path, file: dict[str, Any], mode: VerificationMode, metadata_mtime_ns: int
+) -> VerificationResult:
+    """Verify a dataset exported as a directory against the parts in its metadata."""
+    for part in file.get("parts") or []:
+        part_path = path / part["relative_path"]
+        if not part_path.is_file():
+            return VerificationResult(
+                path, VerificationStatus.missing, f"part {part['relative_path']}"
+            )
+        stat = part_path.stat()
+        if stat.st_size != part["size_bytes"]:
+            return VerificationResult(
+                path,
+                VerificationStatus.size_mismatch,
+                f"part {part['relative_path']}: {stat.st_size} bytes, expected "
+                f"{part['size_bytes']}",
+            )
+        if mode == VerificationMode.cheap and stat.st_mtime_ns > metadata_mtime_ns:
+            return VerificationResult(
+                path, VerificationStatus.modified, f"part {part['relative_path']}"
+            )
+
+    if mode == VerificationMode.full:
+        checksum, _ = compute_dataset_md5_and_size(compute_dataset_parts(path))
+        if checksum != file["checksum_md5"]:
+            return VerificationResult(path, VerificationStatus.checksum_mismatch)
+    return VerificationResult(path, VerificationStatus.ok)
+
+
+def _verify_file(
+    path: Path, metadata: dict[str, Any] | None, mode: VerificationMode
+) -> VerificationResult:
+    """Verify an exported file against its metadata, read from the sidecar file if
+    not given."""
+    sidecar = metadata_path(path)
+    if not sidecar.exists():
+        return VerificationResult(path, VerificationStatus.missing_metadata)
+    metadata_mtime_ns = sidecar.stat().st_mtime_ns
+
+    if metadata is None:
+        with open(sidecar, encoding="utf-8") as stream:
+            metadata = yaml.safe_load(stream)
+    file = metadata["file"]
+
+    if not path.exists():
+        return VerificationResult(path, VerificationStatus.missing)
+    if path.is_dir():
+        return _verify_dataset(path, file, mode, metadata_mtime_ns)
+
+    stat = path.stat()
+    if stat.st_size != file["size_bytes"]:
+        return VerificationResult(
+            path,
+            VerificationStatus.size_mismatch,
+            f"{stat.st_size} bytes, expected {file['size_bytes']}",
+        )
+
+    if mode == VerificationMode.cheap:
+        if stat.st_mtime_ns > metadata_mtime_ns:
+            return VerificationResult(path, VerificationStatus.modified)
+        return VerificationResult(path, VerificationStatus.ok)
+
+    if md5sum(path) != file["checksum_md5"]:
+        return VerificationResult(path, VerificationStatus.checksum_mismatch)
+    return VerificationResult(path, VerificationStatus.ok)
+
+
+def _verify_file_or_error(
+    path: Path, metadata: dict[str, Any] | None, mode: VerificationMode
+) -> VerificationResult:
+    """Verify an exported file, with any error raised recorded in the result."""
+    try:
+        return _verify_file(path, metadata, mode)
+    except Exception as err:
+        logger.warning("Unable to verify %s: %s", path, err)
+        return VerificationResult(
+            path, VerificationStatus.error, f"{type(err).__name__}: {err}"
+        )
+
+
+def _files_to_verify(
+    casepath: Path, source: VerificationSource
+) -> Iterator[tuple[Path, dict[str, Any] | None]]:
+    """Yield the exported files in a case, with their metadata if known."""
+    if source == VerificationSource.catalog:
+        catalog = MetadataCatalog(casepath)
+        if not catalog.path.exists():
+            raise FileNotFoundError(f"No metadata catalog found at {catalog.path}")
+        for entry in catalog.query():
+            yield entry.path, entry.metadata
+        return
+
+    paths = (
+        entry.absolute_path
+        for manifest_path in find_manifest_paths(casepath)
+        for entry in ExportManifest.from_file(manifest_path).root
+    )
+    for path in dict.fromkeys(paths):
+        yield path, None
+
+
+def _read_state(state_path: Path) -> dict[Path, VerificationResult]:
+    """Read the results of a previous verification."""
+    if not state_path.exists():
+        return {}
+
+    results = {}
+    with open(state_path, encoding="utf-8") as stream:
+        for line in stream:
+            try:
+                state = json.loads(line)
+            except json.JSONDecodeError:
+                # the last line of an interrupted verification may be incomplete
+                continue
+            result = VerificationResult(
+                Path(state["path"]),
+                VerificationStatus(state["status"]),
+                state["detail"],
+            )
+            results[result.path] = result
+    return results
+
+
+def verify_case(
+    casepath: Path | str,
+    *,
+    mode: VerificationMode | str = VerificationMode.full,
+    source: VerificationSource | str = VerificationSource.manifest,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    resume: bool = False,
+) -> VerificationReport:
+    """Verify that the exported files in a case match the checksums and sizes in
+    their metadata.
+
+    Example::
+
+        report = verify_case(casepath, mode="cheap")
+        for result in report.failed:
+            print(result.path, result.status)
+
+    Args:
+        casepath: The path to the case.
+        mode: 'full' compares the size and MD5 checksum of the files, 'cheap' only
+            compares the size and checks that the files have not been modified after
+            their metadata was written.
+        source: Find the files from the export manifests ('manifest') or from the
+            metadata catalog ('catalog') of the case.
+        max_workers: The maximum number of files verified at the same time.
+        resume: Skip the files verified by a previous, possibly interrupted,
+            verification with the same mode. Files that could not be verified due
+            to an error are verified again.
+
+    Returns:
+        The results of all the verified files.
+    """
+    casepath = Path(casepath).resolve()
+    mode = VerificationMode(mode)
+    source = VerificationSource(source)
+
+    state_path = get_verification_state_path(casepath, mode)
+    results = (
+        {
+            path: result
+            for path, result in _read_state(state_path).items()
+            if result.status != VerificationStatus.error
+        }
+        if resume
+        else {}
+    )
+    files = (
+        (path, metadata)
+        for path, metadata in _files_to_verify(casepath, source)
+        if path not in results
+    )
+    logger.info(
+        "Verifying the files in %s, %s already verified", casepath, len(results)
+    )
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    with (
+        open(state_path, "a" if resume else "w", encoding="utf-8") as state,
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
+        # only a bounded number of files are queued, such that an interruption only
+        # waits for the files being verified
+        pending: set[Future[VerificationResult]] = {
+            executor.submit(_verify_file_or_error, path, metadata, mode)
+            for path, metadata in itertools.islice(files, 2 * max_workers)
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results[result.path] = result
+                state.write(
+                    json.dumps(
+                        {
+                            "path": str(result.path),
+                            "status": result.status.value,
+                            "detail": result.detail,
+                        }
+                    )
+                    + "\n"
+                )
+            state.flush()
+            pending |= {
+                executor.submit(_verify_file_or_error, path, metadata, mode)
+                for path, metadata in itertools.islice(files, len(done))
+            }
+
+    return VerificationReport(sorted(results.values(), key=lambda r: r.path))
@@ -5,14 +5,28 @@ The metadata spec is documented as a JSON schema, stored under schema/.
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import copy
 import warnings
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal
 
 from fmu.datamodels.fmu_results.global_configuration import GlobalConfiguration
 
-from ._export import ExportConfig, export_with_metadata, export_without_metadata
+from ._background import submit
+from ._export import (
+    CONTEXT_FIELDS,
+    ExportConfig,
+    ExportContext,
+    ExportPlan,
+    export_to_buffer,
+    export_with_metadata,
+    export_without_metadata,
+    plan_export,
+    resolve_per_object_field,
+)
 from ._export.deprecations import _check_vertical_domain_dict
 from ._logging import null_logger
 from ._metadata import generate_metadata
@@ -21,6 +35,9 @@ from .exceptions import ValidationError
 from .preprocessed import ExportPreprocessedData
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Executor, Future
+
     from . import types
 
 
@@ -38,11 +55,66 @@ def _future_warning_preprocessed() -> None:
     )
 
 
+def _future_warning_missing_config() -> None:
+    warnings.warn(
+        "From fmu.dataio version 3.0 it will not be possible to produce "
+        "metadata when the global config is invalid.",
+        FutureWarning,
+    )
+
+
 # ======================================================================================
 # Public function to read/load assosiated metadata given a file (e.g. a map file)
 # ======================================================================================
 
 
+def _snapshot(obj: types.ExportableData) -> types.ExportableData:
+    """Return a copy of an object that is not shared with the caller.
+
+    Immutable objects, e.g. pyarrow Tables, and streams of record batches, which can
+    only be consumed once, are returned as they are.
+    """
+    if isinstance(obj, dict):
+        return copy.deepcopy(obj)
+    if callable(getattr(obj, "copy", None)):
+        return obj.copy()  # type: ignore[union-attr]
+    return obj
+
+
+def _reject_file(obj: types.ExportableData, action: str) -> types.ExportableData:
+    """Raise if the object is a file, which can only be exported directly."""
+    if isinstance(obj, str | Path):
+        raise TypeError(f"Only objects in memory can be {action}, not files.")
+    return obj
+
+
+def _export_in_background(
+    export_config: ExportConfig, obj: types.ExportableData
+) -> str:
+    """Export an object away from the calling thread, returns the path as a string."""
+    if export_config.config is None:
+        return str(export_without_metadata(export_config, obj))
+    return str(export_with_metadata(export_config, obj))
+
+
+async def _aexport(
+    export_config: ExportConfig,
+    obj: types.ExportableData,
+    executor: Executor | None,
+) -> str:
+    """Export an object in an executor, without blocking the event loop. The export
+    runs with the settings of the calling task, e.g. the metadata validation level."""
+    _reject_file(obj, "exported asynchronously")
+    if export_config.config is None:
+        _future_warning_missing_config()
+    logger.info("Exporting object of type %s in an executor", type(obj))
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        executor, context.run, _export_in_background, export_config, obj
+    )
+
+
 def read_metadata(filename: str | Path) -> dict:
     """Read the metadata as a dictionary given a filename.
 
@@ -366,6 +438,29 @@ class ExportData:
 
     """
 
+    partition_by: list[str] | None = None
+    """Optional. A list of table index columns to partition tabular data on.
+
+    If given, the table is exported as a directory of parquet files partitioned on the
+    values of these columns, in the Hive layout, instead of as one file. The table is
+    written batch by batch, and can also be given as a ``pyarrow.RecordBatchReader``,
+    such that very large tables never need to be held in memory.
+
+    .. code-block::
+
+       partition_by=["REAL", "ZONE"],
+
+    .. code-block:: shell
+
+       grid_cells.parquet/REAL=0/ZONE=Valysar/part-0.parquet
+       grid_cells.parquet/REAL=0/ZONE=Therys/part-0.parquet
+       .grid_cells.parquet.yml
+
+    One metadata file is exported for the directory, with the checksum and size of
+    each part in ``file.parts``. The columns must be part of the :attr:`table_index`.
+
+    """
+
     preprocessed: bool = False
     """If True, data is exported to the ``"share/preprocessed/"`` directory.
 
@@ -576,11 +671,14 @@ class ExportData:
     _cached_export_config: ExportConfig | None = field(
         default=None, init=False, repr=False
     )
+    _cached_export_context: ExportContext | None = field(
+        default=None, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         logger.info("Running __post_init__ ExportData")
 
-        self._cached_export_config = ExportConfig.from_export_data(self)
+        self._cached_export_config = self._build_export_config()
 
         object.__setattr__(self, "_initialized", True)
         logger.info("Ran __post_init__")
@@ -593,14 +691,24 @@ class ExportData:
             An immutable ExportConfig with all resolved values.
         """
         if self._cached_export_config is None:
-            self._cached_export_config = ExportConfig.from_export_data(self)
+            self._cached_export_config = self._build_export_config()
         return self._cached_export_config
 
+    def _build_export_config(self) -> ExportConfig:
+        """Resolve the ExportConfig, reusing the export context resolved earlier."""
+        export_config = ExportConfig.from_export_data(self, self._cached_export_context)
+        self._cached_export_context = ExportContext.from_export_config(export_config)
+        return export_config
+
     def __setattr__(self, name: str, value: Any) -> None:
         """Catch attribute mutations and warn."""
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+
         is_initialized = getattr(self, "_initialized", False)
 
-        if is_initialized and not name.startswith("_") and name != "config":
+        if is_initialized and name != "config":
             warnings.warn(
                 f"Mutating ExportData.{name} after initialization is deprecated "
                 "and will be removed in a future version. Create a new ExportData "
@@ -608,16 +716,35 @@ class ExportData:
                 FutureWarning,
             )
 
-        # Invalidate cached config when public properties change. It needs to be
-        # re-created with the new values.
-        object.__setattr__(self, "_cached_export_config", None)
         object.__setattr__(self, name, value)
+        self._update_cached_export_config(name, value)
 
         if name == "vertical_domain":
             maybe_warnings = _check_vertical_domain_dict(value)
             for warning, category in maybe_warnings:
                 warnings.warn(warning, category)
 
+    def _update_cached_export_config(self, name: str, value: Any) -> None:
+        """Update the cached config after a public attribute has changed.
+
+        Arguments only describing the exported object, e.g. 'name' and 'tagname', are
+        applied directly to the cached config. Other arguments invalidate the cached
+        config, which is then re-created with the new values, and arguments the export
+        context is resolved from also invalidate the cached context.
+        """
+        if name in CONTEXT_FIELDS:
+            object.__setattr__(self, "_cached_export_context", None)
+
+        export_config = self._cached_export_config
+        changes = resolve_per_object_field(name, value)
+        object.__setattr__(
+            self,
+            "_cached_export_config",
+            replace(export_config, **changes)
+            if export_config is not None and changes is not None
+            else None,
+        )
+
     def _apply_deprecated_kwargs(self, kwargs: dict[str, Any]) -> None:
         """Deprecated. Updates attributes from kwargs."""
         if not kwargs:
@@ -643,8 +770,9 @@ class ExportData:
             setattr(self, key, value)
             logger.debug(f"Set attribute {key}={value}")
 
-        # Values have changed, so we need a new configuration.
-        self._cached_export_config = ExportConfig.from_export_data(self)
+        # Values have changed, so the configuration is resolved now to surface errors
+        # in the new values. Values only describing the object are already applied.
+        self._cached_export_config = self._export_config
 
     # ==================================================================================
     # Public methods:
@@ -678,11 +806,7 @@ class ExportData:
         logger.info("KW args %s", kwargs)
 
         if self._export_config.config is None:
-            warnings.warn(
-                "From fmu.dataio version 3.0 it will not be possible to produce "
-                "metadata when the global config is invalid.",
-                FutureWarning,
-            )
+            _future_warning_missing_config()
 
         if not compute_md5:
             warnings.warn(
@@ -757,3 +881,179 @@ class ExportData:
             if self._export_config.config is None
             else export_with_metadata(self._export_config, obj)
         )
+
+    def export_to_buffer(self, obj: types.ExportableData) -> tuple[memoryview, dict]:
+        """Serialize a supported data object to memory, without writing to disk.
+
+        The serialized bytes are returned together with the metadata, which describes
+        these exact bytes. The object is only serialized once, and the checksum and
+        size in the metadata are computed from the returned bytes. The ``file`` block
+        holds the paths the object would have been exported to with ``export()``.
+
+        This is useful when the data are handed over directly, e.g. uploaded to Sumo.
+
+        .. code-block:: python
+
+           payload, metadata = ed.export_to_buffer(surface)
+
+        Args:
+            obj: An xtgeo object, Pandas dataframe, or other supported object. A full
+              list of supported data types can be found in the documentation.
+
+        Returns:
+            A tuple of the serialized bytes as a memoryview and the metadata.
+        """
+        _reject_file(obj, "exported to a buffer")
+        if self._export_config.config is None:
+            _future_warning_missing_config()
+
+        return export_to_buffer(self._export_config, obj)
+
+    def export_async(
+        self, obj: types.ExportableData, copy_data: bool = True
+    ) -> Future[str]:
+        """Export a supported data object with metadata on a background worker.
+
+        The export is handed over to a background worker and a future is returned
+        right away, such that e.g. the RMS user interface is not blocked while the
+        object is serialized and written. The exports run one at a time in the order
+        they were submitted, and give the same files and metadata as ``export()``.
+
+        Errors are raised by the returned future, and by ``wait_all()`` which should
+        be called before the script ends.
+
+        .. code-block:: python
+
+           from fmu.dataio.export import wait_all
+
+           for surface in surfaces:
+               ed.export_async(surface)
+           wait_all()
+
+        Args:
+            obj: An xtgeo object, Pandas dataframe, or other supported object. A full
+              list of supported data types can be found in the documentation.
+            copy_data: Export a copy of the object, such that the object can be
+              modified while it is exported. If False, the object must not be
+              modified until the export has completed.
+
+        Returns:
+            A future holding the full path to the exported item.
+        """
+        _reject_file(obj, "exported in the background")
+        snapshot = _snapshot(obj) if copy_data else obj
+        logger.info("Exporting object of type %s in the background", type(obj))
+        return submit(_export_in_background, self._export_config, snapshot)
+
+    async def aexport(
+        self, obj: types.ExportableData, executor: Executor | None = None
+    ) -> str:
+        """Export a supported data object with metadata without blocking the event
+        loop.
+
+        The metadata is built and the object serialized, hashed and written in an
+        executor, giving the same files and metadata as ``export()``. The object must
+        not be modified until the export has completed.
+
+        If the task is cancelled before the export has started, the object is not
+        exported. An export already started is completed, as it can not be
+        interrupted, but its result is discarded.
+
+        .. code-block:: python
+
+           outfile = await ed.aexport(surface)
+
+        Args:
+            obj: An xtgeo object, Pandas dataframe, or other supported object. A full
+              list of supported data types can be found in the documentation.
+            executor: The executor to export in. Defaults to the default executor of
+              the event loop.
+
+        Returns:
+            The full path to the exported item.
+
+        Raises:
+            TypeError: If the object is a file, which can only be exported with
+              ``export()``.
+        """
+        return await _aexport(self._export_config, obj, executor)
+
+    async def aexport_many(
+        self,
+        objects: Iterable[types.ExportableData],
+        max_concurrency: int = 4,
+        executor: Executor | None = None,
+    ) -> list[str]:
+        """Export several supported data objects with metadata without blocking the
+        event loop.
+
+        The objects are exported as with ``aexport()``, with at most
+        ``max_concurrency`` exports running at the same time. If an export fails, the
+        exports not yet started are cancelled, and the errors are raised in an
+        ``ExceptionGroup``.
+
+        .. code-block:: python
+
+           outfiles = await ed.aexport_many(surfaces, max_concurrency=2)
+
+        Args:
+            objects: The objects to export, see ``aexport()``.
+            max_concurrency: The maximum number of exports running at the same time.
+            executor: The executor to export in. Defaults to the default executor of
+              the event loop.
+
+        Returns:
+            The full paths to the exported items, in the order of the objects.
+        """
+        if max_concurrency < 1:
+            raise ValueError("'max_concurrency' must be a positive integer")
+
+        export_config = self._export_config
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def export(obj: types.ExportableData) -> str:
+            async with semaphore:
+                return await _aexport(export_config, obj, executor)
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(export(obj)) for obj in objects]
+        return [task.result() for task in tasks]
+
+    def plan(self, objects: Iterable[types.ExportableData]) -> ExportPlan:
+        """Plan the export of several objects, without serializing or hashing them.
+
+        The paths, entity uuids and estimated file sizes of the objects are resolved
+        up front, such that objects that would be exported to the same path, and
+        overwrite each other, are found before anything is written. A warning is
+        given for each such collision. The planned exports are then exported one by
+        one, e.g. largest first to balance the load when exporting in parallel.
+
+        .. code-block:: python
+
+           plan = ed.plan(surfaces)
+           if plan.collisions:
+               raise ValueError(f"Duplicate exports: {list(plan.collisions)}")
+           for planned in plan.largest_first():
+               planned.export()
+
+        Args:
+            objects: The objects to export. Files, partitioned tables and streams of
+              record batches can not be planned.
+
+        Returns:
+            The plan of the exports, in the order of the objects.
+        """
+        export_config = self._export_config
+        plan = ExportPlan(
+            tuple(
+                plan_export(export_config, _reject_file(obj, "planned"))
+                for obj in objects
+            )
+        )
+        for path, exports in plan.collisions.items():
+            warnings.warn(
+                f"{len(exports)} objects will be exported to the same path, and "
+                f"overwrite each other: {path}",
+                UserWarning,
+            )
+        return plan
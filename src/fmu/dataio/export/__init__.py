@@ -0,0 +1,8 @@
+from fmu.dataio._background import export_async, wait_all
+from fmu.dataio._worker import out_of_process_exports
+
+__all__ = [
+    "export_async",
+    "out_of_process_exports",
+    "wait_all",
+]
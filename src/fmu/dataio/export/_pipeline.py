@@ -0,0 +1,70 @@
+"""Pipelined export of items that are produced one at a time.
+
+Exporting a set of objects from RMS consists of fetching an object from the project
+followed by serializing and writing it to disk. This module overlaps the two, such
+that the next object is fetched while the previous one is exported.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Final, TypeVar
+
+from fmu.dataio._logging import null_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+logger: Final = null_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def export_pipelined(
+    items: Iterable[T],
+    export: Callable[[T], R],
+    max_in_flight: int = 2,
+) -> list[R]:
+    """Export items on a worker thread while the next items are produced.
+
+    The items are produced in the calling thread, which allows them to be fetched
+    lazily from sources that must be accessed from the main thread, e.g. RMS. The
+    ``export`` function is called for one item at a time on a single worker thread,
+    preserving the order of the items. Each item is exported with the context of the
+    calling thread at the time the item was produced, e.g. its metadata validation
+    level, staged writes and background export deferral.
+
+    Args:
+        items: Iterable producing the items to export.
+        export: Function exporting a single item.
+        max_in_flight: Maximum number of produced items waiting for or being exported.
+            Bounds the memory held by produced items.
+
+    Returns:
+        The results from the ``export`` function in the order of the items.
+    """
+    if max_in_flight < 1:
+        raise ValueError("'max_in_flight' must be a positive integer")
+
+    results: list[R] = []
+    pending: deque[Future[R]] = deque()
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dataio") as executor:
+        try:
+            for item in items:
+                run = functools.partial(contextvars.copy_context().run, export, item)
+                pending.append(executor.submit(run))
+                while len(pending) >= max_in_flight:
+                    results.append(pending.popleft().result())
+            while pending:
+                results.append(pending.popleft().result())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+    return results
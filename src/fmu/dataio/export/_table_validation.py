@@ -0,0 +1,233 @@
+"""Columnar validation of tables against the standard result models.
+
+The standard result models describe a table as a list of row models. Validating a
+table by converting every row into a Python dict is slow for large tables, hence the
+row model is translated into a set of column rules that are checked with vectorized
+``pyarrow.compute`` operations. Only if a table fails these checks is it validated
+row by row with pydantic, which produces the error messages users are familiar with.
+"""
+
+from __future__ import annotations
+
+import enum
+import types
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final, Literal, Union, get_args, get_origin
+
+import annotated_types
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from fmu.dataio._logging import null_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from pydantic import BaseModel, RootModel
+    from pydantic.fields import FieldInfo
+
+logger: Final = null_logger(__name__)
+
+_ColumnKind = Literal["int", "float", "str", "enum"]
+
+
+@dataclass(frozen=True)
+class ColumnRule:
+    """Checks applied to a single column, derived from a field in a row model."""
+
+    name: str
+    kind: _ColumnKind
+    required: bool
+    nullable: bool
+    allowed_values: frozenset[str] | None = None
+    ge: float | None = None
+    gt: float | None = None
+    le: float | None = None
+    lt: float | None = None
+
+    @property
+    def has_bounds(self) -> bool:
+        return any(v is not None for v in (self.ge, self.gt, self.le, self.lt))
+
+
+def _get_row_model(model: type[RootModel]) -> type[BaseModel]:
+    """Return the row model from a root model on the form ``list[RowModel]``."""
+    (row_model,) = get_args(model.model_fields["root"].annotation)
+    return row_model
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    """Return the inner annotation and whether None is allowed."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        nullable = len(args) < len(get_args(annotation))
+        if len(args) == 1:
+            return args[0], nullable
+    return annotation, False
+
+
+def _rule_from_field(name: str, field: FieldInfo) -> ColumnRule | None:
+    """Derive a column rule from a pydantic field, or None if not supported."""
+    annotation, nullable = _unwrap_optional(field.annotation)
+
+    kind: _ColumnKind
+    allowed_values = None
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        if not all(isinstance(member.value, str) for member in annotation):
+            return None
+        kind = "enum"
+        allowed_values = frozenset(member.value for member in annotation)
+    elif annotation is float:
+        kind = "float"
+    elif annotation is int:
+        kind = "int"
+    elif annotation is str:
+        kind = "str"
+    else:
+        return None
+
+    bounds: dict[str, float] = {}
+    for constraint in field.metadata:
+        if isinstance(constraint, annotated_types.Ge):
+            bounds["ge"] = float(constraint.ge)  # type: ignore[arg-type]
+        elif isinstance(constraint, annotated_types.Gt):
+            bounds["gt"] = float(constraint.gt)  # type: ignore[arg-type]
+        elif isinstance(constraint, annotated_types.Le):
+            bounds["le"] = float(constraint.le)  # type: ignore[arg-type]
+        elif isinstance(constraint, annotated_types.Lt):
+            bounds["lt"] = float(constraint.lt)  # type: ignore[arg-type]
+        else:
+            return None
+
+    return ColumnRule(
+        name=name,
+        kind=kind,
+        required=field.is_required(),
+        nullable=nullable,
+        allowed_values=allowed_values,
+        **bounds,
+    )
+
+
+@lru_cache
+def get_column_rules(model: type[RootModel]) -> tuple[ColumnRule, ...] | None:
+    """Derive the column rules for a standard result model.
+
+    Returns None if the row model contains fields that can not be checked column-wise,
+    in which case the table must be validated row by row.
+    """
+    rules = []
+    for name, field in _get_row_model(model).model_fields.items():
+        rule = _rule_from_field(field.alias or name, field)
+        if rule is None:
+            logger.debug("Field %s can not be validated column-wise", name)
+            return None
+        rules.append(rule)
+    return tuple(rules)
+
+
+def _column_has_valid_type(column: pa.ChunkedArray, rule: ColumnRule) -> bool:
+    """Check that the column type is one pydantic accepts for the field."""
+    dtype = column.type
+    if pa.types.is_null(dtype):
+        return rule.nullable or column.null_count == 0
+    if rule.kind == "int":
+        return pa.types.is_integer(dtype)
+    if rule.kind == "float":
+        return pa.types.is_integer(dtype) or pa.types.is_floating(dtype)
+    return pa.types.is_string(dtype) or pa.types.is_large_string(dtype)
+
+
+def _column_within_bounds(column: pa.ChunkedArray, rule: ColumnRule) -> bool:
+    """Check that all non-null values are within the bounds of the rule."""
+    if pa.types.is_floating(column.type) and pc.any(pc.is_nan(column)).as_py():
+        return False
+
+    minmax = pc.min_max(column)
+    vmin, vmax = minmax["min"].as_py(), minmax["max"].as_py()
+    if vmin is None:
+        return True
+
+    return not (
+        (rule.ge is not None and vmin < rule.ge)
+        or (rule.gt is not None and vmin <= rule.gt)
+        or (rule.le is not None and vmax > rule.le)
+        or (rule.lt is not None and vmax >= rule.lt)
+    )
+
+
+def _column_satisfies_rule(column: pa.ChunkedArray, rule: ColumnRule) -> bool:
+    """Check a single column against its rule using vectorized operations."""
+    if not rule.nullable and column.null_count > 0:
+        return False
+
+    if not _column_has_valid_type(column, rule):
+        return False
+
+    if pa.types.is_null(column.type):
+        return True
+
+    if rule.allowed_values is not None:
+        value_set = pa.array(sorted(rule.allowed_values), type=column.type)
+        is_allowed = pc.is_in(column, value_set=value_set)
+        if not pc.all(pc.or_kleene(is_allowed, pc.is_null(column))).as_py():
+            return False
+
+    return not rule.has_bounds or _column_within_bounds(column, rule)
+
+
+def table_satisfies_rules(table: pa.Table, rules: tuple[ColumnRule, ...]) -> bool:
+    """Check whether a table satisfies all column rules."""
+    for rule in rules:
+        if rule.name not in table.column_names:
+            if rule.required:
+                return False
+            continue
+        if not _column_satisfies_rule(table[rule.name], rule):
+            logger.debug("Column %s failed the columnar validation", rule.name)
+            return False
+    return True
+
+
+def _to_arrow_table(table: pa.Table | pd.DataFrame) -> pa.Table | None:
+    """Return the table as an Arrow table, or None if it can not be converted."""
+    if isinstance(table, pa.Table):
+        return table
+    try:
+        return pa.Table.from_pandas(table, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        logger.debug("Could not convert dataframe to an Arrow table")
+        return None
+
+
+def _to_records(table: pa.Table | pd.DataFrame) -> list[dict]:
+    """Convert a table to a list of rows, with NaN values replaced by None."""
+    if isinstance(table, pa.Table):
+        return table.to_pylist()
+    return table.replace(np.nan, None).to_dict(orient="records")
+
+
+def validate_table(table: pa.Table | pd.DataFrame, model: type[RootModel]) -> None:
+    """Validate a table against a standard result model.
+
+    The table is first checked column-wise. If that fails, or the model can not be
+    checked column-wise, the table is validated row by row with the pydantic model to
+    give detailed error messages.
+
+    Args:
+        table: The table to validate.
+        model: The standard result root model, on the form ``list[RowModel]``.
+
+    Raises:
+        pydantic.ValidationError: If the table does not conform to the model.
+    """
+    rules = get_column_rules(model)
+    if rules is not None:
+        arrow_table = _to_arrow_table(table)
+        if arrow_table is not None and table_satisfies_rules(arrow_table, rules):
+            logger.debug("Table passed the columnar validation")
+            return
+
+    logger.debug("Validating table row by row against %s", model.__name__)
+    model.model_validate(_to_records(table))
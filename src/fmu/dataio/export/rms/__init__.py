@@ -1,3 +1,4 @@
+from ._cache import rms_fetch_cache
 from .field_outline import export_field_outline
 from .fluid_contact_outlines import export_fluid_contact_outlines
 from .fluid_contact_surfaces import export_fluid_contact_surfaces
@@ -25,4 +26,5 @@ __all__ = [
     "export_fluid_contact_surfaces",
     "export_fluid_contact_outlines",
     "create_fipnum_property",
+    "rms_fetch_cache",
 ]
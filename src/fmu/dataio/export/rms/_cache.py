@@ -0,0 +1,113 @@
+"""Opt-in cache for objects fetched from RMS.
+
+An RMS export script often calls several export functions that fetch the same
+objects from the project, e.g. surfaces from a horizon folder, and look up the project
+units over and over. Inside a ``rms_fetch_cache()`` block, fetched objects and project
+units are memoized and reused by all export functions.
+
+The RMS API does not expose a modification counter for its objects, hence the cache
+is only valid for the lifetime of the ``with`` block. If data in the RMS project is
+modified inside the block, the cache must be cleared with ``RmsFetchCache.clear()``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any, Final, TypeVar
+
+from fmu.dataio._logging import null_logger
+
+logger: Final = null_logger(__name__)
+
+T = TypeVar("T")
+
+_active_cache: RmsFetchCache | None = None
+
+
+class RmsFetchCache:
+    """Memoizes objects fetched from RMS, keyed on the project and object location.
+
+    Cached objects are copied before they are returned, such that callers are free to
+    modify them without affecting the cache.
+    """
+
+    def __init__(self) -> None:
+        self._objects: dict[tuple[Hashable, ...], Any] = {}
+        self._project_units: dict[int, str | None] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_object(
+        self,
+        project: Any,
+        stype: str,
+        folder: str,
+        name: str,
+        fetch: Callable[[], T],
+    ) -> T:
+        """Return a copy of a cached object, fetching it from RMS if not cached."""
+        key = (id(project), stype, folder, name)
+        if key not in self._objects:
+            self.misses += 1
+            logger.debug("Fetching %s from RMS", key[1:])
+            self._objects[key] = fetch()
+        else:
+            self.hits += 1
+            logger.debug("Using cached %s", key[1:])
+        return self._objects[key].copy()
+
+    def get_project_units(
+        self, project: Any, fetch: Callable[[], str | None]
+    ) -> str | None:
+        """Return the memoized project units, fetching them if not memoized."""
+        key = id(project)
+        if key not in self._project_units:
+            self._project_units[key] = fetch()
+        return self._project_units[key]
+
+    def clear(self) -> None:
+        """Remove all cached objects and project units."""
+        self._objects.clear()
+        self._project_units.clear()
+
+
+def get_active_cache() -> RmsFetchCache | None:
+    """Return the active RMS fetch cache, or None if caching is not enabled."""
+    return _active_cache
+
+
+@contextmanager
+def rms_fetch_cache() -> Iterator[RmsFetchCache]:
+    """Cache objects fetched from RMS across export functions.
+
+    Examples:
+        Example usage in an RMS script::
+
+            from fmu.dataio.export.rms import (
+                export_structure_depth_isochores,
+                export_structure_depth_surfaces,
+                rms_fetch_cache,
+            )
+
+            with rms_fetch_cache():
+                export_structure_depth_surfaces(project, "DS_extracted")
+                export_structure_depth_isochores(project, "IS_extracted")
+
+    """
+    global _active_cache
+
+    if _active_cache is not None:
+        yield _active_cache
+        return
+
+    _active_cache = RmsFetchCache()
+    try:
+        yield _active_cache
+    finally:
+        logger.debug(
+            "RMS fetch cache closed with %s hits and %s misses",
+            _active_cache.hits,
+            _active_cache.misses,
+        )
+        _active_cache = None
@@ -3,12 +3,15 @@ from __future__ import annotations
 import warnings
 from typing import TYPE_CHECKING, Any, Final
 
+import numpy as np
+import pandas as pd
 import xtgeo
 from packaging.version import parse as versionparse
 
 from fmu.dataio._global_config import _FMU_SETTINGS_URL, has_fmu_directory
 from fmu.dataio._logging import null_logger
 from fmu.dataio.exceptions import ValidationError
+from fmu.dataio.export.rms._cache import get_active_cache
 from fmu.datamodels.fmu_results.global_configuration import GlobalConfiguration
 from fmu.datamodels.standard_results import enums
 
@@ -76,6 +79,16 @@ def check_rmsapi_version(minimum_version: str) -> None:
 def get_rms_project_units(project: Any) -> str | None:
     """Return whether the RMS project uses metric or field-family units."""
 
+    # the stacklevel makes the warning point at the caller of this function, through
+    # the fetch callback of the cache when it is active
+    if cache := get_active_cache():
+        return cache.get_project_units(
+            project, lambda: _get_rms_project_units(project, stacklevel=5)
+        )
+    return _get_rms_project_units(project, stacklevel=3)
+
+
+def _get_rms_project_units(project: Any, stacklevel: int) -> str | None:
     units = project.project_units
     unit_name = str(units)
     logger.debug("Units are %s", units)
@@ -89,7 +102,7 @@ def get_rms_project_units(project: Any) -> str | None:
         f"RMS project unit system {units!r} is not a known RMS unit system. "
         "Exported metadata unit will be set to an empty string.",
         UserWarning,
-        stacklevel=2,
+        stacklevel=stacklevel,
     )
     return None
 
@@ -126,17 +139,78 @@ def get_rms_project_time_unit(project: Any) -> str:
     return ""
 
 
+def get_polygon_end_rows(
+    poly_ids: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the unique polygon id's together with the row indices of the first and
+    last row of each polygon. The rows of a polygon do not need to be contiguous,
+    but their order is preserved.
+
+    Useful for vectorized checks of each polygon within an xtgeo.Polygons, by
+    indexing the dataframe columns with the returned row indices.
+    """
+    if poly_ids.size == 0:
+        empty = np.array([], dtype=np.intp)
+        return poly_ids[:0], empty, empty
+
+    order = np.argsort(poly_ids, kind="stable")
+    ids, first = np.unique(poly_ids[order], return_index=True)
+    last = np.append(first[1:], len(order)) - 1
+    return ids, order[first], order[last]
+
+
 def get_open_polygons_id(pol: xtgeo.Polygons) -> list[int]:
     """
     Return list of id's for open polygons within an xtgeo.Polygon.
     In an open polygon the first and last row of the dataframe are not equal
     i.e. different coordinates.
     """
-    open_polygons = []
-    for polid, poldf in pol.get_dataframe(copy=False).groupby("POLY_ID"):
-        if not poldf.iloc[0].equals(poldf.iloc[-1]):
-            open_polygons.append(polid)
-    return open_polygons
+    df = pol.get_dataframe(copy=False)
+    ids, first, last = get_polygon_end_rows(df[pol.pname].to_numpy())
+
+    is_closed = np.ones(len(ids), dtype=bool)
+    for column in df.columns:
+        values = df[column].to_numpy()
+        first_values, last_values = values[first], values[last]
+        # missing values are considered equal, as in pandas.Series.equals
+        is_closed &= (first_values == last_values) | (
+            pd.isna(first_values) & pd.isna(last_values)
+        )
+
+    return ids[~is_closed].tolist()
+
+
+def surface_from_rms(
+    project: Any, name: str, folder: str, stype: str
+) -> xtgeo.RegularSurface:
+    """Fetch a surface from RMS, using the RMS fetch cache if active."""
+    if cache := get_active_cache():
+        return cache.get_object(
+            project,
+            stype,
+            folder,
+            name,
+            lambda: xtgeo.surface_from_roxar(project, name, folder, stype=stype),
+        )
+    return xtgeo.surface_from_roxar(project, name, folder, stype=stype)
+
+
+def polygons_from_rms(
+    project: Any, name: str, folder: str, stype: str, attributes: bool = False
+) -> xtgeo.Polygons:
+    """Fetch polygons from RMS, using the RMS fetch cache if active."""
+
+    def fetch() -> xtgeo.Polygons:
+        return xtgeo.polygons_from_roxar(
+            project, name, folder, attributes=attributes, stype=stype
+        )
+
+    if cache := get_active_cache():
+        # polygons with and without attributes are different objects
+        cache_name = f"{name}:attributes" if attributes else name
+        return cache.get_object(project, stype, folder, cache_name, fetch)
+    return fetch()
 
 
 def validate_horizon_folder(project: Any, horizon_folder: str) -> None:
@@ -173,28 +247,41 @@ def validate_zones_folder(project: Any, zone_folder: str) -> None:
         )
 
 
-def get_horizons_in_folder(
-    project: Any, horizon_folder: str
-) -> list[xtgeo.RegularSurface]:
-    """Get all non-empty horizons from a horizon folder stratigraphically ordered."""
+def get_horizon_names_in_folder(project: Any, horizon_folder: str) -> list[str]:
+    """Get names of all non-empty horizons in a horizon folder stratigraphically
+    ordered."""
 
-    logger.debug("Reading horizons from folder %s", horizon_folder)
     validate_horizon_folder(project, horizon_folder)
 
-    surfaces = []
+    names = []
     for horizon in project.horizons:
         rms_object = horizon[horizon_folder]
         if isinstance(rms_object, rmsapi.Surface) and not rms_object.is_empty():
-            surfaces.append(
-                xtgeo.surface_from_roxar(
-                    project, horizon.name, horizon_folder, stype="horizons"
-                )
-            )
-    if not surfaces:
+            names.append(horizon.name)
+    if not names:
         raise RuntimeError(
             f"No surfaces detected in the provided folder '{horizon_folder}'"
         )
-    return surfaces
+    return names
+
+
+def get_horizon_surface(
+    project: Any, name: str, horizon_folder: str
+) -> xtgeo.RegularSurface:
+    """Get a horizon surface from a horizon folder."""
+    return surface_from_rms(project, name, horizon_folder, stype="horizons")
+
+
+def get_horizons_in_folder(
+    project: Any, horizon_folder: str
+) -> list[xtgeo.RegularSurface]:
+    """Get all non-empty horizons from a horizon folder stratigraphically ordered."""
+
+    logger.debug("Reading horizons from folder %s", horizon_folder)
+    return [
+        get_horizon_surface(project, name, horizon_folder)
+        for name in get_horizon_names_in_folder(project, horizon_folder)
+    ]
 
 
 def get_zones_in_folder(project: Any, zone_folder: str) -> list[xtgeo.RegularSurface]:
@@ -208,7 +295,7 @@ def get_zones_in_folder(project: Any, zone_folder: str) -> list[xtgeo.RegularSur
         rms_object = zone[zone_folder]
         if isinstance(rms_object, rmsapi.Surface) and not rms_object.is_empty():
             surfaces.append(
-                xtgeo.surface_from_roxar(project, zone.name, zone_folder, stype="zones")
+                surface_from_rms(project, zone.name, zone_folder, stype="zones")
             )
     if not surfaces:
         raise RuntimeError(
@@ -230,12 +317,12 @@ def get_polygons_in_folder(
         rms_object = horizon[horizon_folder]
         if isinstance(rms_object, rmsapi.Polylines) and not rms_object.is_empty():
             polygons.append(
-                xtgeo.polygons_from_roxar(
+                polygons_from_rms(
                     project,
                     horizon.name,
                     horizon_folder,
-                    attributes=attributes,
                     stype="horizons",
+                    attributes=attributes,
                 )
             )
     if not polygons:
@@ -285,7 +372,7 @@ def get_surfaces_in_general2d_folder(
     for item in folder_items:
         if isinstance(item, rmsapi.Surface) and not item.is_empty():
             surfaces.append(
-                xtgeo.surface_from_roxar(
+                surface_from_rms(
                     project, item.name, "/".join(folder_path), stype="general2d_data"
                 )
             )
@@ -307,7 +394,7 @@ def get_polygons_in_general2d_folder(
     for item in folder_items:
         if isinstance(item, rmsapi.Polylines) and not item.is_empty():
             polygons.append(
-                xtgeo.polygons_from_roxar(
+                polygons_from_rms(
                     project, item.name, "/".join(folder_path), stype="general2d_data"
                 )
             )
@@ -6,10 +6,18 @@ from typing import Any, Final
 import xtgeo
 from pydantic import BaseModel
 
-from fmu.dataio._export import ExportConfig, export_with_metadata
+from fmu.dataio._background import get_deferred_exports
+from fmu.dataio._export import (
+    ExportConfig,
+    export_objdata_with_metadata,
+    export_with_metadata,
+)
 from fmu.dataio._logging import null_logger
+from fmu.dataio._metadata._object._utils import get_value_statistics
+from fmu.dataio._metadata._object._xtgeo import CPGridPropertyData
 from fmu.dataio.export._base import SimpleExportBase
 from fmu.dataio.export._export_result import ExportResult, ExportResultItem
+from fmu.dataio.export._pipeline import export_pipelined
 from fmu.datamodels.common.enums import Classification
 from fmu.datamodels.fmu_results.attribute_specification import (
     AnyAttributeSpecification,
@@ -29,6 +37,7 @@ _logger: Final = null_logger(__name__)
 BULK_VOLUME_OIL: Final = "Oil_bulk"
 BULK_VOLUME_GAS: Final = "Gas_bulk"
 FLUID_INDICATOR: Final = "Discrete_fluid"
+MAX_PROPERTIES_IN_FLIGHT: Final = 2
 
 
 class _PropertySpecifications(BaseModel):
@@ -110,6 +119,9 @@ class _ExportStaticGridProperties(SimpleExportBase):
         self.prop_spec = prop_spec
         self.geometry = geometry
 
+        # computed once and reused for both validation and metadata
+        self._value_statistics = get_value_statistics(self.prop.values)
+
     def _get_export_config(self) -> ExportConfig:
         """Export config for the standard result."""
         return (
@@ -133,7 +145,10 @@ class _ExportStaticGridProperties(SimpleExportBase):
         """Export the grid properties as a standard result."""
 
         export_config = self._get_export_config()
-        export_path = export_with_metadata(export_config, self.prop)
+        objdata = CPGridPropertyData(
+            self.prop, export_config, value_statistics=self._value_statistics
+        )
+        export_path = export_objdata_with_metadata(export_config, objdata)
         _logger.debug("Grid property exported to: %s", export_path)
 
         return ExportResult(items=[ExportResultItem(absolute_path=export_path)])
@@ -148,8 +163,11 @@ class _ExportStaticGridProperties(SimpleExportBase):
                 f"of type {expected_type}."
             )
 
-        min_value = self.prop.values.min()
-        max_value = self.prop.values.max()
+        if self._value_statistics is None:
+            return
+
+        min_value = self._value_statistics.min
+        max_value = self._value_statistics.max
 
         if self.prop_spec.min_value and (min_value < self.prop_spec.min_value):
             raise ValueError(
@@ -232,16 +250,31 @@ class _ExportGridModelStatic:
         export_result_grid = _ExportStaticGrid(grid).export()
         geometry_path = export_result_grid.items[0].absolute_path
         exported_items.extend(export_result_grid.items)
-
-        for name, prop_spec in self.properties.items():
-            prop = self.load_property(name)
-
-            export_result_prop = _ExportStaticGridProperties(
+        # within export_async() the grid is exported on the background worker
+        grid_exports = list(get_deferred_exports() or [])
+
+        def export_property(
+            loaded: tuple[xtgeo.GridProperty, AttributeSpecification],
+        ) -> ExportResult:
+            prop, prop_spec = loaded
+            # the metadata of the properties refer to the metadata of the grid
+            for future in grid_exports:
+                future.result()
+            return _ExportStaticGridProperties(
                 prop=prop,
                 prop_spec=prop_spec,
                 geometry=geometry_path,
             ).export()
 
+        # properties are loaded from RMS while the previous property is exported,
+        # with at most 'max_in_flight' properties held in memory at the same time
+        loaded_properties = (
+            (self.load_property(name), prop_spec)
+            for name, prop_spec in self.properties.items()
+        )
+        for export_result_prop in export_pipelined(
+            loaded_properties, export_property, max_in_flight=MAX_PROPERTIES_IN_FLIGHT
+        ):
             exported_items.extend(export_result_prop.items)
 
         return ExportResult(items=exported_items)
@@ -5,13 +5,14 @@ from pathlib import Path
 from typing import Any, Final
 
 import numpy as np
-import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from fmu.dataio._export import ExportConfig, export_with_metadata
 from fmu.dataio._logging import null_logger
 from fmu.dataio.export._base import SimpleExportBase
 from fmu.dataio.export._export_result import ExportResult, ExportResultItem
+from fmu.dataio.export._table_validation import validate_table
 from fmu.dataio.export.rms._conditional_rms_imports import import_rms_package
 from fmu.dataio.export.rms._utils import (
     check_rmsapi_version,
@@ -77,7 +78,7 @@ class _ExportVolumetricsRMS(SimpleExportBase):
         _logger.debug("Process data, establish state prior to export.")
         self._volume_job = self._get_rms_volume_job_settings()
         self._volume_table_name = self._read_volume_table_name_from_job()
-        self._dataframe = self._get_table_with_volumes()
+        self._table = self._get_table_with_volumes()
         _logger.debug("Process data... DONE")
 
     def _get_rms_volume_job_settings(self) -> dict:
@@ -123,34 +124,47 @@ class _ExportVolumetricsRMS(SimpleExportBase):
         _logger.debug("The volume table name is %s", volume_table_name)
         return volume_table_name
 
-    def _get_table_with_volumes(self) -> pd.DataFrame:
+    def _get_table_with_volumes(self) -> pa.Table:
         """
-        Get a volumetric table from RMS converted into a pandas
-        dataframe on standard format for the inplace_volumes standard result.
+        Get a volumetric table from RMS converted into an Arrow table
+        on standard format for the inplace_volumes standard result.
         """
         table = self._get_table_from_rms()
         table = self._convert_table_from_rms_to_legacy_format(table)
         return self._convert_table_from_legacy_to_standard_format(table)
 
-    def _get_table_from_rms(self) -> pd.DataFrame:
-        """Fetch volumetric table from RMS and convert to pandas dataframe"""
-        _logger.debug("Read values and convert to pandas dataframe...")
-        return pd.DataFrame.from_dict(
+    def _get_table_from_rms(self) -> pa.Table:
+        """Fetch volumetric table from RMS and convert to an Arrow table.
+
+        The columns are converted directly into Arrow arrays, NaN values are
+        converted to nulls.
+        """
+        _logger.debug("Read values and convert to Arrow table...")
+        data = (
             self.project.volumetric_tables[self._volume_table_name]
             .get_data_table()
             .to_dict()
         )
+        return pa.table(
+            {
+                name: pa.array(np.asarray(values), from_pandas=True)
+                for name, values in data.items()
+            }
+        )
 
     @staticmethod
-    def _convert_table_from_rms_to_legacy_format(table: pd.DataFrame) -> pd.DataFrame:
+    def _convert_table_from_rms_to_legacy_format(table: pa.Table) -> pa.Table:
         """Rename columns to legacy naming standard and drop REAL column if present."""
-        _logger.debug("Converting dataframe from RMS to legacy format...")
-        return table.rename(columns=_RENAME_COLUMNS_FROM_RMS).drop(
-            columns="REAL", errors="ignore"
+        _logger.debug("Converting table from RMS to legacy format...")
+        table = table.rename_columns(
+            [_RENAME_COLUMNS_FROM_RMS.get(col, col) for col in table.column_names]
         )
+        if "REAL" in table.column_names:
+            return table.drop_columns("REAL")
+        return table
 
     @staticmethod
-    def _compute_water_zone_volumes_from_totals(table: pd.DataFrame) -> pd.DataFrame:
+    def _compute_water_zone_volumes_from_totals(table: pa.Table) -> pa.Table:
         """
         Calculate 'water' zone volumes by subtracting HC-zone volumes from 'Total'
         volumes which represents the entire zone. Due to RMS inaccuracies small
@@ -160,7 +174,9 @@ class _ExportVolumetricsRMS(SimpleExportBase):
         _logger.debug("Computing water volumes from Totals...")
 
         total_suffix = "_TOTAL"
-        total_columns = [col for col in table.columns if col.endswith(total_suffix)]
+        total_columns = [
+            col for col in table.column_names if col.endswith(total_suffix)
+        ]
 
         if not total_columns:
             raise RuntimeError(
@@ -175,54 +191,59 @@ class _ExportVolumetricsRMS(SimpleExportBase):
             oil_zone_col = f"{volumetric_col}_OIL"
             gas_zone_col = f"{volumetric_col}_GAS"
 
-            # first set water zone data equal to the Total
-            # then subtract data from the oil/gas zone
-            table[water_zone_col] = table[total_col]
-
-            if oil_zone_col in table:
-                table[water_zone_col] -= table[oil_zone_col]
-
-            if gas_zone_col in table:
-                table[water_zone_col] -= table[gas_zone_col]
+            # water zone data equals the Total minus data from the oil/gas zone
+            water_zone = table[total_col]
+            for hc_zone_col in (oil_zone_col, gas_zone_col):
+                if hc_zone_col in table.column_names:
+                    water_zone = pc.subtract(water_zone, table[hc_zone_col])
 
             # Due to an RMS bug related to precision the BULK and PORV
             # can get small negative values in the water zone column.
             # These must be truncated to 0 before validation
-            negative_values = table[water_zone_col] < 0
-            if negative_values.any():
+            zero = pa.scalar(0, type=water_zone.type)
+            negative_values = pc.less(water_zone, zero)
+            if pc.any(negative_values).as_py():
                 _logger.debug(
                     f"Negative values detected in column '{water_zone_col}'. "
-                    f"Truncating them to 0. \n{table.loc[negative_values]}"
+                    "Truncating them to 0."
                 )
-                table.loc[negative_values, water_zone_col] = 0
+                water_zone = pc.if_else(negative_values, zero, water_zone)
 
-        return table.drop(columns=total_columns)
+            table = table.append_column(water_zone_col, water_zone)
+
+        return table.drop_columns(total_columns)
 
     @staticmethod
-    def _set_net_equal_to_bulk_if_missing_in_table(table: pd.DataFrame) -> pd.DataFrame:
+    def _set_net_equal_to_bulk_if_missing_in_table(table: pa.Table) -> pa.Table:
         """
         Add a NET column to the table equal to the BULK column if NET is missing,
         since the absence implies a net-to-gross ratio of 1.
         """
-        if _VolumetricColumns.NET.value not in table:
+        if _VolumetricColumns.NET.value not in table.column_names:
             _logger.debug("NET column missing, setting NET equal BULK...")
-            table[_VolumetricColumns.NET.value] = table[_VolumetricColumns.BULK.value]
+            return table.append_column(
+                _VolumetricColumns.NET.value, table[_VolumetricColumns.BULK.value]
+            )
         return table
 
     @staticmethod
-    def _set_table_column_order(table: pd.DataFrame) -> pd.DataFrame:
+    def _set_table_column_order(table: pa.Table) -> pa.Table:
         """Set the column order in the table."""
         _logger.debug("Settting the table column order...")
-        return table[
-            [col for col in enums.InplaceVolumes.table_columns() if col in table]
-        ]
+        return table.select(
+            [
+                col
+                for col in enums.InplaceVolumes.table_columns()
+                if col in table.column_names
+            ]
+        )
 
     @staticmethod
     def _transform_and_add_fluid_column_to_table(
-        table: pd.DataFrame, table_index: list[str]
-    ) -> pd.DataFrame:
+        table: pa.Table, table_index: list[str]
+    ) -> pa.Table:
         """
-        Transformation of a dataframe containing fluid-specific column data into a
+        Transformation of a table containing fluid-specific column data into a
         standardized format with unified column names, e.g. 'BULK_OIL' and 'PORV_OIL'
         are renamed into 'BULK' and 'PORV' columns. To separate the data an additional
         FLUID column is added that indicates the type of fluid the row represents.
@@ -234,28 +255,34 @@ class _ExportVolumetricsRMS(SimpleExportBase):
             enums.InplaceVolumes.Fluid.oil.value,
             enums.InplaceVolumes.Fluid.water.value,
         ):
-            fluid_suffix = fluid.upper()
+            fluid_suffix = f"_{fluid.upper()}"
             fluid_columns = [
-                col for col in table.columns if col.endswith(f"_{fluid_suffix}")
+                col for col in table.column_names if col.endswith(fluid_suffix)
             ]
             if fluid_columns:
-                fluid_table = table[table_index + fluid_columns].copy()
-
                 # drop fluid suffix from columns to get standard names
-                fluid_table.columns = fluid_table.columns.str.replace(
-                    f"_{fluid_suffix}", ""
+                standard_columns = [
+                    col.removesuffix(fluid_suffix) for col in fluid_columns
+                ]
+                fluid_table = table.select(table_index + fluid_columns).rename_columns(
+                    table_index + standard_columns
                 )
 
                 # add the fluid as column entry instead
-                fluid_table[_TableIndexColumns.FLUID.value] = fluid
+                fluid_table = fluid_table.append_column(
+                    _TableIndexColumns.FLUID.value,
+                    pa.array(np.full(table.num_rows, fluid)),
+                )
 
                 tables.append(fluid_table)
 
-        return pd.concat(tables, ignore_index=True) if tables else pd.DataFrame()
+        if not tables:
+            return pa.table({})
+        return pa.concat_tables(tables, promote_options="default")
 
     def _convert_table_from_legacy_to_standard_format(
-        self, table: pd.DataFrame
-    ) -> pd.DataFrame:
+        self, table: pa.Table
+    ) -> pa.Table:
         """
         Convert the table from legacy to standard format for the 'inplace_volumes'
         standard result. The standard format has a fluid column, and all required
@@ -267,13 +294,20 @@ class _ExportVolumetricsRMS(SimpleExportBase):
         table = self._set_net_equal_to_bulk_if_missing_in_table(table)
         return self._set_table_column_order(table)
 
-    def _is_column_missing_in_table(self, column: str) -> bool | np.bool:
-        """Check if a column is present in the final dataframe and has values"""
-        return column not in self._dataframe or self._dataframe[column].isna().all()
+    def _is_column_missing_in_table(self, column: str) -> bool:
+        """Check if a column is present in the final table and has values"""
+        return (
+            column not in self._table.column_names
+            or pc.all(pc.is_null(self._table[column], nan_is_null=True)).as_py()
+        )
 
-    def _get_table_index(self, table: pd.DataFrame) -> list[str]:
+    def _get_table_index(self, table: pa.Table) -> list[str]:
         """Get the table index columns for the volumetric table."""
-        return [col for col in enums.InplaceVolumes.index_columns() if col in table]
+        return [
+            col
+            for col in enums.InplaceVolumes.index_columns()
+            if col in table.column_names
+        ]
 
     def _validate_table(self) -> None:
         """
@@ -298,8 +332,9 @@ class _ExportVolumetricsRMS(SimpleExportBase):
                     + standard_error_msg
                 )
 
-        has_oil = "oil" in self._dataframe[_TableIndexColumns.FLUID.value].values
-        has_gas = "gas" in self._dataframe[_TableIndexColumns.FLUID.value].values
+        fluids = pc.unique(self._table[_TableIndexColumns.FLUID.value]).to_pylist()
+        has_oil = "oil" in fluids
+        has_gas = "gas" in fluids
 
         # check that one of oil and gas fluids are present
         if not (has_oil or has_gas):
@@ -329,8 +364,7 @@ class _ExportVolumetricsRMS(SimpleExportBase):
                 + standard_error_msg
             )
 
-        df = self._dataframe.replace(np.nan, None).to_dict(orient="records")
-        InplaceVolumesResult.model_validate(df)
+        validate_table(self._table, InplaceVolumesResult)
 
     def _get_export_config(self) -> ExportConfig:
         """Export config for the standard result."""
@@ -343,7 +377,7 @@ class _ExportVolumetricsRMS(SimpleExportBase):
                 name=self.grid_name,
                 subfolder=enums.StandardResultName.inplace_volumes.value,
             )
-            .table_config(table_index=self._get_table_index(self._dataframe))
+            .table_config(table_index=self._get_table_index(self._table))
             .access(Classification.restricted, rep_include=False)
             .global_config(self._config)
             .standard_result(enums.StandardResultName.inplace_volumes)
@@ -354,8 +388,7 @@ class _ExportVolumetricsRMS(SimpleExportBase):
         """Do the actual volume table export using dataio setup."""
         export_config = self._get_export_config()
 
-        volume_table = pa.Table.from_pandas(self._dataframe)
-        absolute_export_path = export_with_metadata(export_config, volume_table)
+        absolute_export_path = export_with_metadata(export_config, self._table)
 
         _logger.debug("Volume result to: %s", absolute_export_path)
         return ExportResult(
@@ -10,6 +10,7 @@ from fmu.dataio._export import ExportConfig, export_with_metadata
 from fmu.dataio._logging import null_logger
 from fmu.dataio.export._base import SimpleExportBase
 from fmu.dataio.export._export_result import ExportResult, ExportResultItem
+from fmu.dataio.export._table_validation import validate_table
 from fmu.datamodels import SimulatorFipregionsMappingResult
 from fmu.datamodels.common.enums import Classification
 from fmu.datamodels.fmu_results.enums import Content
@@ -58,7 +59,7 @@ class _ExportFipZoneRegionMapping(SimpleExportBase):
 
     def _validate_data_pre_export(self) -> None:
         """Data validations before export."""
-        SimulatorFipregionsMappingResult.model_validate(self._mapping_table.to_pylist())
+        validate_table(self._mapping_table, SimulatorFipregionsMappingResult)
 
 
 def _create_fipnum_from_region_and_zone(
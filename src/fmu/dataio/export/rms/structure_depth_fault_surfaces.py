@@ -98,6 +98,10 @@ def _get_fault_surfaces_from_rms(
 
     fault_model = project.structural_models[structural_model_name].fault_model
 
+    # To get coordinate system info in the GOCAD TSurf file
+    # it must be set using metadata in the xtgeo object
+    unit = get_rms_project_length_unit(project)
+
     fault_surfaces = []
     for fault_name in fault_model.fault_names:
         fault_surface = fault_model.get_fault_triangle_surface(
@@ -109,10 +113,6 @@ def _get_fault_surfaces_from_rms(
             triangles=fault_surface.get_triangles(),
         )
 
-        # To get coordinate system info in the GOCAD TSurf file
-        # it must be set using metadata in the xtgeo object
-        unit = get_rms_project_length_unit(project)
-
         tsurf.metadata.freeform = {
             "tsurf_coord_sys": {
                 "name": "Default",
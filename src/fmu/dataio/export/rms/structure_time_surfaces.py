@@ -7,8 +7,10 @@ from fmu.dataio._export import ExportConfig, export_with_metadata
 from fmu.dataio._logging import null_logger
 from fmu.dataio.export._base import SimpleExportBase
 from fmu.dataio.export._export_result import ExportResult, ExportResultItem
+from fmu.dataio.export._pipeline import export_pipelined
 from fmu.dataio.export.rms._utils import (
-    get_horizons_in_folder,
+    get_horizon_names_in_folder,
+    get_horizon_surface,
     get_rms_project_time_unit,
     validate_name_in_stratigraphy,
 )
@@ -31,7 +33,9 @@ class _ExportStructureTimeSurfaces(SimpleExportBase):
         super().__init__()
 
         _logger.debug("Process data, establish state prior to export.")
-        self._surfaces = get_horizons_in_folder(project, horizon_folder)
+        self._project = project
+        self._horizon_folder = horizon_folder
+        self._surface_names = get_horizon_names_in_folder(project, horizon_folder)
         self._unit = get_rms_project_time_unit(project)
         _logger.debug("Process data... DONE")
 
@@ -61,17 +65,24 @@ class _ExportStructureTimeSurfaces(SimpleExportBase):
         )
 
     def _export_data_as_standard_result(self) -> ExportResult:
-        """Do the actual surface export using dataio setup."""
-        return ExportResult(
-            items=[self._export_surface(surf) for surf in self._surfaces]
+        """Do the actual surface export using dataio setup.
+
+        Surfaces are fetched from RMS one at a time, while the previously fetched
+        surface is exported, such that at most two surfaces are held in memory. The
+        surface names are validated before any surface is fetched.
+        """
+        surfaces = (
+            get_horizon_surface(self._project, name, self._horizon_folder)
+            for name in self._surface_names
         )
+        return ExportResult(items=export_pipelined(surfaces, self._export_surface))
 
     def _validate_data_pre_export(self) -> None:
         """Surface validations."""
         # TODO: Add check that the surfaces are consistent, i.e. a stratigraphic
         # deeper surface should never have shallower values than the one above
-        for surf in self._surfaces:
-            validate_name_in_stratigraphy(surf.name, self._config)
+        for name in self._surface_names:
+            validate_name_in_stratigraphy(name, self._config)
 
 
 def export_structure_time_surfaces(
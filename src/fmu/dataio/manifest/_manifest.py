@@ -7,6 +7,11 @@ In a `realization` context, the manifest is located at the runpath.
 In a `case` context, the manifest is located at the casepath.
 """
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Final
 
@@ -18,6 +23,38 @@ logger = null_logger(__name__)
 
 MANIFEST_FILENAME: Final = ".dataio_export_manifest.json"
 
+# Serializes the updates of the manifest by concurrent exports in this process. Exports
+# in the export worker process collect their updates, which are written by the main
+# process.
+_update_lock: Final = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ManifestUpdate:
+    """A file entry to add to an export manifest."""
+
+    manifest_path: Path
+    absolute_path: Path
+    size_bytes: int | None = None
+    deduplicated: bool | None = None
+
+
+_collected: ContextVar[list[ManifestUpdate] | None] = ContextVar(
+    "collected_manifest_updates", default=None
+)
+
+
+@contextmanager
+def collected_manifest_updates() -> Iterator[list[ManifestUpdate]]:
+    """Collect the manifest updates of the exports within the block instead of
+    writing them, such that they can be written by another process."""
+    updates: list[ManifestUpdate] = []
+    token = _collected.set(updates)
+    try:
+        yield updates
+    finally:
+        _collected.reset(token)
+
 
 def get_manifest_path(casepath: Path | str | None = None) -> Path:
     """Determine the manifest path based on the FMU context.
@@ -32,20 +69,45 @@ def get_manifest_path(casepath: Path | str | None = None) -> Path:
     raise ValueError("Casepath must be provided when running in fmu_context `case`.")
 
 
-def update_export_manifest(absolute_path: Path, casepath: Path | None = None) -> None:
+def update_export_manifest(
+    absolute_path: Path,
+    casepath: Path | None = None,
+    size_bytes: int | None = None,
+    deduplicated: bool | None = None,
+) -> None:
     """Update the export manifest with a new file entry.
-    If the manifest does not exist, it will be created."""
-    manifest_path = get_manifest_path(casepath)
-
-    if manifest_path.exists():
-        logger.debug(f"Export manifest found at {manifest_path}")
-        manifest = ExportManifest.from_file(manifest_path)
-    else:
-        logger.debug(f"Export manifest not found at {manifest_path}, creating new one.")
-        manifest = ExportManifest()
-
-    manifest.add_entry(absolute_path)
-    manifest.to_file(manifest_path)
+    If the manifest does not exist, it will be created.
+
+    The size and whether the file was already stored are given for files exported to
+    the content store. Within ``collected_manifest_updates()`` the update is collected
+    instead of written."""
+    update = ManifestUpdate(
+        get_manifest_path(casepath), absolute_path, size_bytes, deduplicated
+    )
+    if (collected := _collected.get()) is not None:
+        collected.append(update)
+        return
+    write_manifest_updates([update])
+
+
+def write_manifest_updates(updates: list[ManifestUpdate]) -> None:
+    """Add file entries to their export manifests, creating the manifests as needed."""
+    with _update_lock:
+        for update in updates:
+            manifest_path = update.manifest_path
+            if manifest_path.exists():
+                logger.debug(f"Export manifest found at {manifest_path}")
+                manifest = ExportManifest.from_file(manifest_path)
+            else:
+                logger.debug(
+                    f"Export manifest not found at {manifest_path}, creating new one."
+                )
+                manifest = ExportManifest()
+
+            manifest.add_entry(
+                update.absolute_path, update.size_bytes, update.deduplicated
+            )
+            manifest.to_file(manifest_path)
 
 
 def load_export_manifest(casepath: Path | str | None = None) -> ExportManifest:
@@ -3,6 +3,7 @@
 import datetime
 import getpass
 import json
+import math
 from pathlib import Path
 from typing import Self
 
@@ -19,6 +20,11 @@ class ExportManifestEntry(BaseModel):
     """The datetime recording when the file was exported"""
     exported_by: str
     """The user that exported the file"""
+    size_bytes: int | None = None
+    """The size of the exported file, if exported to the content store"""
+    deduplicated: bool | None = None
+    """Whether the exported file was already in the content store, if exported to
+    the content store"""
 
 
 class ExportManifest(RootModel):
@@ -39,17 +45,43 @@ class ExportManifest(RootModel):
         with manifest_path.open("r", encoding="utf-8") as file:
             return cls.model_validate(json.load(file))
 
-    def add_entry(self, absolute_path: Path) -> None:
+    @property
+    def bytes_saved(self) -> int:
+        """The number of bytes not written, as the files were already in the content
+        store."""
+        return sum(entry.size_bytes or 0 for entry in self.root if entry.deduplicated)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """The ratio of the size of the files exported to the content store to the
+        size of the files written to it.
+
+        This is 1.0 if no files were deduplicated or none were exported to the content
+        store, and infinite if all files were already in the content store."""
+        exported = sum(entry.size_bytes or 0 for entry in self.root)
+        written = exported - self.bytes_saved
+        if written == 0:
+            return math.inf if exported else 1.0
+        return exported / written
+
+    def add_entry(
+        self,
+        absolute_path: Path,
+        size_bytes: int | None = None,
+        deduplicated: bool | None = None,
+    ) -> None:
         """Append a new file to the manifest."""
         self.root.append(
             ExportManifestEntry(
                 absolute_path=absolute_path,
                 exported_at=datetime.datetime.now(datetime.UTC),
                 exported_by=getpass.getuser(),
+                size_bytes=size_bytes,
+                deduplicated=deduplicated,
             )
         )
 
     def to_file(self, manifest_path: Path) -> None:
         """Save the manifest as a JSON file."""
         with manifest_path.open("w", encoding="utf-8") as file:
-            file.write(self.model_dump_json(indent=2))
+            file.write(self.model_dump_json(indent=2, exclude_none=True))
@@ -16,6 +16,7 @@ from fmu.datamodels.common.enums import TrackLogEventType
 from fmu.datamodels.fmu_results.enums import FMUContext
 from fmu.datamodels.fmu_results.fields import File
 
+from ._content_store import unlink_if_linked
 from ._definitions import ERT_RELATIVE_CASE_METADATA_FILE
 from ._export import ObjectMetadataExport, export_metadata_file
 from ._logging import null_logger
@@ -246,7 +247,8 @@ class ExportPreprocessedData:
         outfile = self.casepath / self._get_relative_export_path(existing_path=objfile)
         outfile.parent.mkdir(parents=True, exist_ok=True)
 
-        # copy existing file to updated path
+        # copy existing file to updated path, without writing through a link
+        unlink_if_linked(outfile)
         shutil.copy2(objfile, outfile)
         logger.info("Copied input file to: %s", outfile)
 
@@ -1,9 +1,9 @@
 import pathlib
-from collections.abc import MutableMapping
+from collections.abc import Iterator, MutableMapping
 from typing import Annotated, TypeAlias, Union
 
 from pandas import DataFrame
-from pyarrow import Table
+from pyarrow import RecordBatch, RecordBatchReader, Table
 from xtgeo import (
     Cube,
     Grid,
@@ -28,6 +28,8 @@ ExportableData: TypeAlias = Annotated[
     | TriangulatedSurface
     | MutableMapping
     | Table
+    | RecordBatchReader
+    | Iterator[RecordBatch]
     | pathlib.Path
     | str,
     "Collection of exportable data objects with metadata deduction capabilities",
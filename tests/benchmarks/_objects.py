@@ -0,0 +1,121 @@
+"""Synthetic objects of Drogon and field size for the benchmarks."""
+
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import xtgeo
+
+from fmu.dataio._readers.faultroom import FaultRoomSurface
+
+# The dimensions of the objects, by benchmark size
+SIZES: dict[str, dict[str, Any]] = {
+    "drogon": {
+        "surface": (292, 440),
+        "grid": (92, 146, 66),
+        "cube": (280, 440, 200),
+        "table": 100_000,
+        "polygons": 10_000,
+        "faultroom": 10_000,
+    },
+    "field": {
+        "surface": (10_000, 10_000),
+        "grid": (500, 500, 200),
+        # 4 GiB of 32-bit values
+        "cube": (1024, 1024, 1024),
+        "table": 10_000_000,
+        "polygons": 1_000_000,
+        "faultroom": 1_000_000,
+    },
+}
+
+OBJECTS = list(SIZES["drogon"])
+
+
+def _surface(shape: tuple[int, int], rng: np.random.Generator) -> xtgeo.RegularSurface:
+    ncol, nrow = shape
+    values = 1700 + 50 * rng.random((ncol, nrow))
+    return xtgeo.RegularSurface(
+        ncol=ncol, nrow=nrow, xinc=25, yinc=25, xori=456000, yori=5930000, values=values
+    )
+
+
+def _grid(shape: tuple[int, int, int], rng: np.random.Generator) -> xtgeo.Grid:
+    grid = xtgeo.create_box_grid(shape, increment=(50, 50, 2))
+    actnum = grid.get_actnum()
+    actnum.values = (rng.random(shape) > 0.1).astype(np.int32)
+    grid.set_actnum(actnum)
+    return grid
+
+
+def _cube(shape: tuple[int, int, int], rng: np.random.Generator) -> xtgeo.Cube:
+    ncol, nrow, nlay = shape
+    values = rng.standard_normal(shape, dtype=np.float32)
+    return xtgeo.Cube(
+        ncol=ncol, nrow=nrow, nlay=nlay, xinc=12.5, yinc=12.5, zinc=4, values=values
+    )
+
+
+def _table(nrows: int, rng: np.random.Generator) -> pa.Table:
+    return pa.table(
+        {
+            "FLUID": np.where(rng.random(nrows) > 0.5, "oil", "gas"),
+            "ZONE": rng.integers(0, 10, nrows),
+            "REGION": rng.integers(0, 20, nrows),
+            "BULK_OIL": rng.random(nrows),
+            "PORV_OIL": rng.random(nrows),
+            "STOIIP_OIL": rng.random(nrows),
+        }
+    )
+
+
+def _polygons(nvertices: int, rng: np.random.Generator) -> xtgeo.Polygons:
+    coordinates = 1000 * rng.random((nvertices, 3))
+    polygon_ids = np.arange(nvertices) // 1000
+    return xtgeo.Polygons(np.column_stack([coordinates, polygon_ids]))
+
+
+def _faultroom(ntriangles: int, rng: np.random.Generator) -> FaultRoomSurface:
+    triangles = (1000 * rng.random((ntriangles, 3, 3))).tolist()
+    juxtaposition = rng.integers(0, 5, ntriangles).tolist()
+    return FaultRoomSurface(
+        {
+            "metadata": {
+                "horizons": ["TopWhatever"],
+                "faults": {"default": ["F1", "F2"]},
+                "juxtaposition": {"fw": ["TopWhatever"], "hw": ["TopWhatever"]},
+                "properties": ["Juxtaposition"],
+                "name": "Drogon",
+            },
+            "features": [
+                {
+                    "geometry": {"coordinates": [triangle]},
+                    "properties": {"Juxtaposition": value},
+                }
+                for triangle, value in zip(triangles, juxtaposition, strict=True)
+            ],
+        }
+    )
+
+
+_FACTORIES = {
+    "surface": (_surface, {"content": "depth"}),
+    "grid": (_grid, {"content": "depth"}),
+    "cube": (
+        _cube,
+        {"content": "seismic", "content_metadata": {"attribute": "amplitude"}},
+    ),
+    "table": (
+        _table,
+        {"content": "volumes", "table_index": ["FLUID", "ZONE", "REGION"]},
+    ),
+    "polygons": (_polygons, {"content": "depth"}),
+    "faultroom": (_faultroom, {"content": "fault_properties"}),
+}
+
+
+def create_object(kind: str, size: str) -> tuple[Any, dict[str, Any]]:
+    """Create a synthetic object, returns it together with the ExportData arguments
+    it is exported with."""
+    factory, kwargs = _FACTORIES[kind]
+    return factory(SIZES[size][kind], np.random.default_rng(seed=42)), kwargs
@@ -0,0 +1,58 @@
+"""Compare the results of two benchmark sessions, and flag the regressions.
+
+Usage::
+
+    python -m tests.benchmarks.compare baseline.json results.json --threshold 0.1
+
+Measurements worse than the baseline by more than the threshold, as a fraction of the
+baseline, are reported as regressions, and the exit code is then 1.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _load(path: Path) -> dict[tuple[str, str], dict[str, Any]]:
+    results = json.loads(path.read_text(encoding="utf-8"))["results"]
+    return {(r["benchmark"], r["metric"]): r for r in results}
+
+
+def compare(
+    baseline: Path, results: Path, threshold: float
+) -> list[tuple[str, str, float, float, float]]:
+    """Return the measurements that regressed by more than the threshold, as tuples
+    of the benchmark, the metric, the baseline value, the new value and the relative
+    change."""
+    before, after = _load(baseline), _load(results)
+    regressions = []
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key]["value"], after[key]["value"]
+        if old == 0:
+            continue
+        change = (new - old) / old
+        worse = -change if after[key]["better"] == "higher" else change
+        if worse > threshold:
+            regressions.append((*key, old, new, change))
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("results", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    regressions = compare(args.baseline, args.results, args.threshold)
+    for benchmark, metric, old, new, change in regressions:
+        print(f"{benchmark} {metric}: {old:.4g} -> {new:.4g} ({change:+.1%})")
+    if not regressions:
+        print(f"No regressions above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Configuration for the benchmarks.
+
+The benchmarks are slow and are only run when the environment variable
+``FMU_DATAIO_BENCHMARKS`` is set, e.g.::
+
+    FMU_DATAIO_BENCHMARKS=1 pytest tests/benchmarks -s
+
+The objects exported by the export pipeline benchmarks are Drogon sized by default,
+and field sized when ``FMU_DATAIO_BENCHMARK_SIZE=field`` is set. The measurements are
+stored as JSON in the file given by ``FMU_DATAIO_BENCHMARK_RESULTS``, and the results
+of two versions are compared with::
+
+    python -m tests.benchmarks.compare baseline.json results.json
+"""
+
+import json
+import os
+import platform
+import time
+from collections.abc import Callable, Generator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Literal
+
+import pytest
+
+import fmu.dataio
+
+BENCHMARK_ENVNAME = "FMU_DATAIO_BENCHMARKS"
+SIZE_ENVNAME = "FMU_DATAIO_BENCHMARK_SIZE"
+RESULTS_ENVNAME = "FMU_DATAIO_BENCHMARK_RESULTS"
+
+
+@pytest.fixture(autouse=True)
+def _run_benchmarks_on_request() -> None:
+    if not os.environ.get(BENCHMARK_ENVNAME):
+        pytest.skip(f"Benchmarks are only run when {BENCHMARK_ENVNAME} is set")
+
+
+def best_of(func: Callable[[], object], repeat: int = 3) -> float:
+    """Return the fastest wall time in seconds of a number of calls to func."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def benchmark_size() -> str:
+    """Return the size of the objects to benchmark, 'drogon' or 'field'."""
+    size = os.environ.get(SIZE_ENVNAME, "drogon")
+    if size not in ("drogon", "field"):
+        raise ValueError(f"{SIZE_ENVNAME} must be 'drogon' or 'field', not {size!r}")
+    return size
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """A single measurement of a benchmark."""
+
+    benchmark: str
+    metric: str
+    value: float
+    unit: str
+    better: Literal["lower", "higher"] = "lower"
+
+
+@dataclass
+class BenchmarkResults:
+    """The measurements of a benchmark session, with the environment they were
+    measured in."""
+
+    environment: dict[str, str | int | None] = field(
+        default_factory=lambda: {
+            "fmu-dataio": fmu.dataio.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "size": benchmark_size(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        }
+    )
+    results: list[Measurement] = field(default_factory=list)
+
+    def add(
+        self,
+        benchmark: str,
+        metric: str,
+        value: float,
+        unit: str,
+        better: Literal["lower", "higher"] = "lower",
+    ) -> None:
+        self.results.append(Measurement(benchmark, metric, value, unit, better))
+
+    def to_file(self, path: Path) -> None:
+        path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def benchmark_results() -> Generator[BenchmarkResults, None, None]:
+    """Collect the measurements of the benchmarks, and store them as JSON if
+    requested."""
+    results = BenchmarkResults()
+    yield results
+    if (path := os.environ.get(RESULTS_ENVNAME)) and results.results:
+        results.to_file(Path(path))
@@ -0,0 +1,92 @@
+"""Benchmark the export pipeline end to end and per stage, for objects of Drogon or
+field size.
+
+For each kind of object the wall time of ``generate_metadata()``, ``export()`` and
+``read_metadata()`` are measured, together with the stages of an export, the
+throughput, the peak memory and the file size. Field sized objects need a machine
+with plenty of memory, e.g.::
+
+    FMU_DATAIO_BENCHMARKS=1 FMU_DATAIO_BENCHMARK_SIZE=field \\
+        FMU_DATAIO_BENCHMARK_RESULTS=results.json \\
+        pytest tests/benchmarks/test_bench_export_pipeline.py -s
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from fmu.dataio import ExportData, memory_profile, read_metadata
+from fmu.dataio._export.serialize import compute_md5_and_size, export_object
+from fmu.dataio._metadata import _generate_metadata, create_object_data
+
+from ._objects import OBJECTS, create_object
+from .conftest import BenchmarkResults, benchmark_size, best_of
+
+MIB = 2**20
+
+
+@pytest.mark.parametrize("kind", OBJECTS)
+def test_bench_export_pipeline(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    mock_global_config: dict[str, Any],
+    benchmark_results: BenchmarkResults,
+    kind: str,
+) -> None:
+    """Measure the export of a synthetic object end to end and per stage."""
+    size = benchmark_size()
+    obj, kwargs = create_object(kind, size)
+    repeat = 3 if size == "drogon" else 1
+
+    monkeypatch.chdir(tmp_path)
+    edata = ExportData(config=mock_global_config, name=kind, **kwargs)
+    export_config = edata._export_config
+
+    timings = {
+        "generate_metadata": best_of(lambda: edata.generate_metadata(obj), repeat),
+        "export": best_of(lambda: edata.export(obj), repeat),
+    }
+    outfile = Path(edata.export(obj))
+    timings["read_metadata"] = best_of(lambda: read_metadata(outfile), repeat)
+
+    objdata = create_object_data(obj, export_config)
+    stagefile = tmp_path / "stage" / outfile.name
+    stagefile.parent.mkdir()
+    timings |= {
+        "stage.object_data": best_of(
+            lambda: create_object_data(obj, export_config), repeat
+        ),
+        "stage.checksum": best_of(lambda: compute_md5_and_size(objdata), repeat),
+        "stage.metadata": best_of(
+            lambda: _generate_metadata(export_config, objdata), repeat
+        ),
+        "stage.write": best_of(lambda: export_object(objdata, stagefile), repeat),
+    }
+
+    with memory_profile() as report:
+        edata.export(obj)
+    file_size = outfile.stat().st_size
+
+    benchmark = f"export_pipeline[{kind}]"
+    for metric, seconds in timings.items():
+        benchmark_results.add(benchmark, f"{metric}.time", seconds, "s")
+    benchmark_results.add(
+        benchmark,
+        "export.throughput",
+        file_size / MIB / timings["export"],
+        "MiB/s",
+        better="higher",
+    )
+    benchmark_results.add(
+        benchmark, "export.peak_traced", report["export"].peak_traced_bytes, "B"
+    )
+    if (peak_rss := report["export"].peak_rss_bytes) is not None:
+        benchmark_results.add(benchmark, "export.peak_rss", peak_rss, "B")
+    benchmark_results.add(benchmark, "file_size", file_size, "B")
+
+    print(
+        f"\n{benchmark} ({size}, {file_size / MIB:.1f} MiB): "
+        + ", ".join(f"{metric} {t:.3f}s" for metric, t in timings.items())
+        + f", peak {report['export'].peak_traced_bytes / MIB:.1f} MiB"
+    )
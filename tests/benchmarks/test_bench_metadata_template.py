@@ -0,0 +1,42 @@
+"""Benchmark the metadata generation for many small objects in one realization"""
+
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import xtgeo
+
+from fmu.dataio import ExportData
+from fmu.dataio._metadata import _generate_metadata, create_object_data
+
+from .conftest import best_of
+
+NOBJECTS = 200
+
+
+def test_bench_metadata_for_many_objects(
+    runpath: Path,
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Compare metadata generation with and without reuse of the shared blocks."""
+    export_config = ExportData(
+        config=mock_global_config, content="depth", name="surf"
+    )._export_config
+    objdata = create_object_data(regsurf, export_config)
+
+    def generate() -> None:
+        for _ in range(NOBJECTS):
+            _generate_metadata(export_config, objdata)
+
+    with_templates = best_of(generate)
+    with mock.patch(
+        "fmu.dataio._metadata.core.get_metadata_template", return_value=None
+    ):
+        without_templates = best_of(generate)
+
+    print(
+        f"\n{NOBJECTS} objects: {without_templates:.3f}s without templates, "
+        f"{with_templates:.3f}s with templates"
+    )
+    assert with_templates < without_templates
@@ -0,0 +1,46 @@
+"""Benchmark the metadata validation levels for many small objects"""
+
+from pathlib import Path
+from typing import Any
+
+import xtgeo
+
+from fmu.dataio import ExportData, metadata_validation
+from fmu.dataio._metadata import _generate_metadata, create_object_data
+from fmu.dataio._metadata._template import clear_metadata_templates
+
+from .conftest import best_of
+
+NOBJECTS = 200
+
+
+def test_bench_metadata_validation_levels(
+    runpath: Path,
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Compare the per-object metadata overhead for the validation levels."""
+    small = xtgeo.RegularSurface(ncol=3, nrow=4, xinc=10, yinc=10, values=1.0)
+    export_config = ExportData(
+        config=mock_global_config, content="depth", name="surf"
+    )._export_config
+
+    def generate(objdata: Any, level: str) -> None:
+        clear_metadata_templates()
+        with metadata_validation(level):
+            for _ in range(NOBJECTS):
+                _generate_metadata(export_config, objdata)
+
+    for name, obj in [("small", small), ("regular", regsurf)]:
+        objdata = create_object_data(obj, export_config)
+        timings = {
+            level: best_of(lambda o=objdata, lv=level: generate(o, lv), repeat=5)
+            for level in ("full", "trusted", "deferred")
+        }
+        print(
+            f"\n{NOBJECTS} {name} objects, per object: "
+            + ", ".join(
+                f"{level} {1e6 * t / NOBJECTS:.0f}us" for level, t in timings.items()
+            )
+        )
+        assert timings["trusted"] < timings["full"]
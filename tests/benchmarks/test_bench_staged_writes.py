@@ -0,0 +1,57 @@
+"""Benchmark staged writes against direct writes of many small surfaces.
+
+The files are written to a temporary directory, or to the directory given by the
+environment variable ``FMU_DATAIO_BENCHMARK_DIR``, e.g. to benchmark on NFS::
+
+    FMU_DATAIO_BENCHMARKS=1 FMU_DATAIO_BENCHMARK_DIR=/scratch/$USER \\
+        pytest tests/benchmarks/test_bench_staged_writes.py -s
+"""
+
+import os
+import tempfile
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any
+
+import pytest
+import xtgeo
+
+from fmu.dataio import ExportData, staged_writes
+
+from .conftest import best_of
+
+NOBJECTS = 100
+
+
+def test_bench_staged_writes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    mock_global_config: dict[str, Any],
+) -> None:
+    """Compare the per-object export time of direct and staged writes."""
+    small = xtgeo.RegularSurface(ncol=3, nrow=4, xinc=10, yinc=10, values=1.0)
+    basedir = os.environ.get("FMU_DATAIO_BENCHMARK_DIR", str(tmp_path))
+
+    with tempfile.TemporaryDirectory(dir=basedir) as exportdir:
+        monkeypatch.chdir(exportdir)
+        edata = ExportData(config=mock_global_config, content="depth")
+
+        def export(mode: str) -> None:
+            block = (
+                nullcontext()
+                if mode == "direct"
+                else staged_writes(durable=mode == "staged")
+            )
+            with block:
+                for i in range(NOBJECTS):
+                    edata.export(small, name=f"surf{i}", tagname=mode)
+
+        timings = {
+            mode: best_of(lambda m=mode: export(m), repeat=3)
+            for mode in ("direct", "staged", "staged-nosync")
+        }
+
+    print(
+        f"\n{NOBJECTS} surfaces in {basedir}, per object: "
+        + ", ".join(f"{mode} {1e3 * t / NOBJECTS:.2f}ms" for mode, t in timings.items())
+    )
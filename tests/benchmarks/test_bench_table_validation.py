@@ -0,0 +1,49 @@
+"""Benchmark the columnar validation of standard result tables"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fmu.datamodels import InplaceVolumesResult
+
+from fmu.dataio.export._table_validation import validate_table
+
+from .conftest import best_of
+
+
+@pytest.fixture(scope="module")
+def large_voltable() -> pd.DataFrame:
+    """An inplace volumes table with 120k rows."""
+    rng = np.random.default_rng(seed=1)
+    nrows = 120_000
+    table = pd.DataFrame(
+        {
+            "FLUID": rng.choice(["oil", "gas", "water"], nrows),
+            "ZONE": rng.choice([f"zone{i}" for i in range(20)], nrows),
+            "REGION": rng.choice([f"region{i}" for i in range(30)], nrows),
+            "FACIES": rng.choice([f"facies{i}" for i in range(10)], nrows),
+            "LICENSE": rng.choice(["lic1", "lic2"], nrows),
+        }
+    )
+    for col in ("BULK", "NET", "PORV", "HCPV", "STOIIP", "GIIP"):
+        table[col] = rng.uniform(0, 1e6, nrows)
+    table.loc[table["FLUID"] == "water", ["HCPV", "STOIIP", "GIIP"]] = np.nan
+    return table
+
+
+def test_bench_inplace_volumes_validation(large_voltable: pd.DataFrame) -> None:
+    """Compare the columnar validation with row by row pydantic validation."""
+
+    def rowwise() -> None:
+        records = large_voltable.replace(np.nan, None).to_dict(orient="records")
+        InplaceVolumesResult.model_validate(records)
+
+    rowwise_time = best_of(rowwise, repeat=1)
+    columnar_time = best_of(
+        lambda: validate_table(large_voltable, InplaceVolumesResult)
+    )
+
+    print(
+        f"\nValidation of {len(large_voltable)} rows: "
+        f"row by row {rowwise_time:.3f}s, columnar {columnar_time:.3f}s"
+    )
+    assert columnar_time < rowwise_time
@@ -31,6 +31,8 @@ from fmu.settings._drogon import create_drogon_fmu_dir
 from pytest import MonkeyPatch
 
 import fmu.dataio as dio
+from fmu.dataio._memory import MemoryReport
+from fmu.dataio._metadata._template import clear_metadata_templates
 from fmu.dataio._readers.faultroom import FaultRoomSurface
 from fmu.dataio.dataio import ExportData
 
@@ -75,6 +77,21 @@ def rootpath(request: pytest.FixtureRequest) -> Path:
     return request.config.rootpath
 
 
+@pytest.fixture(autouse=True)
+def _clear_metadata_templates() -> Generator[None, None, None]:
+    """Ensure metadata templates are not shared between tests."""
+    yield
+    clear_metadata_templates()
+
+
+@pytest.fixture
+def memory_profile() -> Generator[MemoryReport, None, None]:
+    """Record the peak memory of each export stage run in the test, such that memory
+    regressions can be asserted."""
+    with dio.memory_profile() as report:
+        yield report
+
+
 @pytest.fixture
 def inside_rms_interactive(monkeypatch: MonkeyPatch) -> None:
     monkeypatch.setenv("RUNRMS_EXEC_MODE", "interactive")
@@ -1,12 +1,43 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+from importlib.metadata import entry_points
+
 import ert
 from ert.plugins.plugin_manager import ErtPluginManager
 from packaging.version import Version
 
 import fmu.dataio._workflows.jobs
-from fmu.dataio._workflows import copy_preprocessed
-from fmu.dataio._workflows.case import main as create_case_metadata
+from fmu.dataio._workflows import copy_preprocessed, update_catalog, verify_case
+from fmu.dataio._workflows.case import plugin as create_case_metadata
+
+# Modules only imported when a workflow is run, not when Ert imports the plugins
+EXPORT_STACK = (
+    "fmu.dataio.dataio",
+    "fmu.dataio._export",
+    "fmu.dataio.catalog",
+    "fmu.datamodels",
+    "fmu.settings",
+)
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of the modules imported by
+    the statement, as reported by ``python -X importtime``. Modules already imported
+    by Ert are not included."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import ert; {statement}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "[us]" not in line:
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = int(cumulative)
+    return times
 
 
 def test_hook_implementations() -> None:
@@ -15,6 +46,8 @@ def test_hook_implementations() -> None:
             fmu.dataio._workflows.jobs,
             create_case_metadata,
             copy_preprocessed,
+            update_catalog,
+            verify_case,
         ]
     )
 
@@ -25,7 +58,12 @@ def test_hook_implementations() -> None:
         installable_fms = plugin_manager.get_installable_jobs()
     assert set(installable_fms) == expected_forward_models
 
-    expected_workflow_jobs = {"WF_CREATE_CASE_METADATA", "WF_COPY_PREPROCESSED_DATAIO"}
+    expected_workflow_jobs = {
+        "WF_CREATE_CASE_METADATA",
+        "WF_COPY_PREPROCESSED_DATAIO",
+        "WF_UPDATE_CATALOG_DATAIO",
+        "WF_VERIFY_DATAIO",
+    }
     installable_workflow_jobs = plugin_manager.get_ertscript_workflows().get_workflows()
     for wf_name, _ in installable_workflow_jobs.items():
         assert wf_name in expected_workflow_jobs
@@ -39,6 +77,8 @@ def test_hook_implementations_docs() -> None:
             fmu.dataio._workflows.jobs,
             create_case_metadata,
             copy_preprocessed,
+            update_catalog,
+            verify_case,
         ]
     )
 
@@ -63,3 +103,20 @@ def test_hook_implementations_docs() -> None:
         assert wf_docs[wf_name]["description"] != ""
         assert wf_docs[wf_name]["examples"] != ""
         assert wf_docs[wf_name]["category"] != "other"
+
+
+def test_plugin_registration_is_lightweight() -> None:
+    """Test that importing the plugins registered with Ert does not import the export
+    stack, and takes a fraction of the time of importing it."""
+    plugins = [
+        ep.value
+        for ep in entry_points(group="ert")
+        if ep.value.startswith("fmu.dataio")
+    ]
+    assert len(plugins) == 4
+
+    times = _import_times("; ".join(f"import {plugin}" for plugin in plugins))
+    assert not [name for name in times if name.startswith(EXPORT_STACK)]
+
+    export_stack_time = _import_times("import fmu.dataio.dataio")["fmu.dataio.dataio"]
+    assert sum(times[plugin] for plugin in plugins) < export_stack_time / 10
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Generator
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -76,6 +77,8 @@ def mock_export_class(
                 prop = xtgeo_discrete_property
             else:
                 prop = xtgeo_continuous_property
+            # a new object is returned for each property, as from RMS
+            prop = prop.copy()
             prop.name = propname
             return prop
 
@@ -349,3 +352,94 @@ def test_property_specification_fields_in_attribute_specification() -> None:
         AnyAttributeSpecification.model_validate(
             {"attribute": PropertyAttribute[field]}
         )
+
+
+@pytest.mark.usefixtures("inside_rms_interactive")
+def test_property_value_statistics_computed_once(
+    mock_export_class: _ExportGridModelStatic,
+    xtgeo_continuous_property: xtgeo.GridProperty,
+) -> None:
+    """
+    Test that the value statistics used for validation are reused in the metadata
+    instead of being computed again.
+    """
+
+    from fmu.dataio._metadata._object._utils import get_value_statistics
+
+    with (
+        mock.patch(
+            "fmu.dataio.export.rms.grid_model_static.get_value_statistics",
+            side_effect=get_value_statistics,
+        ) as mock_statistics,
+        mock.patch(
+            "fmu.dataio._metadata._object._xtgeo.get_value_statistics",
+        ) as mock_metadata_statistics,
+    ):
+        out = mock_export_class.export()
+
+    assert mock_statistics.call_count == len(mock_export_class.properties)
+    mock_metadata_statistics.assert_not_called()
+
+    metadata = dataio.read_metadata(out.items[-1].absolute_path)
+    statistics = metadata["data"]["spec"]["value_statistics"]
+    assert statistics["min"] == pytest.approx(xtgeo_continuous_property.values.min())
+    assert statistics["max"] == pytest.approx(xtgeo_continuous_property.values.max())
+
+
+@pytest.mark.usefixtures("inside_rms_interactive")
+def test_export_settings_apply_to_properties(
+    mock_export_class: _ExportGridModelStatic,
+) -> None:
+    """Test that the validation level and staged writes of the calling context apply
+    to the properties exported while the next property is loaded."""
+
+    from fmu.dataio._export import core
+    from fmu.dataio._staging import get_staged_writes_durability
+    from fmu.dataio._validation import get_validation_level
+
+    settings = []
+    staged_files = core.staged_files
+
+    def record_settings(*paths: Path) -> Any:
+        settings.append((get_validation_level(), get_staged_writes_durability()))
+        return staged_files(*paths)
+
+    with (
+        mock.patch.object(core, "staged_files", side_effect=record_settings),
+        dataio.staged_writes(durable=False),
+        dataio.metadata_validation("trusted"),
+    ):
+        out = mock_export_class.export()
+
+    assert len(settings) == len(out.items)
+    assert set(settings) == {(dataio.ValidationLevel.trusted, False)}
+
+
+@pytest.mark.usefixtures("inside_rms_interactive")
+def test_export_async_defers_exports(
+    mock_export_class: _ExportGridModelStatic,
+) -> None:
+    """Test that within export_async() the grid and the properties are written on
+    the background worker, and waited for by wait_all()."""
+
+    from fmu.dataio._export import core
+    from fmu.dataio.export import export_async, wait_all
+
+    writing_threads = []
+    write_object = core._write_object
+
+    def record_thread(*args: Any) -> None:
+        writing_threads.append(threading.current_thread().name)
+        write_object(*args)
+
+    with mock.patch.object(core, "_write_object", side_effect=record_thread):
+        future = export_async(mock_export_class.export)
+        assert wait_all() == [future.result()]
+
+    out = future.result()
+    assert len(out.items) == len(mock_export_class.properties) + 1
+    assert len(writing_threads) == len(out.items)
+    assert all(name.startswith("dataio-background") for name in writing_threads)
+    for item in out.items:
+        metadata = dataio.read_metadata(item.absolute_path)
+        assert metadata["file"]["absolute_path"] == str(item.absolute_path)
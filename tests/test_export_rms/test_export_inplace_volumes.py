@@ -11,6 +11,7 @@ from unittest.mock import MagicMock
 import jsonschema
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 from fmu.datamodels.standard_results import enums
@@ -52,6 +53,10 @@ EXPECTED_COLUMN_ORDER = [
 ]
 
 
+def _to_table(df: pd.DataFrame) -> pa.Table:
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
 @pytest.fixture(scope="package")
 def voltable_legacy() -> pd.DataFrame:
     return pd.read_csv(VOLDATA_LEGACY)
@@ -78,7 +83,9 @@ def exportvolumetrics(
     from fmu.dataio.export.rms.inplace_volumes import _ExportVolumetricsRMS
 
     with mock.patch.object(
-        _ExportVolumetricsRMS, "_get_table_with_volumes", return_value=voltable_standard
+        _ExportVolumetricsRMS,
+        "_get_table_with_volumes",
+        return_value=_to_table(voltable_standard),
     ):
         yield _ExportVolumetricsRMS(mock_project_variable, "Geogrid", "geogrid_vol")
 
@@ -120,12 +127,12 @@ def test_rms_volumetrics_export_class_table_index(
     assert metadata["data"]["table_index"] == ["FLUID", "ZONE", "REGION", "FACIES"]
 
     # should fail if missing required table index
-    exportvolumetrics._dataframe = voltable_standard.drop(columns="ZONE")
+    exportvolumetrics._table = _to_table(voltable_standard.drop(columns="ZONE"))
     with pytest.raises(RuntimeError, match="Required index column"):
         exportvolumetrics._validate_data_pre_export()
 
     # should not fail if missing optional table index
-    exportvolumetrics._dataframe = voltable_standard.drop(columns="FACIES")
+    exportvolumetrics._table = _to_table(voltable_standard.drop(columns="FACIES"))
     exportvolumetrics._validate_data_pre_export()
 
 
@@ -203,7 +210,7 @@ def test_convert_table_from_legacy_to_standard_format(
     with mock.patch.object(
         _ExportVolumetricsRMS,
         "_convert_table_from_rms_to_legacy_format",
-        return_value=voltable_legacy.copy(),
+        return_value=_to_table(voltable_legacy),
     ):
         instance = _ExportVolumetricsRMS(
             mock_project_variable,
@@ -211,8 +218,8 @@ def test_convert_table_from_legacy_to_standard_format(
             "geogrid_vol",
         )
 
-    # the _dataframe attribute should now have been converted to standard
-    pd.testing.assert_frame_equal(voltable_standard, instance._dataframe)
+    # the _table attribute should now have been converted to standard
+    pd.testing.assert_frame_equal(voltable_standard, instance._table.to_pandas())
 
     # check that the exported table is equal to the expected
     out = instance._export_data_as_standard_result()
@@ -292,6 +299,43 @@ def test_convert_table_from_legacy_to_standard_format(
     )
 
 
+@pytest.mark.usefixtures("inside_rms_interactive")
+def test_get_table_with_volumes_from_rms_data_table(
+    mock_project_variable: MagicMock,
+    mocked_rmsapi_modules: dict[str, MagicMock],
+    voltable_standard: pd.DataFrame,
+    voltable_legacy: pd.DataFrame,
+    rmssetup_with_fmuconfig: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that a table on the format given by RMS is converted into an Arrow
+    table on standard format"""
+
+    from fmu.dataio.export.rms.inplace_volumes import (
+        _RENAME_COLUMNS_FROM_RMS,
+        _ExportVolumetricsRMS,
+    )
+
+    monkeypatch.chdir(rmssetup_with_fmuconfig)
+
+    # create a dictionary of numpy arrays with RMS column names
+    rename_to_rms = {v: k for k, v in _RENAME_COLUMNS_FROM_RMS.items()}
+    rms_data = {
+        rename_to_rms.get(col, col): voltable_legacy[col].to_numpy()
+        for col in voltable_legacy.columns
+    }
+    rms_data["Proj. real."] = np.zeros(len(voltable_legacy), dtype=np.int32)
+
+    volume_tables = mock_project_variable.volumetric_tables
+    volume_tables["geogrid_volumes"].get_data_table().to_dict.return_value = rms_data
+
+    instance = _ExportVolumetricsRMS(mock_project_variable, "Geogrid", "geogrid_vol")
+
+    assert isinstance(instance._table, pa.Table)
+    assert "REAL" not in instance._table.column_names
+    pd.testing.assert_frame_equal(voltable_standard, instance._table.to_pandas())
+
+
 @pytest.mark.usefixtures("inside_rms_interactive")
 def test_net_column_equal_bulk_if_missing(
     exportvolumetrics: _ExportVolumetricsRMS, voltable_standard: pd.DataFrame
@@ -303,14 +347,18 @@ def test_net_column_equal_bulk_if_missing(
     # remove the NET column
     # and check that NET is set equal to the BULK
     df_in = df_in.drop(columns="NET")
-    df_out = exportvolumetrics._set_net_equal_to_bulk_if_missing_in_table(df_in)
+    df_out = exportvolumetrics._set_net_equal_to_bulk_if_missing_in_table(
+        _to_table(df_in)
+    ).to_pandas()
     assert "NET" in df_out
     assert np.allclose(df_out["NET"], df_out["BULK"])
 
     # add a NET column with some values
     # and check that NET column is kept as is
     df_in["NET"] = df_out["BULK"] * 0.7
-    df_out = exportvolumetrics._set_net_equal_to_bulk_if_missing_in_table(df_in)
+    df_out = exportvolumetrics._set_net_equal_to_bulk_if_missing_in_table(
+        _to_table(df_in)
+    ).to_pandas()
     assert "NET" in df_out
     assert np.allclose(df_out["NET"], df_out["BULK"] * 0.7)
 
@@ -334,7 +382,9 @@ def test_compute_water_zone_volumes_from_totals_oil_and_gas(
     assert f"{volumetric_col}_GAS" in df_in
     assert f"{volumetric_col}_WATER" not in df_in
 
-    df_out = exportvolumetrics._compute_water_zone_volumes_from_totals(df_in)
+    df_out = exportvolumetrics._compute_water_zone_volumes_from_totals(
+        _to_table(df_in)
+    ).to_pandas()
 
     assert f"{volumetric_col}_TOTAL" not in df_out
     assert f"{volumetric_col}_OIL" in df_out
@@ -389,7 +439,9 @@ def test_compute_water_zone_volumes_from_totals_oil(
     assert f"{volumetric_col}_GAS" in df_in
     assert f"{volumetric_col}_WATER" not in df_in
 
-    df_out = exportvolumetrics._compute_water_zone_volumes_from_totals(df_in)
+    df_out = exportvolumetrics._compute_water_zone_volumes_from_totals(
+        _to_table(df_in)
+    ).to_pandas()
 
     assert f"{volumetric_col}_TOTAL" not in df_out
     assert f"{volumetric_col}_OIL" not in df_out
@@ -437,7 +489,9 @@ def test_compute_water_zone_volumes_from_totals_gas(
     assert f"{volumetric_col}_GAS" not in df_in
     assert f"{volumetric_col}_WATER" not in df_in
 
-    df_out = exportvolumetrics._compute_water_zone_volumes_from_totals(df_in)
+    df_out = exportvolumetrics._compute_water_zone_volumes_from_totals(
+        _to_table(df_in)
+    ).to_pandas()
 
     assert f"{volumetric_col}_TOTAL" not in df_out
     assert f"{volumetric_col}_OIL" in df_out
@@ -482,7 +536,9 @@ def test_compute_water_zone_volumes_truncate_negative_values(
     assert water_volumes_prior.iloc[0] == -1
     assert water_volumes_prior.iloc[1] == 1000
 
-    df_out = exportvolumetrics._compute_water_zone_volumes_from_totals(df_in)
+    df_out = exportvolumetrics._compute_water_zone_volumes_from_totals(
+        _to_table(df_in)
+    ).to_pandas()
 
     # check that the negative value have been truncated only for the first row
     assert df_out[f"{volumetric_col}_WATER"].iloc[0] == 0
@@ -506,7 +562,7 @@ def test_total_volumes_required(
     )
 
     with pytest.raises(RuntimeError, match="Found no 'Totals' volumes"):
-        exportvolumetrics._compute_water_zone_volumes_from_totals(df)
+        exportvolumetrics._compute_water_zone_volumes_from_totals(_to_table(df))
 
 
 @pytest.mark.parametrize("required_col", enums.InplaceVolumes.required_columns())
@@ -517,7 +573,7 @@ def test_validate_table_required_col_missing(
 ) -> None:
     """Test that the job fails if a required volumetric column is missing"""
     df = voltable_standard.drop(columns=required_col)
-    exportvolumetrics._dataframe = df
+    exportvolumetrics._table = _to_table(df)
 
     with pytest.raises(RuntimeError, match="missing"):
         exportvolumetrics._validate_table()
@@ -534,7 +590,7 @@ def test_validate_table_required_col_has_nan(
     df = voltable_standard.copy()
     df[required_col] = np.nan
 
-    exportvolumetrics._dataframe = df
+    exportvolumetrics._table = _to_table(df)
 
     with pytest.raises(RuntimeError, match="missing"):
         exportvolumetrics._validate_table()
@@ -548,7 +604,7 @@ def test_validate_table_has_oil_or_gas(
     df = voltable_standard.copy()
     df = df[~df["FLUID"].isin(["oil", "gas"])]
 
-    exportvolumetrics._dataframe = df
+    exportvolumetrics._table = _to_table(df)
 
     with pytest.raises(RuntimeError, match="One or both 'oil' and 'gas'"):
         exportvolumetrics._validate_table()
@@ -562,13 +618,13 @@ def test_validate_table_has_oil_and_stoiip(
     df = voltable_standard.copy()
     df = df.drop(columns="STOIIP")
 
-    exportvolumetrics._dataframe = df
+    exportvolumetrics._table = _to_table(df)
 
     with pytest.raises(RuntimeError, match="missing"):
         exportvolumetrics._validate_table()
 
     # validation should pass when no oil columns are present
-    exportvolumetrics._dataframe = df[~(df["FLUID"] == "oil")]
+    exportvolumetrics._table = _to_table(df[~(df["FLUID"] == "oil")])
     exportvolumetrics._validate_table()
 
 
@@ -580,13 +636,13 @@ def test_validate_table_has_gas_and_giip(
     df = voltable_standard.copy()
     df = df.drop(columns="GIIP")
 
-    exportvolumetrics._dataframe = df
+    exportvolumetrics._table = _to_table(df)
 
     with pytest.raises(RuntimeError, match="missing"):
         exportvolumetrics._validate_table()
 
     # validation should pass when no gas columns are present
-    exportvolumetrics._dataframe = df[~(df["FLUID"] == "gas")]
+    exportvolumetrics._table = _to_table(df[~(df["FLUID"] == "gas")])
     exportvolumetrics._validate_table()
 
 
@@ -597,11 +653,11 @@ def test_validate_table_against_pydantic_model_before_export(
     Pydantic model specifying the result."""
 
     df = voltable_standard.copy()
-    exportvolumetrics._dataframe = df
+    exportvolumetrics._table = _to_table(df)
     exportvolumetrics._validate_table()
 
-    df["PORV"] = df["PORV"].replace(0.0, "a")
-    exportvolumetrics._dataframe = df
+    df["PORV"] = df["PORV"].astype(str).replace("0.0", "a")
+    exportvolumetrics._table = _to_table(df)
     with pytest.raises(ValidationError, match="Input should be a valid number"):
         exportvolumetrics._validate_table()
 
@@ -681,7 +737,7 @@ def test_rms_volumetrics_export_function(
     with mock.patch.object(
         _ExportVolumetricsRMS,
         "_get_table_with_volumes",
-        return_value=voltable_standard,
+        return_value=_to_table(voltable_standard),
     ):
         result = export_inplace_volumes(mock_project_variable, "Geogrid", "geogrid_vol")
     vol_table_file = result.items[0].absolute_path
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Generator
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -40,9 +41,16 @@ def mock_export_class(
         _ExportStructureDepthSurfaces,
     )
 
-    with mock.patch(
-        "fmu.dataio.export.rms.structure_depth_surfaces.get_horizons_in_folder",
-        return_value=xtgeo_surfaces,
+    surfaces = {surf.name: surf for surf in xtgeo_surfaces}
+    with (
+        mock.patch(
+            "fmu.dataio.export.rms.structure_depth_surfaces.get_horizon_names_in_folder",
+            return_value=list(surfaces),
+        ),
+        mock.patch(
+            "fmu.dataio.export.rms.structure_depth_surfaces.get_horizon_surface",
+            side_effect=lambda _project, name, _folder: surfaces[name],
+        ),
     ):
         yield _ExportStructureDepthSurfaces(mock_project_variable, "DS_extracted")
 
@@ -135,13 +143,114 @@ def test_public_export_function(
     )
 
 
+@pytest.mark.usefixtures("inside_rms_interactive")
+def test_public_export_function_async(
+    mock_project_variable: MagicMock,
+    mock_export_class: _ExportStructureDepthSurfaces,
+    rmssetup_with_fmuconfig: Path,
+) -> None:
+    """Test that the surfaces are fetched in the calling thread and exported in the
+    background, giving the same result as the blocking export function."""
+
+    from fmu.dataio.export import export_async, wait_all
+    from fmu.dataio.export.rms import (
+        export_structure_depth_surfaces,
+        structure_depth_surfaces as module,
+    )
+
+    fetch_threads = []
+    get_horizon_surface = module.get_horizon_surface
+
+    def fetch(*args: Any) -> xtgeo.RegularSurface:
+        fetch_threads.append(threading.current_thread())
+        return get_horizon_surface(*args)
+
+    from fmu.dataio._background import submit
+
+    blocked = threading.Event()
+    submit(blocked.wait, 10)
+    with mock.patch.object(module, "get_horizon_surface", side_effect=fetch):
+        future = export_async(
+            export_structure_depth_surfaces, mock_project_variable, "DS_extracted"
+        )
+    # the surfaces are exported on the background worker, not the pipeline thread
+    assert not future.done()
+    export_folder = (
+        rmssetup_with_fmuconfig / "../../share/results/maps/structure_depth_surface"
+    )
+    assert not export_folder.exists() or not any(export_folder.iterdir())
+
+    blocked.set()
+    assert wait_all() == [True, future.result()]
+    out = future.result()
+
+    assert fetch_threads == [threading.main_thread()] * 3
+    assert len(out.items) == 3
+    for item in out.items:
+        metadata = dataio.read_metadata(item.absolute_path)
+        assert metadata["file"]["absolute_path"] == str(item.absolute_path)
+        assert metadata["file"]["size_bytes"] == item.absolute_path.stat().st_size
+
+
+@pytest.mark.usefixtures("inside_rms_interactive")
+def test_surface_names_validated_before_fetching(
+    mock_export_class: _ExportStructureDepthSurfaces,
+) -> None:
+    """Test that an invalid surface name raises before any surface is fetched."""
+
+    from fmu.dataio.export.rms import structure_depth_surfaces as module
+
+    mock_export_class._surface_names[-1] = "missing"
+
+    with (
+        mock.patch.object(module, "get_horizon_surface") as get_horizon_surface,
+        pytest.raises(ValueError, match="not listed"),
+    ):
+        mock_export_class.export()
+    get_horizon_surface.assert_not_called()
+
+
+@pytest.mark.usefixtures("inside_rms_interactive")
+def test_surfaces_exported_while_fetching(
+    mock_export_class: _ExportStructureDepthSurfaces,
+) -> None:
+    """Test that the surfaces are exported while the next surfaces are fetched,
+    rather than all being held in memory until the last one is fetched."""
+
+    from fmu.dataio.export.rms import structure_depth_surfaces as module
+
+    exported_when_fetched = []
+    get_horizon_surface = module.get_horizon_surface
+    export_surface = mock_export_class._export_surface
+
+    exported: list[str] = []
+
+    def fetch(project: Any, name: str, folder: str) -> xtgeo.RegularSurface:
+        exported_when_fetched.append(len(exported))
+        return get_horizon_surface(project, name, folder)
+
+    def export(surf: xtgeo.RegularSurface) -> Any:
+        exported.append(surf.name)
+        return export_surface(surf)
+
+    with (
+        mock.patch.object(module, "get_horizon_surface", side_effect=fetch),
+        mock.patch.object(mock_export_class, "_export_surface", side_effect=export),
+    ):
+        mock_export_class.export()
+
+    # the first surface is exported before the third is fetched
+    assert exported_when_fetched[2] >= 1
+    assert len(exported) == 3
+
+
 @pytest.mark.usefixtures("inside_rms_interactive")
 def test_unknown_name_in_stratigraphy_raises(
     mock_export_class: _ExportStructureDepthSurfaces,
 ) -> None:
     """Test that an error is raised if horizon name is missing in the stratigraphy"""
 
-    mock_export_class._surfaces[0].name = "missing"
+    mock_export_class._surface_names[0] = "missing"
 
     with pytest.raises(ValueError, match="not listed"):
         mock_export_class.export()
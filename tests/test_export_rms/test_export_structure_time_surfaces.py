@@ -40,9 +40,16 @@ def mock_export_class(
         _ExportStructureTimeSurfaces,
     )
 
-    with mock.patch(
-        "fmu.dataio.export.rms.structure_time_surfaces.get_horizons_in_folder",
-        return_value=xtgeo_surfaces,
+    surfaces = {surf.name: surf for surf in xtgeo_surfaces}
+    with (
+        mock.patch(
+            "fmu.dataio.export.rms.structure_time_surfaces.get_horizon_names_in_folder",
+            return_value=list(surfaces),
+        ),
+        mock.patch(
+            "fmu.dataio.export.rms.structure_time_surfaces.get_horizon_surface",
+            side_effect=lambda _project, name, _folder: surfaces[name],
+        ),
     ):
         yield _ExportStructureTimeSurfaces(mock_project_variable, "TS_extracted")
 
@@ -115,7 +122,7 @@ def test_unknown_name_in_stratigraphy_raises(
 ) -> None:
     """Test that an error is raised if horizon name is missing in the stratigraphy"""
 
-    mock_export_class._surfaces[0].name = "missing"
+    mock_export_class._surface_names[0] = "missing"
 
     with pytest.raises(ValueError, match="not listed"):
         mock_export_class.export()
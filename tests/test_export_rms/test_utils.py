@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import contextlib
 from typing import TYPE_CHECKING
 from unittest import mock
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -120,6 +122,110 @@ def test_get_horizons_in_folder(mock_project_variable: MagicMock) -> None:
         assert surfaces == ["TopVolantis", "TopTherys"]
 
 
+def test_get_horizon_names_in_folder(mock_project_variable: MagicMock) -> None:
+    from fmu.dataio.export.rms._utils import get_horizon_names_in_folder
+
+    horizon_folder = "DS_final"
+
+    horizon1 = mock.MagicMock()
+    horizon1[horizon_folder].is_empty.return_value = True
+    horizon1.name = "msl"
+
+    horizon2 = mock.MagicMock()
+    horizon2[horizon_folder].is_empty.return_value = False
+    horizon2.name = "TopVolantis"
+
+    mock_project_variable.horizons.__iter__.return_value = [horizon1, horizon2]
+
+    with mock.patch("xtgeo.surface_from_roxar") as mock_fetch:
+        names = get_horizon_names_in_folder(mock_project_variable, horizon_folder)
+
+    assert names == ["TopVolantis"]
+    mock_fetch.assert_not_called()
+
+
+def test_rms_fetch_cache_reuses_fetched_surfaces(
+    mock_project_variable: MagicMock,
+) -> None:
+    """Test that surfaces are fetched once inside the cache, and copies returned."""
+    from fmu.dataio.export.rms import rms_fetch_cache
+    from fmu.dataio.export.rms._utils import surface_from_rms
+
+    surface = mock.MagicMock()
+    with mock.patch("xtgeo.surface_from_roxar", return_value=surface) as mock_fetch:
+        with rms_fetch_cache() as cache:
+            first = surface_from_rms(
+                mock_project_variable, "TopVolantis", "DS", "horizons"
+            )
+            second = surface_from_rms(
+                mock_project_variable, "TopVolantis", "DS", "horizons"
+            )
+            surface_from_rms(mock_project_variable, "TopVolantis", "TS", "horizons")
+
+        assert mock_fetch.call_count == 2
+        assert cache.hits == 1
+        assert cache.misses == 2
+        assert first is second is surface.copy.return_value
+
+        # outside the block objects are fetched every time
+        surface_from_rms(mock_project_variable, "TopVolantis", "DS", "horizons")
+        assert mock_fetch.call_count == 3
+
+
+def test_rms_fetch_cache_is_reentrant() -> None:
+    from fmu.dataio.export.rms import rms_fetch_cache
+    from fmu.dataio.export.rms._cache import get_active_cache
+
+    assert get_active_cache() is None
+    with rms_fetch_cache() as outer:
+        with rms_fetch_cache() as inner:
+            assert inner is outer
+        assert get_active_cache() is outer
+    assert get_active_cache() is None
+
+
+def test_rms_fetch_cache_memoizes_project_units(
+    mock_project_variable: MagicMock,
+) -> None:
+    from fmu.dataio.export.rms import rms_fetch_cache
+    from fmu.dataio.export.rms._utils import (
+        get_rms_project_length_unit,
+        get_rms_project_units,
+    )
+
+    mock_project_variable.project_units = "custom_units"
+
+    with rms_fetch_cache():
+        with pytest.warns(UserWarning, match="not a known RMS unit system"):
+            assert get_rms_project_units(mock_project_variable) is None
+
+        # the unknown unit system is only warned about once
+        mock_project_variable.project_units = "metric"
+        assert get_rms_project_length_unit(mock_project_variable) == ""
+
+    assert get_rms_project_length_unit(mock_project_variable) == "m"
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_unknown_project_units_warns_at_caller(
+    mock_project_variable: MagicMock, cached: bool
+) -> None:
+    """Test that the unknown unit warning points at the caller, also through the
+    RMS fetch cache."""
+    from fmu.dataio.export.rms import rms_fetch_cache
+    from fmu.dataio.export.rms._utils import get_rms_project_units
+
+    mock_project_variable.project_units = "custom_units"
+
+    with (
+        rms_fetch_cache() if cached else contextlib.nullcontext(),
+        pytest.warns(UserWarning, match="not a known RMS unit system") as record,
+    ):
+        get_rms_project_units(mock_project_variable)
+
+    assert record[0].filename == __file__
+
+
 def test_get_horizons_in_folder_folder_not_exist(
     mock_project_variable: MagicMock,
 ) -> None:
@@ -360,6 +466,51 @@ def test_get_open_polygons_id(polygons: xtgeo.Polygons) -> None:
     assert open_polygons == [2]
 
 
+def test_get_open_polygons_id_matches_groupby(fault_line: xtgeo.Polygons) -> None:
+    """Test that open polygons are found as when comparing rows for each group,
+    also for polygons with non-contiguous rows and differing attributes."""
+    from fmu.dataio.export.rms._utils import get_open_polygons_id
+
+    rng = np.random.default_rng(seed=123)
+    nrows = 1000
+    df = pd.DataFrame(
+        {
+            "X_UTME": rng.integers(0, 3, nrows).astype(float),
+            "Y_UTMN": np.ones(nrows),
+            "Z_TVDSS": np.ones(nrows),
+            "POLY_ID": rng.integers(0, 200, nrows),
+            "NAME": rng.choice(["F1", "F2"], nrows, p=[0.95, 0.05]),
+        }
+    )
+    fault_line.set_dataframe(df)
+
+    expected = [
+        polid
+        for polid, poldf in df.groupby("POLY_ID")
+        if not poldf.iloc[0].equals(poldf.iloc[-1])
+    ]
+    assert 0 < len(expected) < df["POLY_ID"].nunique()
+    assert get_open_polygons_id(fault_line) == expected
+
+
+def test_get_polygon_end_rows() -> None:
+    from fmu.dataio.export.rms._utils import get_polygon_end_rows
+
+    ids, first, last = get_polygon_end_rows(np.array([3, 1, 3, 1, 2, 3]))
+
+    assert ids.tolist() == [1, 2, 3]
+    assert first.tolist() == [1, 4, 0]
+    assert last.tolist() == [3, 4, 5]
+
+
+def test_get_polygon_end_rows_empty() -> None:
+    from fmu.dataio.export.rms._utils import get_polygon_end_rows
+
+    ids, first, last = get_polygon_end_rows(np.array([], dtype=np.int64))
+
+    assert ids.size == first.size == last.size == 0
+
+
 def test_get_surfaces_in_general2d_folder(mock_project_variable: MagicMock) -> None:
     """Test that get_surfaces_in_general2d_folder only picks up non-empty surfaces"""
 
@@ -440,7 +591,7 @@ def test_get_polygons_in_general2d_folder(mock_project_variable: MagicMock) -> N
     # Mock xtgeo.polygons_from_roxar to return just the polygon name
     with mock.patch(
         "xtgeo.polygons_from_roxar",
-        side_effect=lambda _project, name, _category, stype: name,
+        side_effect=lambda _project, name, _category, attributes, stype: name,
     ):
         polygons = get_polygons_in_general2d_folder(mock_project_variable, folder)
 
@@ -0,0 +1,235 @@
+"""Test the aggregation of realization tables to ensemble tables"""
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+import yaml
+from fmu.settings._drogon import create_drogon_fmu_dir
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData
+from fmu.dataio._utils import md5sum
+from fmu.dataio.aggregation import aggregate_tables
+from fmu.dataio.aggregation._discovery import find_realization_exports
+from fmu.dataio.aggregation._tables import _realization_batches, _unified_schema
+from fmu.dataio.manifest._manifest import MANIFEST_FILENAME
+
+from ..conftest import ERT_CASE_DATA, ERTRUN_ENV_PREHOOK
+
+NREALS = 3
+
+
+def _volumes(real: int) -> pa.Table:
+    return pa.table(
+        {
+            "ZONE": ["Valysar", "Therys", "Volon"],
+            "REGION": ["WestLowland", "WestLowland", "CentralSouth"],
+            "FLUID": ["oil", "gas", "oil"],
+            "BULK": [1.0 + real, 2.0 + real, 3.0 + real],
+        }
+    )
+
+
+def _read_metadata(path: Path) -> dict[str, Any]:
+    with open(path.parent / f".{path.name}.yml", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+@pytest.fixture
+def casepath(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    rootpath: Path,
+    mock_global_config: dict[str, Any],
+) -> Path:
+    """A case with a volumes table exported from each realization in iter-0."""
+    casepath = tmp_path / ERT_CASE_DATA
+    shutil.copytree(rootpath / ERT_CASE_DATA, casepath)
+    create_drogon_fmu_dir(casepath)
+
+    for key, value in ERTRUN_ENV_PREHOOK.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv("_ERT_ITERATION_NUMBER", "0")
+
+    for real in range(NREALS):
+        runpath = casepath / f"realization-{real}/iter-0"
+        runpath.mkdir(parents=True, exist_ok=True)
+        monkeypatch.setenv("_ERT_RUNPATH", str(runpath))
+        monkeypatch.setenv("_ERT_REALIZATION_NUMBER", str(real))
+        monkeypatch.chdir(runpath)
+        ExportData(
+            config=mock_global_config,
+            content="volumes",
+            name="geogrid",
+            table_index=["ZONE", "REGION", "FLUID"],
+        ).export(_volumes(real))
+
+    # aggregation runs in a case context, e.g. from an Ert workflow
+    monkeypatch.delenv("_ERT_RUNPATH")
+    monkeypatch.delenv("_ERT_REALIZATION_NUMBER")
+    monkeypatch.delenv("_ERT_ITERATION_NUMBER")
+    monkeypatch.chdir(casepath)
+    return casepath
+
+
+def test_aggregate_tables(casepath: Path, mock_global_config: dict[str, Any]) -> None:
+    """Test that the realization tables are aggregated with a REAL column."""
+    outfile = aggregate_tables(
+        config=mock_global_config,
+        casepath=casepath,
+        ensemble_name="iter-0",
+        content="volumes",
+        name="geogrid",
+    )
+    assert outfile == (
+        casepath / "share/ensemble/iter-0/share/results/tables/geogrid.parquet"
+    )
+
+    table = pq.read_table(outfile)
+    assert table.column_names == ["REAL", "ZONE", "REGION", "FLUID", "BULK"]
+    assert table.schema.field("REAL").type == pa.int32()
+    assert table.num_rows == 3 * NREALS
+    assert table["REAL"].to_pylist() == [0, 0, 0, 1, 1, 1, 2, 2, 2]
+    for real in range(NREALS):
+        rows = table.filter(pc.equal(table["REAL"], real)).drop_columns("REAL")
+        assert rows.equals(_volumes(real))
+
+    metadata = _read_metadata(outfile)
+    assert metadata["fmu"]["context"]["stage"] == "ensemble"
+    assert metadata["fmu"]["ensemble"]["name"] == "iter-0"
+    assert "realization" not in metadata["fmu"]
+    assert metadata["fmu"]["aggregation"]["operation"] == "collection"
+    assert metadata["fmu"]["aggregation"]["realization_ids"] == list(range(NREALS))
+    assert metadata["data"]["content"] == "volumes"
+    assert metadata["data"]["table_index"] == ["ZONE", "REGION", "FLUID", "REAL"]
+    assert metadata["data"]["spec"]["num_rows"] == 3 * NREALS
+    assert metadata["file"]["checksum_md5"] == md5sum(outfile)
+    assert metadata["file"]["size_bytes"] == outfile.stat().st_size
+    assert not list(outfile.parent.parent.parent.parent.glob(".*.tmp"))
+
+
+def test_aggregate_subset_of_realizations(
+    casepath: Path, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that only the given realizations are aggregated."""
+    outfile = aggregate_tables(
+        config=mock_global_config,
+        casepath=casepath,
+        ensemble_name="iter-0",
+        content="volumes",
+        name="geogrid",
+        realizations=[0, 2],
+    )
+    assert pc.unique(pq.read_table(outfile)["REAL"]).to_pylist() == [0, 2]
+    metadata = _read_metadata(outfile)
+    assert metadata["fmu"]["aggregation"]["realization_ids"] == [0, 2]
+
+
+def test_aggregate_without_manifests(
+    casepath: Path, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that the realization tables are found from the metadata files when the
+    runpaths have no export manifests."""
+    for real in range(NREALS):
+        (casepath / f"realization-{real}/iter-0" / MANIFEST_FILENAME).unlink()
+
+    exports = find_realization_exports(
+        casepath,
+        "iter-0",
+        classname="table",
+        fmt="parquet",
+        suffix=".parquet",
+        content="volumes",
+        name="geogrid",
+    )
+    assert [export.realization for export in exports] == list(range(NREALS))
+
+
+def test_aggregate_no_matching_tables(
+    casepath: Path, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that an error is given when no realization tables are found."""
+    with pytest.raises(FileNotFoundError, match="No realization tables"):
+        aggregate_tables(
+            config=mock_global_config,
+            casepath=casepath,
+            ensemble_name="iter-0",
+            content="volumes",
+            name="geogrid",
+            tagname="other",
+        )
+
+
+def test_aggregate_tables_with_different_columns(
+    casepath: Path, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that columns missing in some realizations are filled with nulls."""
+    exports = find_realization_exports(
+        casepath,
+        "iter-0",
+        classname="table",
+        fmt="parquet",
+        suffix=".parquet",
+        content="volumes",
+        name="geogrid",
+    )
+    pq.write_table(
+        _volumes(1).append_column("PORV", pa.array([1.0, 2.0, 3.0])), exports[1].path
+    )
+
+    schema = _unified_schema(exports)
+    out_schema = schema.insert(0, pa.field("REAL", pa.int32()))
+    table = pa.Table.from_batches(
+        _realization_batches(exports, schema, out_schema, batch_size=2)
+    )
+    assert table["PORV"].null_count == 6
+    assert table.filter(pc.equal(table["REAL"], 1))["PORV"].to_pylist() == [
+        1.0,
+        2.0,
+        3.0,
+    ]
+
+
+def test_aggregate_streams_in_batches(
+    casepath: Path, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that no more than batch_size rows are read at a time."""
+    exports = find_realization_exports(
+        casepath,
+        "iter-0",
+        classname="table",
+        fmt="parquet",
+        suffix=".parquet",
+        content="volumes",
+        name="geogrid",
+    )
+    schema = _unified_schema(exports)
+    out_schema = schema.insert(0, pa.field("REAL", pa.int32()))
+    batches = list(_realization_batches(exports, schema, out_schema, batch_size=2))
+    assert max(batch.num_rows for batch in batches) == 2
+    assert sum(batch.num_rows for batch in batches) == 3 * NREALS
+
+
+def test_aggregate_table_with_real_column(
+    casepath: Path, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that tables already containing a REAL column are not aggregated."""
+    exports = find_realization_exports(
+        casepath,
+        "iter-0",
+        classname="table",
+        fmt="parquet",
+        suffix=".parquet",
+        content="volumes",
+        name="geogrid",
+    )
+    pq.write_table(
+        _volumes(0).append_column("REAL", pa.array([0, 0, 0])), exports[0].path
+    )
+    with pytest.raises(ValueError, match="already contain a 'REAL' column"):
+        _unified_schema(exports)
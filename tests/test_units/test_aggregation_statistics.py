@@ -0,0 +1,292 @@
+"""Test the ensemble statistics of surfaces and grid properties"""
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import xtgeo
+import yaml
+from fmu.settings._drogon import create_drogon_fmu_dir
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData
+from fmu.dataio._utils import md5sum
+from fmu.dataio.aggregation import grid_property_statistics, surface_statistics
+from fmu.dataio.aggregation._discovery import find_realization_exports
+from fmu.dataio.aggregation._statistics import compute_statistics
+from fmu.dataio.aggregation._values import IrapBinaryValues, RoffValues
+
+from ..conftest import ERT_CASE_DATA, ERTRUN_ENV_PREHOOK
+
+NREALS = 4
+
+
+def _surface(real: int) -> xtgeo.RegularSurface:
+    rng = np.random.default_rng(real)
+    surf = xtgeo.RegularSurface(ncol=12, nrow=10, xinc=20, yinc=20, values=0.0)
+    values = np.ma.masked_array(1000 + 100 * rng.random((12, 10)))
+    values[0, 0] = np.ma.masked  # undefined in all realizations
+    values[real, 1] = np.ma.masked  # undefined in one realization
+    surf.values = values
+    return surf
+
+
+def _gridproperty(real: int) -> xtgeo.GridProperty:
+    rng = np.random.default_rng(real)
+    values = np.ma.masked_array(rng.random((3, 4, 5)))
+    values[0, 0, 0] = np.ma.masked
+    return xtgeo.GridProperty(ncol=3, nrow=4, nlay=5, name="poro", values=values)
+
+
+def _read_metadata(path: Path) -> dict[str, Any]:
+    with open(path.parent / f".{path.name}.yml", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def _expected(values: list[np.ma.MaskedArray]) -> dict[str, np.ndarray]:
+    """Statistics with numpy over the realizations, of the values as stored in the
+    files in single precision."""
+    values = np.stack([np.ma.filled(v.astype(np.float32), np.nan) for v in values])
+    return {
+        "mean": np.nanmean(values, axis=0),
+        "std": np.nanstd(values, axis=0),
+        "min": np.nanmin(values, axis=0),
+        "max": np.nanmax(values, axis=0),
+        "p10": np.nanpercentile(values, 10, axis=0),
+        "p50": np.nanpercentile(values, 50, axis=0),
+        "p90": np.nanpercentile(values, 90, axis=0),
+    }
+
+
+@pytest.fixture
+def casepath(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    rootpath: Path,
+    mock_global_config: dict[str, Any],
+) -> Path:
+    """A case with a surface and a grid property exported from each realization."""
+    casepath = tmp_path / ERT_CASE_DATA
+    shutil.copytree(rootpath / ERT_CASE_DATA, casepath)
+    create_drogon_fmu_dir(casepath)
+
+    for key, value in ERTRUN_ENV_PREHOOK.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv("_ERT_ITERATION_NUMBER", "0")
+
+    for real in range(NREALS):
+        runpath = casepath / f"realization-{real}/iter-0"
+        runpath.mkdir(parents=True, exist_ok=True)
+        monkeypatch.setenv("_ERT_RUNPATH", str(runpath))
+        monkeypatch.setenv("_ERT_REALIZATION_NUMBER", str(real))
+        monkeypatch.chdir(runpath)
+        ExportData(
+            config=mock_global_config,
+            content="depth",
+            name="TopVolantis",
+            tagname="ds_extract",
+        ).export(_surface(real))
+        ExportData(
+            config=mock_global_config,
+            content="property",
+            name="poro",
+        ).export(_gridproperty(real))
+
+    # aggregation runs in a case context, e.g. from an Ert workflow
+    monkeypatch.delenv("_ERT_RUNPATH")
+    monkeypatch.delenv("_ERT_REALIZATION_NUMBER")
+    monkeypatch.delenv("_ERT_ITERATION_NUMBER")
+    monkeypatch.chdir(casepath)
+    return casepath
+
+
+def test_surface_statistics(casepath: Path, mock_global_config: dict[str, Any]) -> None:
+    """Test that the surface statistics equal the numpy statistics."""
+    outfiles = surface_statistics(
+        config=mock_global_config,
+        casepath=casepath,
+        ensemble_name="iter-0",
+        content="depth",
+        name="TopVolantis",
+        tagname="ds_extract",
+    )
+    assert list(outfiles) == ["mean", "std", "min", "max", "p10", "p50", "p90"]
+    assert outfiles["p10"] == (
+        casepath / "share/ensemble/iter-0/share/results/maps/"
+        "topvolantis--ds_extract_p10.gri"
+    )
+
+    stack = [_surface(real).values for real in range(NREALS)]
+    for statistic, expected in _expected(stack).items():
+        surf = xtgeo.surface_from_file(outfiles[statistic])
+        assert surf.values.mask[0, 0]
+        assert not surf.values.mask[1, 1]
+        np.testing.assert_allclose(
+            np.ma.filled(surf.values, np.nan), expected, rtol=1e-6
+        )
+
+
+def test_surface_statistics_metadata(
+    casepath: Path, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that the statistics are exported in ensemble context with the
+    realizations included in the aggregation."""
+    outfiles = surface_statistics(
+        config=mock_global_config,
+        casepath=casepath,
+        ensemble_name="iter-0",
+        content="depth",
+        name="TopVolantis",
+        tagname="ds_extract",
+        statistics=["mean", "p90"],
+        realizations=[0, 1, 3],
+    )
+    mean, p90 = _read_metadata(outfiles["mean"]), _read_metadata(outfiles["p90"])
+
+    for metadata, statistic in ((mean, "mean"), (p90, "p90")):
+        assert metadata["fmu"]["context"]["stage"] == "ensemble"
+        assert "realization" not in metadata["fmu"]
+        assert metadata["fmu"]["aggregation"]["operation"] == statistic
+        assert metadata["fmu"]["aggregation"]["realization_ids"] == [0, 1, 3]
+        assert metadata["data"]["content"] == "depth"
+        assert metadata["data"]["name"] == "VOLANTIS GP. Top"
+        assert "TopVolantis" in metadata["data"]["alias"]
+        assert metadata["data"]["tagname"] == f"ds_extract_{statistic}"
+        assert metadata["file"]["checksum_md5"] == md5sum(outfiles[statistic])
+
+    assert mean["fmu"]["aggregation"]["id"] != p90["fmu"]["aggregation"]["id"]
+
+
+def test_grid_property_statistics(
+    casepath: Path, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that the grid property statistics equal the numpy statistics."""
+    outfiles = grid_property_statistics(
+        config=mock_global_config,
+        casepath=casepath,
+        ensemble_name="iter-0",
+        content="property",
+        name="poro",
+    )
+    assert outfiles["mean"].parent == (
+        casepath / "share/ensemble/iter-0/share/results/grids"
+    )
+
+    stack = [_gridproperty(real).values for real in range(NREALS)]
+    for statistic, expected in _expected(stack).items():
+        prop = xtgeo.gridproperty_from_file(outfiles[statistic])
+        assert prop.values.mask[0, 0, 0]
+        np.testing.assert_allclose(
+            np.ma.filled(prop.values, np.nan), expected, rtol=1e-6
+        )
+
+    metadata = _read_metadata(outfiles["p50"])
+    assert metadata["fmu"]["aggregation"]["realization_ids"] == list(range(NREALS))
+
+
+def _readers(casepath: Path, tmp_path: Path) -> list[IrapBinaryValues]:
+    exports = find_realization_exports(
+        casepath,
+        "iter-0",
+        classname="surface",
+        fmt="irap_binary",
+        suffix=".gri",
+        content="depth",
+        name="TopVolantis",
+        tagname="ds_extract",
+    )
+    return [IrapBinaryValues(export.path, tmp_path) for export in exports]
+
+
+def test_statistics_independent_of_tiles(casepath: Path, tmp_path: Path) -> None:
+    """Test that the statistics are the same for any tile size."""
+    readers = _readers(casepath, tmp_path)
+    full = compute_statistics(readers, ["mean", "std", "p50"], tile_memory=2**30)
+    tiled = compute_statistics(
+        readers, ["mean", "std", "p50"], tile_memory=8 * 7 * 10, max_workers=4
+    )
+    for statistic, values in full.items():
+        np.testing.assert_array_equal(values, tiled[statistic])
+
+
+def test_irap_binary_values_memory_mapped(casepath: Path, tmp_path: Path) -> None:
+    """Test that the irap binary values are memory mapped in file order."""
+    reader = _readers(casepath, tmp_path)[0]
+    assert reader._layout.path == reader.path
+    assert not list(tmp_path.glob("*.npy"))
+
+    surf = xtgeo.surface_from_file(reader.path)
+    np.testing.assert_array_equal(
+        reader.read(0, reader.size),
+        np.ma.filled(surf.values.astype(np.float64), np.nan).ravel(order="F"),
+    )
+    np.testing.assert_array_equal(
+        reader.read(5, 17),
+        np.ma.filled(surf.values.astype(np.float64), np.nan).ravel(order="F")[5:17],
+    )
+
+
+def test_irap_binary_values_irregular_records(tmp_path: Path) -> None:
+    """Test that irap binary files with irregular records are read with xtgeo."""
+    path = tmp_path / "surf.gri"
+    _surface(0).to_file(path)
+
+    # split the first data record of 12 values into records of 5 and 7 values
+    data = bytearray(path.read_bytes())
+    values = data[104 : 104 + 48]
+    head, tail = np.array([20], ">i4").tobytes(), np.array([28], ">i4").tobytes()
+    data[100 : 100 + 56] = head + values[:20] + head + tail + values[20:] + tail
+    path.write_bytes(bytes(data))
+
+    reader = IrapBinaryValues(path, tmp_path)
+    assert reader._layout.path.suffix == ".npy"
+    np.testing.assert_allclose(
+        reader.read(0, reader.size),
+        np.ma.filled(_surface(0).values, np.nan).ravel(order="F"),
+        rtol=1e-6,
+    )
+
+
+def test_roff_values_memory_mapped(tmp_path: Path) -> None:
+    """Test that the roff values are memory mapped."""
+    path = tmp_path / "poro.roff"
+    prop = _gridproperty(0)
+    prop.to_file(path)
+
+    reader = RoffValues(path, tmp_path)
+    assert reader._layout.path == path
+    np.testing.assert_allclose(
+        reader.read(0, reader.size),
+        np.ma.filled(np.flip(prop.values, axis=2), np.nan).ravel(),
+        rtol=1e-6,
+    )
+    np.testing.assert_allclose(
+        reader.to_object(reader.read(0, reader.size)).values, prop.values, rtol=1e-6
+    )
+
+
+def test_statistics_different_shapes(casepath: Path, tmp_path: Path) -> None:
+    """Test that an error is given when the realizations have different shapes."""
+    readers = _readers(casepath, tmp_path)
+    xtgeo.RegularSurface(ncol=5, nrow=5, xinc=1, yinc=1, values=1.0).to_file(
+        readers[1].path
+    )
+    readers[1] = IrapBinaryValues(readers[1].path, tmp_path)
+    with pytest.raises(ValueError, match="differs from the shape"):
+        compute_statistics(readers, ["mean"])
+
+
+def test_invalid_statistic(casepath: Path, mock_global_config: dict[str, Any]) -> None:
+    """Test that an error is given for an invalid statistic."""
+    with pytest.raises(ValueError, match="Invalid statistic 'p101'"):
+        surface_statistics(
+            config=mock_global_config,
+            casepath=casepath,
+            ensemble_name="iter-0",
+            content="depth",
+            name="TopVolantis",
+            tagname="ds_extract",
+            statistics=["mean", "p101"],
+        )
@@ -0,0 +1,172 @@
+"""Test the asyncio export methods of ExportData"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+import xtgeo
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData, read_metadata
+from fmu.dataio._export import core
+from fmu.dataio.manifest._manifest import load_export_manifest
+
+
+@pytest.fixture
+def exportdata(
+    monkeypatch: MonkeyPatch, tmp_path: Path, mock_global_config: dict[str, Any]
+) -> ExportData:
+    monkeypatch.chdir(tmp_path)
+    return ExportData(config=mock_global_config, content="depth")
+
+
+def _surfaces(count: int) -> list[xtgeo.RegularSurface]:
+    return [
+        xtgeo.RegularSurface(
+            ncol=12, nrow=10, xinc=20, yinc=20, values=float(i), name=f"surf{i}"
+        )
+        for i in range(count)
+    ]
+
+
+def test_aexport_identical_to_export(
+    exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that aexport() gives the same file and metadata as export(), exported
+    outside the event loop thread."""
+    export_threads = []
+    original_export_object = core.export_object
+
+    def export_object(*args: Any) -> Any:
+        export_threads.append(threading.current_thread())
+        return original_export_object(*args)
+
+    with mock.patch.object(core, "export_object", side_effect=export_object):
+        outfile = asyncio.run(exportdata.aexport(regsurf))
+    assert export_threads
+    assert threading.current_thread() not in export_threads
+
+    expected = read_metadata(outfile)
+    expected_bytes = Path(outfile).read_bytes()
+
+    assert exportdata.export(regsurf) == outfile
+    metadata = read_metadata(outfile)
+    assert Path(outfile).read_bytes() == expected_bytes
+    assert metadata["file"] == expected["file"]
+    assert metadata["data"] == expected["data"]
+
+
+def test_aexport_of_file_raises(exportdata: ExportData, tmp_path: Path) -> None:
+    """Test that files are not exported asynchronously."""
+    with pytest.raises(TypeError, match="Only objects in memory"):
+        asyncio.run(exportdata.aexport(tmp_path / "file.gri"))
+    with pytest.raises(ExceptionGroup) as e:
+        asyncio.run(exportdata.aexport_many([str(tmp_path / "file.gri")]))
+    assert isinstance(e.value.exceptions[0], TypeError)
+
+
+def test_aexport_without_config_warns(
+    monkeypatch: MonkeyPatch, tmp_path: Path, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that exporting without a valid config warns, and exports the object
+    without metadata."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.warns(UserWarning):
+        exportdata = ExportData(config={}, content="depth")
+
+    with pytest.warns(FutureWarning, match="global config is invalid"):
+        outfile = Path(asyncio.run(exportdata.aexport(regsurf)))
+    assert outfile.exists()
+    assert not (outfile.parent / f".{outfile.name}.yml").exists()
+
+
+def test_aexport_many_limits_concurrency(exportdata: ExportData) -> None:
+    """Test that aexport_many() exports all objects in order, with no more than the
+    given number of exports running at the same time."""
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+    original_export_object = core.export_object
+
+    def export_object(*args: Any) -> Any:
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        try:
+            threading.Event().wait(0.05)
+            return original_export_object(*args)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    surfaces = _surfaces(6)
+    with (
+        mock.patch.object(core, "export_object", side_effect=export_object),
+        ThreadPoolExecutor(max_workers=6) as executor,
+    ):
+        outfiles = asyncio.run(
+            exportdata.aexport_many(surfaces, max_concurrency=2, executor=executor)
+        )
+
+    assert max_running[0] == 2
+    assert [Path(f).name for f in outfiles] == [f"surf{i}.gri" for i in range(6)]
+    for outfile, surface in zip(outfiles, surfaces, strict=True):
+        assert xtgeo.surface_from_file(outfile).values.mean() == surface.values.mean()
+
+
+def test_aexport_many_records_all_exports_in_manifest(
+    runpath_no_dotfmu: Path, rmsglobalconfig: dict[str, Any]
+) -> None:
+    """Test that concurrent exports do not lose updates of the export manifest."""
+    exportdata = ExportData(config=rmsglobalconfig, content="depth")
+    outfiles = asyncio.run(exportdata.aexport_many(_surfaces(8), max_concurrency=8))
+
+    manifest = load_export_manifest()
+    assert sorted(str(entry.absolute_path) for entry in manifest.root) == sorted(
+        outfiles
+    )
+
+
+def test_aexport_many_invalid_concurrency(exportdata: ExportData) -> None:
+    with pytest.raises(ValueError, match="positive integer"):
+        asyncio.run(exportdata.aexport_many([], max_concurrency=0))
+
+
+def test_aexport_many_cancels_remaining_on_error(exportdata: ExportData) -> None:
+    """Test that the exports not started are cancelled when an export fails."""
+    surfaces = _surfaces(4)
+    with (
+        mock.patch.object(core, "export_object", side_effect=OSError("disk full")),
+        pytest.raises(ExceptionGroup) as exc_info,
+    ):
+        asyncio.run(exportdata.aexport_many(surfaces, max_concurrency=1))
+
+    assert exc_info.group_contains(OSError, match="disk full")
+    assert len(exc_info.value.exceptions) == 1
+    assert not list(Path().rglob("*.gri"))
+
+
+def test_aexport_cancelled_before_started(
+    exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that an export cancelled while waiting for the executor is not run."""
+    release = threading.Event()
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            blocker = loop.run_in_executor(executor, release.wait, 10)
+            task = asyncio.create_task(exportdata.aexport(regsurf, executor=executor))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            release.set()
+            await blocker
+
+    asyncio.run(main())
+    assert not list(Path().rglob("*.gri"))
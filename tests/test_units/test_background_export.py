@@ -0,0 +1,224 @@
+"""Test the exports running on a background worker"""
+
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+import xtgeo
+from pytest import MonkeyPatch
+
+from fmu.dataio import (
+    ExportData,
+    ValidationLevel,
+    deduplicated_writes,
+    metadata_validation,
+    read_metadata,
+    staged_writes,
+)
+from fmu.dataio._background import submit
+from fmu.dataio._content_store import deduplicated_writes_enabled
+from fmu.dataio._staging import get_staged_writes_durability
+from fmu.dataio._validation import get_validation_level
+from fmu.dataio.export import export_async, wait_all
+
+
+@pytest.fixture
+def blocked_worker() -> Iterator[threading.Event]:
+    """Block the background worker until the yielded event is set."""
+    event = threading.Event()
+    submit(event.wait, 10)
+    yield event
+    event.set()
+    wait_all()
+
+
+@pytest.fixture
+def exportdata(
+    monkeypatch: MonkeyPatch, tmp_path: Path, mock_global_config: dict[str, Any]
+) -> Iterator[ExportData]:
+    monkeypatch.chdir(tmp_path)
+    yield ExportData(config=mock_global_config, content="depth", name="surf")
+    # exports not waited for by the test are not reported by later tests
+    wait_all()
+
+
+def test_export_async_identical_to_export(
+    exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that a background export gives the same file and metadata as export()."""
+    outfile = exportdata.export_async(regsurf).result()
+    expected = read_metadata(outfile)
+    expected_bytes = Path(outfile).read_bytes()
+
+    assert exportdata.export(regsurf) == outfile
+    metadata = read_metadata(outfile)
+    assert Path(outfile).read_bytes() == expected_bytes
+    assert metadata["file"] == expected["file"]
+    assert metadata["data"] == expected["data"]
+
+
+def test_export_async_returns_before_export(
+    blocked_worker: threading.Event,
+    exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the future is returned right away, and that the object is copied
+    such that it can be modified while waiting to be exported."""
+    future = exportdata.export_async(regsurf)
+    original = regsurf.values.copy()
+    regsurf.values += 100
+    exportdata.name = "other"
+
+    assert not future.done()
+    blocked_worker.set()
+
+    outfile = Path(future.result())
+    assert outfile.name == "surf.gri"
+    exported = xtgeo.surface_from_file(outfile)
+    assert (exported.values == original).all()
+
+
+def test_export_async_without_copy(
+    blocked_worker: threading.Event,
+    exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the object itself is exported when not copied."""
+    future = exportdata.export_async(regsurf, copy_data=False)
+    regsurf.values += 100
+    blocked_worker.set()
+
+    exported = xtgeo.surface_from_file(future.result())
+    assert (exported.values == regsurf.values).all()
+
+
+def test_export_async_of_file_raises(exportdata: ExportData, tmp_path: Path) -> None:
+    """Test that files are not exported in the background."""
+    with pytest.raises(TypeError, match="Only objects in memory"):
+        exportdata.export_async(tmp_path / "file.gri")
+
+
+def test_wait_all_reports_errors(
+    exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that wait_all() raises the errors of all failed exports, and that they
+    are only reported once."""
+    first = exportdata.export_async(regsurf)
+    failed = [exportdata.export_async(object()) for _ in range(2)]  # type: ignore
+
+    with pytest.raises(ExceptionGroup, match="2 of 3 background exports failed") as e:
+        wait_all()
+    assert len(e.value.exceptions) == 2
+    assert all(f.exception() is not None for f in failed)
+    assert first.exception() is None
+
+    assert wait_all() == []
+
+
+def test_wait_all_timeout(blocked_worker: threading.Event) -> None:
+    """Test that exports not completed within the timeout are waited for again."""
+    with pytest.raises(TimeoutError, match="1 of 1 background exports"):
+        wait_all(timeout=0.01)
+
+    blocked_worker.set()
+    assert wait_all() == [True]
+
+
+def test_export_async_of_function(
+    blocked_worker: threading.Event,
+    exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the exports of a function are deferred, with the paths known up
+    front, and that the function result is given when all exports are complete."""
+    calling_threads = []
+
+    def export_surfaces(names: list[str]) -> list[str]:
+        calling_threads.append(threading.current_thread())
+        return [exportdata.export(regsurf, name=name) for name in names]
+
+    future = export_async(export_surfaces, ["first", "second"])
+
+    assert calling_threads == [threading.current_thread()]
+    assert not future.done()
+    blocked_worker.set()
+
+    outfiles = future.result()
+    assert [Path(f).name for f in outfiles] == ["first.gri", "second.gri"]
+    for outfile in outfiles:
+        assert read_metadata(outfile)["file"]["absolute_path"] == outfile
+
+
+def test_export_async_of_function_raises_export_errors(
+    exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that the future of a function raises the errors of its exports."""
+
+    def export_surface() -> str:
+        return exportdata.export(regsurf)
+
+    with mock.patch(
+        "fmu.dataio._export.core.export_object", side_effect=OSError("disk full")
+    ):
+        future = export_async(export_surface)
+        with pytest.raises(OSError, match="disk full"):
+            future.result()
+
+    with pytest.raises(ExceptionGroup, match="1 of 1 background exports failed"):
+        wait_all()
+
+
+def test_export_async_of_function_raising_waits_for_exports(
+    blocked_worker: threading.Event,
+    exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the exports deferred before a function raises are still run, and
+    waited for by wait_all()."""
+
+    def export_surfaces() -> None:
+        exportdata.export(regsurf, name="first")
+        raise ValueError("Unable to fetch the second surface")
+
+    with pytest.raises(ValueError, match="Unable to fetch"):
+        export_async(export_surfaces)
+    blocked_worker.set()
+
+    _, outfile = wait_all()
+    assert outfile.name == "first.gri"
+    assert read_metadata(outfile)["file"]["absolute_path"] == str(outfile)
+
+
+def _settings() -> tuple[bool | None, bool, ValidationLevel]:
+    return (
+        get_staged_writes_durability(),
+        deduplicated_writes_enabled(),
+        get_validation_level(),
+    )
+
+
+def test_background_exports_use_settings_at_submit(
+    blocked_worker: threading.Event,
+) -> None:
+    """Test that background exports use the settings of the context they were
+    submitted from, also when the settings have changed before they run."""
+    with (
+        staged_writes(durable=False),
+        deduplicated_writes(),
+        metadata_validation("trusted"),
+    ):
+        future = submit(_settings)
+    unset = submit(_settings)
+    blocked_worker.set()
+
+    assert future.result() == (False, True, ValidationLevel.trusted)
+    assert unset.result() == (None, False, ValidationLevel.full)
+
+
+def test_export_async_can_not_be_nested() -> None:
+    """Test that export_async() can not be called from a function run by it."""
+    with pytest.raises(RuntimeError, match="can not be called within"):
+        export_async(export_async, lambda: None)
@@ -0,0 +1,218 @@
+"""Test the metadata catalog of a case"""
+
+import multiprocessing
+import shutil
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+import xtgeo
+from fmu.settings._drogon import create_drogon_fmu_dir
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData
+from fmu.dataio._workflows.update_catalog import get_parser, update_catalog_main
+from fmu.dataio.catalog import MetadataCatalog, get_catalog_path
+from fmu.dataio.manifest._manifest import MANIFEST_FILENAME
+
+from ..conftest import ERT_CASE_DATA, ERTRUN_ENV_PREHOOK
+
+NREALS = 3
+
+
+def _export_realization(
+    casepath: Path,
+    monkeypatch: MonkeyPatch,
+    config: dict[str, Any],
+    surface: xtgeo.RegularSurface,
+    real: int,
+    iteration: int = 0,
+) -> Path:
+    """Export surfaces from a realization, returning the runpath."""
+    runpath = casepath / f"realization-{real}/iter-{iteration}"
+    runpath.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("_ERT_ITERATION_NUMBER", str(iteration))
+    monkeypatch.setenv("_ERT_RUNPATH", str(runpath))
+    monkeypatch.setenv("_ERT_REALIZATION_NUMBER", str(real))
+    monkeypatch.chdir(runpath)
+
+    for tagname in ("ds_extract", "mapped"):
+        ExportData(
+            config=config, content="depth", name="topvolantis", tagname=tagname
+        ).export(surface)
+    ExportData(
+        config=config, content="time", name="topvolantis", timedata=[["20200101"]]
+    ).export(surface)
+    return runpath
+
+
+@pytest.fixture
+def casepath(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    rootpath: Path,
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+) -> Path:
+    """A case with surfaces exported from each realization in iter-0."""
+    casepath = tmp_path / ERT_CASE_DATA
+    shutil.copytree(rootpath / ERT_CASE_DATA, casepath)
+    create_drogon_fmu_dir(casepath)
+
+    for key, value in ERTRUN_ENV_PREHOOK.items():
+        monkeypatch.setenv(key, value)
+    for real in range(NREALS):
+        _export_realization(casepath, monkeypatch, mock_global_config, regsurf, real)
+    return casepath
+
+
+def test_update_catalog(casepath: Path) -> None:
+    """Test that the objects in the export manifests are added to the catalog."""
+    catalog = MetadataCatalog(casepath)
+    assert catalog.update() == 3 * NREALS
+    assert catalog.path == casepath / "share/metadata/catalog.sqlite"
+    assert get_catalog_path(casepath) == catalog.path
+
+    entries = catalog.query()
+    assert len(entries) == 3 * NREALS
+    for entry in entries:
+        assert entry.path.exists()
+        assert entry.path.is_relative_to(catalog.casepath)
+        assert entry.metadata["class"] == "surface"
+
+
+def test_query_catalog(casepath: Path) -> None:
+    """Test filtering the objects in the catalog."""
+    catalog = MetadataCatalog(casepath)
+    catalog.update()
+
+    entries = catalog.query(
+        classname="surface",
+        content="depth",
+        name="topvolantis",
+        tagname="ds_extract",
+        ensemble="iter-0",
+    )
+    assert [entry.metadata["fmu"]["realization"]["id"] for entry in entries] == [
+        0,
+        1,
+        2,
+    ]
+    assert all(entry.metadata["data"]["tagname"] == "ds_extract" for entry in entries)
+
+    assert len(catalog.query(content="depth", realization=1)) == 2
+    assert len(catalog.query(content="depth", realization=[0, 2])) == 4
+    assert len(catalog.query(fmt="irap_binary")) == 3 * NREALS
+    assert not catalog.query(ensemble="iter-1")
+    assert not catalog.query(classname="table")
+
+
+def test_query_catalog_on_time(casepath: Path) -> None:
+    """Test filtering the objects in the catalog on time."""
+    catalog = MetadataCatalog(casepath)
+    catalog.update()
+
+    assert len(catalog.query(time0="2020-01-01")) == NREALS
+    assert len(catalog.query(time0="2020-01-01T00:00:00")) == NREALS
+    assert not catalog.query(time0="2021-01-01")
+
+
+def test_update_catalog_is_incremental(
+    casepath: Path,
+    monkeypatch: MonkeyPatch,
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that only the objects exported since the last update are read."""
+    catalog = MetadataCatalog(casepath)
+    catalog.update()
+    assert catalog.update() == 0
+
+    runpath = _export_realization(
+        casepath, monkeypatch, mock_global_config, regsurf, real=0, iteration=1
+    )
+    assert catalog.update() == 3
+    assert len(catalog.query(ensemble="iter-1")) == 3
+
+    # re-exporting an object updates the existing entry
+    ExportData(
+        config=mock_global_config,
+        content="depth",
+        name="topvolantis",
+        tagname="mapped",
+    ).export(regsurf)
+    assert catalog.update([runpath / MANIFEST_FILENAME]) == 1
+    assert len(catalog.query()) == 3 * NREALS + 3
+
+
+def test_add_to_catalog(casepath: Path) -> None:
+    """Test that single files can be added to the catalog."""
+    catalog = MetadataCatalog(casepath)
+    path = casepath / "realization-1/iter-0/share/results/maps/topvolantis--mapped.gri"
+
+    assert catalog.add([path, str(path)]) == 1
+    assert catalog.add([path]) == 0
+    assert [entry.path for entry in catalog.query()] == [path.resolve()]
+
+
+def test_rebuild_catalog(casepath: Path) -> None:
+    """Test that the catalog is rebuilt from the metadata files in the case."""
+    catalog = MetadataCatalog(casepath)
+    catalog.update()
+    with sqlite3.connect(catalog.path) as connection:
+        connection.execute("DELETE FROM objects WHERE realization = 1")
+    assert len(catalog.query()) == 2 * NREALS
+
+    for runpath in casepath.glob("realization-*/iter-0"):
+        (runpath / MANIFEST_FILENAME).unlink()
+    assert catalog.rebuild() == 3 * NREALS
+    assert len(catalog.query(realization=1)) == 3
+
+
+def test_concurrent_catalog_writers(casepath: Path) -> None:
+    """Test that concurrent updates of the catalog on one host are serialized."""
+    manifests = [
+        casepath / f"realization-{real}/iter-0" / MANIFEST_FILENAME
+        for real in range(NREALS)
+    ]
+    with ThreadPoolExecutor(max_workers=NREALS) as executor:
+        counts = list(
+            executor.map(
+                lambda manifest: MetadataCatalog(casepath).update([manifest]),
+                manifests,
+            )
+        )
+    assert counts == [3] * NREALS
+    assert len(MetadataCatalog(casepath).query()) == 3 * NREALS
+
+
+def test_concurrent_catalog_writer_processes(casepath: Path) -> None:
+    """Test that processes on one host can update the same catalog at the same
+    time."""
+    manifests = [
+        casepath / f"realization-{real}/iter-0" / MANIFEST_FILENAME
+        for real in range(NREALS)
+    ]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=NREALS, mp_context=context) as executor:
+        futures = [
+            executor.submit(MetadataCatalog(casepath).update, [manifest])
+            for manifest in manifests
+        ]
+        counts = [future.result() for future in futures]
+    assert counts == [3] * NREALS
+    assert len(MetadataCatalog(casepath).query()) == 3 * NREALS
+
+
+def test_update_catalog_workflow(casepath: Path) -> None:
+    """Test the workflow for updating and rebuilding the catalog."""
+    update_catalog_main(get_parser().parse_args([str(casepath)]))
+    assert len(MetadataCatalog(casepath).query()) == 3 * NREALS
+
+    update_catalog_main(get_parser().parse_args([str(casepath), "--rebuild"]))
+    assert len(MetadataCatalog(casepath).query()) == 3 * NREALS
+
+    with pytest.raises(ValueError, match="must be an absolute path"):
+        update_catalog_main(get_parser().parse_args(["relative/case"]))
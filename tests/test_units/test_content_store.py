@@ -0,0 +1,219 @@
+"""Test the deduplication of exported files in the content store of a case"""
+
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+import xtgeo
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData, deduplicated_writes, read_metadata, staged_writes
+from fmu.dataio._content_store import (
+    CONTENT_STORE_PATH,
+    ContentStore,
+    get_content_store,
+    unlink_if_linked,
+)
+from fmu.dataio.manifest._manifest import load_export_manifest
+from fmu.dataio.manifest._models import ExportManifest
+
+# The MD5 checksum of b"data"
+DATA_MD5 = "8d777f385d3dfec8815d20f7496026dc"
+
+
+def _to_realization(monkeypatch: MonkeyPatch, runpath: Path, real: int) -> Path:
+    """Move to the runpath of another realization of the same case."""
+    realpath = runpath.parents[1] / f"realization-{real}" / runpath.name
+    realpath.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("_ERT_RUNPATH", str(realpath))
+    monkeypatch.setenv("_ERT_REALIZATION_NUMBER", str(real))
+    monkeypatch.chdir(realpath)
+    return realpath
+
+
+def _export(config: dict[str, Any], obj: Any, **kwargs: Any) -> Path:
+    return Path(ExportData(config=config, content="depth", **kwargs).export(obj))
+
+
+def test_content_store_disabled_by_default(tmp_path: Path) -> None:
+    """Test that files are only deduplicated within a deduplicated_writes block."""
+    assert get_content_store(tmp_path) is None
+    with deduplicated_writes():
+        store = get_content_store(tmp_path)
+        assert store is not None
+        assert store.path == tmp_path / CONTENT_STORE_PATH
+        assert get_content_store(None) is None
+    assert get_content_store(tmp_path) is None
+
+
+def test_content_store_enabled_per_context(tmp_path: Path) -> None:
+    """Test that deduplicated writes are not enabled for other threads."""
+    with deduplicated_writes(), ThreadPoolExecutor(max_workers=1) as executor:
+        assert get_content_store(tmp_path) is not None
+        assert executor.submit(get_content_store, tmp_path).result() is None
+
+
+def test_content_store_write(tmp_path: Path) -> None:
+    """Test that a file is written once, and linked when already stored."""
+    store = ContentStore(tmp_path)
+    write = mock.Mock(side_effect=lambda path: path.write_bytes(b"data"))
+
+    first, second = tmp_path / "a" / "file", tmp_path / "b" / "file"
+    assert store.write(first, DATA_MD5, 4, write) is False
+    assert store.write(second, DATA_MD5, 4, write) is True
+
+    write.assert_called_once()
+    blob = store.blob_path(DATA_MD5, 4)
+    assert blob == tmp_path / CONTENT_STORE_PATH / "8d" / f"{DATA_MD5}-4"
+    assert first.samefile(blob)
+    assert second.samefile(blob)
+    assert second.read_bytes() == b"data"
+    assert [p.name for p in second.parent.iterdir()] == ["file"]
+
+
+def test_content_store_write_without_hard_links(tmp_path: Path) -> None:
+    """Test that the files are written as regular files if hard links are not
+    supported."""
+    store = ContentStore(tmp_path)
+    write = mock.Mock(side_effect=lambda path: path.write_bytes(b"data"))
+
+    with mock.patch("os.link", side_effect=OSError(18, "Invalid cross-device link")):
+        assert store.write(tmp_path / "a", DATA_MD5, 4, write) is False
+        assert store.write(tmp_path / "b", DATA_MD5, 4, write) is False
+
+    assert write.call_count == 2
+    assert (tmp_path / "b").read_bytes() == b"data"
+    assert (tmp_path / "b").stat().st_nlink == 1
+    assert not store.blob_path(DATA_MD5, 4).exists()
+
+
+def test_content_store_write_mismatching_checksum(tmp_path: Path) -> None:
+    """Test that a written file not matching its checksum is not stored."""
+    store = ContentStore(tmp_path)
+    write = mock.Mock(side_effect=lambda path: path.write_bytes(b"diff"))
+
+    assert store.write(tmp_path / "a", DATA_MD5, 4, write) is False
+    assert store.write(tmp_path / "b", DATA_MD5, 4, write) is False
+
+    assert write.call_count == 2
+    assert (tmp_path / "b").read_bytes() == b"diff"
+    assert (tmp_path / "b").stat().st_nlink == 1
+    assert not store.blob_path(DATA_MD5, 4).exists()
+
+
+def test_unlink_if_linked(tmp_path: Path) -> None:
+    """Test that only files linked to other files are removed."""
+    single, linked = tmp_path / "single", tmp_path / "linked"
+    single.write_text("data")
+    os.link(single, linked)
+
+    unlink_if_linked(linked)
+    assert not linked.exists()
+
+    unlink_if_linked(single)
+    assert single.exists()
+
+    unlink_if_linked(tmp_path / "missing")
+
+
+@pytest.mark.parametrize("staged", [False, True])
+def test_deduplicated_exports_across_realizations(
+    monkeypatch: MonkeyPatch,
+    runpath_no_dotfmu: Path,
+    rmsglobalconfig: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+    staged: bool,
+) -> None:
+    """Test that identical files exported by two realizations are stored once, while
+    their metadata are unchanged."""
+    with deduplicated_writes():
+        first = _export(rmsglobalconfig, regsurf, name="surf")
+        second_runpath = _to_realization(monkeypatch, runpath_no_dotfmu, 1)
+        with staged_writes() if staged else deduplicated_writes():
+            second = _export(rmsglobalconfig, regsurf, name="surf")
+
+    assert first != second
+    assert first.samefile(second)
+    assert second.read_bytes() == first.read_bytes()
+
+    casepath = runpath_no_dotfmu.parents[1]
+    stored = list((casepath / CONTENT_STORE_PATH).rglob("*"))
+    assert [p for p in stored if p.is_file()] == [
+        ContentStore(casepath).blob_path(
+            read_metadata(first)["file"]["checksum_md5"], first.stat().st_size
+        )
+    ]
+
+    metadata = read_metadata(second)
+    assert metadata["file"]["absolute_path"] == str(second)
+    assert metadata["fmu"]["realization"]["id"] == 1
+
+    manifest = ExportManifest.from_file(second_runpath / ".dataio_export_manifest.json")
+    assert manifest[0].deduplicated is True
+    assert manifest[0].size_bytes == second.stat().st_size
+    assert manifest.bytes_saved == second.stat().st_size
+
+
+def test_reexport_does_not_modify_stored_file(
+    monkeypatch: MonkeyPatch,
+    runpath_no_dotfmu: Path,
+    rmsglobalconfig: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that exporting a changed object to a path linked to the store does not
+    change the stored file, with and without deduplication."""
+    with deduplicated_writes():
+        first = _export(rmsglobalconfig, regsurf, name="surf")
+        _to_realization(monkeypatch, runpath_no_dotfmu, 1)
+        second = _export(rmsglobalconfig, regsurf, name="surf")
+    original = first.read_bytes()
+
+    changed = regsurf.copy()
+    changed.values += 1
+    assert _export(rmsglobalconfig, changed, name="surf") == second
+
+    assert first.read_bytes() == original
+    assert second.read_bytes() != original
+    assert not first.samefile(second)
+
+
+def test_manifest_dedup_statistics() -> None:
+    """Test the bytes saved and the dedup ratio from the manifest entries."""
+    manifest = ExportManifest()
+    assert manifest.bytes_saved == 0
+    assert manifest.dedup_ratio == 1.0
+
+    manifest.add_entry(Path("a.gri"), size_bytes=100, deduplicated=False)
+    manifest.add_entry(Path("b.gri"), size_bytes=100, deduplicated=True)
+    manifest.add_entry(Path("c.gri"), size_bytes=100, deduplicated=True)
+    manifest.add_entry(Path("d.gri"))
+
+    assert manifest.bytes_saved == 200
+    assert manifest.dedup_ratio == 3.0
+
+
+def test_manifest_dedup_ratio_all_deduplicated() -> None:
+    """Test that the dedup ratio is infinite when all files were already stored."""
+    manifest = ExportManifest()
+    manifest.add_entry(Path("a.gri"), size_bytes=100, deduplicated=True)
+    manifest.add_entry(Path("b.gri"), size_bytes=100, deduplicated=True)
+
+    assert manifest.bytes_saved == 200
+    assert manifest.dedup_ratio == math.inf
+
+
+def test_manifest_entries_without_store_unchanged(
+    runpath_no_dotfmu: Path,
+    rmsglobalconfig: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the manifest entries are unchanged when not deduplicating."""
+    _export(rmsglobalconfig, regsurf, name="surf")
+
+    manifest_file = runpath_no_dotfmu / ".dataio_export_manifest.json"
+    assert "size_bytes" not in manifest_file.read_text()
+    assert load_export_manifest()[0].deduplicated is None
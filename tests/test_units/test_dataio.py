@@ -1949,6 +1949,92 @@ def test_mutation_multiple_attributes_emits_multiple_warnings(
     assert edata.tagname == "new_tag"
 
 
+def test_mutation_of_name_updates_cached_config_without_resolving(
+    mock_global_config: dict[str, Any], monkeypatch: MonkeyPatch
+) -> None:
+    """Changing arguments only describing the object should not resolve the context
+    again, and should not re-create the config."""
+    edata = ExportData(config=mock_global_config, content="depth", unit="m")
+    context = edata._cached_export_context
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("The export config should not be resolved again")
+
+    monkeypatch.setattr("fmu.dataio.dataio.ExportConfig.from_export_data", fail)
+
+    with pytest.warns(FutureWarning, match="Mutating ExportData"):
+        edata.name = "TopVolantis"
+        edata.tagname = "mytag"
+        edata.unit = None
+        edata.display_name = "Top Volantis"
+
+    assert edata._export_config.name == "TopVolantis"
+    assert edata._export_config.tagname == "mytag"
+    assert edata._export_config.unit == ""
+    assert edata._export_config.display.name == "Top Volantis"
+    assert edata._export_config.content == "depth"
+    assert edata._cached_export_context is context
+
+
+def test_deprecated_export_kwargs_reuse_export_context(
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """The global config and run context are only resolved once when exporting many
+    objects with different names through deprecated export kwargs."""
+    edata = ExportData(config=mock_global_config, content="depth")
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("The export context should not be resolved again")
+
+    monkeypatch.setattr(
+        "fmu.dataio._export._export_config_resolver.resolve_export_context", fail
+    )
+
+    for name in ["TopVolantis", "BaseVolantis"]:
+        meta = edata.generate_metadata(regsurf, name=name, tagname="depth")
+        assert meta["data"]["name"] == name
+
+    # a changed content re-creates the config, but with the same context
+    meta = edata.generate_metadata(regsurf, content="thickness")
+    assert meta["data"]["content"] == "thickness"
+    assert meta["data"]["name"] == "BaseVolantis"
+
+
+def test_mutation_of_context_argument_resolves_context_again(
+    mock_global_config: dict[str, Any],
+) -> None:
+    """Changing an argument the export context is resolved from should resolve the
+    context again."""
+    edata = ExportData(config=mock_global_config, content="depth")
+    context = edata._cached_export_context
+    assert edata._export_config.preprocessed is False
+
+    with pytest.warns(FutureWarning, match="Mutating ExportData.preprocessed"):
+        edata.preprocessed = True
+
+    assert edata._cached_export_context is None
+    assert edata._export_config.preprocessed is True
+    assert edata._cached_export_context is not context
+
+
+def test_export_context_resolved_again_when_environment_changes(
+    runpath_no_dotfmu: Path,
+    rmsglobalconfig: dict[str, Any],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """A cached export context is not reused after the Ert environment changed."""
+    edata = ExportData(config=rmsglobalconfig, content="depth")
+    assert edata._export_config.runcontext.inside_fmu is True
+
+    monkeypatch.delenv("_ERT_RUNPATH")
+    monkeypatch.delenv("_ERT_EXPERIMENT_ID")
+    edata._apply_deprecated_kwargs({"content": "thickness"})
+
+    assert edata._export_config.runcontext.inside_fmu is False
+
+
 def test_no_mutation_warning_during_init(
     mock_global_config: dict[str, Any],
 ) -> None:
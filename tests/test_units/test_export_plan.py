@@ -0,0 +1,154 @@
+"""Test the planning of exports with ExportData.plan()"""
+
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pyarrow as pa
+import pytest
+import xtgeo
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData, read_metadata
+
+
+@pytest.fixture
+def exportdata(
+    monkeypatch: MonkeyPatch, tmp_path: Path, mock_global_config: dict[str, Any]
+) -> ExportData:
+    monkeypatch.chdir(tmp_path)
+    return ExportData(config=mock_global_config, content="depth")
+
+
+def _surface(name: str, ncol: int = 12) -> xtgeo.RegularSurface:
+    return xtgeo.RegularSurface(
+        ncol=ncol, nrow=10, xinc=20, yinc=20, values=1234.0, name=name
+    )
+
+
+def test_plan_does_not_serialize_or_write(
+    exportdata: ExportData, tmp_path: Path
+) -> None:
+    """Test that nothing is serialized, hashed or written when planning."""
+    with (
+        mock.patch("fmu.dataio._export.core.export_object", side_effect=AssertionError),
+        mock.patch(
+            "fmu.dataio._export.serialize.export_object", side_effect=AssertionError
+        ),
+    ):
+        plan = exportdata.plan([_surface("first"), _surface("second")])
+
+    assert len(plan) == 2
+    assert not (tmp_path / "share").exists()
+
+
+def test_plan_paths_identical_to_export(exportdata: ExportData) -> None:
+    """Test that the planned paths are the paths the objects are exported to."""
+    surfaces = [_surface("first"), _surface("second")]
+    plan = exportdata.plan(surfaces)
+
+    assert not plan.collisions
+    for planned, surf in zip(plan, surfaces, strict=True):
+        assert planned.obj is surf
+        outfile = exportdata.export(surf)
+        assert str(planned.absolute_path) == outfile
+        assert planned.share_path == Path("share/results/maps") / Path(outfile).name
+
+
+def test_plan_collisions(exportdata: ExportData) -> None:
+    """Test that objects planned to be exported to the same path are reported."""
+    first, second, other = _surface("same"), _surface("same"), _surface("other")
+
+    with pytest.warns(UserWarning, match="2 objects will be exported to the same"):
+        plan = exportdata.plan([first, other, second])
+
+    assert len(plan.collisions) == 1
+    ((path, exports),) = plan.collisions.items()
+    assert path.name == "same.gri"
+    assert [planned.obj for planned in exports] == [first, second]
+
+
+def test_plan_collisions_across_plans(
+    exportdata: ExportData, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that collisions between the plans of several instances are found when
+    the plans are combined."""
+    other_exportdata = ExportData(config=mock_global_config, content="depth")
+    plan = exportdata.plan([_surface("same")]) + other_exportdata.plan(
+        [_surface("same")]
+    )
+    assert len(plan) == 2
+    assert len(plan.collisions) == 1
+
+
+def test_plan_largest_first(exportdata: ExportData) -> None:
+    """Test that the planned exports are ordered by estimated size, largest first."""
+    small, large = _surface("small", ncol=10), _surface("large", ncol=1000)
+    plan = exportdata.plan([small, large, _surface("medium", ncol=100)])
+
+    ordered = plan.largest_first()
+    assert [planned.obj.name for planned in ordered] == ["large", "medium", "small"]
+    assert plan.estimated_size_bytes == sum(
+        planned.estimated_size_bytes or 0 for planned in plan
+    )
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        xtgeo.RegularSurface(ncol=200, nrow=100, xinc=20, yinc=20, values=1.0),
+        xtgeo.Cube(ncol=20, nrow=30, nlay=50, xinc=12, yinc=12, zinc=4),
+        xtgeo.create_box_grid((20, 30, 10)),
+        xtgeo.GridProperty(ncol=20, nrow=30, nlay=10, values=1.0),
+    ],
+    ids=["surface", "cube", "grid", "gridproperty"],
+)
+def test_plan_estimated_size(
+    exportdata: ExportData, mock_global_config: dict[str, Any], obj: Any
+) -> None:
+    """Test that the estimated sizes are close to the sizes of the exported files."""
+    exportdata = ExportData(config=mock_global_config, content="depth", name="obj")
+    (planned,) = exportdata.plan([obj])
+    assert planned.estimated_size_bytes is not None
+
+    size = Path(exportdata.export(obj)).stat().st_size
+    assert size / 2 < planned.estimated_size_bytes < size * 2
+
+
+def test_plan_entity_uuid_in_realization(
+    runpath_no_dotfmu: Path, rmsglobalconfig: dict[str, Any]
+) -> None:
+    """Test that the planned entity uuid is the entity uuid in the metadata."""
+    exportdata = ExportData(config=rmsglobalconfig, content="depth")
+    (planned,) = exportdata.plan([_surface("surface")])
+    assert planned.entity_uuid is not None
+
+    outfile = planned.export()
+    assert outfile == str(planned.absolute_path)
+    assert read_metadata(outfile)["fmu"]["entity"]["uuid"] == str(planned.entity_uuid)
+
+
+def test_planned_export_identical_to_export(exportdata: ExportData) -> None:
+    """Test that exporting as planned gives the same file and metadata as export()."""
+    surf = _surface("surface")
+    (planned,) = exportdata.plan([surf])
+    assert planned.entity_uuid is None
+
+    outfile = planned.export()
+    expected = read_metadata(outfile)
+    expected_bytes = Path(outfile).read_bytes()
+
+    assert exportdata.export(surf) == outfile
+    metadata = read_metadata(outfile)
+    assert Path(outfile).read_bytes() == expected_bytes
+    assert metadata["file"] == expected["file"]
+    assert metadata["data"] == expected["data"]
+
+
+def test_plan_rejects_files_and_streams(
+    exportdata: ExportData, tmp_path: Path, arrowtable: pa.Table
+) -> None:
+    with pytest.raises(TypeError, match="can be planned, not files"):
+        exportdata.plan([tmp_path / "file.gri"])
+    with pytest.raises(ValueError, match="can not be planned"):
+        exportdata.plan([arrowtable.to_reader()])
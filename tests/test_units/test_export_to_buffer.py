@@ -0,0 +1,96 @@
+"""Test exporting objects to memory together with their metadata"""
+
+import hashlib
+import io
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import xtgeo
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData
+from fmu.dataio._export import serialize
+
+
+def test_export_to_buffer_surface(
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that a surface is serialized to memory with metadata describing the
+    bytes, and nothing is written to disk."""
+    monkeypatch.chdir(tmp_path)
+    exportdata = ExportData(config=mock_global_config, content="depth", name="mymap")
+    payload, metadata = exportdata.export_to_buffer(regsurf)
+
+    assert isinstance(payload, memoryview)
+    assert metadata["file"]["checksum_md5"] == hashlib.md5(payload).hexdigest()
+    assert metadata["file"]["size_bytes"] == payload.nbytes
+    assert metadata["file"]["relative_path"] == "share/results/maps/mymap.gri"
+    assert not list(tmp_path.rglob("*"))
+
+    surf = xtgeo.surface_from_file(io.BytesIO(payload), fformat="irap_binary")
+    assert surf.values.mean() == pytest.approx(regsurf.values.mean())
+
+
+def test_export_to_buffer_matches_export(
+    mock_global_config: dict[str, Any],
+    arrowtable: pa.Table,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that the bytes and metadata are the same as when exported to a file."""
+    monkeypatch.chdir(tmp_path)
+    exportdata = ExportData(config=mock_global_config, content="volumes", name="vol")
+    payload, metadata = exportdata.export_to_buffer(arrowtable)
+
+    outfile = Path(exportdata.export(arrowtable))
+    assert outfile.read_bytes() == payload
+    assert metadata["file"] == exportdata.generate_metadata(arrowtable)["file"]
+    assert pq.read_table(pa.BufferReader(payload)).equals(arrowtable)
+
+
+def test_export_to_buffer_serializes_once(
+    mock_global_config: dict[str, Any],
+    dataframe: pd.DataFrame,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the object is only serialized once."""
+    calls = []
+    export_object = serialize.export_object
+
+    def _export_object(*args: Any) -> None:
+        calls.append(args)
+        export_object(*args)
+
+    monkeypatch.setattr(serialize, "export_object", _export_object)
+    ExportData(
+        config=mock_global_config, content="volumes", name="vol"
+    ).export_to_buffer(dataframe)
+    assert len(calls) == 1
+
+
+def test_export_to_buffer_not_supported(
+    mock_global_config: dict[str, Any], arrowtable: pa.Table, tmp_path: Path
+) -> None:
+    """Test that files, streams and partitioned tables can not be exported to
+    memory."""
+    exportdata = ExportData(config=mock_global_config, content="volumes", name="vol")
+    with pytest.raises(TypeError, match="Only objects in memory"):
+        exportdata.export_to_buffer(tmp_path / "file.csv")
+    with pytest.raises(TypeError, match="can only be exported to a file"):
+        exportdata.export_to_buffer(iter(arrowtable.to_batches()))
+
+    with pytest.raises(ValueError, match="partition_by"):
+        ExportData(
+            config=mock_global_config,
+            content="volumes",
+            name="vol",
+            table_index=["COL1"],
+            partition_by=["COL1"],
+        ).export_to_buffer(arrowtable)
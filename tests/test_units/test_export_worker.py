@@ -0,0 +1,261 @@
+"""Test the exports running in a separate worker process"""
+
+import os
+import time
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import numpy as np
+import pyarrow as pa
+import pytest
+import xtgeo
+from pytest import MonkeyPatch
+
+from fmu.dataio import (
+    ExportData,
+    ValidationLevel,
+    deduplicated_writes,
+    metadata_validation,
+    read_metadata,
+    staged_writes,
+)
+from fmu.dataio._export.serialize import serialize_to_buffer
+from fmu.dataio._metadata import create_object_data
+from fmu.dataio._worker import _dumps, _loads, _Settings, get_export_worker
+from fmu.dataio.export import export_async, out_of_process_exports, wait_all
+from fmu.dataio.manifest._manifest import (
+    MANIFEST_FILENAME,
+    ManifestUpdate,
+    update_export_manifest,
+)
+
+
+@pytest.fixture
+def large_regsurf() -> xtgeo.RegularSurface:
+    """A surface with values large enough to be handed over in shared memory."""
+    surf = xtgeo.RegularSurface(ncol=200, nrow=100, xinc=20, yinc=20, values=1234.0)
+    surf.values[:10] = np.ma.masked
+    return surf
+
+
+def _exists(name: str) -> bool:
+    try:
+        SharedMemory(name=name).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def test_worker_disabled_by_default() -> None:
+    """Test that the worker process is only used within the block."""
+    assert get_export_worker() is None
+    with out_of_process_exports():
+        assert get_export_worker() is not None
+    assert get_export_worker() is None
+
+
+def test_shared_memory_round_trip(
+    large_regsurf: xtgeo.RegularSurface, grid: xtgeo.Grid
+) -> None:
+    """Test that objects are rebuilt from their buffers in shared memory, and that
+    the shared memory is removed when released."""
+    data, buffers = _dumps((large_regsurf, grid))
+    names = [name for name, _ in buffers.descriptor]
+    try:
+        # only the surface values are large enough to be put in shared memory
+        assert len(names) == 1
+        assert len(data) < large_regsurf.values.nbytes
+        surf, rebuilt_grid = _loads(data, buffers.descriptor)
+    finally:
+        buffers.release()
+
+    assert not any(_exists(name) for name in names)
+    np.testing.assert_array_equal(surf.values, large_regsurf.values)
+    np.testing.assert_array_equal(surf.values.mask, large_regsurf.values.mask)
+    assert surf.values.flags.writeable
+    assert rebuilt_grid.dimensions == grid.dimensions
+    np.testing.assert_array_equal(rebuilt_grid._zcornsv, grid._zcornsv)
+
+
+def test_serialized_object_round_trip(
+    mock_global_config: dict[str, Any], large_regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that an object already serialized to memory is handed over with its
+    serialized bytes in shared memory."""
+    export_config = ExportData(
+        config=mock_global_config, content="depth", name="surf"
+    )._export_config
+    objdata = create_object_data(large_regsurf, export_config)
+    serialize_to_buffer(objdata)
+    data, buffers = _dumps(objdata)
+    try:
+        assert len(buffers.descriptor) == 2
+        rebuilt = _loads(data, buffers.descriptor)
+    finally:
+        buffers.release()
+
+    assert rebuilt.serialized == objdata.serialized
+
+
+@pytest.mark.parametrize("fixture", ["large_regsurf", "grid", "gridproperty"])
+def test_export_async_out_of_process_identical_to_export(
+    request: pytest.FixtureRequest,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    mock_global_config: dict[str, Any],
+    fixture: str,
+) -> None:
+    """Test that an export in the worker process gives the same file and metadata as
+    export(), without exporting anything in the main process."""
+    monkeypatch.chdir(tmp_path)
+    obj = request.getfixturevalue(fixture)
+    edata = ExportData(config=mock_global_config, content="depth", name="obj")
+
+    with (
+        mock.patch("fmu.dataio._export.core.export_object", side_effect=AssertionError),
+        out_of_process_exports(),
+    ):
+        outfile = edata.export_async(obj, copy_data=False).result()
+    expected = read_metadata(outfile)
+    expected_bytes = Path(outfile).read_bytes()
+
+    assert edata.export(obj) == outfile
+    metadata = read_metadata(outfile)
+    if not outfile.endswith(".roff"):
+        # roff files hold their time of creation, in seconds, and may differ
+        assert Path(outfile).read_bytes() == expected_bytes
+    else:
+        del metadata["file"]["checksum_md5"], expected["file"]["checksum_md5"]
+    assert metadata["file"] == expected["file"]
+    assert metadata["data"] == expected["data"]
+    assert wait_all() == [outfile]
+
+
+def test_export_async_of_function_out_of_process(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    mock_global_config: dict[str, Any],
+    large_regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the deferred exports of a function run in the worker process."""
+    monkeypatch.chdir(tmp_path)
+    edata = ExportData(config=mock_global_config, content="depth")
+
+    def export_surfaces(names: list[str]) -> list[str]:
+        return [edata.export(large_regsurf, name=name) for name in names]
+
+    with (
+        mock.patch("fmu.dataio._export.core.export_object", side_effect=AssertionError),
+        out_of_process_exports(),
+        pytest.warns(FutureWarning),
+    ):
+        outfiles = export_async(export_surfaces, ["first", "second"]).result()
+
+    assert [Path(f).name for f in outfiles] == ["first.gri", "second.gri"]
+    for outfile in outfiles:
+        assert read_metadata(outfile)["file"]["absolute_path"] == outfile
+    wait_all()
+
+
+def test_export_async_out_of_process_reports_errors(
+    monkeypatch: MonkeyPatch, tmp_path: Path, mock_global_config: dict[str, Any]
+) -> None:
+    """Test that errors raised in the worker process are raised by the futures."""
+    monkeypatch.chdir(tmp_path)
+    edata = ExportData(config=mock_global_config, content="depth")
+
+    with out_of_process_exports():
+        future = edata.export_async(np.zeros(3), copy_data=False)  # type: ignore
+
+    with pytest.raises(NotImplementedError):
+        future.result()
+    with pytest.raises(ExceptionGroup, match="1 of 1 background exports failed"):
+        wait_all()
+
+
+def test_worker_uses_settings_at_submit() -> None:
+    """Test that the export settings of the submitting context apply in the worker
+    process."""
+    with out_of_process_exports():
+        worker = get_export_worker()
+        assert worker is not None
+        with (
+            staged_writes(durable=False),
+            deduplicated_writes(),
+            metadata_validation("deferred"),
+        ):
+            future = worker.submit(_Settings.capture)
+        unset = worker.submit(_Settings.capture)
+
+    assert future.result() == _Settings(ValidationLevel.deferred, False, True)
+    assert unset.result() == _Settings(ValidationLevel.full, None, False)
+
+
+def test_worker_manifest_updates_written_by_main_process(tmp_path: Path) -> None:
+    """Test that the manifest updates of an export in the worker process are sent to
+    the main process, and not written by the worker process."""
+    with (
+        mock.patch("fmu.dataio._worker.write_manifest_updates") as write_updates,
+        out_of_process_exports(),
+    ):
+        worker = get_export_worker()
+        assert worker is not None
+        worker.submit(
+            update_export_manifest, tmp_path / "file.gri", casepath=tmp_path
+        ).result()
+
+    assert not (tmp_path / MANIFEST_FILENAME).exists()
+    write_updates.assert_called_once_with(
+        [ManifestUpdate(tmp_path / MANIFEST_FILENAME, tmp_path / "file.gri")]
+    )
+
+
+def test_unpicklable_export_runs_in_thread(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    mock_global_config: dict[str, Any],
+    arrowtable: pa.Table,
+) -> None:
+    """Test that exports which can not be handed over run on the background thread."""
+    monkeypatch.chdir(tmp_path)
+    edata = ExportData(
+        config=mock_global_config,
+        content="property",
+        content_metadata={"attribute": "porosity", "is_discrete": False},
+        name="table",
+        table_index=["COL1"],
+    )
+
+    with out_of_process_exports():
+        outfile = edata.export_async(arrowtable.to_reader()).result()
+
+    assert read_metadata(outfile)["file"]["absolute_path"] == outfile
+    wait_all()
+
+
+def test_worker_exit_fails_pending_exports(
+    large_regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the exports are failed and their shared memory removed if the
+    worker process exits, and that a new worker process is started on next use."""
+    with out_of_process_exports():
+        worker = get_export_worker()
+        assert worker is not None
+        worker.submit(time.sleep, 0.5)
+        future = worker.submit(os._exit, 1)
+        pending = worker.submit(np.ma.sum, large_regsurf.values)
+        names = [name for name, _ in worker._jobs[max(worker._jobs)].buffers.descriptor]
+        assert names
+
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            future.result()
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            pending.result()
+        assert not any(_exists(name) for name in names)
+
+        new_worker = get_export_worker()
+        assert new_worker is not worker
+        assert new_worker is not None
+        assert new_worker.submit(int, "1").result() == 1
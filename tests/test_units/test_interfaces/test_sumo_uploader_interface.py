@@ -372,3 +372,17 @@ def test_from_new_case_stores_global_config_path() -> None:
         )
 
     assert uploader.global_config_path == global_config_path
+
+
+def test_queue_table_uses_payload(
+    simple_parameters: pa.Table,
+    simple_metadata: dict[str, Any],
+    mock_uploader: SumoUploaderInterface,
+) -> None:
+    """An already serialized payload is queued instead of serializing the table."""
+    with patch("fmu.sumo.uploader._fileonjob.FileOnJob") as mock_file_cls:
+        mock_uploader.queue_table(
+            simple_parameters, simple_metadata, payload=memoryview(b"payload")
+        )
+
+    mock_file_cls.assert_called_once_with(b"payload", simple_metadata)
@@ -0,0 +1,216 @@
+"""Test loading exported objects together with their metadata"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+import xtgeo
+from pytest import MonkeyPatch
+
+from fmu import dataio
+from fmu.dataio import ExportData
+from fmu.dataio._readers import loader
+
+
+@pytest.fixture
+def exportdata(mock_global_config: dict[str, Any]) -> ExportData:
+    return ExportData(config=mock_global_config, content="depth", name="mymap")
+
+
+def test_load_surface(
+    exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that a surface is loaded through a memory map, with undefined values
+    masked."""
+    monkeypatch.chdir(tmp_path)
+    regsurf.values[2:5, 3] = np.ma.masked
+    regsurf.values[0, 0] = 12.5
+    outfile = exportdata.export(regsurf)
+
+    loaded = dataio.load(outfile)
+    assert loaded.metadata == dataio.read_metadata(outfile)
+    assert loaded.path == Path(outfile)
+
+    surf = loaded.obj
+    expected = xtgeo.surface_from_file(outfile)
+    assert isinstance(surf, xtgeo.RegularSurface)
+    assert (surf.ncol, surf.nrow, surf.xinc) == (expected.ncol, expected.nrow, 20)
+    np.testing.assert_array_equal(surf.values.mask, expected.values.mask)
+    np.testing.assert_allclose(surf.values.compressed(), expected.values.compressed())
+    assert surf.values.count() == regsurf.values.count()
+
+
+def test_load_object_is_lazy(
+    exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that the object is only read when accessed, and only once."""
+    monkeypatch.chdir(tmp_path)
+    outfile = exportdata.export(regsurf)
+
+    loaded = dataio.load(outfile)
+    assert "obj" not in vars(loaded)
+    assert loaded.obj is loaded.obj
+
+
+def test_load_is_cached_on_modification_time(
+    exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that repeated loads are cached until the file is modified."""
+    monkeypatch.chdir(tmp_path)
+    outfile = exportdata.export(regsurf)
+
+    with dataio.cached_loads():
+        loaded = dataio.load(outfile)
+        assert dataio.load(Path(outfile)) is loaded
+
+        regsurf.values = 99.0
+        exportdata.export(regsurf)
+        reloaded = dataio.load(outfile)
+        assert reloaded is not loaded
+        assert reloaded.obj.values.mean() == pytest.approx(99.0)
+
+
+def test_load_is_not_cached_by_default(
+    exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that loads outside a cached_loads block are not cached, and that the
+    cache is released when the block is left."""
+    monkeypatch.chdir(tmp_path)
+    outfile = exportdata.export(regsurf)
+
+    assert dataio.load(outfile) is not dataio.load(outfile)
+
+    with dataio.cached_loads():
+        loaded = dataio.load(outfile)
+        with dataio.cached_loads():
+            assert dataio.load(outfile) is loaded
+    assert dataio.load(outfile) is not loaded
+    assert loader._cache.get() is None
+
+
+def test_load_cache_is_bounded_and_cleared(
+    exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that the cache keeps the most recently loaded objects, and that it can
+    be cleared."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(loader, "LOAD_CACHE_SIZE", 2)
+    outfiles = [
+        exportdata.export(regsurf, name=f"map{i}", tagname=str(i)) for i in range(3)
+    ]
+
+    with dataio.cached_loads():
+        first, second, third = (dataio.load(outfile) for outfile in outfiles)
+        assert dataio.load(outfiles[1]) is second
+        assert dataio.load(outfiles[2]) is third
+        assert dataio.load(outfiles[0]) is not first
+
+        dataio.clear_load_cache()
+        assert dataio.load(outfiles[2]) is not third
+
+
+def test_load_gridproperty(
+    mock_global_config: dict[str, Any],
+    gridproperty: xtgeo.GridProperty,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that a grid property is loaded with xtgeo."""
+    monkeypatch.chdir(tmp_path)
+    outfile = ExportData(
+        config=mock_global_config,
+        content="property",
+        content_metadata={"attribute": "porosity", "is_discrete": False},
+        name="poro",
+    ).export(gridproperty)
+
+    prop = dataio.load(outfile).obj
+    assert isinstance(prop, xtgeo.GridProperty)
+    assert prop.dimensions == gridproperty.dimensions
+    np.testing.assert_allclose(prop.values, gridproperty.values)
+
+
+def test_load_table(
+    mock_global_config: dict[str, Any],
+    arrowtable: pa.Table,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that a parquet file is loaded as a pyarrow Table."""
+    monkeypatch.chdir(tmp_path)
+    outfile = ExportData(
+        config=mock_global_config, content="volumes", name="table"
+    ).export(arrowtable)
+
+    table = dataio.load(outfile).obj
+    assert isinstance(table, pa.Table)
+    assert table.equals(arrowtable)
+
+
+def test_load_partitioned_table(
+    mock_global_config: dict[str, Any],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that a partitioned parquet dataset is loaded as a lazy dataset."""
+    monkeypatch.chdir(tmp_path)
+    table = pa.table({"REAL": [0, 0, 1], "ZONE": ["A", "B", "A"], "PORO": [1, 2, 3]})
+    outdir = ExportData(
+        config=mock_global_config,
+        content="property",
+        content_metadata={"attribute": "porosity", "is_discrete": False},
+        name="cells",
+        table_index=["REAL", "ZONE"],
+        partition_by=["REAL"],
+    ).export(table)
+
+    dataset = dataio.load(outdir).obj
+    assert isinstance(dataset, ds.Dataset)
+    assert dataset.count_rows() == 3
+
+
+def test_load_csv_and_dictionary(
+    mock_global_config: dict[str, Any],
+    dataframe: pd.DataFrame,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that csv files are loaded with pandas, and json files as a dict."""
+    monkeypatch.chdir(tmp_path)
+    csvfile = ExportData(
+        config=mock_global_config, content="volumes", name="table"
+    ).export(dataframe)
+    jsonfile = ExportData(
+        config=mock_global_config, content="parameters", name="params"
+    ).export({"some": {"nested": 1}})
+
+    pd.testing.assert_frame_equal(dataio.load(csvfile).obj, dataframe)
+    assert dataio.load(jsonfile).obj == {"some": {"nested": 1}}
+
+
+def test_load_without_metadata(regsurf: xtgeo.RegularSurface, tmp_path: Path) -> None:
+    """Test that only files with metadata can be loaded."""
+    regsurf.to_file(tmp_path / "mymap.gri")
+    with pytest.raises(OSError, match="Cannot find requested metafile"):
+        dataio.load(tmp_path / "mymap.gri")
+    with pytest.raises(FileNotFoundError):
+        dataio.load(tmp_path / "missing.gri")
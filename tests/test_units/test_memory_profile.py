@@ -0,0 +1,106 @@
+"""Test the accounting of the peak memory of each export stage"""
+
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import xtgeo
+from pytest import MonkeyPatch
+
+import fmu.dataio as dio
+from fmu.dataio import ExportData
+from fmu.dataio._memory import MemoryReport, memory_stage
+
+MIB = 2**20
+
+
+@pytest.fixture
+def large_regsurf() -> xtgeo.RegularSurface:
+    """A surface with 8 MiB of values."""
+    return xtgeo.RegularSurface(ncol=1024, nrow=1024, xinc=20, yinc=20, values=1.0)
+
+
+def test_stages_only_recorded_within_block() -> None:
+    """Test that stages are not recorded, nor memory traced, outside the block."""
+    with memory_stage("outside"):
+        pass
+    with dio.memory_profile() as report:
+        assert tracemalloc.is_tracing()
+        with dio.memory_profile() as nested:
+            assert nested is report
+    assert not tracemalloc.is_tracing()
+    assert "outside" not in report
+
+
+def test_nested_stage_peaks() -> None:
+    """Test that the peak of a stage includes the peaks of the stages within it, and
+    is relative to the memory in use when the stage started."""
+    with dio.memory_profile() as report:
+        held = bytearray(8 * MIB)
+        with memory_stage("outer"):
+            with memory_stage("inner"):
+                data = bytearray(16 * MIB)
+                del data
+            data = bytearray(4 * MIB)
+            del data
+        for _ in range(2):
+            with memory_stage("inner"):
+                data = bytearray(2 * MIB)
+                del data
+        del held
+
+    assert report["outer"].calls == 1
+    assert report["inner"].calls == 3
+    assert 16 * MIB <= report["outer"].peak_traced_bytes < 17 * MIB
+    assert 16 * MIB <= report["inner"].peak_traced_bytes < 17 * MIB
+    assert "outer" in str(report)
+
+
+def test_export_stages_recorded(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    mock_global_config: dict[str, Any],
+    memory_profile: MemoryReport,
+    large_regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the stages of an export are recorded, with the masked copy of the
+    values in the value statistics, and the serialized surface in the checksum."""
+    monkeypatch.chdir(tmp_path)
+    ExportData(config=mock_global_config, content="depth", name="surf").export(
+        large_regsurf
+    )
+
+    stages = ["export", "object_data", "value_statistics", "metadata", "checksum"]
+    assert all(stage in memory_profile for stage in [*stages, "write"])
+    assert all(memory_profile[stage].calls == 1 for stage in stages)
+
+    export = memory_profile["export"]
+    assert all(
+        memory_profile[stage].peak_traced_bytes <= export.peak_traced_bytes
+        for stage in stages
+    )
+    values_bytes = large_regsurf.values.nbytes
+    assert memory_profile["value_statistics"].peak_traced_bytes >= values_bytes
+    assert memory_profile["checksum"].peak_traced_bytes >= values_bytes / 2
+
+
+def test_memory_regression_of_checksum(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    mock_global_config: dict[str, Any],
+    memory_profile: MemoryReport,
+    large_regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that computing the checksum of a surface needs no more memory than a few
+    copies of its values."""
+    monkeypatch.chdir(tmp_path)
+    large_regsurf.values = np.ma.masked_greater(large_regsurf.values, 2.0)
+    ExportData(config=mock_global_config, content="depth", name="surf").export(
+        large_regsurf
+    )
+
+    values_bytes = large_regsurf.values.nbytes
+    assert memory_profile["checksum"].peak_traced_bytes < 3 * values_bytes
+    assert memory_profile["export"].peak_traced_bytes < 5 * values_bytes
@@ -0,0 +1,159 @@
+"""Test the reuse of metadata blocks for objects exported in the same context"""
+
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+import xtgeo
+
+from fmu.dataio import ExportData
+from fmu.dataio._metadata import _generate_metadata, create_object_data
+from fmu.dataio._metadata._template import get_metadata_template
+
+OBJECT_KEYS = ("class", "data", "file", "display")
+
+
+def _metadata(exportdata: ExportData, obj: Any) -> dict[str, Any]:
+    export_config = exportdata._export_config
+    return _generate_metadata(export_config, create_object_data(obj, export_config))
+
+
+def _without_object_parts(metadata: dict[str, Any]) -> dict[str, Any]:
+    shared = {key: value for key, value in metadata.items() if key not in OBJECT_KEYS}
+    shared["tracklog"] = [
+        {key: value for key, value in event.items() if key != "datetime"}
+        for event in shared["tracklog"]
+    ]
+    if "fmu" in shared:
+        shared["fmu"] = {k: v for k, v in shared["fmu"].items() if k != "entity"}
+    return shared
+
+
+def test_template_reused_for_objects_in_same_context(
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+    polygons: xtgeo.Polygons,
+) -> None:
+    """Test that the shared blocks are only built for the first object."""
+    first = ExportData(config=mock_global_config, content="depth", name="first")
+    second = ExportData(config=mock_global_config, content="depth", name="second")
+
+    assert get_metadata_template(first._export_config) is None
+    first_meta = _metadata(first, regsurf)
+    assert get_metadata_template(second._export_config) is not None
+
+    with mock.patch(
+        "fmu.dataio._metadata.core.generate_export_metadata"
+    ) as mock_generate:
+        second_meta = _metadata(second, polygons)
+    mock_generate.assert_not_called()
+
+    assert second_meta["class"] == "polygons"
+    assert second_meta["data"]["name"] == "second"
+    assert second_meta["display"]["name"] == "second"
+    assert second_meta["file"]["relative_path"].endswith("second.csv")
+    assert list(second_meta) == list(first_meta)
+    assert _without_object_parts(second_meta) == _without_object_parts(first_meta)
+
+
+def test_template_output_equals_full_metadata(
+    runpath: Path,
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the metadata from a template is identical to the fully generated
+    metadata, including a unique entity for each object."""
+    first = ExportData(config=mock_global_config, content="depth", name="first")
+    second = ExportData(config=mock_global_config, content="depth", name="second")
+
+    first_meta = _metadata(first, regsurf)
+    from_template = _metadata(second, regsurf)
+    assert "entity" in from_template["fmu"]
+
+    with mock.patch(
+        "fmu.dataio._metadata.core.get_metadata_template", return_value=None
+    ):
+        expected = _metadata(second, regsurf)
+
+    assert from_template["fmu"]["entity"] != first_meta["fmu"]["entity"]
+    from_template["tracklog"][0]["datetime"] = expected["tracklog"][0]["datetime"]
+    assert from_template == expected
+
+
+def test_template_returns_independent_copies(
+    mock_exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that modifying the returned metadata does not affect the template."""
+    _metadata(mock_exportdata, regsurf)
+
+    metadata = _metadata(mock_exportdata, regsurf)
+    metadata["masterdata"]["smda"]["country"].clear()
+    metadata["tracklog"].clear()
+
+    metadata = _metadata(mock_exportdata, regsurf)
+    assert metadata["masterdata"]["smda"]["country"]
+    assert metadata["tracklog"]
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"classification": "restricted"},
+        {"rep_include": True},
+        {"workflow": "another workflow"},
+    ],
+)
+def test_template_not_reused_for_other_context(
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+    changes: dict[str, Any],
+) -> None:
+    """Test that a template is not used for exports with different shared blocks."""
+    kwargs = {"config": mock_global_config, "content": "depth", "name": "surf"}
+    _metadata(ExportData(**kwargs), regsurf)
+
+    other = ExportData(**kwargs, **changes)
+    assert get_metadata_template(other._export_config) is None
+
+
+def test_template_not_reused_when_environment_changes(
+    mock_exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that environment variables read when building metadata invalidate."""
+    _metadata(mock_exportdata, regsurf)
+    assert get_metadata_template(mock_exportdata._export_config) is not None
+
+    monkeypatch.setenv("KOMODO_RELEASE", "2030.01")
+    assert get_metadata_template(mock_exportdata._export_config) is None
+    assert _metadata(mock_exportdata, regsurf)["tracklog"][0]["sysinfo"]["komodo"] == {
+        "version": "2030.01"
+    }
+
+
+def test_metadata_from_template_is_validated(
+    mock_exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that the metadata rendered from a template is validated as a whole at
+    the default validation level, but not at the 'trusted' level."""
+    from fmu.dataio import metadata_validation
+    from fmu.dataio._metadata._template import MetadataTemplate
+    from fmu.dataio.exceptions import ValidationError
+
+    _metadata(mock_exportdata, regsurf)
+
+    render = MetadataTemplate.render
+
+    def render_invalid(self: MetadataTemplate, *args: Any) -> dict[str, Any]:
+        metadata = render(self, *args)
+        metadata["access"]["classification"] = "invalid"
+        return metadata
+
+    with mock.patch.object(MetadataTemplate, "render", render_invalid):
+        with pytest.raises(ValidationError, match="Invalid metadata"):
+            _metadata(mock_exportdata, regsurf)
+
+        with metadata_validation("trusted"):
+            _metadata(mock_exportdata, regsurf)
@@ -0,0 +1,230 @@
+"""Test the metadata validation levels"""
+
+import threading
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+import xtgeo
+
+from fmu.dataio import ExportData, ValidationLevel, metadata_validation
+from fmu.dataio._background import submit
+from fmu.dataio._metadata import _generate_metadata, create_object_data
+from fmu.dataio._validation import (
+    _deferred,
+    defer_validation,
+    get_validation_level,
+    validate_metadata,
+)
+from fmu.dataio.exceptions import ValidationError
+from fmu.dataio.export import wait_all
+
+
+def _metadata(exportdata: ExportData, obj: Any) -> dict[str, Any]:
+    export_config = exportdata._export_config
+    return _generate_metadata(export_config, create_object_data(obj, export_config))
+
+
+def _invalid(metadata: dict[str, Any]) -> dict[str, Any]:
+    return {**metadata, "access": {**metadata["access"], "classification": "secret"}}
+
+
+@pytest.mark.parametrize("level", ["trusted", "deferred"])
+def test_lowered_validation_gives_identical_metadata(
+    runpath: Path,
+    mock_exportdata: ExportData,
+    regsurf: xtgeo.RegularSurface,
+    level: str,
+) -> None:
+    """Test that the metadata is identical to fully validated metadata."""
+    expected = _metadata(mock_exportdata, regsurf)
+
+    with (
+        mock.patch(
+            "fmu.dataio._metadata.core.get_metadata_template", return_value=None
+        ),
+        metadata_validation(level),
+    ):
+        assert get_validation_level() == level
+        metadata = _metadata(mock_exportdata, regsurf)
+
+    assert get_validation_level() == ValidationLevel.full
+    metadata["tracklog"][0]["datetime"] = expected["tracklog"][0]["datetime"]
+    assert metadata == expected
+    assert list(metadata) == list(expected)
+
+
+@pytest.mark.parametrize("level", ["trusted", "deferred"])
+@pytest.mark.parametrize(
+    "fixture, kwargs",
+    [
+        ("polygons", {"content": "depth"}),
+        (
+            "gridproperty",
+            {
+                "content": "property",
+                "content_metadata": {"attribute": "porosity", "is_discrete": False},
+            },
+        ),
+        ("dataframe", {}),
+        ("regsurf", {"content": "depth", "timedata": [["20200101", "base"]]}),
+    ],
+)
+def test_constructed_data_block_identical_to_validated(
+    request: pytest.FixtureRequest,
+    mock_global_config: dict[str, Any],
+    fixture: str,
+    kwargs: dict[str, Any],
+    level: str,
+) -> None:
+    """Test that the data block built without validation at lowered levels is
+    identical to the validated data block."""
+    obj = request.getfixturevalue(fixture)
+    export_config = ExportData(
+        config=mock_global_config, name="obj", **kwargs
+    )._export_config
+
+    expected = create_object_data(obj, export_config).get_metadata()
+    with metadata_validation(level):
+        constructed = create_object_data(obj, export_config).get_metadata()
+
+    assert type(getattr(constructed, "root", constructed)) is type(
+        getattr(expected, "root", expected)
+    )
+    assert constructed.model_dump(mode="json") == expected.model_dump(mode="json")
+
+
+def test_trusted_validates_first_object_in_context(
+    mock_exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that the complete metadata is checked once before used as template."""
+    with (
+        metadata_validation("trusted"),
+        mock.patch("fmu.dataio._metadata.core.validate_metadata") as mock_validate,
+    ):
+        for _ in range(3):
+            _metadata(mock_exportdata, regsurf)
+    mock_validate.assert_called_once()
+
+
+def test_deferred_validation_at_end_of_block(
+    mock_exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that the metadata of all objects is validated in one batch on exit."""
+    with mock.patch("fmu.dataio._validation.validate_metadata") as mock_validate:
+        with metadata_validation("deferred"):
+            metadata = [_metadata(mock_exportdata, regsurf) for _ in range(3)]
+            assert len(_deferred.get()) == 3
+            mock_validate.assert_not_called()
+        mock_validate.assert_called_once_with(metadata)
+
+    assert _deferred.get() is None
+
+
+def test_deferred_validation_raises_for_invalid_metadata(
+    mock_exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that invalid metadata is reported with the file paths on exit."""
+    metadata = _metadata(mock_exportdata, regsurf)
+
+    with (
+        pytest.raises(ValidationError, match=metadata["file"]["absolute_path"]),
+        metadata_validation("deferred"),
+    ):
+        defer_validation(metadata)
+        defer_validation(_invalid(metadata))
+
+    assert _deferred.get() is None
+
+
+def test_deferred_queue_discarded_on_error(
+    mock_exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that an error within the block discards the queued metadata."""
+    with pytest.raises(RuntimeError), metadata_validation("deferred"):
+        _metadata(mock_exportdata, regsurf)
+        raise RuntimeError
+
+    assert _deferred.get() is None
+    assert get_validation_level() == ValidationLevel.full
+
+
+def test_nested_deferred_validated_by_outermost_block(
+    mock_exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that nested deferred blocks are validated when the outer block exits."""
+    with metadata_validation("deferred"):
+        with metadata_validation("deferred"):
+            _metadata(mock_exportdata, regsurf)
+        assert len(_deferred.get()) == 1
+
+        with metadata_validation("full"):
+            _metadata(mock_exportdata, regsurf)
+        assert len(_deferred.get()) == 1
+
+    assert _deferred.get() is None
+
+
+def test_validate_metadata(
+    mock_exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test validation of a batch of dumped metadata."""
+    metadata = _metadata(mock_exportdata, regsurf)
+    validate_metadata([])
+    validate_metadata([metadata, metadata])
+
+    with pytest.raises(ValidationError, match="classification"):
+        validate_metadata([metadata, _invalid(metadata)])
+
+
+def test_invalid_validation_level() -> None:
+    """Test that an unknown validation level is not accepted."""
+    with (
+        pytest.raises(ValueError, match="not_a_level"),
+        metadata_validation("not_a_level"),
+    ):
+        pass
+
+
+def test_validation_level_not_shared_with_other_threads() -> None:
+    """Test that the validation level only applies to the thread setting it."""
+    levels = []
+    with metadata_validation("trusted"):
+        thread = threading.Thread(target=lambda: levels.append(get_validation_level()))
+        thread.start()
+        thread.join()
+    assert levels == [ValidationLevel.full]
+
+
+def test_validation_level_captured_when_export_submitted() -> None:
+    """Test that a background export uses the level of the block it was submitted
+    in, also when run after the block has been exited."""
+    release = threading.Event()
+    submit(release.wait)
+
+    with metadata_validation("trusted"):
+        future = submit(get_validation_level)
+    release.set()
+
+    assert future.result() == ValidationLevel.trusted
+    wait_all()
+
+
+def test_deferred_metadata_from_late_export_validated_right_away(
+    mock_exportdata: ExportData, regsurf: xtgeo.RegularSurface
+) -> None:
+    """Test that metadata deferred by a background export completing after the
+    deferred block has been exited is still validated."""
+    metadata = _metadata(mock_exportdata, regsurf)
+    release = threading.Event()
+    submit(release.wait)
+
+    with metadata_validation("deferred"):
+        future = submit(defer_validation, _invalid(metadata))
+    release.set()
+
+    with pytest.raises(ValidationError, match="classification"):
+        future.result()
+    with pytest.raises(ExceptionGroup):
+        wait_all()
@@ -0,0 +1,70 @@
+"""Test the pipelined export of items"""
+
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from fmu.dataio.export._pipeline import export_pipelined
+
+
+def test_export_pipelined_preserves_order() -> None:
+    results = export_pipelined(range(10), lambda item: item * 2)
+    assert results == [item * 2 for item in range(10)]
+
+
+def test_export_pipelined_exports_on_worker_thread() -> None:
+    main_thread = threading.get_ident()
+    produced_on = []
+
+    def produce():
+        for item in range(3):
+            produced_on.append(threading.get_ident())
+            yield item
+
+    exported_on = export_pipelined(produce(), lambda _: threading.get_ident())
+
+    assert set(produced_on) == {main_thread}
+    assert main_thread not in exported_on
+
+
+def test_export_pipelined_exports_with_context_of_producer() -> None:
+    """Test that each item is exported with the context it was produced in."""
+    var: ContextVar[int | None] = ContextVar("var", default=None)
+
+    def produce():
+        for item in range(3):
+            var.set(item)
+            yield item
+
+    assert export_pipelined(produce(), lambda _: var.get()) == [0, 1, 2]
+
+
+def test_export_pipelined_limits_items_in_flight() -> None:
+    """Test that no more than max_in_flight items are produced ahead of export."""
+    exported: list[int] = []
+    produced: list[int] = []
+
+    def produce():
+        for item in range(6):
+            assert len(produced) - len(exported) < 2
+            produced.append(item)
+            yield item
+
+    export_pipelined(produce(), exported.append, max_in_flight=2)
+    assert exported == list(range(6))
+
+
+def test_export_pipelined_propagates_errors() -> None:
+    def export(item: int) -> int:
+        if item == 2:
+            raise ValueError("Failed exporting 2")
+        return item
+
+    with pytest.raises(ValueError, match="Failed exporting 2"):
+        export_pipelined(range(5), export)
+
+
+def test_export_pipelined_invalid_max_in_flight() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        export_pipelined([1], print, max_in_flight=0)
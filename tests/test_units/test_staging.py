@@ -0,0 +1,203 @@
+"""Test the staged writes of exported files and their metadata"""
+
+import contextvars
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pyarrow as pa
+import pytest
+import xtgeo
+
+from fmu.dataio import ExportData, read_metadata, staged_writes
+from fmu.dataio._export.serialize import compute_md5_and_size
+from fmu.dataio._metadata import create_object_data
+from fmu.dataio._staging import staged_files
+
+
+def _hidden_files(directory: Path) -> list[str]:
+    return sorted(p.name for p in directory.iterdir() if p.name.endswith(".tmp"))
+
+
+def test_staged_files_outside_block_yields_given_paths(tmp_path: Path) -> None:
+    """Test that the files are written directly outside a staged_writes block."""
+    path = tmp_path / "file.txt"
+    with staged_files(path) as (staged,):
+        assert staged == path
+
+
+def test_staged_files_renamed_into_place(tmp_path: Path) -> None:
+    """Test that the files are written to temporary paths and renamed on exit."""
+    datafile = tmp_path / "file.txt"
+    metafile = tmp_path / ".file.txt.yml"
+
+    with staged_writes(), staged_files(datafile, metafile) as staged:
+        assert staged[0] != datafile
+        assert staged[0].parent == tmp_path
+        assert staged[0].name.startswith(".")
+        staged[0].write_text("data")
+        staged[1].write_text("metadata")
+        assert not datafile.exists()
+        assert not metafile.exists()
+
+    assert datafile.read_text() == "data"
+    assert metafile.read_text() == "metadata"
+    assert _hidden_files(tmp_path) == []
+
+
+def test_staged_files_removed_on_error(tmp_path: Path) -> None:
+    """Test that the existing files are kept and the temporary files removed when
+    writing fails."""
+    datafile = tmp_path / "file.txt"
+    metafile = tmp_path / ".file.txt.yml"
+    datafile.write_text("old data")
+    metafile.write_text("old metadata")
+
+    with (
+        pytest.raises(RuntimeError, match="crash"),
+        staged_writes(),
+        staged_files(datafile, metafile) as staged,
+    ):
+        staged[0].write_text("new data")
+        raise RuntimeError("crash")
+
+    assert datafile.read_text() == "old data"
+    assert metafile.read_text() == "old metadata"
+    assert _hidden_files(tmp_path) == []
+
+
+def test_staged_files_marker_removed_before_replacing(tmp_path: Path) -> None:
+    """Test that an old metadata file never describes a new file."""
+    datafile = tmp_path / "file.txt"
+    metafile = tmp_path / ".file.txt.yml"
+    datafile.write_text("old data")
+    metafile.write_text("old metadata")
+
+    original_replace = Path.replace
+
+    def replace(self: Path, target: Path) -> Path:
+        if target == datafile:
+            assert not metafile.exists()
+        return original_replace(self, target)
+
+    with (
+        mock.patch.object(Path, "replace", replace),
+        staged_writes(),
+        staged_files(datafile, metafile) as staged,
+    ):
+        staged[0].write_text("new data")
+        staged[1].write_text("new metadata")
+
+    assert datafile.read_text() == "new data"
+    assert metafile.read_text() == "new metadata"
+
+
+@pytest.mark.parametrize("durable", [True, False])
+def test_staged_writes_directories_synced_once(tmp_path: Path, durable: bool) -> None:
+    """Test that the directories are synced once when the block is exited, and only
+    when the writes are durable."""
+    with (
+        mock.patch("fmu.dataio._staging._fsync_directory") as fsync_directory,
+        mock.patch("fmu.dataio._staging._fsync_file") as fsync_file,
+        staged_writes(durable=durable),
+    ):
+        for i in range(3):
+            with staged_writes(), staged_files(tmp_path / f"file{i}.txt") as staged:
+                staged[0].write_text("data")
+        fsync_directory.assert_not_called()
+
+    assert fsync_file.call_count == (3 if durable else 0)
+    if durable:
+        fsync_directory.assert_called_once_with(tmp_path)
+    else:
+        fsync_directory.assert_not_called()
+
+
+def test_staged_files_completed_after_block_synced(tmp_path: Path) -> None:
+    """Test that files staged in a block, but renamed into place after it has been
+    exited, e.g. by a background export, have their directory synced right away."""
+
+    def export() -> None:
+        with staged_files(tmp_path / "file.txt") as staged:
+            staged[0].write_text("data")
+
+    with mock.patch("fmu.dataio._staging._fsync_directory") as fsync_directory:
+        with staged_writes():
+            context = contextvars.copy_context()
+        fsync_directory.assert_not_called()
+        context.run(export)
+
+    assert (tmp_path / "file.txt").read_text() == "data"
+    fsync_directory.assert_called_once_with(tmp_path)
+
+
+def test_staged_export_gives_identical_files(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that a staged export gives the same file and metadata as a direct
+    export."""
+    monkeypatch.chdir(tmp_path)
+    edata = ExportData(config=mock_global_config, content="depth", name="surf")
+
+    direct = Path(edata.export(regsurf, tagname="direct"))
+    with staged_writes():
+        staged = Path(edata.export(regsurf, tagname="staged"))
+
+    assert staged.read_bytes() == direct.read_bytes()
+    metadata = read_metadata(staged)
+    assert (
+        metadata["file"]["checksum_md5"]
+        == read_metadata(direct)["file"]["checksum_md5"]
+    )
+    assert metadata["file"]["absolute_path"] == str(staged)
+    assert _hidden_files(staged.parent) == []
+
+
+def test_staged_export_of_streamed_table(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    mock_global_config: dict[str, Any],
+    arrowtable: pa.Table,
+) -> None:
+    """Test that a table streamed into place is not copied, and that only its metadata
+    is staged."""
+    monkeypatch.chdir(tmp_path)
+    edata = ExportData(
+        config=mock_global_config,
+        content="property",
+        content_metadata={"attribute": "porosity", "is_discrete": False},
+        name="table",
+        table_index=["COL1"],
+    )
+
+    with (
+        mock.patch("fmu.dataio._export.serialize.shutil.copyfile") as copyfile,
+        staged_writes(),
+    ):
+        outfile = Path(edata.export(arrowtable.to_reader()))
+
+    copyfile.assert_not_called()
+    metadata = read_metadata(outfile)
+    assert metadata["file"]["size_bytes"] == outfile.stat().st_size
+    assert _hidden_files(outfile.parent) == []
+
+
+def test_staged_export_without_metadata(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    regsurf: xtgeo.RegularSurface,
+) -> None:
+    """Test that the files exported without metadata are staged."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.warns(UserWarning):
+        edata = ExportData(config={}, content="depth", name="surf")
+
+    with staged_writes():
+        outfile = Path(edata.export(regsurf))
+
+    objdata = create_object_data(regsurf, edata._export_config)
+    assert outfile.stat().st_size == compute_md5_and_size(objdata)[1]
+    assert _hidden_files(outfile.parent) == []
@@ -0,0 +1,273 @@
+"""Tests for tables exported as partitioned parquet datasets"""
+
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+import yaml
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData
+from fmu.dataio._export._export_models import FilePartExport
+from fmu.dataio._export.serialize import compute_dataset_md5_and_size
+from fmu.dataio._utils import md5sum
+
+NREALS = 3
+
+
+def _cells(real: int) -> pa.Table:
+    return pa.table(
+        {
+            "REAL": pa.array([real] * 4, type=pa.int32()),
+            "ZONE": ["Valysar", "Valysar", "Therys", "Volon"],
+            "REGION": ["WestLowland", "CentralSouth", "WestLowland", "CentralSouth"],
+            "PORO": [0.1 + real, 0.2 + real, 0.3 + real, 0.4 + real],
+        }
+    )
+
+
+def _read_metadata(path: Path) -> dict[str, Any]:
+    with open(path.parent / f".{path.name}.yml", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def _read_dataset(path: Path) -> pa.Table:
+    table = ds.dataset(path, format="parquet", partitioning="hive").to_table()
+    return table.sort_by([("REAL", "ascending"), ("PORO", "ascending")])
+
+
+@pytest.fixture
+def table() -> pa.Table:
+    return pa.concat_tables([_cells(real) for real in range(NREALS)])
+
+
+@pytest.fixture
+def exportdata(mock_global_config: dict[str, Any]) -> ExportData:
+    return ExportData(
+        config=mock_global_config,
+        content="property",
+        content_metadata={"attribute": "porosity", "is_discrete": False},
+        name="cells",
+        table_index=["REAL", "ZONE", "REGION"],
+        partition_by=["REAL", "ZONE"],
+    )
+
+
+def test_export_partitioned_table(
+    exportdata: ExportData,
+    table: pa.Table,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that a table is exported as a Hive partitioned directory of parquet
+    files."""
+    monkeypatch.chdir(tmp_path)
+    outdir = Path(exportdata.export(table))
+
+    assert outdir == tmp_path / "share/results/tables/cells.parquet"
+    assert outdir.is_dir()
+    assert (outdir / "REAL=0/ZONE=Valysar/part-0.parquet").exists()
+    assert len(list(outdir.rglob("*.parquet"))) == 3 * NREALS
+
+    result = _read_dataset(outdir)
+    assert result.num_rows == table.num_rows
+    assert result.select(["PORO", "REGION"]).equals(
+        table.sort_by([("REAL", "ascending"), ("PORO", "ascending")]).select(
+            ["PORO", "REGION"]
+        )
+    )
+
+
+def test_export_partitioned_table_metadata(
+    exportdata: ExportData,
+    table: pa.Table,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that one metadata file is exported with the checksum and size of each
+    part."""
+    monkeypatch.chdir(tmp_path)
+    outdir = Path(exportdata.export(table))
+    metadata = _read_metadata(outdir)
+
+    parts = metadata["file"]["parts"]
+    part_files = sorted(path for path in outdir.rglob("*") if path.is_file())
+    assert [part["relative_path"] for part in parts] == [
+        str(path.relative_to(outdir)) for path in part_files
+    ]
+    for part, path in zip(parts, part_files, strict=True):
+        assert part["checksum_md5"] == md5sum(path)
+        assert part["size_bytes"] == path.stat().st_size
+
+    assert metadata["file"]["size_bytes"] == sum(
+        path.stat().st_size for path in part_files
+    )
+    assert len(metadata["file"]["checksum_md5"]) == 32
+    assert metadata["data"]["format"] == "parquet"
+    assert metadata["data"]["table_index"] == ["REAL", "ZONE", "REGION"]
+    assert metadata["data"]["spec"]["num_rows"] == table.num_rows
+    assert sorted(metadata["data"]["spec"]["columns"]) == sorted(table.column_names)
+
+
+def test_dataset_checksum_changes_with_parts(
+    exportdata: ExportData,
+    table: pa.Table,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that the checksum of the dataset changes when a part changes."""
+    monkeypatch.chdir(tmp_path)
+    outdir = Path(exportdata.export(table))
+    checksum = _read_metadata(outdir)["file"]["checksum_md5"]
+
+    changed = table.set_column(3, "PORO", pa.array([0.5] * table.num_rows))
+    exportdata.export(changed)
+    assert _read_metadata(outdir)["file"]["checksum_md5"] != checksum
+
+
+def test_export_partitioned_from_record_batch_reader(
+    exportdata: ExportData,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that a table can be exported batch by batch from a reader."""
+    monkeypatch.chdir(tmp_path)
+    schema = _cells(0).schema
+    reader = pa.RecordBatchReader.from_batches(
+        schema,
+        (batch for real in range(NREALS) for batch in _cells(real).to_batches()),
+    )
+    outdir = Path(exportdata.export(reader))
+
+    metadata = _read_metadata(outdir)
+    assert metadata["data"]["spec"]["num_rows"] == 4 * NREALS
+    assert _read_dataset(outdir).num_rows == 4 * NREALS
+
+
+def test_export_partitioned_dataframe(
+    exportdata: ExportData,
+    table: pa.Table,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that a pandas DataFrame is exported as a partitioned parquet dataset."""
+    monkeypatch.chdir(tmp_path)
+    outdir = Path(exportdata.export(table.to_pandas()))
+
+    assert outdir.suffix == ".parquet"
+    assert _read_dataset(outdir).num_rows == table.num_rows
+
+
+def test_export_partitioned_replaces_dataset(
+    exportdata: ExportData,
+    table: pa.Table,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that an existing dataset is replaced, and no temporary files are left."""
+    monkeypatch.chdir(tmp_path)
+    exportdata.export(table)
+    outdir = Path(exportdata.export(_cells(0)))
+
+    assert _read_dataset(outdir).num_rows == 4
+    assert not (outdir / "REAL=1").exists()
+    assert not list(tmp_path.glob(".*.tmp"))
+
+    metadata = _read_metadata(outdir)
+    assert len(metadata["file"]["parts"]) == 3
+    assert (metadata["file"]["checksum_md5"], metadata["file"]["size_bytes"]) == (
+        compute_dataset_md5_and_size(
+            [FilePartExport.model_validate(part) for part in metadata["file"]["parts"]]
+        )
+    )
+
+
+def test_export_partitioned_without_config(
+    table: pa.Table, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a partitioned dataset is exported without metadata when the config is
+    invalid."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.warns(UserWarning):
+        exportdata = ExportData(
+            config={},
+            content="property",
+            name="cells",
+            table_index=["REAL", "ZONE"],
+            partition_by=["REAL"],
+        )
+    outdir = Path(exportdata.export(table))
+
+    assert (outdir / "REAL=2/part-0.parquet").exists()
+    assert not (outdir.parent / f".{outdir.name}.yml").exists()
+
+
+def test_partition_by_not_in_table_index(
+    mock_global_config: dict[str, Any],
+    table: pa.Table,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that the partition columns must be table index columns."""
+    monkeypatch.chdir(tmp_path)
+    exportdata = ExportData(
+        config=mock_global_config,
+        content="property",
+        content_metadata={"attribute": "porosity", "is_discrete": False},
+        name="cells",
+        table_index=["REAL", "ZONE"],
+        partition_by=["REGION"],
+    )
+    with pytest.raises(ValueError, match="must be part of the 'table_index'"):
+        exportdata.export(table)
+    assert not list(tmp_path.rglob("*.parquet"))
+
+
+def test_export_partitioned_many_partitions(
+    exportdata: ExportData, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a table with more partitions than the default limit of pyarrow,
+    e.g. of more than 1024 realizations, can be exported."""
+    monkeypatch.chdir(tmp_path)
+    nreals = 1500
+    table = pa.table(
+        {
+            "REAL": pa.array(range(nreals), type=pa.int32()),
+            "ZONE": ["Valysar"] * nreals,
+            "REGION": ["WestLowland"] * nreals,
+            "PORO": [0.1] * nreals,
+        }
+    )
+    outdir = Path(exportdata.export(table))
+
+    assert len(list(outdir.glob("REAL=*"))) == nreals
+    assert _read_dataset(outdir).num_rows == nreals
+    assert _read_metadata(outdir)["data"]["table_index"] == ["REAL", "ZONE", "REGION"]
+
+
+def test_export_partitioned_empty_table_raises(
+    exportdata: ExportData, table: pa.Table, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that an empty table can not be exported partitioned."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError, match="must have at least one row"):
+        exportdata.export(table.slice(0, 0))
+    assert not list(tmp_path.rglob("*.parquet"))
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_partition_by_not_a_table(
+    exportdata: ExportData, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that only tables can be exported partitioned."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(TypeError, match="Only tables can be exported partitioned"):
+        exportdata.export({"some": "dict"})
+
+
+def test_generate_metadata_partitioned(exportdata: ExportData, table: pa.Table) -> None:
+    """Test that metadata for a partitioned table is only generated on export."""
+    with pytest.raises(ValueError, match="generated on export"):
+        exportdata.generate_metadata(table.to_pandas())
@@ -0,0 +1,142 @@
+"""Tests for tables exported from a stream of record batches"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import yaml
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData
+from fmu.dataio._utils import md5sum
+
+NBATCHES = 4
+
+
+def _batch(i: int, zone: str | None = "Valysar") -> pa.RecordBatch:
+    return pa.record_batch(
+        {
+            "REAL": pa.array([i] * 3, type=pa.int32()),
+            "ZONE": pa.array([zone] * 3, type=pa.string()),
+            "PORO": [0.1 * i, 0.2 * i, 0.3 * i],
+        }
+    )
+
+
+def _batches(zone: str | None = "Valysar") -> Iterator[pa.RecordBatch]:
+    return (_batch(i, zone) for i in range(NBATCHES))
+
+
+def _read_metadata(path: Path) -> dict[str, Any]:
+    with open(path.parent / f".{path.name}.yml", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+@pytest.fixture
+def exportdata(mock_global_config: dict[str, Any]) -> ExportData:
+    return ExportData(
+        config=mock_global_config,
+        content="property",
+        content_metadata={"attribute": "porosity", "is_discrete": False},
+        name="cells",
+        table_index=["REAL", "ZONE"],
+    )
+
+
+def test_export_from_iterator(
+    exportdata: ExportData, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that an iterator of record batches is exported to a single parquet file
+    with metadata derived while writing."""
+    monkeypatch.chdir(tmp_path)
+    outfile = Path(exportdata.export(_batches()))
+
+    assert outfile == tmp_path / "share/results/tables/cells.parquet"
+    table = pq.read_table(outfile)
+    assert table.num_rows == 3 * NBATCHES
+    assert table.equals(pa.Table.from_batches(list(_batches())))
+
+    metadata = _read_metadata(outfile)
+    assert metadata["file"]["checksum_md5"] == md5sum(outfile)
+    assert metadata["file"]["size_bytes"] == outfile.stat().st_size
+    assert metadata["data"]["format"] == "parquet"
+    assert metadata["data"]["table_index"] == ["REAL", "ZONE"]
+    assert metadata["data"]["spec"]["num_rows"] == 3 * NBATCHES
+    assert metadata["data"]["spec"]["columns"] == ["REAL", "ZONE", "PORO"]
+    assert metadata["data"]["spec"]["size"] == 3 * 3 * NBATCHES
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_export_from_record_batch_reader(
+    exportdata: ExportData, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a pyarrow RecordBatchReader is exported batch by batch."""
+    monkeypatch.chdir(tmp_path)
+    reader = pa.RecordBatchReader.from_batches(_batch(0).schema, _batches())
+    outfile = Path(exportdata.export(reader))
+
+    assert pq.read_metadata(outfile).num_rows == 3 * NBATCHES
+    assert _read_metadata(outfile)["file"]["checksum_md5"] == md5sum(outfile)
+
+
+def test_export_stream_replaces_file(
+    exportdata: ExportData, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that an existing file is replaced by a streamed table."""
+    monkeypatch.chdir(tmp_path)
+    exportdata.export(_batches())
+    outfile = Path(exportdata.export(iter([_batch(1)])))
+
+    assert pq.read_metadata(outfile).num_rows == 3
+    assert _read_metadata(outfile)["file"]["checksum_md5"] == md5sum(outfile)
+
+
+def test_export_stream_drops_empty_table_index(
+    exportdata: ExportData, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that table index columns with only null values are detected from the
+    null counts of the batches."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.warns(FutureWarning, match="ZONE"):
+        outfile = Path(exportdata.export(_batches(zone=None)))
+
+    assert _read_metadata(outfile)["data"]["table_index"] == ["REAL"]
+
+
+def test_export_stream_without_config(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Test that a stream is exported without metadata when the config is invalid."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.warns(UserWarning):
+        exportdata = ExportData(config={}, content="property", name="cells")
+    outfile = Path(exportdata.export(_batches()))
+
+    assert pq.read_metadata(outfile).num_rows == 3 * NBATCHES
+    assert not (outfile.parent / f".{outfile.name}.yml").exists()
+
+
+def test_export_empty_iterator(
+    exportdata: ExportData, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that an empty iterator can not be exported."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError, match="empty iterator"):
+        exportdata.export(iter([]))
+
+
+def test_export_iterator_of_other_objects(
+    exportdata: ExportData, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that only iterators of record batches can be exported."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(TypeError, match="not of dict"):
+        exportdata.export(iter([{"REAL": 0}]))
+    assert not list(tmp_path.rglob("*.parquet"))
+
+
+def test_generate_metadata_stream(exportdata: ExportData) -> None:
+    """Test that metadata for a stream is only generated on export."""
+    with pytest.raises(ValueError, match="generated on export"):
+        exportdata.generate_metadata(_batches())
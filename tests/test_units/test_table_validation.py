@@ -0,0 +1,160 @@
+"""Test the columnar validation of standard result tables"""
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from fmu.datamodels import InplaceVolumesResult, SimulatorFipregionsMappingResult
+from pydantic import ValidationError
+
+from fmu.dataio.export._table_validation import (
+    ColumnRule,
+    get_column_rules,
+    table_satisfies_rules,
+    validate_table,
+)
+
+VOLDATA_STANDARD = "tests/data/drogon/tabular/volumes/geogrid.csv"
+
+
+@pytest.fixture
+def voltable() -> pd.DataFrame:
+    return pd.read_csv(VOLDATA_STANDARD)
+
+
+@pytest.fixture
+def mapping_table() -> pa.Table:
+    return pa.table(
+        {
+            "FIPNUM": [1, 2, 3, 4],
+            "REGION": ["reg1", "reg2", "reg1", "reg2"],
+            "ZONE": ["upper", "upper", "lower", "lower"],
+        }
+    )
+
+
+def _pydantic_error(model: type, rows: list[dict]) -> str:
+    with pytest.raises(ValidationError) as excinfo:
+        model.model_validate(rows)
+    return str(excinfo.value)
+
+
+def test_column_rules_derived_from_model() -> None:
+    """Test that the column rules reflect the fields in the row model."""
+    rules = {rule.name: rule for rule in get_column_rules(InplaceVolumesResult)}
+
+    assert rules["FLUID"] == ColumnRule(
+        name="FLUID",
+        kind="enum",
+        required=True,
+        nullable=False,
+        allowed_values=frozenset({"oil", "gas", "water"}),
+    )
+    assert rules["ZONE"] == ColumnRule(
+        name="ZONE", kind="str", required=True, nullable=False
+    )
+    assert rules["FACIES"] == ColumnRule(
+        name="FACIES", kind="str", required=False, nullable=True
+    )
+    assert rules["BULK"] == ColumnRule(
+        name="BULK", kind="float", required=True, nullable=False, ge=0.0
+    )
+    assert rules["HCPV"] == ColumnRule(
+        name="HCPV", kind="float", required=False, nullable=True, ge=0.0
+    )
+
+    fip_rules = get_column_rules(SimulatorFipregionsMappingResult)
+    assert fip_rules[0] == ColumnRule(
+        name="FIPNUM", kind="int", required=True, nullable=False, ge=0.0
+    )
+
+
+def test_valid_tables_skip_row_validation(
+    voltable: pd.DataFrame, mapping_table: pa.Table
+) -> None:
+    """Test that valid tables are not validated row by row."""
+    with mock.patch.object(InplaceVolumesResult, "model_validate") as mocked:
+        validate_table(voltable, InplaceVolumesResult)
+        validate_table(pa.Table.from_pandas(voltable), InplaceVolumesResult)
+    mocked.assert_not_called()
+
+    with mock.patch.object(SimulatorFipregionsMappingResult, "model_validate") as m:
+        validate_table(mapping_table, SimulatorFipregionsMappingResult)
+    m.assert_not_called()
+
+
+def test_optional_columns_may_be_missing(voltable: pd.DataFrame) -> None:
+    """Test that optional columns can be missing or empty."""
+    rules = get_column_rules(InplaceVolumesResult)
+    table = pa.Table.from_pandas(voltable.drop(columns=["FACIES", "GIIP"]))
+    assert table_satisfies_rules(table, rules)
+
+    voltable["HCPV"] = np.nan
+    assert table_satisfies_rules(pa.Table.from_pandas(voltable), rules)
+
+
+@pytest.mark.parametrize(
+    "column, value",
+    [
+        ("PORV", -1.0),
+        ("PORV", np.nan),
+        ("PORV", "a"),
+        ("HCPV", -1.0),
+        ("FLUID", "condensate"),
+        ("ZONE", None),
+        ("ZONE", 1),
+    ],
+)
+def test_invalid_inplace_volumes_gives_pydantic_errors(
+    voltable: pd.DataFrame, column: str, value: object
+) -> None:
+    """Test that the error messages are identical to row-wise pydantic validation."""
+    voltable[column] = voltable[column].astype(object)
+    voltable.loc[3, column] = value
+
+    expected = _pydantic_error(
+        InplaceVolumesResult, voltable.replace(np.nan, None).to_dict(orient="records")
+    )
+    with pytest.raises(ValidationError) as excinfo:
+        validate_table(voltable, InplaceVolumesResult)
+    assert str(excinfo.value) == expected
+
+
+def test_missing_required_column_gives_pydantic_error(voltable: pd.DataFrame) -> None:
+    """Test that a missing required column is reported by pydantic."""
+    with pytest.raises(ValidationError, match="PORV"):
+        validate_table(voltable.drop(columns="PORV"), InplaceVolumesResult)
+
+
+@pytest.mark.parametrize(
+    "fipnum",
+    [
+        pa.array([1, 2, -3, 4]),
+        pa.array([1, 2, None, 4], type=pa.int64()),
+        pa.array(["1", "2", "x", "4"]),
+    ],
+)
+def test_invalid_mapping_table_gives_pydantic_errors(
+    mapping_table: pa.Table, fipnum: pa.Array
+) -> None:
+    """Test that invalid mapping tables fail with the pydantic error messages."""
+    table = mapping_table.set_column(0, "FIPNUM", fipnum)
+
+    expected = _pydantic_error(SimulatorFipregionsMappingResult, table.to_pylist())
+    with pytest.raises(ValidationError) as excinfo:
+        validate_table(table, SimulatorFipregionsMappingResult)
+    assert str(excinfo.value) == expected
+
+
+def test_failed_columnar_validation_accepts_coercible_values(
+    mapping_table: pa.Table,
+) -> None:
+    """Test that values pydantic can coerce are accepted after falling back to
+    row by row validation."""
+    table = mapping_table.set_column(0, "FIPNUM", pa.array(["1", "2", "3", "4"]))
+    assert not table_satisfies_rules(
+        table, get_column_rules(SimulatorFipregionsMappingResult)
+    )
+    validate_table(table, SimulatorFipregionsMappingResult)
@@ -0,0 +1,207 @@
+"""Test the verification of the exported files in a case against their metadata"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pytest
+import xtgeo
+from fmu.settings._drogon import create_drogon_fmu_dir
+from pytest import MonkeyPatch
+
+from fmu.dataio import ExportData
+from fmu.dataio._workflows.verify_case import get_parser, verify_case_main
+from fmu.dataio.catalog import (
+    MetadataCatalog,
+    VerificationMode,
+    VerificationStatus,
+    verify_case,
+)
+from fmu.dataio.catalog._verify import get_verification_state_path
+
+from ..conftest import ERT_CASE_DATA, ERTRUN_ENV_PREHOOK
+
+NREALS = 3
+
+
+@pytest.fixture
+def casepath(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    rootpath: Path,
+    mock_global_config: dict[str, Any],
+    regsurf: xtgeo.RegularSurface,
+) -> Path:
+    """A case with a surface and a partitioned table exported from each realization
+    in iter-0."""
+    casepath = tmp_path / ERT_CASE_DATA
+    shutil.copytree(rootpath / ERT_CASE_DATA, casepath)
+    create_drogon_fmu_dir(casepath)
+
+    for key, value in ERTRUN_ENV_PREHOOK.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv("_ERT_ITERATION_NUMBER", "0")
+
+    table = pa.table({"ZONE": ["A", "B", "A"], "PORO": [0.1, 0.2, 0.3]})
+    for real in range(NREALS):
+        runpath = casepath / f"realization-{real}/iter-0"
+        runpath.mkdir(parents=True, exist_ok=True)
+        monkeypatch.setenv("_ERT_RUNPATH", str(runpath))
+        monkeypatch.setenv("_ERT_REALIZATION_NUMBER", str(real))
+        monkeypatch.chdir(runpath)
+        ExportData(config=mock_global_config, content="depth", name="mymap").export(
+            regsurf
+        )
+        ExportData(
+            config=mock_global_config,
+            content="property",
+            content_metadata={"attribute": "porosity", "is_discrete": False},
+            name="cells",
+            table_index=["ZONE"],
+            partition_by=["ZONE"],
+        ).export(table)
+    return casepath
+
+
+def _surface(casepath: Path, real: int) -> Path:
+    return casepath / f"realization-{real}/iter-0/share/results/maps/mymap.gri"
+
+
+def _dataset(casepath: Path, real: int) -> Path:
+    return casepath / f"realization-{real}/iter-0/share/results/tables/cells.parquet"
+
+
+def _statuses(casepath: Path, **kwargs: Any) -> dict[Path, VerificationStatus]:
+    report = verify_case(casepath, **kwargs)
+    return {result.path: result.status for result in report.failed}
+
+
+@pytest.mark.parametrize("mode", list(VerificationMode))
+def test_verify_case(casepath: Path, mode: VerificationMode) -> None:
+    """Test that all exported files match their metadata."""
+    report = verify_case(casepath, mode=mode, max_workers=2)
+    assert report.ok
+    assert len(report.results) == 2 * NREALS
+    assert all(r.status == VerificationStatus.ok for r in report.results)
+
+
+def test_verify_case_reports_mismatches(casepath: Path) -> None:
+    """Test that missing files, size and checksum mismatches are reported."""
+    _surface(casepath, 0).unlink()
+    with open(_surface(casepath, 1), "ab") as stream:
+        stream.write(b"extra")
+    surface = _surface(casepath, 2)
+    content = bytearray(surface.read_bytes())
+    content[-10] ^= 0xFF
+    surface.write_bytes(content)
+
+    assert _statuses(casepath) == {
+        _surface(casepath, 0): VerificationStatus.missing,
+        _surface(casepath, 1): VerificationStatus.size_mismatch,
+        _surface(casepath, 2): VerificationStatus.checksum_mismatch,
+    }
+
+
+def test_verify_case_cheap(casepath: Path) -> None:
+    """Test that the cheap mode detects files modified after their metadata."""
+    surface = _surface(casepath, 0)
+    content = bytearray(surface.read_bytes())
+    content[-10] ^= 0xFF
+    surface.write_bytes(content)
+    sidecar = surface.parent / f".{surface.name}.yml"
+    os.utime(surface, ns=(0, sidecar.stat().st_mtime_ns + 1))
+
+    assert _statuses(casepath, mode="cheap") == {surface: VerificationStatus.modified}
+
+
+def test_verify_case_dataset(casepath: Path) -> None:
+    """Test that the parts of a partitioned dataset are verified."""
+    (_dataset(casepath, 0) / "ZONE=A/part-0.parquet").unlink()
+    (_dataset(casepath, 1) / "ZONE=C").mkdir()
+    shutil.copy(
+        _dataset(casepath, 1) / "ZONE=A/part-0.parquet",
+        _dataset(casepath, 1) / "ZONE=C/part-0.parquet",
+    )
+
+    assert _statuses(casepath) == {
+        _dataset(casepath, 0): VerificationStatus.missing,
+        _dataset(casepath, 1): VerificationStatus.checksum_mismatch,
+    }
+
+
+def test_verify_case_from_catalog(casepath: Path) -> None:
+    """Test that the files can be found from the metadata catalog."""
+    with pytest.raises(FileNotFoundError, match="No metadata catalog"):
+        verify_case(casepath, source="catalog")
+
+    MetadataCatalog(casepath).update()
+    _surface(casepath, 1).unlink()
+    assert _statuses(casepath, source="catalog") == {
+        _surface(casepath, 1): VerificationStatus.missing
+    }
+
+
+def test_verify_case_missing_metadata(casepath: Path) -> None:
+    """Test that files without metadata are reported."""
+    surface = _surface(casepath, 0)
+    (surface.parent / f".{surface.name}.yml").unlink()
+    assert _statuses(casepath) == {surface: VerificationStatus.missing_metadata}
+
+
+def test_verify_case_records_errors(casepath: Path) -> None:
+    """Test that a file that can not be verified is recorded with the error, without
+    stopping the verification, and is verified again when resuming."""
+    surface = _surface(casepath, 0)
+    sidecar = surface.parent / f".{surface.name}.yml"
+    original = sidecar.read_text()
+    sidecar.write_text("file: [unparsable")
+
+    report = verify_case(casepath)
+    assert len(report.results) == 2 * NREALS
+    [failed] = report.failed
+    assert failed.path.samefile(surface)
+    assert failed.status == VerificationStatus.error
+    assert failed.detail.startswith("ParserError")
+
+    sidecar.write_text(original)
+    assert verify_case(casepath, resume=True).ok
+
+
+def test_verify_case_resume(casepath: Path) -> None:
+    """Test that the files verified by an interrupted verification are skipped."""
+    state_path = get_verification_state_path(casepath, VerificationMode.full)
+    first = _surface(casepath, 0).resolve()
+    with open(state_path, "w", encoding="utf-8") as stream:
+        stream.write(
+            json.dumps({"path": str(first), "status": "ok", "detail": ""}) + "\n"
+        )
+        stream.write('{"path": "incomplete')
+
+    # the file is changed, but is not verified again when resuming
+    first.unlink()
+    report = verify_case(casepath, resume=True)
+    assert report.ok
+    assert len(report.results) == 2 * NREALS
+
+    report = verify_case(casepath)
+    assert [r.path for r in report.failed] == [first]
+
+
+def test_verify_case_workflow(casepath: Path) -> None:
+    """Test the workflow for verifying a case."""
+    report = verify_case_main(get_parser().parse_args([str(casepath)]))
+    assert report.ok
+
+    _surface(casepath, 0).unlink()
+    report = verify_case_main(
+        get_parser().parse_args(
+            [str(casepath), "--mode", "cheap", "--max-workers", "1"]
+        )
+    )
+    assert [r.path for r in report.failed] == [_surface(casepath, 0)]
+
+    with pytest.raises(ValueError, match="must be an absolute path"):
+        verify_case_main(get_parser().parse_args(["relative/case"]))
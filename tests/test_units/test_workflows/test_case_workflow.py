@@ -151,6 +151,7 @@ def test_queue_ert_parameters_queue_table_when_present(
 
     fake_table = pa.table({"REAL": [0]})
     fake_metadata = {"data": {"content": "parameters"}}
+    fake_payload = memoryview(b"payload")
 
     with (
         patch(
@@ -158,13 +159,15 @@ def test_queue_ert_parameters_queue_table_when_present(
             return_value=fake_table,
         ),
         patch(
-            "fmu.dataio._workflows.case.main.generate_metadata",
-            return_value=fake_metadata,
+            "fmu.dataio._workflows.case.main.export_to_buffer",
+            return_value=(fake_payload, fake_metadata),
         ),
     ):
         _queue_ert_parameters(ensemble, run_paths, workflow_config, sumo_uploader)
 
-    sumo_uploader.queue_table.assert_called_once_with(fake_table, fake_metadata)
+    sumo_uploader.queue_table.assert_called_once_with(
+        fake_table, fake_metadata, payload=fake_payload
+    )
 
 
 def test_queue_stratigraphy_mappings_does_nothing_when_table_is_none(
@@ -194,6 +197,7 @@ def test_queue_stratigraphy_mappings_queue_table_when_present(
 
     fake_table = pa.table({"column": ["value"]})
     fake_metadata = {"data": {"content": "mapping"}}
+    fake_payload = memoryview(b"payload")
 
     with (
         patch(
@@ -201,13 +205,15 @@ def test_queue_stratigraphy_mappings_queue_table_when_present(
             return_value=fake_table,
         ),
         patch(
-            "fmu.dataio._workflows.case.main.generate_metadata",
-            return_value=fake_metadata,
+            "fmu.dataio._workflows.case.main.export_to_buffer",
+            return_value=(fake_payload, fake_metadata),
         ),
     ):
         _queue_stratigraphy_mappings("ensemble", workflow_config, sumo_uploader)
 
-    sumo_uploader.queue_table.assert_called_once_with(fake_table, fake_metadata)
+    sumo_uploader.queue_table.assert_called_once_with(
+        fake_table, fake_metadata, payload=fake_payload
+    )
 
 
 def test_upload_files_to_sumo_queues_stratigraphy_when_fmu_dir_present(